@@ -2,11 +2,14 @@
 """
 EXECUTOR - Run AI model tasks with budget tracking
 """
-import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from auto_log import append_entry  # Segmented AUTO_LOG writer
+
 class TaskExecutor:
     """Executes AI tasks with model routing and budget tracking"""
 
@@ -36,11 +39,9 @@ class TaskExecutor:
         }
 
     def log_activity(self, sejr_path: Path, action: str, details: dict) -> None:
-        log_file = sejr_path / "AUTO_LOG.jsonl"
         entry = {
             "timestamp": datetime.now().isoformat(),
             "action": action,
             "details": details,
         }
-        with open(log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_entry(sejr_path, entry)
@@ -14,7 +14,6 @@ Features:
 """
 
 import os
-import json
 import asyncio
 import logging
 from dataclasses import dataclass, field
@@ -27,6 +26,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.model_router import ModelType, ModelRouter, get_model_for_script
+from auto_log import LOG_FILENAME, append_entry
 
 
 # Configure logging
@@ -366,7 +366,7 @@ class ModelHandler:
         # Find active sejr folders
         for sejr_folder in active_dir.iterdir():
             if sejr_folder.is_dir():
-                auto_log = sejr_folder / "AUTO_LOG.jsonl"
+                auto_log = sejr_folder / LOG_FILENAME
                 if auto_log.exists():
                     try:
                         log_entry = {
@@ -377,8 +377,7 @@ class ModelHandler:
                             "duration_ms": entry["duration_ms"],
                             "success": entry["success"],
                         }
-                        with open(auto_log, "a") as f:
-                            f.write(json.dumps(log_entry) + "\n")
+                        append_entry(sejr_folder, log_entry)
                     except Exception as e:
                         logger.warning(f"Could not log to AUTO_LOG: {e}")
 
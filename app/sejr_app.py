@@ -23,8 +23,6 @@ Keyboard Shortcuts (Fra Plan):
 from __future__ import annotations
 import os
 import sys
-import json
-import yaml
 import asyncio
 import subprocess
 from pathlib import Path
@@ -53,6 +51,17 @@ ARCHIVE_PATH = BASE_PATH / "90_ARCHIVE"
 CURRENT_PATH = BASE_PATH / "_CURRENT"
 DNA_FILE = BASE_PATH / "DNA.yaml"
 
+CARD_ROWS = 6      # .sejr-card height (5) + margin-bottom (1)
+CARD_OVERSCAN = 4  # Cards mounted above/below the viewport
+
+sys.path.insert(0, str(BASE_PATH))
+from sejr_index import get_index  # Shared on-disk index (_CURRENT/sejr_index.db)
+from grid_window import clamp_selection, reconcile, spacer_heights, visible_range  # Pure grid arithmetic
+from auto_log import latest_entries  # Segmented AUTO_LOG (reads only the newest segment)
+from app.watcher import watch_files  # Coalesced live updates (sejr daemon or watchdog)
+
+SEJR_INDEX = get_index(BASE_PATH)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # STEAM-STYLE CSS - Dark Theme with Accent Colors
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -112,7 +121,7 @@ Screen {
     border: solid #66c0f4;
 }
 
-.sejr-card:focus {
+.sejr-card:focus, .sejr-card.-selected {
     background: #1a9fff;
     border: solid white;
 }
@@ -277,7 +286,7 @@ Footer {
 
 class Sejr:
     """Represents a single Sejr (Victory) project"""
-    def __init__(self, path: Path, is_archived: bool = False):
+    def __init__(self, path: Path, is_archived: bool = False, record: Optional[dict] = None):
         self.path = path
         self.name = path.name
         self.is_archived = is_archived
@@ -286,42 +295,35 @@ class Sejr:
         self.phase = "UNKNOWN"
         self.tasks_total = 0
         self.tasks_done = 0
-        self.load_status()
+        self.load_status(record)
     
-    def load_status(self):
-        """Load status from STATUS.yaml (unified v3.0.0)"""
-        status_file = self.path / "STATUS.yaml"
-        if status_file.exists():
-            try:
-                with open(status_file) as f:
-                    data = yaml.safe_load(f) or {}
-                    # Handle both nested (v3.0.0) and flat (legacy) formats
-                    if isinstance(data.get("statistics"), dict):
-                        self.progress = data["statistics"].get("completion_percentage", 0)
-                    else:
-                        self.progress = data.get("completion_percentage", 0)
-                    if isinstance(data.get("score_tracking"), dict):
-                        self.score = f"{data['score_tracking'].get('totals', {}).get('total_score', 0)}/30"
-                    else:
-                        self.score = f"{data.get('current_score', 0)}/30"
-                    if isinstance(data.get("pass_tracking"), dict):
-                        self.phase = f"Pass {data['pass_tracking'].get('current_pass', 1)}"
-                    else:
-                        self.phase = data.get("current_phase", "UNKNOWN")
-            except Exception:
-                pass
+    def load_status(self, record: Optional[dict] = None):
+        """Load status from the shared sejr index (STATUS.yaml unified v3.0.0)"""
+        if record is None:
+            record = SEJR_INDEX.get(self.path)
+        data = record.get("status") or {}
+        try:
+            # Handle both nested (v3.0.0) and flat (legacy) formats
+            if isinstance(data.get("statistics"), dict):
+                self.progress = data["statistics"].get("completion_percentage", 0)
+            else:
+                self.progress = data.get("completion_percentage", 0)
+            if isinstance(data.get("score_tracking"), dict):
+                self.score = f"{data['score_tracking'].get('totals', {}).get('total_score', 0)}/30"
+            else:
+                self.score = f"{data.get('current_score', 0)}/30"
+            if isinstance(data.get("pass_tracking"), dict):
+                self.phase = f"Pass {data['pass_tracking'].get('current_pass', 1)}"
+            else:
+                self.phase = data.get("current_phase", "UNKNOWN")
+        except Exception:
+            pass
         
-        # Count tasks from SEJR_LISTE.md
-        sejr_file = self.path / "SEJR_LISTE.md"
-        if sejr_file.exists():
-            try:
-                content = sejr_file.read_text()
-                self.tasks_total = content.count("- [ ]") + content.count("- [x]")
-                self.tasks_done = content.count("- [x]")
-                if self.tasks_total > 0:
-                    self.progress = (self.tasks_done / self.tasks_total) * 100
-            except Exception:
-                pass
+        # Task counts from SEJR_LISTE.md (counted once per change by the index)
+        self.tasks_total = record.get("checkboxes_total", 0)
+        self.tasks_done = record.get("checkboxes_done", 0)
+        if self.tasks_total > 0:
+            self.progress = (self.tasks_done / self.tasks_total) * 100
 
     @property
     def status_class(self) -> str:
@@ -329,6 +331,17 @@ class Sejr:
             return "sejr-status-archived"
         return "sejr-status-active"
 
+    @property
+    def key(self) -> str:
+        """Stable identity for the grid (same folder -> same card)"""
+        return str(self.path)
+
+    @property
+    def render_key(self) -> tuple:
+        """Everything a SejrCard shows; the card is only updated when this changes"""
+        return (self.is_archived, int(self.progress), self.score, self.phase,
+                self.tasks_done, self.tasks_total)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # LIBRARY SCREEN - Steam-like game library
@@ -358,39 +371,123 @@ class SejrCard(Static):
     def __init__(self, sejr: Sejr) -> None:
         super().__init__()
         self.sejr = sejr
+        self._shown = sejr.render_key
         self.classes = "sejr-card"
     
-    def compose(self) -> ComposeResult:
+    def card_lines(self) -> List[str]:
         status_icon = "[VICTORY]" if self.sejr.is_archived else ""
         progress_bar = "█" * int(self.sejr.progress / 10) + "░" * (10 - int(self.sejr.progress / 10))
-        
-        yield Static(f"{status_icon} {self.sejr.name}", classes="sejr-title")
-        yield Static(f"   [{progress_bar}] {self.sejr.progress:.0f}% | Score: {self.sejr.score}", classes="sejr-progress")
-        yield Static(f"   Phase: {self.sejr.phase} | Tasks: {self.sejr.tasks_done}/{self.sejr.tasks_total}", classes=self.sejr.status_class)
+        return [
+            f"{status_icon} {self.sejr.name}",
+            f"   [{progress_bar}] {self.sejr.progress:.0f}% | Score: {self.sejr.score}",
+            f"   Phase: {self.sejr.phase} | Tasks: {self.sejr.tasks_done}/{self.sejr.tasks_total}",
+        ]
+    
+    def compose(self) -> ComposeResult:
+        title, progress, status = self.card_lines()
+        yield Static(title, classes="sejr-title")
+        yield Static(progress, classes="sejr-progress")
+        yield Static(status, classes=self.sejr.status_class)
+    
+    def update_sejr(self, sejr: Sejr) -> bool:
+        """Point the card at fresh data; re-render the lines only if they changed"""
+        self.sejr = sejr
+        if sejr.render_key == self._shown:
+            return False
+        self._shown = sejr.render_key
+        for line, text in zip(self.query(Static), self.card_lines()):
+            line.update(text)
+        return True
 
 
 class SejrGrid(ScrollableContainer):
-    """Grid of Sejr cards - like Steam's game grid"""
+    """Grid of Sejr cards - like Steam's game grid
+    
+    Virtualized: only the cards in (and just around) the viewport are
+    mounted; spacers stand in for the rest. sync() reconciles by sejr key,
+    so a reload touches only cards whose data changed.
+    """
     
     def __init__(self, sejrs: List[Sejr]) -> None:
         super().__init__()
         self.sejrs = sejrs
         self.selected_index = 0
+        self._cards: Dict[str, SejrCard] = {}
+        self._window = None
     
     def compose(self) -> ComposeResult:
-        if not self.sejrs:
-            yield Static("Ingen sejr fundet. Tryk 'n' for at oprette ny.", classes="library-category")
-        else:
-            for sejr in self.sejrs:
-                yield SejrCard(sejr)
+        yield Static("Ingen sejr fundet. Tryk 'n' for at oprette ny.", id="grid-empty", classes="library-category")
+        yield Static(id="grid-top")
+        yield Static(id="grid-bottom")
+    
+    def on_mount(self) -> None:
+        self._render_window()
+    
+    def on_resize(self) -> None:
+        self._render_window()
+    
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        self._render_window()
+    
+    def sync(self, sejrs: List[Sejr]) -> None:
+        """Reconcile mounted cards with a new list of sejr"""
+        self.sejrs = sejrs
+        self.selected_index = clamp_selection(self.selected_index, len(sejrs))
+        for sejr in sejrs:
+            card = self._cards.get(sejr.key)
+            if card is not None:
+                card.update_sejr(sejr)
+        self._window = None
+        self._render_window()
+    
+    def _visible_range(self) -> tuple:
+        return visible_range(self.scroll_y, self.size.height, len(self.sejrs), CARD_ROWS, CARD_OVERSCAN)
+    
+    def _render_window(self) -> None:
+        if not self.is_mounted:
+            return
+        window = self._visible_range()
+        if window == self._window:
+            return
+        self._window = window
+        first, last = window
+        wanted = self.sejrs[first:last]
+        stale, _ = reconcile(self._cards, [sejr.key for sejr in wanted])
+        
+        for key in stale:
+            self._cards.pop(key).remove()
+        
+        top, bottom = self.query_one("#grid-top"), self.query_one("#grid-bottom")
+        previous = top
+        for sejr in wanted:
+            card = self._cards.get(sejr.key)
+            if card is None:
+                card = self._cards[sejr.key] = SejrCard(sejr)
+                self.mount(card, after=previous)
+            elif self.children.index(card) != self.children.index(previous) + 1:
+                self.move_child(card, after=previous)
+            card.set_class(sejr is self.selected_sejr, "-selected")
+            previous = card
+        
+        top.styles.height, bottom.styles.height = spacer_heights(first, last, len(self.sejrs), CARD_ROWS)
+        self.query_one("#grid-empty").display = not self.sejrs
+    
+    def _select(self, index: int) -> None:
+        self.selected_index = index
+        y = index * CARD_ROWS
+        if y < self.scroll_y or y + CARD_ROWS > self.scroll_y + self.size.height:
+            self.scroll_to(y=y, animate=False)
+        for card in self._cards.values():
+            card.set_class(card.sejr is self.selected_sejr, "-selected")
     
     def select_next(self):
         if self.sejrs:
-            self.selected_index = min(self.selected_index + 1, len(self.sejrs) - 1)
+            self._select(min(self.selected_index + 1, len(self.sejrs) - 1))
     
     def select_prev(self):
         if self.sejrs:
-            self.selected_index = max(self.selected_index - 1, 0)
+            self._select(max(self.selected_index - 1, 0))
     
     @property
     def selected_sejr(self) -> Optional[Sejr]:
@@ -465,17 +562,13 @@ class LogStreamWidget(RichLog):
         self.sejr_path = sejr_path
     
     def load_recent_logs(self, count: int = 10):
-        log_file = self.sejr_path / "AUTO_LOG.jsonl"
-        if log_file.exists():
-            lines = log_file.read_text().strip().split("\n")[-count:]
-            for line in lines:
-                try:
-                    entry = json.loads(line)
-                    ts = entry.get("timestamp", "")[:19]
-                    action = entry.get("action", "unknown")
-                    self.write(f"[dim]{ts}[/] [cyan]{action}[/]")
-                except Exception:
-                    pass
+        for entry in latest_entries(self.sejr_path, count):
+            try:
+                ts = entry.get("timestamp", "")[:19]
+                action = entry.get("action", "unknown")
+                self.write(f"[dim]{ts}[/] [cyan]{action}[/]")
+            except Exception:
+                pass
 
 
 class ProductionRoom(Container):
@@ -617,6 +710,8 @@ class SejrlisteApp(App):
     def on_mount(self) -> None:
         """Called when app is mounted - safe to use set_interval here."""
         self.set_interval(1.0, self.update_session_timer)
+        # Live updates: sejr daemon pushes, or a local watchdog observer without it
+        self.run_worker(watch_files(self), name="watcher", group="watcher", exclusive=True)
 
     def get_session_duration(self) -> str:
         """Get formatted session duration"""
@@ -653,17 +748,33 @@ class SejrlisteApp(App):
         self.sejrs = []
         
         # Active sejr
-        if ACTIVE_PATH.exists():
-            for folder in ACTIVE_PATH.iterdir():
-                if folder.is_dir() and not folder.name.startswith("."):
-                    self.sejrs.append(Sejr(folder, is_archived=False))
+        for record in SEJR_INDEX.scan_dir(ACTIVE_PATH):
+            self.sejrs.append(Sejr(Path(record["path"]), is_archived=False, record=record))
         
         # Archived sejr (if showing)
-        if self.show_archived and ARCHIVE_PATH.exists():
-            for folder in sorted(ARCHIVE_PATH.iterdir(), reverse=True)[:10]:  # Last 10
-                if folder.is_dir() and not folder.name.startswith("."):
-                    self.sejrs.append(Sejr(folder, is_archived=True))
-    
+        if self.show_archived:
+            records = sorted(SEJR_INDEX.scan_dir(ARCHIVE_PATH), key=lambda r: r["name"], reverse=True)
+            for record in records[:10]:  # Last 10
+                self.sejrs.append(Sejr(Path(record["path"]), is_archived=True, record=record))
+
+    def reload_sejrs(self, names, structural: bool = False):
+        """Reload only the named active sejr (from a watcher ChangeBatch).
+
+        Falls back to a full load_sejrs() when sejr folders came or went.
+        """
+        loaded = {sejr.name: sejr for sejr in self.sejrs if not sejr.is_archived}
+        if structural or any(name not in loaded or not loaded[name].path.is_dir() for name in names):
+            self.load_sejrs()
+        else:
+            for name in names:
+                loaded[name].load_status()
+        self.sync_grid()
+
+    def sync_grid(self):
+        """Push self.sejrs to the mounted grid (only changed cards re-render)"""
+        for grid in self.query(SejrGrid):
+            grid.sync(self.sejrs)
+
     def compose(self) -> ComposeResult:
         yield Header()
         
@@ -734,6 +845,7 @@ class SejrlisteApp(App):
                 self.notify(f"[FAIL] Verification failed: {result.stderr[:100]}", severity="error")
                 self.play_sound("error")
             self.load_sejrs()
+            self.sync_grid()
             self.refresh()
     
     @work(exclusive=True)
@@ -755,6 +867,7 @@ class SejrlisteApp(App):
                 self.notify(f"[FAIL] Archive failed: {result.stderr[:100]}", severity="error")
                 self.play_sound("error")
             self.load_sejrs()
+            self.sync_grid()
             self.refresh()
     
     @work(exclusive=True)
@@ -796,11 +909,13 @@ class SejrlisteApp(App):
                 self.notify(f"[FAIL] Create failed: {result.stderr[:100]}", severity="error")
                 self.play_sound("error")
             self.load_sejrs()
+            self.sync_grid()
             self.refresh()
     
     def action_refresh(self):
         """Refresh all data"""
         self.load_sejrs()
+        self.sync_grid()
         self.notify("[SYNC] Data refreshed", severity="information")
         self.refresh()
     
@@ -808,12 +923,14 @@ class SejrlisteApp(App):
     def show_active(self):
         self.show_archived = False
         self.load_sejrs()
+        self.sync_grid()
         self.refresh()
     
     @on(Button.Pressed, "#btn-archived")
     def show_archived_sejr(self):
         self.show_archived = True
         self.load_sejrs()
+        self.sync_grid()
         self.refresh()
     
     @on(Button.Pressed, "#btn-verify")
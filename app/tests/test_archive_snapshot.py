@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the packed archive snapshot (archive_snapshot.py).
+
+Tests:
+1. Records carry scores, checkbox totals, learnings and flags
+2. Records survive a write/read round-trip through the packed file
+3. Changed archive folders are re-read, removed ones dropped
+4. A truncated tail (interrupted append) is ignored
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from archive_snapshot import ArchiveSnapshot
+
+
+STATUS = """pass_tracking:
+  pass_1: {complete: true, score: 8}
+  pass_2: {complete: true, score: 9}
+  pass_3: {complete: true, score: 10}
+score_tracking:
+  totals: {total_score: 27}
+"""
+
+CONCLUSION = """# CONCLUSION
+
+## Hvad Lærte Vi
+Altid kør tests før arkivering.
+
+## Hvad Kan Genbruges
+- scripts/auto_verify.py
+
+All 12 tests passed.
+"""
+
+
+class TestArchiveSnapshot(unittest.TestCase):
+    """Test cases for ArchiveSnapshot."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.system = Path(self.tmp.name)
+        self.archive = self.system / "90_ARCHIVE"
+        self.folder = self._make_archive("FIRST_2026-01-01_20260101_120000")
+        self.snapshot = ArchiveSnapshot(self.system)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _make_archive(self, name: str) -> Path:
+        folder = self.archive / name
+        folder.mkdir(parents=True)
+        (folder / "STATUS.yaml").write_text(STATUS, encoding="utf-8")
+        (folder / "CONCLUSION.md").write_text(CONCLUSION, encoding="utf-8")
+        (folder / "SEJR_LISTE.md").write_text("- [x] a\n- [x] b\n- [ ] c\n", encoding="utf-8")
+        (folder / "ARCHIVE_METADATA.yaml").write_text(
+            "archived_at: '2026-01-01T12:00:00'\nthree_pass_verified: true\n", encoding="utf-8")
+        return folder
+
+    def test_record_fields(self):
+        """Test that a record summarizes the archive folder."""
+        (record,) = self.snapshot.records()
+        self.assertEqual(record.total_score, 27)
+        self.assertEqual((record.pass_1_score, record.pass_2_score, record.pass_3_score), (8, 9, 10))
+        self.assertEqual((record.checkboxes_done, record.checkboxes_total), (2, 3))
+        self.assertEqual(record.tests_passed, 12)
+        self.assertTrue(record.has_conclusion and record.three_pass_verified)
+        self.assertFalse(record.has_diplom)
+        self.assertEqual(record.extras["learnings"], ["Altid kør tests før arkivering."])
+        self.assertEqual(record.extras["reusable"], ["scripts/auto_verify.py"])
+
+    def test_round_trip_without_rebuild(self):
+        """Test that a second reader gets identical records from the file only."""
+        first = self.snapshot.records()
+        reader = ArchiveSnapshot(self.system)
+        second = reader.records()
+        self.assertEqual(reader.build_count, 0)
+        self.assertEqual([(r.name, r.total_score, r.extras) for r in first],
+                         [(r.name, r.total_score, r.extras) for r in second])
+
+    def test_append_and_invalidation(self):
+        """Test append, re-read of changed folders and removal of deleted ones."""
+        self.snapshot.records()
+        second = self._make_archive("SECOND_2026-01-02_20260102_120000")
+        self.snapshot.append(second)
+        self.assertEqual(set(self.snapshot.read()), {self.folder.name, second.name})
+
+        (self.folder / "SEJR_DIPLOM.md").write_text("SCORE: 27/30\nRANG: ADMIRAL\n", encoding="utf-8")
+        (self.archive / second.name / "STATUS.yaml").unlink()
+        (self.archive / second.name / "CONCLUSION.md").unlink()
+        (self.archive / second.name / "SEJR_LISTE.md").unlink()
+        (self.archive / second.name / "ARCHIVE_METADATA.yaml").unlink()
+        (self.archive / second.name).rmdir()
+
+        reader = ArchiveSnapshot(self.system)
+        (record,) = reader.records()
+        self.assertEqual(reader.build_count, 1)
+        self.assertTrue(record.has_diplom)
+        self.assertEqual(record.extras["diplom_rank"], "ADMIRAL")
+        self.assertEqual(list(reader.read()), [self.folder.name])
+
+    def test_truncated_tail_ignored(self):
+        """Test that a half-written record at the end is skipped."""
+        self.snapshot.records()
+        with open(self.snapshot.path, "ab") as f:
+            f.write(b"\xff\x00\x00\x00partial")
+        self.assertEqual(list(self.snapshot.read()), [self.folder.name])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Unit tests for incremental learning (scripts/auto_learn.py).
+
+Tests:
+1. First run stores state whose aggregates match a full identify_patterns
+2. A run without new archives is a no-op
+3. A new archive is merged into the stored aggregates
+4. A removed archive triggers a re-merge from stored results
+5. Paraphrased learnings cluster into one pattern with support
+6. NumPy and pure-Python clustering agree
+7. Paraphrases of stored patterns strengthen instead of append
+8. learn_from_completed returns a structured result
+9. A run that learns nothing new leaves PATTERNS.json/.yaml untouched
+10. A new archive is clustered against stored leaders and only its log is synced
+"""
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import auto_learn
+import text_similarity
+
+
+CONCLUSION = """# CONCLUSION
+
+## Hvad Lærte Vi
+Altid kør auto_verify.py før arkivering af sejr {n}.
+
+## Hvad Kan Genbruges
+- Script: auto_verify.py version {n}
+
+### Pass 1 → Pass 2 Forbedring
+Flere tests tilføjet i pass 2 for sejr {n}
+"""
+
+
+class TestIncrementalLearn(unittest.TestCase):
+    """Test cases for learn_from_completed."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.system = Path(self.tmp.name)
+        (self.system / "_CURRENT").mkdir()
+        for n in range(3):
+            self._make_archive(n)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _make_archive(self, n: int) -> Path:
+        folder = self.system / "90_ARCHIVE" / f"SEJR_{n}_20260101_12000{n}"
+        folder.mkdir(parents=True)
+        (folder / "CONCLUSION.md").write_text(CONCLUSION.format(n=n), encoding="utf-8")
+        (folder / "STATUS.yaml").write_text("total_score: 28\n", encoding="utf-8")
+        return folder
+
+    def _learn(self) -> str:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            auto_learn.learn_from_completed(self.system)
+        return out.getvalue()
+
+    def test_first_run_matches_full(self):
+        """Test that stored aggregates give the same patterns as a full pass."""
+        self._learn()
+        state = auto_learn.load_learn_state(self.system)
+        self.assertEqual(len(state["archives"]), 3)
+        self.assertEqual(state["aggregates"]["sejr_count"], 3)
+        full = auto_learn.identify_patterns([a["data"] for _, a in sorted(state["archives"].items())])
+        incremental = auto_learn.patterns_from_aggregates(state["aggregates"])
+        self.assertEqual([p["pattern"] for p in full], [p["pattern"] for p in incremental])
+
+    def test_no_new_archives_is_noop(self):
+        """Test that a second run without changes does nothing."""
+        self._learn()
+        state_file = self.system / "_CURRENT" / auto_learn.LEARN_STATE_FILE
+        before = state_file.stat().st_mtime_ns
+        self.assertIn("Ingen nye arkiver", self._learn())
+        self.assertEqual(state_file.stat().st_mtime_ns, before)
+
+    def test_structured_result(self):
+        """Test that learn_from_completed returns counts and patterns for in-process callers."""
+        with redirect_stdout(io.StringIO()):
+            first = auto_learn.learn_from_completed(self.system)
+            second = auto_learn.learn_from_completed(self.system)
+        self.assertEqual((first["new"], first["total"]), (3, 3))
+        self.assertTrue(first["patterns"])
+        self.assertEqual(second, {"new": 0, "total": 3, "patterns": None})
+
+    def test_new_archive_merged(self):
+        """Test that only the new archive is processed and merged."""
+        self._learn()
+        self._make_archive(3)
+        output = self._learn()
+        self.assertIn("Learning from 1 new of 4", output)
+        aggregates = auto_learn.load_learn_state(self.system)["aggregates"]
+        self.assertEqual(aggregates["sejr_count"], 4)
+        self.assertEqual(len(aggregates["reusable_by_type"]["Script"]), 4)
+        self.assertEqual(aggregates["improvement_keywords"]["tests"], 4)
+
+    def test_new_archive_touches_only_new_data(self):
+        """Test that a new archive joins the stored clusters and syncs only its own log."""
+        self._learn()
+        clusters = auto_learn.load_learn_state(self.system)["aggregates"]["clusters"]
+        self.assertEqual(len(clusters), 1)
+        self._make_archive(3)
+        with mock.patch.object(auto_learn, "cluster_texts") as batch, \
+                mock.patch("event_store.EventStore.sync_folders", autospec=True) as sync:
+            self._learn()
+        batch.assert_not_called()
+        self.assertEqual([Path(f).name for f in sync.call_args[0][1]], ["SEJR_3_20260101_120003"])
+        aggregates = auto_learn.load_learn_state(self.system)["aggregates"]
+        self.assertEqual([c["support"] for c in aggregates["clusters"]], [4])
+        self.assertEqual(aggregates["clustered"], 4)
+
+    def test_removed_archive_remerged(self):
+        """Test that a removed archive is dropped from the aggregates."""
+        self._learn()
+        shutil.rmtree(self.system / "90_ARCHIVE" / "SEJR_0_20260101_120000")
+        self._learn()
+        state = auto_learn.load_learn_state(self.system)
+        self.assertEqual(sorted(state["archives"]), ["SEJR_1_20260101_120001", "SEJR_2_20260101_120002"])
+        self.assertEqual(state["aggregates"]["sejr_count"], 2)
+
+
+PARAPHRASES = [
+    "1. 3-pass systemet TVINGER forbedring - score SKAL stige mellem passes.",
+    "Regex i parseren skal altid testes mod tomme linjer",
+    "4. **3-pass systemet** tvinger forbedring - score skal stige fra pass til pass",
+    "3-pass systemet tvinger forbedring, score skal stige mellem alle passes",
+]
+
+
+class TestSemanticClustering(unittest.TestCase):
+    """Test cases for extract_semantic_patterns and text_similarity."""
+
+    def test_paraphrases_clustered(self):
+        """Test that paraphrases become one pattern whose support drives confidence."""
+        patterns = auto_learn.extract_semantic_patterns(PARAPHRASES)
+        workflow = [p for p in patterns if p['category'] == 'WORKFLOW']
+        self.assertEqual(len(workflow), 2)
+        self.assertEqual(workflow[0]['support'], 3)
+        self.assertIn("3-pass systemet TVINGER", workflow[0]['pattern'])
+        self.assertEqual(workflow[0]['confidence'], auto_learn.support_confidence(0.9, 3))
+        self.assertGreater(workflow[0]['confidence'], workflow[1]['confidence'])
+
+    @unittest.skipIf(text_similarity.np is None, "numpy not installed")
+    def test_numpy_matches_python(self):
+        """Test that both similarity paths produce the same clusters."""
+        texts = PARAPHRASES * 3 + [f"Unik læring nummer {i} om emne {i * 7}" for i in range(20)]
+        self.assertEqual(text_similarity.cluster_texts(texts, use_numpy=True),
+                         text_similarity.cluster_texts(texts, use_numpy=False))
+
+    def test_paraphrase_not_appended(self):
+        """Test that update_patterns_yaml merges a paraphrase into the stored pattern."""
+        with tempfile.TemporaryDirectory() as tmp:
+            system = Path(tmp)
+            (system / "_CURRENT").mkdir()
+            first = auto_learn.extract_semantic_patterns(PARAPHRASES[:1])
+            second = auto_learn.extract_semantic_patterns(PARAPHRASES[2:])
+            with redirect_stdout(io.StringIO()):
+                auto_learn.update_patterns_yaml(system, first)
+                auto_learn.update_patterns_yaml(system, second)
+            stored = json.loads((system / "_CURRENT" / "PATTERNS.json").read_text(encoding="utf-8"))
+            self.assertEqual(len(stored['learned_patterns']), 1)
+            self.assertEqual(stored['learned_patterns'][0]['support'], 2)
+
+    def test_unchanged_patterns_not_rewritten(self):
+        """Test that re-learning the same patterns does not touch the watched files."""
+        with tempfile.TemporaryDirectory() as tmp:
+            system = Path(tmp)
+            (system / "_CURRENT").mkdir()
+            patterns = auto_learn.extract_semantic_patterns(PARAPHRASES[:1])
+            files = [system / "_CURRENT" / "PATTERNS.json", system / "_CURRENT" / "PATTERNS.yaml"]
+            with redirect_stdout(io.StringIO()):
+                auto_learn.update_patterns_yaml(system, patterns)
+                for path in files:
+                    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+                auto_learn.update_patterns_yaml(system, patterns)
+            self.assertEqual([p.stat().st_mtime_ns for p in files], [1_000_000_000] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
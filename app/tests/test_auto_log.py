@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the segmented AUTO_LOG (auto_log.py).
+
+Tests:
+1. Size-based rotation seals compressed segments with a manifest
+2. Latest entries and action counts span hot and cold segments
+3. Time-range reads skip segments outside the range
+4. Age-based rotation and compaction of small segments
+5. Interrupted rotations are sealed on the next rotation
+"""
+
+import gzip
+import json
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import auto_log
+from auto_log import (action_counts, append_entry, compact, latest_entries,
+                      load_manifest, read_entries, rotate)
+
+
+class TestAutoLog(unittest.TestCase):
+    """Test cases for the segmented AUTO_LOG store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sejr = Path(self.tmp.name)
+        self.seg_dir = self.sejr / auto_log.SEGMENT_DIRNAME
+        # Fixed January timestamps: only rotate on age where a test asks for it
+        patcher = mock.patch.object(auto_log, "SEGMENT_MAX_AGE", timedelta(days=100000))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fill(self, days, per_day=3):
+        for day in days:
+            for i in range(per_day):
+                append_entry(self.sejr, {"timestamp": f"2026-01-{day:02d}T10:00:0{i}",
+                                         "action": "verify" if i else "start"})
+
+    def test_size_rotation(self):
+        """Test that a full hot segment is compressed and listed in the manifest."""
+        with mock.patch.object(auto_log, "SEGMENT_MAX_BYTES", 200):
+            self._fill([1, 2, 3])
+        segments = load_manifest(self.sejr)
+        self.assertGreaterEqual(len(segments), 2)
+        self.assertEqual(len(list(read_entries(self.sejr))), 9)
+        first = segments[0]
+        with gzip.open(self.seg_dir / first["file"], "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        self.assertEqual(len(lines), first["count"])
+        self.assertEqual(first["first_ts"], "2026-01-01T10:00:00")
+        # The newest entry always stays in the hot file for tail readers
+        hot = (self.sejr / auto_log.LOG_FILENAME).read_text(encoding="utf-8")
+        self.assertIn("2026-01-03T10:00:02", hot)
+
+    def test_latest_and_counts_span_segments(self):
+        """Test that latest_entries and action_counts include cold segments."""
+        with mock.patch.object(auto_log, "SEGMENT_MAX_BYTES", 200):
+            self._fill([1, 2, 3])
+        latest = latest_entries(self.sejr, 9)
+        self.assertEqual([e["timestamp"][8:10] for e in latest], ["01"] * 3 + ["02"] * 3 + ["03"] * 3)
+        self.assertEqual(latest_entries(self.sejr, 2)[-1]["timestamp"], "2026-01-03T10:00:02")
+        self.assertEqual(action_counts(self.sejr), {"start": 3, "verify": 6})
+
+    def test_time_range_skips_segments(self):
+        """Test that segments outside the range are never opened."""
+        for day in (1, 2, 3):
+            self._fill([day])
+            rotate(self.sejr)
+        self._fill([4])
+        opened = []
+        real = auto_log._read_segment
+        with mock.patch.object(auto_log, "_read_segment",
+                               side_effect=lambda d, name: opened.append(name) or real(d, name)):
+            entries = list(read_entries(self.sejr, since="2026-01-02", until="2026-01-02"))
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(len(opened), 1)
+        self.assertEqual(len(list(read_entries(self.sejr, since="2026-01-03"))), 6)
+
+    def test_age_rotation_and_compaction(self):
+        """Test that old hot segments rotate and small segments are merged."""
+        old = (datetime.now() - timedelta(days=30)).isoformat()
+        with mock.patch.object(auto_log, "SEGMENT_MAX_AGE", timedelta(days=7)):
+            append_entry(self.sejr, {"timestamp": old, "action": "start"})
+            append_entry(self.sejr, {"timestamp": datetime.now().isoformat(), "action": "verify"})
+        self.assertEqual([s["count"] for s in load_manifest(self.sejr)], [1])
+
+        for day in range(1, 7):
+            self._fill([day], per_day=1)
+            rotate(self.sejr)
+        segments = load_manifest(self.sejr)
+        self.assertLess(len(segments), 7)
+        self.assertEqual(sum(s["count"] for s in segments), 8)
+        self.assertEqual(action_counts(self.sejr), {"start": 7, "verify": 1})
+        files = sorted(p.name for p in self.seg_dir.glob("*.gz"))
+        self.assertEqual(files, sorted(s["file"] for s in segments))
+        self.assertEqual(compact(self.sejr), 0)
+
+    def test_interrupted_rotation_recovered(self):
+        """Test that a raw segment left by a crash is sealed later."""
+        self.seg_dir.mkdir()
+        (self.seg_dir / "000001.jsonl").write_text('{"timestamp": "2026-01-01T09:00:00", "action": "old"}\n')
+        self._fill([2])
+        rotate(self.sejr)
+        self.assertEqual([s["count"] for s in load_manifest(self.sejr)], [1, 3])
+        self.assertEqual(list(self.seg_dir.glob("*.jsonl")), [])
+        self.assertEqual(latest_entries(self.sejr, 4)[0]["action"], "old")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the verify cache and parallel --all (scripts/auto_verify.py).
+
+Tests:
+1. Editing one SEJR_LISTE.md re-verifies only that sejr (serial and --jobs)
+2. Cache entries from another VERIFIER_VERSION are not trusted
+"""
+
+import io
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Add scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import auto_verify
+
+
+SEJR_CONTENT = """# SEJR: {name}
+
+## PASS 1: FUNGERENDE
+- [x] Step one
+- [ ] Step two
+"""
+
+
+class TestVerifyCache(unittest.TestCase):
+    """Test cases for verify_all with the content-hash cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.system = Path(self.tmp)
+        for name in ("SEJR_A", "SEJR_B", "SEJR_C"):
+            folder = self.system / "10_ACTIVE" / name
+            folder.mkdir(parents=True)
+            (folder / "SEJR_LISTE.md").write_text(SEJR_CONTENT.format(name=name), encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _verified(self, jobs=1):
+        """Names verified (not served from the cache) by one --all run."""
+        with redirect_stdout(io.StringIO()):
+            summary = auto_verify.verify_all(self.system, jobs=jobs)
+        return sorted(name for name, r in summary["results"].items() if not r["cached"])
+
+    def _edit(self, name):
+        sejr_file = self.system / "10_ACTIVE" / name / "SEJR_LISTE.md"
+        sejr_file.write_text(sejr_file.read_text(encoding="utf-8") + "- [x] Step three\n",
+                             encoding="utf-8")
+
+    def test_only_edited_sejr_reverified(self):
+        self.assertEqual(self._verified(jobs=2), ["SEJR_A", "SEJR_B", "SEJR_C"])
+        self.assertTrue((self.system / "10_ACTIVE" / "SEJR_B" / "STATUS.yaml").exists())
+        self.assertEqual(self._verified(jobs=2), [])
+
+        self._edit("SEJR_B")
+        self.assertEqual(self._verified(), ["SEJR_B"])
+        self.assertEqual(self._verified(), [])
+
+        self._edit("SEJR_A")
+        self._edit("SEJR_C")
+        self.assertEqual(self._verified(jobs=2), ["SEJR_A", "SEJR_C"])
+        self.assertEqual(self._verified(jobs=2), [])
+
+    def test_verifier_version_invalidates(self):
+        self._verified()
+        cache = json.loads((self.system / "_CURRENT" / auto_verify.VERIFY_CACHE_FILE).read_text())
+        self.assertEqual({e["verifier"] for e in cache.values()}, {auto_verify.VERIFIER_VERSION})
+
+        with mock.patch.object(auto_verify, "VERIFIER_VERSION", "changed"):
+            self.assertEqual(self._verified(), ["SEJR_A", "SEJR_B", "SEJR_C"])
+            self.assertEqual(self._verified(), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the cross-sejr activity store (event_store.py).
+
+Tests:
+1. Sync imports AUTO_LOG and enforcement events once
+2. Appends are imported incrementally; rotation does not duplicate
+3. Writers through auto_log are recorded directly
+4. Query filters and grouped counts
+5. Archiving (folder renamed into 90_ARCHIVE) does not double-count events
+"""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import auto_log
+from auto_archive import archive_sejr
+from event_store import EventStore, get_event_store
+
+
+class TestEventStore(unittest.TestCase):
+    """Test cases for EventStore."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.system = Path(self.tmp.name)
+        self.sejr = self.system / "10_ACTIVE" / "SEJR_A"
+        self.sejr.mkdir(parents=True)
+        self.log = self.sejr / "AUTO_LOG.jsonl"
+        self.store = EventStore(self.system)
+
+    def tearDown(self):
+        self.store.close()
+        get_event_store(self.system).close()
+        self.tmp.cleanup()
+
+    def _write(self, *entries):
+        with open(self.log, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+
+    def test_sync_imports_once(self):
+        """Test that logs and enforcement state are imported without duplicates."""
+        # The repeated byte-identical entry is stored once (content digest, no offset)
+        self._write({"timestamp": "2026-01-01T10:00:00", "action": "create"},
+                    {"timestamp": "2026-01-01T10:00:00", "action": "create"},
+                    {"timestamp": "2026-01-01T11:00:00", "action": "verify", "model": "haiku"})
+        (self.sejr / "ENFORCEMENT_STATE.json").write_text(json.dumps({"enforcement_log": [
+            {"timestamp": "2026-01-01T12:00:00", "action": "checkpoint_verified", "checkpoint_id": "cp1"}]}))
+        self.assertEqual(self.store.sync(), 3)
+        self.assertEqual(self.store.sync(), 0)
+        self.assertEqual(self.store.count_by("source"), {"auto_log": 2, "enforcement": 1})
+
+    def test_incremental_and_rotation(self):
+        """Test that only appended lines are read and rotation re-imports safely."""
+        self._write({"timestamp": "2026-01-01T10:00:00", "action": "create"})
+        self.store.sync()
+        self._write({"timestamp": "2026-01-02T10:00:00", "action": "verify"})
+        with open(self.log, "a", encoding="utf-8") as f:
+            f.write('{"timestamp": "2026-01-03T10:00:00", "act')  # Half-written line
+        self.assertEqual(self.store.sync(), 1)
+        with open(self.log, "a", encoding="utf-8") as f:
+            f.write('ion": "test"}\n')
+        self.assertEqual(self.store.sync(), 1)
+        auto_log.rotate(self.sejr)
+        self._write({"timestamp": "2026-01-04T10:00:00", "action": "archive"})
+        self.assertEqual(self.store.sync(), 1)
+        self.assertEqual(len(self.store.query(limit=None)), 4)
+
+    def test_writers_record_directly(self):
+        """Test that auto_log.append_entry writes to the store without a sync."""
+        auto_log.append_entry(self.sejr, {"timestamp": "2026-01-05T10:00:00", "action": "model_request",
+                                          "model": "opus"})
+        store = get_event_store(self.system)
+        self.assertEqual(store.count_by("model"), {"opus": 1})
+        self.assertEqual(store.sync(), 0)  # Same event found in the log is ignored
+
+    def test_queries(self):
+        """Test filters, ordering and grouping."""
+        self.store.record_many("SEJR_A", [
+            {"timestamp": "2026-01-01T10:00:00", "action": "verify"},
+            {"timestamp": "2026-01-02T10:00:00", "action": "verify"},
+            {"timestamp": "2026-01-02T12:00:00", "action": "create"},
+        ])
+        self.store.record("SEJR_B", {"timestamp": "2026-01-03T09:00:00", "action": "verify"})
+        newest = self.store.query(limit=1)[0]
+        self.assertEqual((newest.sejr, newest.ts), ("SEJR_B", "2026-01-03T09:00:00"))
+        self.assertEqual(len(self.store.query(action="verify", sejr="SEJR_A")), 2)
+        self.assertEqual(len(self.store.query(since="2026-01-02", until="2026-01-02")), 2)
+        self.assertEqual(self.store.count_by("day"), {"2026-01-02": 2, "2026-01-01": 1, "2026-01-03": 1})
+        self.assertEqual(self.store.count_by("action", sejrs=["SEJR_B"]), {"verify": 1})
+        self.assertEqual(self.store.last_activity()["SEJR_A"], "2026-01-02T12:00:00")
+        after = self.store.query(after_id=newest.id - 1, newest_first=False)
+        self.assertEqual([e.sejr for e in after], ["SEJR_B"])
+        with self.assertRaises(ValueError):
+            self.store.count_by("details")
+
+    def test_archive_keeps_counts(self):
+        """Test that a sejr renamed into 90_ARCHIVE replaces its old name instead of adding to it."""
+        self._write(*({"timestamp": f"2026-01-0{i}T10:00:00", "action": "verify"} for i in range(1, 4)))
+        (self.sejr / "SEJR_LISTE.md").write_text("# SEJR: A\n- [x] done\n", encoding="utf-8")
+        self.store.sync()
+        self.assertEqual(self.store.count_by("action"), {"verify": 3})
+
+        with redirect_stdout(io.StringIO()):
+            archive_sejr("SEJR_A", self.system, force=True)
+        self.assertFalse(self.sejr.exists())
+        self.store.sync()
+        self.assertEqual(self.store.count_by("action"), {"verify": 3})
+        (archived,) = self.store.count_by("sejr")
+        self.assertTrue(archived.startswith("SEJR_A_"))
+        self.assertEqual(self.store.sync(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
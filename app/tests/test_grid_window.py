@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SejrGrid window and keying arithmetic (grid_window.py).
+
+Tests:
+1. Scrolling moves the mounted window and the spacers cover the rest
+2. A changed key unmounts the old card and mounts the new one; same keys are kept
+3. A removed key is unmounted and the window shrinks with the list
+4. The selection is clamped when the list shrinks or empties
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from grid_window import clamp_selection, reconcile, spacer_heights, visible_range
+
+ROWS = 6
+OVERSCAN = 4
+
+
+def window(scroll_y, count, height=30):
+    return visible_range(scroll_y, height, count, ROWS, OVERSCAN)
+
+
+class TestGridWindow(unittest.TestCase):
+    """Test cases for visible_range, spacer_heights, reconcile and clamp_selection."""
+
+    def test_scrolling(self):
+        self.assertEqual(window(0, 100), (0, 14))
+        self.assertEqual(window(60, 100), (6, 20))            # Row 10 at the top, 4 rows overscan
+        self.assertEqual(window(597, 100), (95, 100))         # Clipped at the end
+        self.assertEqual(visible_range(0, 0, 100, ROWS, OVERSCAN), (0, 19))  # Not laid out yet
+        for scroll_y in (0, 60, 597):
+            first, last = window(scroll_y, 100)
+            top, bottom = spacer_heights(first, last, 100, ROWS)
+            self.assertEqual(top + (last - first) * ROWS + bottom, 100 * ROWS)
+
+    def test_changed_key(self):
+        mounted = ["SEJR_A", "SEJR_B", "SEJR_C"]
+        stale, new = reconcile(mounted, ["SEJR_A", "SEJR_B_20260101", "SEJR_C"])
+        self.assertEqual((stale, new), (["SEJR_B"], ["SEJR_B_20260101"]))
+        self.assertEqual(reconcile(mounted, list(mounted)), ([], []))
+
+    def test_removed_key(self):
+        stale, new = reconcile(["SEJR_A", "SEJR_B", "SEJR_C"], ["SEJR_A", "SEJR_C"])
+        self.assertEqual((stale, new), (["SEJR_B"], []))
+        # Scrolled to the bottom of a list that then shrank: empty window, no negative spacer
+        first, last = window(597, 3)
+        self.assertEqual((first, last), (3, 3))
+        self.assertEqual(spacer_heights(first, last, 3, ROWS), (18, 0))
+        self.assertEqual(reconcile(["SEJR_A"], []), (["SEJR_A"], []))
+
+    def test_selection_clamped(self):
+        self.assertEqual(clamp_selection(5, 10), 5)
+        self.assertEqual(clamp_selection(9, 3), 2)
+        self.assertEqual(clamp_selection(4, 0), 0)
+        self.assertEqual(clamp_selection(-1, 3), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the INTRO snapshot scanner (intro_integration.py).
+
+Tests:
+1. Categories, I-files, structure and summary derive from one snapshot
+2. File contents are read once and re-read only when (inode, mtime, size) changes
+3. Health checks use the snapshot listing (no extra directory walks)
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import intro_integration
+from intro_integration import (get_intro_categories, get_intro_health, get_intro_i_files,
+                               get_intro_structure, get_intro_summary, get_scanner, scan_intro)
+
+
+class TestIntroScanner(unittest.TestCase):
+    """Test cases for IntroScanner and the get_intro_* functions."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.root = Path(self.tmp) / "INTRO"
+        terminals = self.root / "PROJEKTS TERMINALS"
+        terminals.mkdir(parents=True)
+        (self.root / "I2_ORDERS.md").write_text("# I2\n**Status:** AKTIV\n", encoding="utf-8")
+        (self.root / "I10_ECO.md").write_text("# I10\n", encoding="utf-8")
+        (self.root / "I1_VISION.md").write_text("# I1\n**Status:** COMPLETE\nline\n", encoding="utf-8")
+        (self.root / "NAVIGATION_INDEX.md").write_text("x" * 200, encoding="utf-8")
+        for i in range(1, 11):
+            (terminals / f"B{i}_CMD.md").write_text(f"# B{i}\n", encoding="utf-8")
+        (terminals / "notes.txt").write_text("not a B-file\n", encoding="utf-8")
+        self._orig = intro_integration.INTRO_PATH
+        intro_integration.INTRO_PATH = self.root
+
+    def tearDown(self):
+        intro_integration.INTRO_PATH = self._orig
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_views_from_one_snapshot(self):
+        snapshot = scan_intro()
+        i_files = get_intro_i_files(snapshot)
+        self.assertEqual([f.name for f in i_files], ["I1_VISION.md", "I2_ORDERS.md", "I10_ECO.md"])
+        self.assertEqual((i_files[0].lines, i_files[0].status), (3, "COMPLETE"))
+        self.assertEqual(i_files[1].status, "ACTIVE")
+
+        cats = {cat.letter: cat for cat in get_intro_categories(snapshot)}
+        self.assertEqual(cats["B"].file_count, 10)
+        self.assertEqual(cats["C"].files, [])
+
+        structure = get_intro_structure(snapshot)
+        self.assertEqual(structure["subdirectories"], ["PROJEKTS TERMINALS"])
+        self.assertEqual([f.name for f in structure["root_files"]], ["NAVIGATION_INDEX.md"])
+        self.assertEqual(structure["total_files"], 14)
+        self.assertEqual(get_intro_summary(snapshot)["i_file_count"], 3)
+
+    def test_reads_cached_by_stat(self):
+        scanner = get_scanner()
+        get_intro_structure()
+        reads = scanner.read_count
+        get_intro_structure()
+        get_intro_summary()
+        get_intro_categories()
+        self.assertEqual(scanner.read_count, reads)
+
+        path = self.root / "I1_VISION.md"
+        path.write_text("# I1\n**Status:** ARKIVERET\n", encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        i1 = get_intro_i_files()[0]
+        self.assertEqual(scanner.read_count, reads + 1)
+        self.assertEqual((i1.lines, i1.status), (2, "ARCHIVED"))
+
+    def test_health_from_snapshot(self):
+        report = get_intro_health(scan_intro())
+        checks = {c.check_name: c for c in report.checks}
+        self.assertTrue(checks["B-files B1-B10 present"].passed)
+        self.assertFalse(checks["C-files C1-C10 present"].passed)
+        self.assertEqual(checks["I-files I1-I12 present"].details,
+                         [f"I{i}" for i in range(3, 10)] + ["I11", "I12"])
+        self.assertTrue(checks["NAVIGATION_INDEX.md present"].passed)
+
+        intro_integration.INTRO_PATH = self.root / "missing"
+        self.assertEqual(len(get_intro_health().checks), 1)
+        self.assertEqual(get_intro_categories(), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
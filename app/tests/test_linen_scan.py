@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the single-walk LINEN scanner (linen_scan.py).
+
+Tests:
+1. One walk yields all 5 LINEN scores and the file-based sync statuses
+2. Markdown files are read once; rule outputs are reused until (mtime, size) changes
+3. Broken links are re-checked against the disk even when no source file changed
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from linen_scan import LinenScanner
+
+
+class TestLinenScanner(unittest.TestCase):
+    """Test cases for LinenScanner and LinenReport."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.root = Path(self.tmp) / "INTRO"
+        section = self.root / "10_ARKITEKTUR"
+        (section / "_TODO_VERIFIKATION").mkdir(parents=True)
+        (section / "STATUS.md").write_text("# Status\n", encoding="utf-8")
+        (section / "10_INDEX.md").write_text("[Main](10_MAIN.md) [Gone](GONE.md) [Web](https://x)\n",
+                                             encoding="utf-8")
+        (section / "10_MAIN.md").write_text("# Main\n## ÆNDRINGSLOG\n", encoding="utf-8")
+        (self.root / "_SKRALDESPAND").mkdir()
+        (self.root / "README.md").write_text("# Readme\nCHANGELOG\n[A](10_ARKITEKTUR/10_MAIN.md)\n",
+                                             encoding="utf-8")
+        (self.root / ".git").mkdir()
+        self.scanner = LinenScanner()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_all_scores_from_one_walk(self):
+        report = self.scanner.scan(self.root)
+        self.assertEqual(self.scanner.read_count, 4)
+        scores = {s.component: s for s in report.linen_scores()}
+        self.assertEqual((scores["L"].passing_items, scores["L"].total_items), (1, 4))
+        self.assertEqual(dict(scores["I"].details),
+                         {"10_ARKITEKTUR": True, "README.md": False, "_SKRALDESPAND": False})
+        self.assertEqual(dict(scores["N"].details), {"10_ARKITEKTUR": True, "_SKRALDESPAND": False})
+        self.assertEqual(scores["E"].passing_items, 1)
+        self.assertEqual(scores["N2"].percentage, 50.0)
+
+        sync = {s.component_id: s for s in report.sync_statuses()}
+        self.assertEqual((sync["SYNC-2"].count_ok, sync["SYNC-2"].count_total), (2, 4))
+        self.assertEqual((sync["SYNC-3"].count_ok, sync["SYNC-3"].count_total), (0, 1))
+        self.assertEqual(sync["SYNC-4"].detail, "2 OK / 1 broken")
+        self.assertEqual(sync["SYNC-5"].status, "ok")
+
+    def test_rule_outputs_cached_by_mtime(self):
+        self.scanner.scan(self.root)
+        self.scanner.scan(self.root)
+        self.assertEqual(self.scanner.read_count, 4)
+
+        main = self.root / "10_ARKITEKTUR" / "10_MAIN.md"
+        main.write_text("# Main, no log yet\n", encoding="utf-8")
+        os.utime(main, ns=(1, 1))
+        report = self.scanner.scan(self.root)
+        self.assertEqual(self.scanner.read_count, 5)
+        self.assertEqual(report.logging().passing_items, 0)
+
+        (self.root / "README.md").unlink()
+        report = self.scanner.scan(self.root)
+        self.assertEqual(len(report.markdown), 3)
+        self.assertEqual(len(self.scanner._cache), 3)
+
+    def test_broken_links_follow_targets(self):
+        report = self.scanner.scan(self.root)
+        self.assertEqual(report.broken_links(),
+                         [(os.path.join("10_ARKITEKTUR", "10_INDEX.md"), "Gone", "GONE.md", None)])
+
+        (self.root / "10_ARKITEKTUR" / "10_MAIN.md").rename(self.root / "10_ARKITEKTUR" / "10_MAIN_V2.md")
+        report = self.scanner.scan(self.root)
+        broken = {(src, href): fix for src, _text, href, fix in report.broken_links()}
+        self.assertEqual(broken[(os.path.join("10_ARKITEKTUR", "10_INDEX.md"), "10_MAIN.md")],
+                         "10_MAIN_V2.md")
+        self.assertIn(("README.md", "10_ARKITEKTUR/10_MAIN.md"), broken)
+        self.assertEqual(report.cross_references().status, "warning")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the VirtualList splice logic (list_sync.py).
+
+Tests:
+1. sync_store makes one splice covering only the changed range (none if equal)
+2. Insertions, removals and a full replacement end up equal to the new list
+3. replace_item swaps the item with the same key and keeps its selection
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from list_sync import diff_range, find_key, replace_item, store_items, sync_store
+
+
+class Entry:
+    """Stand-in for ListEntry (key + data, compared with same_as)."""
+
+    def __init__(self, key, data=0):
+        self.key = key
+        self.data = data
+
+    def same_as(self, other):
+        return self.key == other.key and self.data == other.data
+
+
+class FakeStore:
+    """The Gio.ListStore methods list_sync uses, recording every splice."""
+
+    def __init__(self, items=()):
+        self.items = list(items)
+        self.splices = []
+
+    def get_n_items(self):
+        return len(self.items)
+
+    def get_item(self, position):
+        return self.items[position]
+
+    def splice(self, position, n_removals, additions):
+        self.splices.append((position, n_removals, [e.key for e in additions]))
+        self.items[position:position + n_removals] = additions
+
+
+class FakeSelection:
+    def __init__(self, selected=None):
+        self.selected = selected
+
+    def is_selected(self, position):
+        return position == self.selected
+
+    def select_item(self, position, unselect_rest):
+        self.selected = position
+
+
+def entries(*keys):
+    return [Entry(k) for k in keys]
+
+
+class TestListSync(unittest.TestCase):
+    """Test cases for sync_store, diff_range and replace_item."""
+
+    def test_one_splice_for_changed_range(self):
+        store = FakeStore(entries("a", "b", "c", "d"))
+        self.assertFalse(sync_store(store, entries("a", "b", "c", "d")))
+        self.assertEqual(store.splices, [])
+
+        self.assertTrue(sync_store(store, [Entry("a"), Entry("b", 1), Entry("c"), Entry("d")]))
+        self.assertEqual(store.splices, [(1, 1, ["b"])])
+        self.assertEqual(store.items[1].data, 1)
+
+    def test_insert_remove_replace(self):
+        for old, new in ((("a", "c"), ("a", "b", "c")),
+                         (("a", "b", "c"), ("a", "c")),
+                         (("a", "b"), ("x", "y", "z")),
+                         ((), ("a",)),
+                         (("a", "a"), ("a",))):
+            store = FakeStore(entries(*old))
+            sync_store(store, entries(*new))
+            self.assertEqual([e.key for e in store_items(store)], list(new))
+            self.assertLessEqual(len(store.splices), 1)
+
+        position, n_removed, added = diff_range(entries("a", "b", "c", "d"), entries("a", "x", "d"))
+        self.assertEqual((position, n_removed, [e.key for e in added]), (1, 2, ["x"]))
+        self.assertIsNone(diff_range([], []))
+
+    def test_replace_item_keeps_selection(self):
+        store = FakeStore(entries("a", "b", "c"))
+        selection = FakeSelection(selected=1)
+        self.assertTrue(replace_item(store, Entry("b", 2), selection))
+        self.assertEqual(store.splices, [(1, 1, ["b"])])
+        self.assertEqual((store.items[1].data, selection.selected), (2, 1))
+        self.assertFalse(replace_item(store, Entry("zz"), selection))
+        self.assertEqual(find_key(store, "c"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
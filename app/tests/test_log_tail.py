@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the AUTO_LOG tail reader (log_tail.py).
+
+Tests:
+1. Last N lines are read backwards across block boundaries
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import log_tail
+from log_tail import last_json, tail_lines
+
+
+class TestLogTail(unittest.TestCase):
+    """Test cases for tail_lines and last_json."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log = Path(self.tmp.name) / "AUTO_LOG.jsonl"
+        self.log.write_text("".join(f'{{"i": {i}}}\n' for i in range(5000)), encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tail_lines(self):
+        """Test that the last lines are found without reading the whole file."""
+        self.assertGreater(self.log.stat().st_size, log_tail.BLOCK_SIZE)
+        self.assertEqual(tail_lines(self.log, 2), ['{"i": 4998}', '{"i": 4999}'])
+        self.assertEqual(last_json(self.log), {"i": 4999})
+        self.assertEqual(len(tail_lines(self.log, 1000)), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
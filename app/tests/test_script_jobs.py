@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the background script job queue (script_jobs.py).
+
+Tests:
+1. Output is collected line by line and the result reported
+2. Duplicate submits attach to the running job; other args wait their turn
+3. Finished results are reused until the sejr folders change
+4. Timeouts and missing scripts fail cleanly
+5. Concurrent submits from several threads share one job
+6. Scripts with main(argv) run in-process with output and result captured
+7. Scripts with a zero-argument main() fall back to a subprocess
+8. Loaded modules are registered so their functions pickle (--jobs workers)
+"""
+
+import io
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from contextlib import redirect_stdout
+
+from script_jobs import DONE, FAILED, JobQueue, load_script
+
+SLOW_SCRIPT = """\
+import pathlib, sys, time
+gate = pathlib.Path(sys.argv[1])
+print("start", sys.argv[1:], flush=True)
+while not gate.exists():
+    time.sleep(0.02)
+print("end")
+"""
+
+MAIN_SCRIPT = """\
+import argparse, os, sys
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fail", action="store_true")
+    args = parser.parse_args(argv)
+    print("in process")
+    print("warning", file=sys.stderr)
+    if args.fail:
+        sys.exit(3)
+    return {"pid": os.getpid()}
+
+if __name__ == "__main__":
+    main()
+"""
+
+NO_ARGV_SCRIPT = """\
+import sys
+
+def main():
+    print("args", sys.argv[1:])
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+class TestScriptJobs(unittest.TestCase):
+    """Test cases for JobQueue."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "scripts").mkdir()
+        (self.root / "10_ACTIVE").mkdir()
+        (self.root / "90_ARCHIVE").mkdir()
+        (self.root / "scripts" / "hello.py").write_text(
+            "import sys\nfor i in range(3):\n    print('line', i)\nsys.exit(len(sys.argv) - 1)\n")
+        (self.root / "scripts" / "slow.py").write_text(SLOW_SCRIPT)
+        self.queue = JobQueue(self.root, max_workers=2, timeout=10)
+
+    def tearDown(self):
+        self.queue.shutdown()
+        self.tmp.cleanup()
+
+    def test_output_and_status(self):
+        job = self.queue.submit("hello.py")
+        self.assertTrue(job.wait(10))
+        self.assertEqual(job.status, DONE)
+        self.assertEqual(job.output(), "line 0\nline 1\nline 2")
+        self.assertEqual(job.tail(1), "line 2")
+        self.assertIs(self.queue.get(job.id), job)
+
+        failed = self.queue.submit("hello.py", ["x"])
+        self.assertTrue(failed.wait(10))
+        self.assertEqual((failed.status, failed.returncode), (FAILED, 1))
+
+    def test_dedup_and_per_script_exclusion(self):
+        gate_a, gate_b = self.root / "gate_a", self.root / "gate_b"
+        first = self.queue.submit("slow.py", [str(gate_a)])
+        self.assertIs(self.queue.submit("slow.py", [str(gate_a)]), first)
+
+        second = self.queue.submit("slow.py", [str(gate_b)])
+        gate_b.touch()
+        # A free worker exists, but the same script must wait for the first run
+        self.assertFalse(second.wait(0.5))
+        self.assertEqual(second.status, "queued")
+        self.assertEqual(len(self.queue.active_jobs()), 2)
+
+        gate_a.touch()
+        self.assertTrue(first.wait(10) and second.wait(10))
+        self.assertGreaterEqual(second.started, first.finished)
+        self.assertEqual(self.queue.active_jobs(), [])
+
+    def test_result_reuse(self):
+        job = self.queue.submit("hello.py")
+        job.wait(10)
+        self.assertIs(self.queue.submit("hello.py"), job)
+        self.assertIsNot(self.queue.submit("hello.py", use_cache=False), job)
+
+        cached = self.queue.cached("hello.py")
+        (self.root / "10_ACTIVE" / "NEW_SEJR").mkdir()
+        self.assertIsNone(self.queue.cached("hello.py"))
+        fresh = self.queue.submit("hello.py")
+        self.assertIsNot(fresh, cached)
+
+    def test_timeout_and_missing_script(self):
+        queue = JobQueue(self.root, timeout=0.3)
+        try:
+            job = queue.submit("slow.py", [str(self.root / "never")])
+            self.assertTrue(job.wait(10))
+            self.assertEqual(job.status, FAILED)
+            self.assertIn("Timeout", job.output())
+        finally:
+            queue.shutdown()
+
+        missing = self.queue.submit("nope.py")
+        self.assertTrue(missing.is_done)
+        self.assertEqual(missing.status, FAILED)
+        self.assertIn("Script not found", missing.output())
+
+    def test_concurrent_submits_share_one_job(self):
+        gate = self.root / "gate"
+        jobs = []
+        threads = [threading.Thread(target=lambda: jobs.append(self.queue.submit("slow.py", [str(gate)])))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        gate.touch()
+        self.assertEqual(len({job.id for job in jobs}), 1)
+        self.assertTrue(jobs[0].wait(10))
+
+    def test_inprocess_main(self):
+        (self.root / "scripts" / "dna.py").write_text(MAIN_SCRIPT)
+        self.assertIsNone(load_script(self.root / "scripts" / "hello.py"))
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            job = self.queue.submit("dna.py")
+            self.assertTrue(job.wait(10))
+        self.assertEqual(job.status, DONE)
+        self.assertEqual(job.result, {"pid": os.getpid()})
+        self.assertEqual(job.output(), "in process\nwarning")
+        self.assertNotIn("in process", stdout.getvalue())
+
+        failed = self.queue.submit("dna.py", ["--fail"])
+        self.assertTrue(failed.wait(10))
+        self.assertEqual((failed.status, failed.returncode), (FAILED, 3))
+
+        queue = JobQueue(self.root, inprocess=False)
+        try:
+            job = queue.submit("dna.py")
+            self.assertTrue(job.wait(10))
+            self.assertEqual((job.status, job.result), (DONE, None))
+        finally:
+            queue.shutdown()
+
+    def test_zero_argument_main_runs_as_subprocess(self):
+        script = self.root / "scripts" / "view.py"
+        script.write_text(NO_ARGV_SCRIPT)
+        self.assertIsNone(load_script(script))
+
+        job = self.queue.submit("view.py", ["--x"])
+        self.assertTrue(job.wait(10))
+        self.assertEqual((job.status, job.output()), (DONE, "args ['--x']"))
+
+    def test_loaded_functions_pickle(self):
+        (self.root / "scripts" / "dna.py").write_text(MAIN_SCRIPT)
+        module = load_script(self.root / "scripts" / "dna.py")
+        self.assertIs(pickle.loads(pickle.dumps(module.main)), module.main)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
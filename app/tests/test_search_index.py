@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent full-text search index (search_index.py).
+
+Tests:
+1. Content, filenames and folder names are found by word prefix
+2. Verbatim matches rank first
+3. Only changed files are re-indexed; removed files are purged
+4. A fresh index reuses the SQLite database
+5. INTRO hits can be excluded, even when they would fill the whole limit
+6. Results stream in batches and stop when cancelled
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from search_index import SearchIndex, build_match_query
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test cases for SearchIndex."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.folder = self.root / "90_ARCHIVE" / "SEARCH_TEST_2026-01-01"
+        self.folder.mkdir(parents=True)
+        (self.folder / "CONCLUSION.md").write_text(
+            "# CONCLUSION\n\nKør auto_verify.py før arkivering\nverificering af tests\n", encoding="utf-8")
+        (self.folder / "AUTO_LOG.jsonl").write_text(
+            '{"action": "verify", "detail": "pass 1 done"}\n', encoding="utf-8")
+        self.intro = self.root / "INTRO"
+        self.intro.mkdir()
+        (self.intro / "I1_VISION.md").write_text("# Vision\nVerifikation af alt\n", encoding="utf-8")
+        self.index = SearchIndex(self.root, intro_path=self.intro)
+        self.index.refresh()
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def test_prefix_match(self):
+        """Test that tokens match as prefixes in content, filenames and folders."""
+        hits = self.index.search("verif")
+        found = {(h.name, h.line_num) for h in hits}
+        self.assertIn(("CONCLUSION.md", 3), found)
+        self.assertIn(("CONCLUSION.md", 4), found)
+        self.assertIn(("AUTO_LOG.jsonl", 1), found)
+        self.assertIn(("I1_VISION.md", 2), found)
+        folder_hits = self.index.search("search_te")
+        self.assertEqual(folder_hits[0].kind, "folder")
+        self.assertEqual(build_match_query("auto_verify.py"), '"auto"* "verify"* "py"*')
+
+    def test_verbatim_first(self):
+        """Test that lines containing the query verbatim rank first."""
+        hits = self.index.search("auto_verify")
+        self.assertEqual((hits[0].name, hits[0].line_num), ("CONCLUSION.md", 3))
+
+    def test_incremental_refresh(self):
+        """Test that only changed files are re-indexed and removed files purged."""
+        before = self.index.index_count
+        self.assertEqual(self.index.refresh(), 0)
+        (self.folder / "CONCLUSION.md").write_text("# CONCLUSION\n\nNy læring om regex\n", encoding="utf-8")
+        os.remove(self.folder / "AUTO_LOG.jsonl")
+        self.assertEqual(self.index.refresh(), 2)
+        self.assertEqual(self.index.index_count, before + 2)
+        self.assertEqual([h.line_num for h in self.index.search("regex")], [3])
+        names = {h.name for h in self.index.search("verif")}
+        self.assertEqual(names, {"I1_VISION.md"})
+
+    def test_fresh_index_reuses_db(self):
+        """Test that a new instance serves results without re-indexing."""
+        fresh = SearchIndex(self.root, intro_path=self.intro)
+        try:
+            self.assertEqual(fresh.refresh(), 0)
+            self.assertTrue(fresh.search("arkivering"))
+        finally:
+            fresh.close()
+
+    def test_exclude_intro(self):
+        """Test that include_intro=False drops INTRO hits."""
+        hits = self.index.search("verifikation", include_intro=False)
+        self.assertEqual(hits, [])
+        self.assertEqual(len(self.index.search("verifikation")), 1)
+
+    def test_exclude_intro_many_matches(self):
+        """Test that many INTRO matches do not crowd out sejr hits."""
+        for i in range(300):
+            (self.intro / f"T{i}.md").write_text("test test test\n", encoding="utf-8")
+        (self.folder / "NOTES.md").write_text("a test\n", encoding="utf-8")
+        self.index.refresh()
+        hits = self.index.search("test", include_intro=False)
+        self.assertEqual(hits[0].name, "NOTES.md")
+        self.assertNotIn("intro", {h.kind for h in hits})
+
+        # An index without intro_path keeps the shared INTRO rows
+        sejr_only = SearchIndex(self.root)
+        try:
+            sejr_only.refresh()
+            intro_hits = [h for h in self.index.search("test", limit=500) if h.kind == "intro"]
+            self.assertEqual(len(intro_hits), 300)
+        finally:
+            sejr_only.close()
+
+    def test_batches_and_cancel(self):
+        """Test that search_batches yields batches and honours cancellation."""
+        batches = list(self.index.search_batches("verif", batch_size=2))
+        self.assertEqual([len(b) for b in batches], [2, 2])
+        stream = self.index.search_batches("verif", batch_size=2, cancelled=lambda: bool(seen))
+        seen = []
+        for batch in stream:
+            seen.append(batch)
+        self.assertEqual(len(seen), 1)
+        self.assertEqual(list(self.index.search_batches("verif", cancelled=lambda: True)), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the local state daemon (sejr_daemon.py).
+
+Tests:
+1. SejrState reports only what changed between refreshes
+2. Clients get snapshots over the socket, and "unchanged" for a known version
+3. Subscribers receive pushed changes (polling mode, no watchdog needed)
+4. load_state falls back to a local scan without a daemon; stale sockets are reclaimed
+"""
+
+import queue
+import shutil
+import socket
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sejr_daemon import SejrClient, SejrDaemon, SejrState, load_state
+
+
+class TestSejrDaemon(unittest.TestCase):
+    """Test cases for SejrState, SejrDaemon and SejrClient."""
+
+    def setUp(self):
+        # Short path: Unix socket paths are limited to ~100 bytes
+        self.tmp = tempfile.mkdtemp(prefix="sejrd", dir="/tmp")
+        self.root = Path(self.tmp)
+        (self.root / "_CURRENT").mkdir()
+        (self.root / "90_ARCHIVE").mkdir()
+        self._make_sejr("ALPHA", "- [x] a\n- [ ] b\n")
+        self.daemon = None
+
+    def tearDown(self):
+        if self.daemon is not None:
+            self.daemon.stop()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _make_sejr(self, name, checkboxes):
+        folder = self.root / "10_ACTIVE" / name
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / "SEJR_LISTE.md").write_text(checkboxes, encoding="utf-8")
+        (folder / "AUTO_LOG.jsonl").touch()
+        return folder
+
+    def _start(self):
+        self.daemon = SejrDaemon(self.root, use_watchdog=False, poll_interval=0.05)
+        self.daemon.start()
+        return SejrClient(self.root)
+
+    def test_state_changes(self):
+        state = SejrState(self.root)
+        first = state.refresh()
+        self.assertEqual(first["active"], ["ALPHA"])
+        self.assertIsNone(state.refresh())
+
+        self._make_sejr("BETA", "- [ ] x\n")
+        with open(self.root / "10_ACTIVE" / "ALPHA" / "AUTO_LOG.jsonl", "a") as log:
+            log.write('{"action": "x"}\n')
+        change = state.refresh()
+        self.assertEqual(change["active"], ["BETA"])
+        self.assertEqual(change["logs"], ["ALPHA", "BETA"])
+        self.assertEqual(change["version"], 2)
+
+        snap = state.snapshot()
+        alpha = next(r for r in snap["active"] if r["name"] == "ALPHA")
+        self.assertEqual((alpha["checkboxes_done"], alpha["checkboxes_total"]), (1, 2))
+
+    def test_snapshot_over_socket(self):
+        client = self._start()
+        version = client.ping()
+        self.assertEqual(version, 1)
+        snap = client.snapshot()
+        self.assertEqual([r["name"] for r in snap["active"]], ["ALPHA"])
+        self.assertEqual(client.snapshot(since=version), {"ok": True, "version": 1, "unchanged": True})
+        self.assertIsNone(client.request("bogus"))
+
+    def test_subscribe_receives_changes(self):
+        client = self._start()
+        changes = queue.Queue()
+        self.assertIsNotNone(client.subscribe(changes.put))
+
+        self._make_sejr("ALPHA", "- [x] a\n- [x] b\n- [ ] c\n")
+        change = changes.get(timeout=5)
+        self.assertEqual(change["event"], "changed")
+        self.assertEqual(change["active"], ["ALPHA"])
+        alpha = client.snapshot()["active"][0]
+        self.assertEqual(alpha["checkboxes_total"], 3)
+
+    def test_fallback_and_stale_socket(self):
+        self.assertIsNone(SejrClient(self.root).ping())
+        self.assertEqual([r["name"] for r in load_state(self.root)["active"]], ["ALPHA"])
+
+        # Leftover socket file from a crashed daemon
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(self.root / "_CURRENT" / "sejrd.sock"))
+        stale.close()
+        self.assertIsNone(SejrClient(self.root).ping())
+        client = self._start()
+        self.assertIsNotNone(client.ping())
+        with self.assertRaises(RuntimeError):
+            SejrDaemon(self.root, use_watchdog=False).start()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
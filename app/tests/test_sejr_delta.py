@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the incremental checkbox-delta engine (sejr_delta.py).
+
+Tests:
+1. Ticking a checkbox emits a 'checked' event on the fast path
+2. Inserted lines shift line numbers and keep counts exact
+3. Structural edits fall back to a full re-parse
+4. Unchanged files are not re-read
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sejr_delta import DeltaEngine
+from sejr_parser import parse_sejr
+
+
+CONTENT = """# SEJR: DELTA_TEST
+
+## PASS 1: FUNGERENDE
+- [x] One
+- [ ] Two
+
+## PASS 2: FORBEDRET
+- [ ] Three
+- [ ] Four
+"""
+
+
+def _snapshot(doc):
+    return ([(cb.line, cb.column, cb.checked, cb.text, cb.region, cb.pass_num) for cb in doc.checkboxes],
+            doc.spans, doc.span_counts, doc.counts)
+
+
+class TestDeltaEngine(unittest.TestCase):
+    """Test cases for DeltaEngine."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sejr = Path(self.tmp.name)
+        (self.sejr / "SEJR_LISTE.md").write_text(CONTENT, encoding="utf-8")
+        self.engine = DeltaEngine()
+        self.engine.update(self.sejr)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tick_emits_event(self):
+        """Test that ticking one checkbox yields one 'checked' event."""
+        new = CONTENT.replace("- [ ] Three", "- [x] Three")
+        result = self.engine.update(self.sejr, content=new)
+        self.assertFalse(result.full_reparse)
+        self.assertEqual(result.changed_lines, 1)
+        self.assertEqual(len(result.events), 1)
+        self.assertEqual(result.events[0].describe(), "checkbox 3 in Pass 2 checked")
+        self.assertEqual(result.doc.pass_counts(2), (1, 2))
+
+    def test_insert_shifts_lines(self):
+        """Test that inserting a task keeps the model identical to a full parse."""
+        new = CONTENT.replace("- [ ] Two\n", "- [ ] Two\n- [x] Two and a half\n")
+        result = self.engine.update(self.sejr, content=new)
+        self.assertFalse(result.full_reparse)
+        self.assertEqual([e.kind for e in result.events], ["added"])
+        self.assertEqual(_snapshot(result.doc), _snapshot(parse_sejr(new)))
+        # No PASS 1 REVIEW marker: pass 1 runs to the end of the file (auto_verify rules)
+        self.assertEqual(result.doc.pass_counts(1), (2, 5))
+        self.assertEqual(result.doc.pass_counts(2), (0, 2))
+
+    def test_structural_edit_reparses(self):
+        """Test that adding a heading triggers a full re-parse."""
+        new = CONTENT.replace("- [ ] Two\n", "- [ ] Two\n\n## PASS 1 REVIEW\n- [ ] Review\n")
+        result = self.engine.update(self.sejr, content=new)
+        self.assertTrue(result.full_reparse)
+        self.assertEqual(result.doc.review_counts(1), (0, 1))
+        self.assertEqual(_snapshot(result.doc), _snapshot(parse_sejr(new)))
+
+    def test_unchanged_file_not_reread(self):
+        """Test that an unchanged file returns the cached model without events."""
+        first = self.engine.update(self.sejr)
+        second = self.engine.update(self.sejr)
+        self.assertIs(first.doc, second.doc)
+        self.assertFalse(second.changed)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared sejr metadata index (sejr_index.py).
+
+Tests:
+1. Records are parsed from SEJR_LISTE.md + STATUS.yaml
+2. Unchanged folders are served from cache (no re-parse)
+3. Changed folders are re-parsed
+4. A fresh index reuses the SQLite database
+5. Removed folders are purged
+6. Directory fingerprints change with edits inside sejr folders
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sejr_index import SejrIndex, dir_fingerprint, summarize_status
+
+
+SEJR_CONTENT = """# SEJR: TEST
+
+## PASS 1: FUNGERENDE
+- [x] Task one
+- [ ] Task two
+"""
+
+STATUS_CONTENT = """pass_tracking:
+  current_pass: 2
+  total_score: 17
+  pass_1:
+    complete: true
+    score: 9
+  pass_2:
+    complete: false
+    score: 8
+"""
+
+
+class TestSejrIndex(unittest.TestCase):
+    """Test cases for SejrIndex."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.active = self.root / "10_ACTIVE"
+        self.folder = self.active / "TEST_2026-01-01"
+        self.folder.mkdir(parents=True)
+        (self.folder / "SEJR_LISTE.md").write_text(SEJR_CONTENT, encoding="utf-8")
+        (self.folder / "STATUS.yaml").write_text(STATUS_CONTENT, encoding="utf-8")
+        self.index = SejrIndex(self.root)
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def test_parse_record(self):
+        """Test that a folder is parsed into a complete record."""
+        records = self.index.scan_dir(self.active)
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        self.assertEqual(record["checkboxes_done"], 1)
+        self.assertEqual(record["checkboxes_total"], 2)
+        self.assertEqual(record["progress"], 50)
+        self.assertEqual(record["score"], 17)
+        self.assertEqual(record["phase"], "PASS 2")
+        self.assertEqual(record["files"], ["SEJR_LISTE.md", "STATUS.yaml"])
+        self.assertFalse(record["is_archived"])
+
+    def test_unchanged_not_reparsed(self):
+        """Test that a second scan does not re-parse unchanged folders."""
+        self.index.scan_dir(self.active)
+        self.index.scan_dir(self.active)
+        self.assertEqual(self.index.parse_count, 1)
+
+    def test_changed_reparsed(self):
+        """Test that editing SEJR_LISTE.md triggers a re-parse."""
+        self.index.scan_dir(self.active)
+        sejr_file = self.folder / "SEJR_LISTE.md"
+        sejr_file.write_text(SEJR_CONTENT.replace("- [ ]", "- [x]"), encoding="utf-8")
+        st = sejr_file.stat()
+        os.utime(sejr_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        record = self.index.scan_dir(self.active)[0]
+        self.assertEqual(self.index.parse_count, 2)
+        self.assertEqual(record["checkboxes_done"], 2)
+
+    def test_database_reused(self):
+        """Test that a new index instance reads from the SQLite file."""
+        self.index.scan_dir(self.active)
+        fresh = SejrIndex(self.root)
+        try:
+            record = fresh.scan_dir(self.active)[0]
+            self.assertEqual(fresh.parse_count, 0)
+            self.assertEqual(record["score"], 17)
+        finally:
+            fresh.close()
+
+    def test_removed_folder_purged(self):
+        """Test that deleted folders disappear from the index."""
+        self.index.scan_dir(self.active)
+        for f in self.folder.iterdir():
+            f.unlink()
+        self.folder.rmdir()
+        self.assertEqual(self.index.scan_dir(self.active), [])
+        fresh = SejrIndex(self.root)
+        try:
+            self.assertIsNone(fresh._db_load(str(self.folder)))
+        finally:
+            fresh.close()
+
+    def test_dir_fingerprint(self):
+        """Test that the fingerprint is stable and sees in-place edits and new folders."""
+        first = dir_fingerprint(self.active)
+        self.assertEqual(dir_fingerprint(self.active), first)
+        status_file = self.folder / "STATUS.yaml"
+        st = status_file.stat()
+        os.utime(status_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        second = dir_fingerprint(self.active)
+        self.assertNotEqual(second, first)
+        (self.active / "NEW_2026-01-02").mkdir()
+        self.assertNotEqual(dir_fingerprint(self.active), second)
+
+    def test_summarize_flat_status(self):
+        """Test score/phase derivation from the legacy flat format."""
+        score, phase = summarize_status({
+            "pass_1_score": 8, "pass_2_score": 9, "pass_3_score": 10,
+            "pass_1_complete": True, "pass_2_complete": True, "pass_3_complete": True,
+        })
+        self.assertEqual(score, 27)
+        self.assertEqual(phase, "COMPLETE")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the coalescing file watcher (app/watcher.py).
+
+Tests:
+1. A burst of writes becomes one batch, deduplicated per file
+2. created/deleted/moved events net out per path and flag added/removed sejr
+3. Per-file callbacks fire once per batch; SEJR_LISTE.md goes through sejr_delta
+4. A steady stream of events still flushes after max_delay
+5. watch_daemon forwards sejr daemon pushes to the app until the daemon stops
+"""
+
+import asyncio
+import queue
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.watcher import CREATED, DELETED, MODIFIED, EventCoalescer, FileWatcher, watch_daemon
+from sejr_daemon import SejrDaemon
+
+
+class TestWatcher(unittest.TestCase):
+    """Test cases for EventCoalescer and FileWatcher.dispatch."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.active = self.root / "10_ACTIVE"
+        self.current = self.root / "_CURRENT"
+        self.current.mkdir()
+        self.batches = queue.Queue()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _sejr(self, name, content="- [ ] a\n"):
+        folder = self.active / name
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / "SEJR_LISTE.md").write_text(content, encoding="utf-8")
+        return folder
+
+    def test_burst_is_one_batch(self):
+        coalescer = EventCoalescer(self.batches.put, self.root, window=0.1)
+        alpha = self.active / "ALPHA"
+        for _ in range(20):
+            coalescer.add(MODIFIED, alpha / "STATUS.yaml")
+            coalescer.add(MODIFIED, alpha / "AUTO_LOG.jsonl")
+        coalescer.add(MODIFIED, self.current / "STATE.md")
+        coalescer.add(MODIFIED, alpha / "notes.txt")           # not watched
+        coalescer.add(MODIFIED, alpha, is_directory=True)      # directory noise
+
+        batch = self.batches.get(timeout=5)
+        self.assertEqual(batch.events, 41)
+        self.assertEqual(batch.sejrs, {"ALPHA"})
+        self.assertEqual(batch.current, {"STATE.md"})
+        self.assertEqual(len(batch.files_for("ALPHA")), 2)
+        self.assertFalse(batch.structural)
+        time.sleep(0.3)
+        self.assertTrue(self.batches.empty())
+
+    def test_net_effect_per_path(self):
+        coalescer = EventCoalescer(self.batches.put, self.root, window=60)
+        alpha, beta = self.active / "ALPHA", self.active / "BETA"
+        coalescer.add(CREATED, alpha / "STATUS.yaml")
+        coalescer.add(MODIFIED, alpha / "STATUS.yaml")
+        coalescer.add(CREATED, beta / "AUTO_LOG.jsonl")
+        coalescer.add(DELETED, beta / "AUTO_LOG.jsonl")
+        coalescer.add_move(alpha / "SEJR_LISTE.md.tmp", alpha / "SEJR_LISTE.md")
+        coalescer.add(CREATED, self.active / "GAMMA", is_directory=True)
+        coalescer.add_move(beta, self.root / "90_ARCHIVE" / "BETA", is_directory=True)
+
+        batch = coalescer.flush()
+        self.assertEqual(batch.files, {alpha / "STATUS.yaml": CREATED, alpha / "SEJR_LISTE.md": CREATED})
+        self.assertEqual((batch.added, batch.removed), ({"GAMMA"}, {"BETA"}))
+        self.assertEqual(batch.sejrs, {"ALPHA", "BETA", "GAMMA"})
+        self.assertTrue(batch.structural)
+        self.assertIsNone(coalescer.flush())
+
+    def test_dispatch_callbacks(self):
+        folder = self._sejr("ALPHA", "- [ ] a\n- [ ] b\n")
+        watcher = FileWatcher(window=60, base_path=self.root)
+        calls = []
+        for name in ("update_task_list", "update_progress", "checkbox_delta", "batch"):
+            watcher.register_callback(name, lambda arg, name=name: calls.append((name, arg)))
+
+        watcher.coalescer.add(MODIFIED, folder / "SEJR_LISTE.md")
+        watcher.coalescer.flush()
+        (folder / "SEJR_LISTE.md").write_text("- [x] a\n- [ ] b\n", encoding="utf-8")
+        for _ in range(5):
+            watcher.coalescer.add(MODIFIED, folder / "SEJR_LISTE.md")
+        watcher.coalescer.add(DELETED, folder / "STATUS.yaml")
+        calls.clear()
+        watcher.coalescer.flush()
+
+        names = [name for name, _ in calls]
+        self.assertEqual(names, ["checkbox_delta", "update_task_list", "batch"])
+        self.assertEqual(calls[0][1].events[0].kind, "checked")
+        self.assertEqual(calls[-1][1].sejrs, {"ALPHA"})
+
+    def test_max_delay(self):
+        coalescer = EventCoalescer(self.batches.put, self.root, window=0.2, max_delay=0.3)
+        start = time.monotonic()
+        while self.batches.empty() and time.monotonic() - start < 5:
+            coalescer.add(MODIFIED, self.current / "NEXT.md")
+            time.sleep(0.05)
+        self.assertFalse(self.batches.empty())
+        self.assertLess(time.monotonic() - start, 2)
+        coalescer.cancel()
+
+    def test_watch_daemon(self):
+        self._sejr("ALPHA")
+        (self.root / "90_ARCHIVE").mkdir()
+        daemon = SejrDaemon(self.root, use_watchdog=False, poll_interval=0.05)
+        daemon.start()
+        calls = queue.Queue()
+
+        class FakeApp:
+            def call_from_thread(self, fn, *args):
+                fn(*args)
+
+            def reload_sejrs(self, names, structural):
+                calls.put((names, structural))
+
+            def refresh(self):
+                pass
+
+        async def run():
+            task = asyncio.ensure_future(watch_daemon(FakeApp(), self.root))
+            await asyncio.sleep(0.2)
+            self._sejr("ALPHA", "- [x] a\n")
+            received = await asyncio.get_running_loop().run_in_executor(None, calls.get, True, 5)
+            daemon.stop()
+            await asyncio.wait_for(task, 5)
+            return received
+
+        try:
+            self.assertEqual(asyncio.run(run()), ({"ALPHA"}, False))
+        finally:
+            daemon.stop()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared YAML writer (scripts/yaml_utils.py) and
+loader (sejr_yaml.py).
+
+Tests:
+1. New files are written and round-trip
+2. Semantically unchanged data is not rewritten
+3. Ignored (volatile) keys do not trigger a write
+4. Real changes are written atomically without leftover temp files
+5. Loader cache hits until the file changes, and returns copies
+6. Missing, invalid and non-mapping files load as {}
+7. write_json follows the same write-if-changed rules
+8. app.utils.write_yaml_simple goes through write_yaml
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent and scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from app.utils import write_yaml_simple
+from sejr_yaml import YamlCache, load_yaml_file
+from yaml_utils import parse_yaml, write_json, write_yaml
+
+
+class TestWriteYaml(unittest.TestCase):
+    """Test cases for write_yaml."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "STATUS.yaml"
+        self.data = {"meta": {"version": "3.0.0", "last_updated": "t1"}, "scores": [1, 2, 3]}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_new_file_written(self):
+        """Test that a missing file is created with header and content."""
+        self.assertTrue(write_yaml(self.path, self.data, header="Test header"))
+        self.assertTrue(self.path.read_text(encoding="utf-8").startswith("# Test header\n"))
+        self.assertEqual(parse_yaml(self.path), self.data)
+
+    def test_unchanged_not_rewritten(self):
+        """Test that identical data leaves the file (and its mtime) alone."""
+        write_yaml(self.path, self.data)
+        os.utime(self.path, ns=(1_000_000_000, 1_000_000_000))
+        same = {"scores": [1, 2, 3], "meta": {"version": "3.0.0", "last_updated": "t1"}}
+        self.assertFalse(write_yaml(self.path, same))
+        self.assertEqual(self.path.stat().st_mtime_ns, 1_000_000_000)
+
+    def test_ignored_keys(self):
+        """Test that volatile keys alone do not cause a rewrite."""
+        write_yaml(self.path, self.data)
+        changed = {"meta": {"version": "3.0.0", "last_updated": "t2"}, "scores": [1, 2, 3]}
+        self.assertFalse(write_yaml(self.path, changed, ignore_keys=("meta.last_updated",)))
+        self.assertTrue(write_yaml(self.path, changed))
+
+    def test_change_written_atomically(self):
+        """Test that a real change replaces the file and leaves no temp files."""
+        write_yaml(self.path, self.data)
+        self.path.chmod(0o640)
+        self.assertTrue(write_yaml(self.path, dict(self.data, scores=[4])))
+        self.assertEqual(parse_yaml(self.path)["scores"], [4])
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o640)
+        self.assertEqual(os.listdir(self.tmp.name), ["STATUS.yaml"])
+
+    def test_write_json(self):
+        """Test that write_json skips unchanged data and ignored keys."""
+        path = Path(self.tmp.name) / "PATTERNS.json"
+        self.assertTrue(write_json(path, self.data))
+        changed = {"meta": {"version": "3.0.0", "last_updated": "t2"}, "scores": [1, 2, 3]}
+        self.assertFalse(write_json(path, changed, ignore_keys=("meta.last_updated",)))
+        self.assertTrue(write_json(path, dict(changed, scores=[4])))
+        self.assertEqual(json.loads(path.read_text(encoding="utf-8"))["scores"], [4])
+
+    def test_write_yaml_simple(self):
+        """Test that the app.utils writer only rewrites on real changes."""
+        self.assertTrue(write_yaml_simple(self.path, self.data))
+        os.utime(self.path, ns=(1_000_000_000, 1_000_000_000))
+        self.assertFalse(write_yaml_simple(self.path, dict(self.data)))
+        self.assertEqual(self.path.stat().st_mtime_ns, 1_000_000_000)
+        self.assertTrue(write_yaml_simple(self.path, dict(self.data, scores=[4])))
+        self.assertEqual(os.listdir(self.tmp.name), ["STATUS.yaml"])
+
+
+class TestYamlCache(unittest.TestCase):
+    """Test cases for the sejr_yaml loader."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "STATUS.yaml"
+        self.cache = YamlCache(maxsize=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cache_hit_and_invalidation(self):
+        """Test that unchanged files come from the cache and changes are seen."""
+        self.path.write_text("pass_tracking:\n  total_score: 27\n", encoding="utf-8")
+        first = self.cache.load(self.path)
+        first["pass_tracking"]["total_score"] = 0  # Callers may mutate their copy
+        self.assertEqual(self.cache.load(self.path)["pass_tracking"]["total_score"], 27)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        write_yaml(self.path, {"pass_tracking": {"total_score": 30}})
+        self.assertEqual(self.cache.load(self.path)["pass_tracking"]["total_score"], 30)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_empty_results(self):
+        """Test that missing, invalid and list files load as {}."""
+        self.assertEqual(load_yaml_file(self.path), {})
+        self.path.write_text("key: [unclosed\n", encoding="utf-8")
+        self.assertEqual(load_yaml_file(self.path), {})
+        self.path.write_text("- a\n- b\n", encoding="utf-8")
+        self.assertEqual(load_yaml_file(self.path), {})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -16,12 +16,20 @@ Usage:
     write_yaml_simple(Path("output.yaml"), {"key": "value"})
 
 Migrated 2026-01-31: Flat line parser replaced with PyYAML.
+Reading goes through sejr_yaml (LibYAML CSafeLoader + parse cache), the
+same loader scripts/yaml_utils and the UIs use; writing goes through
+yaml_utils.write_yaml (only rewrites on real changes, atomic replace).
 """
 
-import yaml
+import sys
 from pathlib import Path
 from typing import Any, Dict
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+from sejr_yaml import load_yaml_file
+from yaml_utils import write_yaml  # Write-if-changed, atomic
+
 
 def parse_yaml_simple(filepath: Path) -> Dict[str, Any]:
     """
@@ -33,34 +41,25 @@ def parse_yaml_simple(filepath: Path) -> Dict[str, Any]:
     Returns:
         Dictionary of parsed content, or empty dict if file missing/invalid
     """
-    if not filepath.exists():
-        return {}
-
-    try:
-        content = filepath.read_text(encoding="utf-8")
-        result = yaml.safe_load(content)
-        return result if isinstance(result, dict) else {}
-    except (yaml.YAMLError, UnicodeDecodeError):
-        return {}
+    return load_yaml_file(Path(filepath))
 
 
-def write_yaml_simple(filepath: Path, data: Dict[str, Any], indent: int = 0) -> None:
+def write_yaml_simple(filepath: Path, data: Dict[str, Any], indent: int = 0) -> bool:
     """
     Write YAML file using PyYAML (preserves nested structures).
 
+    Goes through yaml_utils.write_yaml: unchanged content is not rewritten
+    and real changes are written atomically.
+
     Args:
         filepath: Path to write YAML file
         data: Dictionary to write
         indent: Unused (kept for backward compatibility)
+
+    Returns:
+        True if the file was written, False if it was already up to date
     """
-    yaml_content = yaml.dump(
-        data,
-        default_flow_style=False,
-        allow_unicode=True,
-        sort_keys=False,
-        width=120
-    )
-    filepath.write_text(yaml_content, encoding="utf-8")
+    return write_yaml(Path(filepath), data, timestamp=False)
 
 
 # ============================================================================
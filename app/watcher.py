@@ -8,101 +8,318 @@ Watches for changes in:
 - _CURRENT/STATE.md
 - _CURRENT/PATTERNS.yaml
 - _CURRENT/NEXT.md
+
+Events are coalesced: created/modified/deleted/moved events are merged
+per path and delivered once per burst (after `window` seconds of quiet,
+at most `max_delay` after the first event) as a ChangeBatch naming the
+affected sejr. One `auto_verify --all` run is one batch, not dozens of
+reloads.
+
+SEJR_LISTE.md changes go through sejr_delta, so the "checkbox_delta"
+callback receives a DeltaResult with events like
+"checkbox 14 in Pass 2 checked".
 """
 
 import asyncio
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileSystemEvent
+from typing import Callable, Dict, Optional, Set
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler, FileSystemEvent
+except ImportError:  # EventCoalescer still works (and is testable) without watchdog
+    Observer = None
+    FileSystemEventHandler = object
+    FileSystemEvent = object
 
 BASE_PATH = Path(__file__).parent.parent
 
+sys.path.insert(0, str(BASE_PATH))
+from sejr_delta import get_delta_engine  # Incremental checkbox deltas
+from sejr_daemon import SejrClient  # Push updates from the shared state daemon, if running
+
+ACTIVE_DIRNAME = "10_ACTIVE"
+CURRENT_DIRNAME = "_CURRENT"
+
+DEBOUNCE_WINDOW = 0.3  # Seconds of quiet before a batch is delivered
+MAX_DELAY = 2.0        # Seconds; a steady stream of writes still flushes this often
+
+CREATED, MODIFIED, DELETED = "created", "modified", "deleted"
+
+# Watched filename -> per-file callback
+FILE_CALLBACKS = {
+    "SEJR_LISTE.md": "update_task_list",
+    "STATUS.yaml": "update_progress",
+    "AUTO_LOG.jsonl": "append_log_stream",
+    "STATE.md": "refresh_overview",
+    "PATTERNS.yaml": "update_patterns",
+    "NEXT.md": "update_predictions",
+}
+
+
+def _merge(old: Optional[str], new: str) -> Optional[str]:
+    """Net effect of two events on one path (None: nothing happened)."""
+    if old is None:
+        return new
+    if old == CREATED:
+        return None if new == DELETED else CREATED
+    if old == DELETED:
+        return MODIFIED if new == CREATED else DELETED
+    return DELETED if new == DELETED else MODIFIED
+
+
+@dataclass
+class ChangeBatch:
+    """Net file changes from one burst of events."""
+    files: Dict[Path, str] = field(default_factory=dict)  # path -> created|modified|deleted
+    sejrs: Set[str] = field(default_factory=set)          # affected folders in 10_ACTIVE
+    added: Set[str] = field(default_factory=set)          # sejr folders created
+    removed: Set[str] = field(default_factory=set)        # sejr folders deleted
+    current: Set[str] = field(default_factory=set)        # changed files in _CURRENT
+    events: int = 0                                       # raw events folded into this batch
+
+    @property
+    def structural(self) -> bool:
+        """True if the set of active sejr changed (a folder came or went)."""
+        return bool(self.added or self.removed)
+
+    def files_for(self, sejr: str) -> Dict[Path, str]:
+        return {path: kind for path, kind in self.files.items()
+                if path.parent.name == sejr and path.parent.parent.name == ACTIVE_DIRNAME}
+
+    def __bool__(self) -> bool:
+        return bool(self.files or self.added or self.removed)
+
+
+class EventCoalescer:
+    """Collects file events and hands them to `deliver` as ChangeBatches.
+
+    Thread-safe: watchdog calls add() from its observer thread, delivery
+    happens on a timer thread.
+    """
+
+    def __init__(self, deliver: Callable[[ChangeBatch], None], base_path: Path = BASE_PATH,
+                 window: float = DEBOUNCE_WINDOW, max_delay: float = MAX_DELAY):
+        self.deliver = deliver
+        self.active_path = Path(base_path) / ACTIVE_DIRNAME
+        self.current_path = Path(base_path) / CURRENT_DIRNAME
+        self.window = window
+        self.max_delay = max(max_delay, window)
+        self._lock = threading.Lock()
+        self._files: Dict[Path, str] = {}
+        self._dirs: Dict[str, str] = {}
+        self._events = 0
+        self._first: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def add(self, kind: str, path: Path, is_directory: bool = False) -> None:
+        """Record one created/modified/deleted event (moves are delete + create)."""
+        path = Path(path)
+        if is_directory:
+            # Only sejr folders themselves matter; their files get their own events
+            if path.parent != self.active_path or kind == MODIFIED:
+                return
+            target, key = self._dirs, path.name
+        elif path.name in FILE_CALLBACKS and self._relevant(path):
+            target, key = self._files, path
+        else:
+            return
+
+        with self._lock:
+            merged = _merge(target.get(key), kind)
+            if merged is None:
+                target.pop(key, None)
+            else:
+                target[key] = merged
+            self._events += 1
+            now = time.monotonic()
+            if self._first is None:
+                self._first = now
+            delay = min(self.window, self._first + self.max_delay - now)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(max(delay, 0), self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def add_move(self, src: Path, dest: Path, is_directory: bool = False) -> None:
+        self.add(DELETED, src, is_directory)
+        self.add(CREATED, dest, is_directory)
+
+    def _relevant(self, path: Path) -> bool:
+        if path.parent == self.current_path:
+            return True
+        return path.parent.parent == self.active_path
+
+    def flush(self) -> Optional[ChangeBatch]:
+        """Deliver everything collected so far (no-op if nothing net changed)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            files, dirs, events = self._files, self._dirs, self._events
+            self._files, self._dirs, self._events, self._first = {}, {}, 0, None
+
+        batch = ChangeBatch(files=files, events=events)
+        for name, kind in dirs.items():
+            if kind == CREATED:
+                batch.added.add(name)
+            elif kind == DELETED:
+                batch.removed.add(name)
+        batch.sejrs.update(batch.added, batch.removed)
+        for path in files:
+            if path.parent == self.current_path:
+                batch.current.add(path.name)
+            else:
+                batch.sejrs.add(path.parent.name)
+        if not batch:
+            return None
+        self.deliver(batch)
+        return batch
+
+    def cancel(self) -> None:
+        """Drop pending events without delivering them."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._files, self._dirs, self._events, self._first = {}, {}, 0, None
+
 
 class SejrFileHandler(FileSystemEventHandler):
-    """Handler for file system events"""
-    
-    def __init__(self, callbacks: Dict[str, Callable]):
-        self.callbacks = callbacks
-    
+    """Handler for file system events (feeds an EventCoalescer)"""
+
+    def __init__(self, coalescer: EventCoalescer):
+        self.coalescer = coalescer
+
+    def on_created(self, event: FileSystemEvent):
+        self.coalescer.add(CREATED, Path(event.src_path), event.is_directory)
+
     def on_modified(self, event: FileSystemEvent):
-        if event.is_directory:
-            return
-        
-        path = Path(event.src_path)
-        filename = path.name
-        
-        # Match against watched patterns
-        if filename == "SEJR_LISTE.md":
-            self._call("update_task_list", path)
-        elif filename == "STATUS.yaml":
-            self._call("update_progress", path)
-        elif filename == "AUTO_LOG.jsonl":
-            self._call("append_log_stream", path)
-        elif filename == "STATE.md":
-            self._call("refresh_overview", path)
-        elif filename == "PATTERNS.yaml":
-            self._call("update_patterns", path)
-        elif filename == "NEXT.md":
-            self._call("update_predictions", path)
-    
-    def _call(self, callback_name: str, path: Path):
-        if callback_name in self.callbacks:
-            self.callbacks[callback_name](path)
+        self.coalescer.add(MODIFIED, Path(event.src_path), event.is_directory)
+
+    def on_deleted(self, event: FileSystemEvent):
+        self.coalescer.add(DELETED, Path(event.src_path), event.is_directory)
+
+    def on_moved(self, event: FileSystemEvent):
+        self.coalescer.add_move(Path(event.src_path), Path(event.dest_path), event.is_directory)
 
 
 class FileWatcher:
     """Watches sejrliste files for changes"""
-    
-    def __init__(self):
-        self.observer = Observer()
+
+    def __init__(self, window: float = DEBOUNCE_WINDOW, max_delay: float = MAX_DELAY,
+                 base_path: Path = BASE_PATH):
+        self.base_path = Path(base_path)
+        self.observer = Observer() if Observer is not None else None
         self.callbacks: Dict[str, Callable] = {}
-    
+        self.coalescer = EventCoalescer(self.dispatch, self.base_path, window, max_delay)
+
     def register_callback(self, name: str, callback: Callable):
-        """Register a callback for a specific event"""
+        """Register a callback for a specific event ("batch" gets the whole ChangeBatch)"""
         self.callbacks[name] = callback
-    
+
+    def dispatch(self, batch: ChangeBatch):
+        """Fire the per-file callbacks once per changed file, then "batch"."""
+        for path, kind in batch.files.items():
+            if path.name == "SEJR_LISTE.md":
+                if kind == DELETED:
+                    get_delta_engine().forget(path.parent)
+                else:
+                    # Only the changed lines are re-tokenized; callbacks get the events
+                    result = get_delta_engine().update(path)
+                    if result.events:
+                        self._call("checkbox_delta", result)
+            if kind != DELETED:
+                self._call(FILE_CALLBACKS[path.name], path)
+        self._call("batch", batch)
+
+    def _call(self, callback_name: str, arg):
+        if callback_name in self.callbacks:
+            self.callbacks[callback_name](arg)
+
     def start(self):
         """Start watching for file changes"""
-        handler = SejrFileHandler(self.callbacks)
-        
+        if self.observer is None:
+            raise RuntimeError("watchdog is not installed")
+        handler = SejrFileHandler(self.coalescer)
+
         # Watch active sejr folder
-        active_path = BASE_PATH / "10_ACTIVE"
+        active_path = self.base_path / ACTIVE_DIRNAME
         if active_path.exists():
             self.observer.schedule(handler, str(active_path), recursive=True)
-        
+
         # Watch current state folder
-        current_path = BASE_PATH / "_CURRENT"
+        current_path = self.base_path / CURRENT_DIRNAME
         if current_path.exists():
             self.observer.schedule(handler, str(current_path), recursive=True)
-        
+
         self.observer.start()
-    
+
     def stop(self):
         """Stop watching"""
-        self.observer.stop()
-        self.observer.join()
-
-
-async def watch_files(app):
-    """Async file watcher integration with Textual app"""
-    watcher = FileWatcher()
-    
-    def on_update(path: Path):
-        app.load_sejrs()
-        app.refresh()
-    
-    watcher.register_callback("update_task_list", on_update)
-    watcher.register_callback("update_progress", on_update)
-    watcher.register_callback("append_log_stream", on_update)
-    watcher.register_callback("refresh_overview", on_update)
-    watcher.register_callback("update_patterns", on_update)
-    watcher.register_callback("update_predictions", on_update)
-    
-    watcher.start()
-    
+        self.coalescer.cancel()
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+
+
+async def watch_files(app, window: float = DEBOUNCE_WINDOW):
+    """Async file watcher integration with Textual app.
+
+    The app reloads once per batch, and only the sejr in it. With a sejr
+    daemon running its pushed changes are used instead, so the TUI runs
+    no observer of its own; if the daemon goes away, local watching takes
+    over (when watchdog is installed).
+    """
+    await watch_daemon(app)
+
+    watcher = FileWatcher(window=window)
+
+    def on_batch(batch: ChangeBatch):
+        if batch.sejrs:
+            app.call_from_thread(app.reload_sejrs, batch.sejrs, batch.structural)
+        app.call_from_thread(app.refresh)
+
+    def on_checkbox_delta(result):
+        for event in result.events[:3]:
+            app.call_from_thread(app.notify, f"{result.sejr}: {event.describe()}",
+                                 severity="information")
+
+    watcher.register_callback("checkbox_delta", on_checkbox_delta)
+    watcher.register_callback("batch", on_batch)
+
+    try:
+        watcher.start()
+    except RuntimeError:
+        return  # Neither a daemon nor watchdog: the app refreshes on demand (r)
+
     try:
         while True:
             await asyncio.sleep(1)
     finally:
         watcher.stop()
+
+
+async def watch_daemon(app, base_path: Path = BASE_PATH) -> None:
+    """Forward sejr daemon pushes to the app until the daemon goes away.
+
+    Returns at once if no daemon is running.
+    """
+    loop = asyncio.get_running_loop()
+    lost = asyncio.Event()
+
+    def on_change(change: dict):
+        names = set(change.get("active", [])) | set(change.get("logs", []))
+        if names or change.get("archived"):
+            # Archive changes only matter as a full reload (the grid shows the newest 10)
+            app.call_from_thread(app.reload_sejrs, names, bool(change.get("archived")))
+        app.call_from_thread(app.refresh)
+
+    if SejrClient(base_path).subscribe(on_change, lambda: loop.call_soon_threadsafe(lost.set)) is None:
+        return
+    await lost.wait()
@@ -3,10 +3,13 @@
 LOG STREAM WIDGET - Live AUTO_LOG.jsonl viewer
 """
 from pathlib import Path
-import json
+import sys
 from typing import List
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from auto_log import append_entry, latest_entries  # Segmented AUTO_LOG
+
 class LogStream:
     """Widget for displaying live log stream"""
 
@@ -17,15 +20,7 @@ class LogStream:
 
     def load(self, limit: int = 10) -> None:
         """Load recent log entries"""
-        self.entries = []
-        if self.log_file.exists():
-            lines = self.log_file.read_text(encoding="utf-8").strip().split("\n")
-            for line in lines[-limit:]:
-                try:
-                    entry = json.loads(line)
-                    self.entries.append(entry)
-                except json.JSONDecodeError:
-                    pass
+        self.entries = latest_entries(self.sejr_path, limit)
 
     def get_formatted_entries(self) -> List[str]:
         """Get entries formatted for display"""
@@ -44,6 +39,5 @@ class LogStream:
             "action": action,
             "details": details,
         }
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_entry(self.sejr_path, entry)
         self.entries.append(entry)
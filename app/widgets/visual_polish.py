@@ -15,6 +15,10 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from archive_snapshot import get_archive_records  # Packed 90_ARCHIVE snapshot
 
 
 # Status colors (ANSI escape codes for terminal)
@@ -226,7 +230,7 @@ class StatisticsView:
         self.patterns_file = system_path / "_CURRENT" / "PATTERNS.yaml"
 
     def get_stats(self) -> Dict[str, Any]:
-        """Calculate all statistics."""
+        """Calculate all statistics (archive numbers come from one snapshot read)."""
         return {
             "sejr_completed": self._count_archived(),
             "tests_passed": self._count_tests(),
@@ -237,28 +241,11 @@ class StatisticsView:
 
     def _count_archived(self) -> int:
         """Count archived sejr."""
-        if not self.archive_dir.exists():
-            return 0
-        return len([d for d in self.archive_dir.iterdir() if d.is_dir()])
+        return len(get_archive_records(self.system_path))
 
     def _count_tests(self) -> int:
-        """Count total tests passed from archives."""
-        count = 0
-        if not self.archive_dir.exists():
-            return 0
-
-        for archive in self.archive_dir.iterdir():
-            if archive.is_dir():
-                conclusion = archive / "CONCLUSION.md"
-                if conclusion.exists():
-                    content = conclusion.read_text()
-                    # Look for test count patterns
-                    import re
-                    match = re.search(r'(\d+)\s*tests?\s*passed', content, re.IGNORECASE)
-                    if match:
-                        count += int(match.group(1))
-
-        return count
+        """Count total tests passed from archives ("N tests passed" in CONCLUSION.md)."""
+        return sum(r.tests_passed for r in get_archive_records(self.system_path))
 
     def _count_patterns(self) -> int:
         """Count learned patterns."""
@@ -282,19 +269,7 @@ class StatisticsView:
 
     def _count_total_checkboxes(self) -> int:
         """Count total checkboxes completed across all archives."""
-        count = 0
-        if not self.archive_dir.exists():
-            return 0
-
-        for archive in self.archive_dir.iterdir():
-            if archive.is_dir():
-                sejr_file = archive / "SEJR_LISTE.md"
-                if sejr_file.exists():
-                    content = sejr_file.read_text()
-                    import re
-                    count += len(re.findall(r'- \[[xX]\]', content))
-
-        return count
+        return sum(r.checkboxes_done for r in get_archive_records(self.system_path))
 
     def render(self, width: int = 50) -> str:
         """Render statistics panel."""
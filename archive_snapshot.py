@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+ARCHIVE SNAPSHOT — Pakket snapshot af 90_ARCHIVE i én fil
+=========================================================
+
+WHAT: Én binær fil (_CURRENT/ARCHIVE_SNAPSHOT.bin) med en kompakt record
+      pr. arkiveret sejr: scores, checkbox-tal, tests, tidsstempler,
+      diplom-rang samt learnings / reusable / forbedringer / action-tællinger
+WHY:  Arkiverede sejr ændres aldrig efter archive_sejr, men
+      update_archive_index, show_leaderboard, StatisticsView, pages/2_Arkiv
+      og auto_learn læste CONCLUSION.md, STATUS.yaml, ARCHIVE_METADATA.yaml
+      og SEJR_DIPLOM.md for ALLE arkiver ved hvert kald
+WHO:  Skrives af scripts/auto_archive.archive_sejr (append). Læses af
+      auto_archive, admiral_tracker, auto_learn, app/widgets/visual_polish
+      og pages/2_Arkiv
+HOW:  from archive_snapshot import get_archive_records
+      for rec in get_archive_records(SYSTEM_PATH):
+          print(rec.name, rec.total_score)
+
+FORMAT (little-endian):
+  b"SEJRSNP1"
+  pr. record: <I længde> + RECORD_HEADER + navn (UTF-8) + extras (JSON, UTF-8)
+  Numeriske kolonner ligger i den faste header, så stats kan læses uden
+  at JSON-dekode. Senere record for samme navn vinder. En afkortet hale
+  (afbrudt append) ignoreres og fjernes ved næste omskrivning.
+
+Snapshot er en cache: records valideres mod en stat-signatur af
+arkivmappen og dens filer (ingen læsning), og manglende eller ændrede
+arkiver genopbygges automatisk.
+
+Version: 3.0.0
+"""
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from auto_log import SEGMENT_DIRNAME, MANIFEST_FILENAME, action_counts
+from sejr_parser import parse_sejr
+from sejr_yaml import load_yaml_file
+
+SNAPSHOT_FILENAME = "ARCHIVE_SNAPSHOT.bin"
+MAGIC = b"SEJRSNP1"
+
+# signature, archived_ts, total, p1, p2, p3, checkboxes_done, checkboxes_total,
+# tests_passed, flags, name_len
+RECORD_HEADER = struct.Struct("<qdhhhhIIIBH")
+LENGTH = struct.Struct("<I")
+
+FLAG_CONCLUSION = 1
+FLAG_DIPLOM = 2
+FLAG_THREE_PASS = 4
+
+# Files whose stat decides whether an archive record is still valid
+TRACKED_FILES = ("STATUS.yaml", "CONCLUSION.md", "SEJR_DIPLOM.md", "ARCHIVE_METADATA.yaml",
+                 "SEJR_LISTE.md", "ADMIRAL_SCORE.yaml", "AUTO_LOG.jsonl",
+                 f"{SEGMENT_DIRNAME}/{MANIFEST_FILENAME}")
+
+TESTS_PASSED_RE = re.compile(r'(\d+)\s*tests?\s*passed', re.IGNORECASE)
+DIPLOM_SCORE_RE = re.compile(r"SCORE:\s*(\d+)/30")
+DIPLOM_RANK_RE = re.compile(r"RANG:\s*(\w+)")
+
+
+# ============================================================================
+# EXTRACTION (shared with auto_archive / auto_learn)
+# ============================================================================
+
+def extract_status_fields(status: dict) -> dict:
+    """Extract status fields from either flat or nested STATUS.yaml format.
+
+    Supports both:
+    - Flat format: status.get("pass_1_complete") (legacy)
+    - Nested format: status['pass_tracking']['pass_1']['complete'] (current)
+    """
+    pt = status.get("pass_tracking", {})
+    st = status.get("score_tracking", {})
+
+    if pt:
+        # Nested format (current standard)
+        p1 = pt.get("pass_1", {})
+        p2 = pt.get("pass_2", {})
+        p3 = pt.get("pass_3", {})
+        totals = st.get("totals", pt.get("totals", {}))
+        return {
+            "can_archive": pt.get("can_archive", False),
+            "current_pass": pt.get("current_pass", 0),
+            "pass_1_complete": p1.get("complete", False),
+            "pass_2_complete": p2.get("complete", False),
+            "pass_3_complete": p3.get("complete", False),
+            "pass_1_score": p1.get("score", 0),
+            "pass_2_score": p2.get("score", 0),
+            "pass_3_score": p3.get("score", 0),
+            "total_score": totals.get("total_score", totals.get("score", 0)),
+            "final_verification_complete": p3.get("final_verification", False),
+            "pass_1_checkboxes": p1.get("checkboxes_done", 0),
+            "pass_2_checkboxes": p2.get("checkboxes_done", 0),
+            "pass_3_checkboxes": p3.get("checkboxes_done", 0),
+        }
+    else:
+        # Flat format (legacy)
+        return {
+            "can_archive": status.get("can_archive", False),
+            "current_pass": status.get("current_pass", 0),
+            "pass_1_complete": status.get("pass_1_complete", False),
+            "pass_2_complete": status.get("pass_2_complete", False),
+            "pass_3_complete": status.get("pass_3_complete", False),
+            "pass_1_score": status.get("pass_1_score", 0),
+            "pass_2_score": status.get("pass_2_score", 0),
+            "pass_3_score": status.get("pass_3_score", 0),
+            "total_score": status.get("total_score", 0),
+            "final_verification_complete": status.get("final_verification_complete", False),
+            "pass_1_checkboxes": status.get("pass_1_checkboxes", 0),
+            "pass_2_checkboxes": status.get("pass_2_checkboxes", 0),
+            "pass_3_checkboxes": status.get("pass_3_checkboxes", 0),
+        }
+
+
+def extract_conclusion_sections(content: str) -> Tuple[List[str], List[str], List[str]]:
+    """(learnings, reusable, improvements) from a CONCLUSION.md."""
+    lines = content.split('\n')
+
+    # "## Hvad Lærte Vi" — prose lines (not bullets)
+    learnings = []
+    in_learnings = False
+    for line in lines:
+        if '## Hvad Lærte Vi' in line:
+            in_learnings = True
+            continue
+        if in_learnings:
+            if line.startswith('##'):
+                break
+            if line.strip() and not line.strip().startswith('-'):
+                learnings.append(line.strip())
+
+    # "## Hvad Kan Genbruges" — bullets
+    reusable = []
+    in_reusable = False
+    for line in lines:
+        if '## Hvad Kan Genbruges' in line:
+            in_reusable = True
+            continue
+        if in_reusable:
+            if line.startswith('##'):
+                break
+            if line.strip().startswith('-'):
+                reusable.append(line.strip().lstrip('- '))
+
+    # "### Pass X → Pass Y Forbedring" blocks
+    improvements = []
+    in_improvement = False
+    for line in lines:
+        if '→' in line and 'Forbedring' in line:
+            in_improvement = True
+            continue
+        if in_improvement:
+            if line.startswith('#'):
+                in_improvement = False
+                continue
+            if line.strip():
+                improvements.append(line.strip())
+
+    return learnings, reusable, improvements
+
+
+def count_log_actions(log_file: Path) -> Dict[str, int]:
+    """Normalized action name -> count for an AUTO_LOG.jsonl (including its sealed segments)."""
+    counts: Counter = Counter()
+    for action, count in action_counts(log_file.parent).items():
+        counts[action.lower().strip()] += count
+    return dict(counts)
+
+
+def _int(value: Any) -> int:
+    """Scores in old STATUS files may be strings ('7') or missing."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def folder_signature(folder: Path) -> int:
+    """64-bit stat signature of an archive folder and its tracked files."""
+    parts = []
+    for path in (folder,) + tuple(folder / name for name in TRACKED_FILES):
+        try:
+            st = path.stat()
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    digest = hashlib.blake2b("|".join(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+# ============================================================================
+# RECORD
+# ============================================================================
+
+@dataclass
+class ArchiveRecord:
+    """Compact summary of one archived sejr."""
+    name: str
+    signature: int = 0
+    archived_ts: float = 0.0
+    total_score: int = 0
+    pass_1_score: int = 0
+    pass_2_score: int = 0
+    pass_3_score: int = 0
+    checkboxes_done: int = 0
+    checkboxes_total: int = 0
+    tests_passed: int = 0
+    flags: int = 0
+    _extras_raw: bytes = field(default=b"{}", repr=False)
+    _extras: Optional[dict] = field(default=None, repr=False)
+
+    @property
+    def has_conclusion(self) -> bool:
+        return bool(self.flags & FLAG_CONCLUSION)
+
+    @property
+    def has_diplom(self) -> bool:
+        return bool(self.flags & FLAG_DIPLOM)
+
+    @property
+    def three_pass_verified(self) -> bool:
+        return bool(self.flags & FLAG_THREE_PASS)
+
+    @property
+    def extras(self) -> dict:
+        """Variable-size fields, JSON-decoded on first access.
+
+        Keys: archived_at, diplom_score, diplom_rank, admiral_score,
+        status_score, created_by, metrics, learnings, reusable,
+        improvements, action_counts
+        """
+        if self._extras is None:
+            try:
+                self._extras = json.loads(self._extras_raw.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                self._extras = {}
+        return self._extras
+
+    def pack(self) -> bytes:
+        name = self.name.encode("utf-8")
+        extras = json.dumps(self.extras, ensure_ascii=False, default=str).encode("utf-8")
+        payload = RECORD_HEADER.pack(
+            self.signature, self.archived_ts,
+            self.total_score, self.pass_1_score, self.pass_2_score, self.pass_3_score,
+            self.checkboxes_done, self.checkboxes_total, self.tests_passed,
+            self.flags, len(name),
+        ) + name + extras
+        return LENGTH.pack(len(payload)) + payload
+
+    @classmethod
+    def unpack(cls, payload: bytes) -> "ArchiveRecord":
+        (signature, archived_ts, total, p1, p2, p3, done, cb_total, tests,
+         flags, name_len) = RECORD_HEADER.unpack_from(payload)
+        start = RECORD_HEADER.size
+        name = bytes(payload[start:start + name_len]).decode("utf-8")
+        return cls(name, signature, archived_ts, total, p1, p2, p3, done, cb_total,
+                   tests, flags, bytes(payload[start + name_len:]))
+
+
+def build_record(folder: Path) -> ArchiveRecord:
+    """Read one archive folder into an ArchiveRecord (the expensive part)."""
+    signature = folder_signature(folder)
+    status = load_yaml_file(folder / "STATUS.yaml")
+    metadata = load_yaml_file(folder / "ARCHIVE_METADATA.yaml")
+    try:
+        s = extract_status_fields(status)
+    except AttributeError:  # Malformed nested sections
+        s = {}
+
+    record = ArchiveRecord(
+        name=folder.name,
+        signature=signature,
+        total_score=_int(s.get("total_score")),
+        pass_1_score=_int(s.get("pass_1_score")),
+        pass_2_score=_int(s.get("pass_2_score")),
+        pass_3_score=_int(s.get("pass_3_score")),
+    )
+
+    archived_at = metadata.get("archived_at")
+    try:
+        record.archived_ts = datetime.fromisoformat(str(archived_at)).timestamp()
+    except (TypeError, ValueError):
+        try:
+            record.archived_ts = folder.stat().st_mtime
+        except OSError:
+            pass
+    if metadata.get("three_pass_verified"):
+        record.flags |= FLAG_THREE_PASS
+
+    extras: Dict[str, Any] = {
+        "archived_at": str(archived_at) if archived_at else None,
+        # STATUS.yaml "score"/"created_by" for the admiral leaderboard (None = no STATUS.yaml)
+        "status_score": status.get("score", 0) if (folder / "STATUS.yaml").exists() else None,
+        "created_by": status.get("created_by", "Kv1nt"),
+        # Flat keys, as auto_learn has always read them
+        "metrics": {
+            "pass_1_score": status.get("pass_1_score", 0),
+            "pass_2_score": status.get("pass_2_score", 0),
+            "pass_3_score": status.get("pass_3_score", 0),
+            "total_score": status.get("total_score", 0),
+        },
+        "learnings": [],
+        "reusable": [],
+        "improvements": [],
+        "action_counts": {},
+        "diplom_score": None,
+        "diplom_rank": None,
+        "admiral_score": None,
+    }
+
+    conclusion = _read(folder / "CONCLUSION.md")
+    if conclusion is not None:
+        record.flags |= FLAG_CONCLUSION
+        extras["learnings"], extras["reusable"], extras["improvements"] = extract_conclusion_sections(conclusion)
+        match = TESTS_PASSED_RE.search(conclusion)
+        if match:
+            record.tests_passed = int(match.group(1))
+
+    diplom = _read(folder / "SEJR_DIPLOM.md")
+    if diplom is not None:
+        record.flags |= FLAG_DIPLOM
+        match = DIPLOM_SCORE_RE.search(diplom)
+        if match:
+            extras["diplom_score"] = int(match.group(1))
+            rank_match = DIPLOM_RANK_RE.search(diplom)
+            extras["diplom_rank"] = rank_match.group(1) if rank_match else None
+
+    sejr_liste = _read(folder / "SEJR_LISTE.md")
+    if sejr_liste is not None:
+        record.checkboxes_done, record.checkboxes_total = parse_sejr(sejr_liste).totals()
+
+    if (folder / "ADMIRAL_SCORE.yaml").exists():
+        extras["admiral_score"] = load_yaml_file(folder / "ADMIRAL_SCORE.yaml")
+
+    log_file = folder / "AUTO_LOG.jsonl"
+    if log_file.exists():
+        extras["action_counts"] = count_log_actions(log_file)
+
+    record._extras = extras
+    return record
+
+
+# ============================================================================
+# SNAPSHOT FILE
+# ============================================================================
+
+class ArchiveSnapshot:
+    """Reader/writer for the packed archive snapshot of one system path."""
+
+    def __init__(self, system_path: Path, path: Optional[Path] = None):
+        self.system_path = Path(system_path)
+        self.archive_dir = self.system_path / "90_ARCHIVE"
+        self.path = Path(path) if path else self.system_path / "_CURRENT" / SNAPSHOT_FILENAME
+        self._lock = threading.Lock()
+        self.build_count = 0  # Archive folders read by this instance (for diagnostics)
+
+    def read(self) -> Dict[str, ArchiveRecord]:
+        """All records in the file (last one per name wins). One open + mmap."""
+        records: Dict[str, ArchiveRecord] = {}
+        try:
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < len(MAGIC):
+                    return records
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm[:len(MAGIC)] != MAGIC:
+                        return records
+                    pos = len(MAGIC)
+                    while pos + LENGTH.size <= size:
+                        (length,) = LENGTH.unpack_from(mm, pos)
+                        pos += LENGTH.size
+                        if length < RECORD_HEADER.size or pos + length > size:
+                            break  # Truncated tail from an interrupted append
+                        try:
+                            record = ArchiveRecord.unpack(mm[pos:pos + length])
+                        except (struct.error, UnicodeDecodeError):
+                            break
+                        records[record.name] = record
+                        pos += length
+        except (OSError, ValueError):
+            pass
+        return records
+
+    def _write_all(self, records: List[ArchiveRecord]) -> None:
+        """Rewrite the whole file atomically (temp file + os.replace)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.path.parent), prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                for record in records:
+                    f.write(record.pack())
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    def append(self, folder: Path) -> ArchiveRecord:
+        """Build and append the record for a freshly archived folder."""
+        record = build_record(Path(folder))
+        self.build_count += 1
+        with self._lock:
+            try:
+                if not self.path.exists() or self.path.stat().st_size < len(MAGIC):
+                    self._write_all([record])
+                else:
+                    with open(self.path, "ab") as f:
+                        f.write(record.pack())
+            except OSError:
+                pass  # Snapshot is a cache — readers rebuild what is missing
+        return record
+
+    def records(self) -> List[ArchiveRecord]:
+        """Valid records for every archive folder, sorted by name.
+
+        Validation is stat-only. Missing or changed folders are re-read,
+        and the file is compacted (rewritten) when anything changed.
+        """
+        if not self.archive_dir.exists():
+            return []
+        with self._lock:
+            stored = self.read()
+            result = []
+            dirty = False
+            for folder in sorted(self.archive_dir.iterdir()):
+                if not folder.is_dir() or folder.name.startswith('.'):
+                    continue
+                record = stored.pop(folder.name, None)
+                if record is None or record.signature != folder_signature(folder):
+                    record = build_record(folder)
+                    self.build_count += 1
+                    dirty = True
+                result.append(record)
+            if dirty or stored:
+                try:
+                    self._write_all(result)
+                except OSError:
+                    pass
+        return result
+
+    def rebuild(self) -> List[ArchiveRecord]:
+        """Discard the snapshot and re-read every archive folder."""
+        with self._lock:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+        return self.records()
+
+
+def get_archive_records(system_path: Path) -> List[ArchiveRecord]:
+    """Validated records for all archived sejr of a system path."""
+    return ArchiveSnapshot(system_path).records()
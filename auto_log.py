@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+AUTO LOG — Segmenteret AUTO_LOG med rotation, komprimering og manifest
+======================================================================
+
+WHAT: AUTO_LOG.jsonl er nu kun det "varme" segment. Når det når
+      SEGMENT_MAX_BYTES eller dets ældste entry er ældre end
+      SEGMENT_MAX_AGE, flyttes det til AUTO_LOG.d/NNNNNN.jsonl.gz (gzip),
+      og AUTO_LOG.d/MANIFEST.json får segmentets tidsinterval, antal
+      entries og action-tællinger. Små kolde segmenter slås sammen
+      (compaction)
+WHY:  TaskExecutor.log_activity, LogStream.append_entry og
+      ModelHandler._log_to_auto_log appendede til én ubegrænset fil pr.
+      sejr, og "seneste N" / action-tællinger læste hele historikken.
+      Nu læser tidsinterval-forespørgsler kun de segmenter manifestet
+      peger på, og "seneste N" læser det varme segment baglæns
+WHO:  Skrives af app/executor, app/widgets/log_stream, app/models/model_handler.
+      Læses af scripts/view, app/sejr_app, web_app/web_app_en og archive_snapshot
+HOW:  from auto_log import append_entry, latest_entries, read_entries
+      append_entry(sejr_path, {"timestamp": ..., "action": "verify"})
+      for entry in latest_entries(sejr_path, 10): ...            # ældste først
+      for entry in read_entries(sejr_path, since="2026-01-30"): ...
+
+Eksisterende læsere af AUTO_LOG.jsonl (auto_track) virker uændret: den
+nyeste entry ligger altid i det varme segment, og rotation ses som en ny
+inode. Tidsstempler sammenlignes som ISO-strenge. Hver entry spejles også
+i event_store (_CURRENT/events.db) til forespørgsler på tværs af sejr.
+
+Version: 3.0.0
+"""
+import gzip
+import json
+import os
+import tempfile
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from log_tail import tail_lines
+
+try:
+    import fcntl
+except ImportError:  # Not POSIX — single-writer assumption
+    fcntl = None
+
+LOG_FILENAME = "AUTO_LOG.jsonl"
+SEGMENT_DIRNAME = "AUTO_LOG.d"
+MANIFEST_FILENAME = "MANIFEST.json"
+SEGMENT_SUFFIX = ".jsonl.gz"
+
+SEGMENT_MAX_BYTES = 256 * 1024          # Rotate the hot segment at this size
+SEGMENT_MAX_AGE = timedelta(days=7)     # ... or when its oldest entry is this old
+COMPACT_MIN_SEGMENTS = 4                # Merge once this many small cold segments exist
+COMPACT_SMALL_BYTES = SEGMENT_MAX_BYTES // 4
+
+
+def _ts(entry: dict) -> str:
+    """Comparable timestamp key ('' if missing)."""
+    return str(entry.get("timestamp", "")).replace(" ", "T")[:19]
+
+
+def _parse_lines(lines) -> List[dict]:
+    entries = []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+@contextmanager
+def _locked(path: Path):
+    """Exclusive advisory lock on a lock file (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# ============================================================================
+# MANIFEST
+# ============================================================================
+
+def load_manifest(sejr_path: Path) -> List[dict]:
+    """Cold segments, oldest first: file, first_ts, last_ts, count, bytes, actions."""
+    try:
+        data = json.loads((Path(sejr_path) / SEGMENT_DIRNAME / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    segments = data.get("segments", []) if isinstance(data, dict) else []
+    return [s for s in segments if isinstance(s, dict) and "file" in s]
+
+
+def _save_manifest(seg_dir: Path, segments: List[dict]) -> None:
+    payload = json.dumps({"version": 1, "segments": segments}, indent=1, ensure_ascii=False)
+    _atomic_write(seg_dir / MANIFEST_FILENAME, payload.encode("utf-8"))
+
+
+def _next_name(seg_dir: Path, segments: List[dict]) -> str:
+    numbers = [0]
+    for name in [s["file"] for s in segments] + os.listdir(seg_dir):
+        stem = name.split(".", 1)[0]
+        if stem.isdigit():
+            numbers.append(int(stem))
+    return f"{max(numbers) + 1:06d}"
+
+
+def _summarize(entries: List[dict], name: str, raw_bytes: int) -> dict:
+    stamps = [t for t in (_ts(e) for e in entries) if t]
+    actions = Counter(str(e.get("action", "unknown")) for e in entries)
+    return {
+        "file": name,
+        "first_ts": min(stamps) if stamps else "",
+        "last_ts": max(stamps) if stamps else "",
+        "count": len(entries),
+        "bytes": raw_bytes,
+        "actions": dict(actions),
+    }
+
+
+def _write_segment(seg_dir: Path, stem: str, raw: bytes) -> dict:
+    """Compress raw JSONL into a new cold segment and return its manifest entry."""
+    name = stem + SEGMENT_SUFFIX
+    _atomic_write(seg_dir / name, gzip.compress(raw, compresslevel=6))
+    return _summarize(_parse_lines(raw.split(b"\n")), name, len(raw))
+
+
+def _read_segment(seg_dir: Path, name: str) -> List[dict]:
+    try:
+        with gzip.open(seg_dir / name, "rb") as f:
+            return _parse_lines(f.read().split(b"\n"))
+    except (OSError, EOFError):
+        return []
+
+
+def _seal_pending(seg_dir: Path, segments: List[dict]) -> bool:
+    """Compress raw segments left behind by an interrupted rotation."""
+    changed = False
+    for raw_path in sorted(seg_dir.glob("[0-9]*.jsonl")):
+        try:
+            raw = raw_path.read_bytes()
+        except OSError:
+            continue
+        if raw.strip():
+            segments.append(_write_segment(seg_dir, raw_path.name.split(".", 1)[0], raw))
+        raw_path.unlink()
+        changed = True
+    return changed
+
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+def _needs_rotation(f, now: datetime) -> bool:
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        return False
+    if size >= SEGMENT_MAX_BYTES:
+        return True
+    f.seek(0)
+    first = _parse_lines([f.readline()])
+    if not first or not _ts(first[0]):
+        return False
+    return _ts(first[0]) < (now - SEGMENT_MAX_AGE).isoformat()[:19]
+
+
+def _rotate_locked(sejr_path: Path, log_file: Path) -> bool:
+    """Move the hot segment (caller holds its lock) into AUTO_LOG.d and seal it."""
+    seg_dir = sejr_path / SEGMENT_DIRNAME
+    seg_dir.mkdir(exist_ok=True)
+    with _locked(seg_dir / ".lock"):
+        segments = load_manifest(sejr_path)
+        # Raw name first: a crash after the rename is repaired by _seal_pending
+        os.replace(log_file, seg_dir / (_next_name(seg_dir, segments) + ".jsonl"))
+        _seal_pending(seg_dir, segments)
+        _compact_segments(seg_dir, segments)
+        _save_manifest(seg_dir, segments)
+    return True
+
+
+def append_entry(sejr_path: Path, entry: dict) -> None:
+    """Append one entry to the sejr's AUTO_LOG, rotating the hot segment first if due."""
+    sejr_path = Path(sejr_path)
+    log_file = sejr_path / LOG_FILENAME
+    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+    now = datetime.now()
+    while True:
+        with open(log_file, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                # Rotated by another writer while we waited: use the new file
+                try:
+                    if os.stat(log_file).st_ino != os.fstat(f.fileno()).st_ino:
+                        continue
+                except FileNotFoundError:
+                    continue
+            if _needs_rotation(f, now):
+                _rotate_locked(sejr_path, log_file)
+                continue
+            f.seek(0, os.SEEK_END)
+            f.write(line)
+            break
+    # Imported here: event_store reads segments through this module
+    from event_store import record_event
+    record_event(sejr_path, entry)
+
+
+def rotate(sejr_path: Path) -> bool:
+    """Seal the current hot segment now. False if there was nothing to rotate."""
+    sejr_path = Path(sejr_path)
+    log_file = sejr_path / LOG_FILENAME
+    try:
+        f = open(log_file, "rb")
+    except OSError:
+        return False
+    with f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        return _rotate_locked(sejr_path, log_file)
+
+
+def _compact_segments(seg_dir: Path, segments: List[dict]) -> int:
+    """Merge runs of adjacent small segments in place. Returns segments removed."""
+    small = [s for s in segments if s.get("bytes", 0) < COMPACT_SMALL_BYTES]
+    if len(small) < COMPACT_MIN_SEGMENTS:
+        return 0
+    merged: List[dict] = []
+    run: List[dict] = []
+    removed = 0
+
+    def flush():
+        nonlocal removed
+        if len(run) > 1:
+            raw = b"".join(
+                b"".join(json.dumps(e, ensure_ascii=False).encode("utf-8") + b"\n"
+                         for e in _read_segment(seg_dir, s["file"]))
+                for s in run)
+            merged.append(_write_segment(seg_dir, _next_name(seg_dir, segments + merged), raw))
+            for s in run:
+                try:
+                    (seg_dir / s["file"]).unlink()
+                except OSError:
+                    pass
+            removed += len(run) - 1
+        else:
+            merged.extend(run)
+        run.clear()
+
+    for seg in segments:
+        size = seg.get("bytes", 0)
+        if size < COMPACT_SMALL_BYTES and sum(s.get("bytes", 0) for s in run) + size <= SEGMENT_MAX_BYTES:
+            run.append(seg)
+            continue
+        flush()
+        if size < COMPACT_SMALL_BYTES:
+            run.append(seg)
+        else:
+            merged.append(seg)
+    flush()
+    segments[:] = merged
+    return removed
+
+
+def compact(sejr_path: Path) -> int:
+    """Merge small adjacent cold segments. Returns the number of segments removed."""
+    seg_dir = Path(sejr_path) / SEGMENT_DIRNAME
+    if not seg_dir.is_dir():
+        return 0
+    with _locked(seg_dir / ".lock"):
+        segments = load_manifest(sejr_path)
+        changed = _seal_pending(seg_dir, segments)
+        removed = _compact_segments(seg_dir, segments)
+        if changed or removed:
+            _save_manifest(seg_dir, segments)
+    return removed
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+def read_entries(sejr_path: Path, since: Optional[str] = None,
+                 until: Optional[str] = None, include_hot: bool = True) -> Iterator[dict]:
+    """Entries with since <= timestamp <= until, oldest segment first.
+
+    Cold segments whose manifest range lies outside the interval are not
+    opened. Bounds are ISO strings compared on their first 19 characters.
+    include_hot=False reads only the sealed segments.
+    """
+    sejr_path = Path(sejr_path)
+    lo = since.replace(" ", "T")[:19] if since else None
+    hi = until.replace(" ", "T")[:19] if until else None
+
+    def wanted(entry: dict) -> bool:
+        ts = _ts(entry)
+        return (lo is None or ts >= lo) and (hi is None or ts[:len(hi)] <= hi)
+
+    seg_dir = sejr_path / SEGMENT_DIRNAME
+    for seg in load_manifest(sejr_path):
+        if lo is not None and seg.get("last_ts") and seg["last_ts"] < lo:
+            continue
+        if hi is not None and seg.get("first_ts") and seg["first_ts"][:len(hi)] > hi:
+            continue
+        for entry in _read_segment(seg_dir, seg["file"]):
+            if wanted(entry):
+                yield entry
+    if not include_hot:
+        return
+    try:
+        with open(sejr_path / LOG_FILENAME, "rb") as f:
+            hot = _parse_lines(f)
+    except OSError:
+        return
+    for entry in hot:
+        if wanted(entry):
+            yield entry
+
+
+def latest_entries(sejr_path: Path, n: int) -> List[dict]:
+    """The last n entries, oldest first. Cold segments are opened only if needed."""
+    sejr_path = Path(sejr_path)
+    if n <= 0:
+        return []
+    entries = _parse_lines(tail_lines(sejr_path / LOG_FILENAME, n))
+    seg_dir = sejr_path / SEGMENT_DIRNAME
+    for seg in reversed(load_manifest(sejr_path)):
+        if len(entries) >= n:
+            break
+        entries = _read_segment(seg_dir, seg["file"])[-(n - len(entries)):] + entries
+    return entries[-n:]
+
+
+def action_counts(sejr_path: Path) -> Dict[str, int]:
+    """Action name -> count over the whole log (cold counts come from the manifest)."""
+    sejr_path = Path(sejr_path)
+    counts: Counter = Counter()
+    for seg in load_manifest(sejr_path):
+        counts.update(seg.get("actions", {}))
+    try:
+        with open(sejr_path / LOG_FILENAME, "rb") as f:
+            counts.update(str(e.get("action", "unknown")) for e in _parse_lines(f))
+    except OSError:
+        pass
+    return dict(counts)
@@ -36,6 +36,9 @@ import json
 import re
 import hashlib
 
+from sejr_parser import Checkbox, parse_sejr  # Single-pass SEJR_LISTE.md parser
+from event_store import record_event  # Cross-sejr activity store
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -58,6 +61,16 @@ class EnforcementState:
     BLOCKED = " BLOCKED"          # Blocked by failed verification
     SKIPPED_TEMP = "⏸ TEMP SKIP"   # Temporarily skipped (must return)
 
+def _checkpoint_section(checkbox: Checkbox) -> str:
+    """Section label for a checkpoint: PHASE_N heading, else PASS_N / region"""
+    match = re.search(r'PHASE (\d)', checkbox.section.upper())
+    if match:
+        return f"PHASE_{match.group(1)}"
+    if checkbox.pass_num:
+        suffix = "_REVIEW" if checkbox.region == "review" else ""
+        return f"PASS_{checkbox.pass_num}{suffix}"
+    return checkbox.region.upper()
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CHECKPOINT DEFINITION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -128,37 +141,17 @@ class EnforcementEngine:
         if not sejr_file.exists():
             return
 
-        content = sejr_file.read_text()
+        doc = parse_sejr(sejr_file.read_text(encoding="utf-8"))
 
-        # Find all checkboxes with their context
-        checkbox_pattern = r'- \[( |x|X)\] (.+?)(?:\n|$)'
-        matches = re.findall(checkbox_pattern, content)
-
-        current_section = "UNKNOWN"
         checkpoint_id = 0
         prev_id = None
 
-        for match in matches:
-            is_checked = match[0].lower() == 'x'
-            task_text = match[1].strip()
-
-            # Detect section from task context
-            if "PHASE 0" in task_text or "Research" in task_text:
-                current_section = "PHASE_0"
-            elif "PHASE 1" in task_text or "Planning" in task_text:
-                current_section = "PHASE_1"
-            elif "PHASE 2" in task_text or "Development" in task_text:
-                current_section = "PHASE_2"
-            elif "PHASE 3" in task_text or "Verification" in task_text:
-                current_section = "PHASE_3"
-            elif "PHASE 4" in task_text or "Git" in task_text:
-                current_section = "PHASE_4"
-            elif "Pass 1" in task_text.lower():
-                current_section = "PASS_1"
-            elif "Pass 2" in task_text.lower():
-                current_section = "PASS_2"
-            elif "Pass 3" in task_text.lower():
-                current_section = "PASS_3"
+        for checkbox in doc.checkboxes:
+            if not checkbox.text:
+                continue
+            is_checked = checkbox.checked
+            task_text = checkbox.text
+            current_section = _checkpoint_section(checkbox)
 
             cp_id = f"CP_{checkpoint_id:03d}"
 
@@ -421,12 +414,14 @@ class EnforcementEngine:
 
     def _log_action(self, action: str, checkpoint_id: str, details: str):
         """Log an enforcement action"""
-        self.enforcement_log.append({
+        entry = {
             'timestamp': datetime.now().isoformat(),
             'action': action,
             'checkpoint_id': checkpoint_id,
             'details': details
-        })
+        }
+        self.enforcement_log.append(entry)
+        record_event(self.sejr_path, entry, source="enforcement")
 
     # ═══════════════════════════════════════════════════════════════════════════
     # STATUS & VISUALIZATION
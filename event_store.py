@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+EVENT STORE — Forespørgbar aktivitets-database på tværs af alle sejr
+====================================================================
+
+WHAT: SQLite (WAL) i _CURRENT/events.db med én række pr. hændelse:
+      tidsstempel, sejr, action, model, kilde og hele entry (JSON), med
+      indekser på sejr, action, model og tidsstempel. Fødes af loggerne
+      (auto_log.append_entry, EnforcementEngine) og synkroniseres
+      inkrementelt fra AUTO_LOG (varmt segment + AUTO_LOG.d) og
+      ENFORCEMENT_STATE.json for hændelser skrevet af andre værktøjer
+WHY:  Aktivitet lå spredt i AUTO_LOG.jsonl pr. mappe, enforcement_log
+      (afkortet til 100) og ADMIRAL_SCORE-tællere, så hver statistik på
+      tværs af sejr var en scanning af hundredvis af JSONL-filer
+WHO:  Skrives af auto_log og enforcement_engine. Læses af scripts/auto_learn,
+      scripts/auto_predict, pages/4_Statistik og LiveActivityMonitor
+      (masterpiece/masterpiece_en)
+HOW:  from event_store import get_event_store
+      store = get_event_store(SYSTEM_PATH)
+      store.sync()                                       # stat-only for uændrede logs
+      store.count_by("action", since="2026-01-01")       # {"verify": 42, ...}
+      store.query(sejr="MIN_SEJR", limit=10)             # nyeste først
+
+Samme hændelse importeres kun én gang (UNIQUE på sejr + indholds-digest),
+så dobbelt-skrivning fra logger og sync er ufarlig. Bevidst konsekvens: to
+byte-identiske entries i samme sejr (samme timestamp, action og detaljer)
+gemmes som én hændelse. Kildens byte-offset kan ikke indgå i digesten, fordi
+loggeren skriver direkte uden at kende den, og rotation flytter entries ind
+i AUTO_LOG.d. Loggere der skal tælle gentagelser skal give dem forskellige
+timestamps (datetime.now().isoformat() har mikrosekunder; "%Y-%m-%d %H:%M"
+slår gentagelser inden for samme minut sammen).
+
+Version: 3.0.0
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from auto_log import LOG_FILENAME, MANIFEST_FILENAME, SEGMENT_DIRNAME, read_entries
+
+STORE_FILENAME = "events.db"
+SCHEMA_VERSION = 1
+SEJR_DIRS = ("10_ACTIVE", "90_ARCHIVE")
+ENFORCEMENT_FILENAME = "ENFORCEMENT_STATE.json"
+GROUP_FIELDS = ("sejr", "action", "model", "source", "day")
+
+
+@dataclass
+class Event:
+    """One stored activity event."""
+    id: int
+    ts: str
+    sejr: str
+    action: str
+    model: Optional[str]
+    source: str
+    data: Dict[str, Any]      # The full logged entry
+
+
+def _normalize_ts(value: Any) -> str:
+    return str(value or "").replace(" ", "T")
+
+
+def _stat_key(path: Path) -> str:
+    try:
+        st = path.stat()
+    except OSError:
+        return "-"
+    return f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _row(sejr: str, entry: dict, source: str) -> tuple:
+    """Insert parameters for one entry; the digest covers the content only, not its position"""
+    details = entry.get("details")
+    model = entry.get("model") or (details.get("model") if isinstance(details, dict) else None)
+    canonical = json.dumps(entry, sort_keys=True, ensure_ascii=False, default=str)
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=12).hexdigest()
+    return (_normalize_ts(entry.get("timestamp")), sejr, str(entry.get("action", "unknown")),
+            str(model) if model else None, source, canonical, digest)
+
+
+class EventStore:
+    """SQLite event store for one system path."""
+
+    def __init__(self, system_path: Path, db_path: Optional[Path] = None):
+        self.system_path = Path(system_path)
+        self.db_path = Path(db_path) if db_path else self.system_path / "_CURRENT" / STORE_FILENAME
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._failed = False
+
+    # -- database -----------------------------------------------------------
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._failed:
+            return self._conn
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS events")
+                conn.execute("DROP TABLE IF EXISTS sources")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                " id INTEGER PRIMARY KEY,"
+                " ts TEXT NOT NULL,"
+                " sejr TEXT NOT NULL,"
+                " action TEXT NOT NULL,"
+                " model TEXT,"
+                " source TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " digest TEXT NOT NULL,"
+                " UNIQUE (sejr, digest))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS events_ts ON events (ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS events_sejr_ts ON events (sejr, ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS events_action_ts ON events (action, ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS events_model_ts ON events (model, ts)")
+            # Sync bookkeeping: how far each log file has been imported
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sources ("
+                " path TEXT PRIMARY KEY,"
+                " signature TEXT NOT NULL,"
+                " offset INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.commit()
+            self._conn = conn
+        except sqlite3.Error:
+            self._failed = True
+            self._conn = None
+        return self._conn
+
+    @property
+    def available(self) -> bool:
+        with self._lock:
+            return self._db() is not None
+
+    # -- writing ------------------------------------------------------------
+
+    def record_many(self, sejr: str, entries: Iterable[dict], source: str = "auto_log") -> int:
+        """Insert entries for a sejr, skipping ones already stored. Returns rows added."""
+        rows = [_row(sejr, e, source) for e in entries if isinstance(e, dict)]
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._db()
+            if conn is None:
+                return 0
+            try:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO events (ts, sejr, action, model, source, data, digest)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                conn.commit()
+                return conn.total_changes - before
+            except sqlite3.Error:
+                conn.rollback()
+                return 0
+
+    def record(self, sejr: str, entry: dict, source: str = "auto_log") -> int:
+        return self.record_many(sejr, [entry], source)
+
+    # -- sync from files ----------------------------------------------------
+
+    def _sync_log(self, conn: sqlite3.Connection, folder: Path) -> int:
+        """Import new AUTO_LOG entries of one folder (appends read incrementally)."""
+        hot = folder / LOG_FILENAME
+        manifest_key = _stat_key(folder / SEGMENT_DIRNAME / MANIFEST_FILENAME)
+        try:
+            st = hot.stat()
+            hot_id, size = st.st_ino, st.st_size
+        except OSError:
+            hot_id, size = None, 0
+        signature = f"{hot_id}|{manifest_key}"
+        known = conn.execute("SELECT signature, offset FROM sources WHERE path = ?", (str(hot),)).fetchone()
+
+        if known is not None and known[0] == signature and known[1] == size:
+            return 0
+        if known is not None and known[0] == signature and known[1] < size:
+            entries, start = [], known[1]  # Plain append: read only the new bytes
+        else:
+            # New folder, rotation or rewrite: re-import (duplicates are ignored)
+            entries, start = list(read_entries(folder, include_hot=False)), 0
+        offset = start
+        if size > start:
+            with open(hot, "rb") as f:
+                f.seek(start)
+                data = f.read(size - start)
+            cut = data.rfind(b"\n") + 1
+            for line in data[:cut].split(b"\n"):
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+            offset = start + cut
+        added = self.record_many(folder.name, entries, "auto_log")
+        conn.execute("INSERT OR REPLACE INTO sources (path, signature, offset) VALUES (?, ?, ?)",
+                     (str(hot), signature, offset))
+        return added
+
+    def _sync_enforcement(self, conn: sqlite3.Connection, folder: Path) -> int:
+        state_file = folder / ENFORCEMENT_FILENAME
+        signature = _stat_key(state_file)
+        if signature == "-":
+            return 0
+        known = conn.execute("SELECT signature FROM sources WHERE path = ?", (str(state_file),)).fetchone()
+        if known is not None and known[0] == signature:
+            return 0
+        try:
+            log = json.loads(state_file.read_text(encoding="utf-8")).get("enforcement_log", [])
+        except (OSError, ValueError, AttributeError):
+            log = []
+        added = self.record_many(folder.name, log if isinstance(log, list) else [], "enforcement")
+        conn.execute("INSERT OR REPLACE INTO sources (path, signature, offset) VALUES (?, ?, 0)",
+                     (str(state_file), signature))
+        return added
+
+    def _folders(self, dirname: str) -> Optional[List[Path]]:
+        """Sejr folders in one system dir ([] if missing, None if it cannot be listed)."""
+        root = self.system_path / dirname
+        try:
+            return [f for f in root.iterdir() if f.is_dir() and not f.name.startswith(".")]
+        except FileNotFoundError:
+            return []
+        except OSError:
+            return None
+
+    def _prune(self, conn: sqlite3.Connection, folders: List[Path]) -> None:
+        """Drop events and sync state of sejrs whose folder is gone.
+
+        auto_archive moves a sejr to 90_ARCHIVE/<name>_<timestamp>, and sync
+        imports its log again under the new name; the old name must go or
+        every archived event would be counted twice.
+        """
+        names = {f.name for f in folders}
+        gone = [name for (name,) in conn.execute("SELECT DISTINCT sejr FROM events") if name not in names]
+        if gone:
+            conn.executemany("DELETE FROM events WHERE sejr = ?", [(name,) for name in gone])
+        paths = {str(f) for f in folders}
+        stale = [(path,) for (path,) in conn.execute("SELECT path FROM sources")
+                 if str(Path(path).parent) not in paths]
+        if stale:
+            conn.executemany("DELETE FROM sources WHERE path = ?", stale)
+
+    def _sync_folders(self, conn: sqlite3.Connection, folders: Iterable[Path]) -> int:
+        added = 0
+        for folder in folders:
+            try:
+                added += self._sync_log(conn, folder)
+                added += self._sync_enforcement(conn, folder)
+            except (OSError, sqlite3.Error):
+                continue
+        return added
+
+    def sync_folders(self, folders: Iterable[Path]) -> int:
+        """Import new activity of just these sejr folders (no scan, no pruning)."""
+        with self._lock:
+            conn = self._db()
+            if conn is None:
+                return 0
+            added = self._sync_folders(conn, [Path(f) for f in folders])
+            try:
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+        return added
+
+    def sync(self, dirs: Sequence[str] = SEJR_DIRS) -> int:
+        """Import activity written to disk since the last sync. Returns events added.
+
+        Unchanged logs cost one stat each; appended logs are read from
+        their last offset only. Events of folders that no longer exist in
+        10_ACTIVE/90_ARCHIVE (renamed on archive, deleted) are removed.
+        """
+        added = 0
+        with self._lock:
+            conn = self._db()
+            if conn is None:
+                return 0
+            listing = {dirname: self._folders(dirname) for dirname in SEJR_DIRS}
+            for dirname in dirs:
+                folders = listing[dirname] if dirname in listing else self._folders(dirname)
+                added += self._sync_folders(conn, folders or [])
+            if all(folders is not None for folders in listing.values()):
+                try:
+                    self._prune(conn, [f for folders in listing.values() for f in folders])
+                except sqlite3.Error:
+                    pass
+            try:
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+        return added
+
+    # -- queries ------------------------------------------------------------
+
+    @staticmethod
+    def _where(sejr=None, action=None, model=None, source=None, since=None, until=None,
+               after_id=None, sejrs=None) -> tuple:
+        clauses, params = [], []
+        for column, value in (("sejr", sejr), ("action", action), ("model", model), ("source", source)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if sejrs is not None:
+            sejrs = list(sejrs)
+            clauses.append(f"sejr IN ({', '.join('?' * len(sejrs)) or 'NULL'})")
+            params.extend(sejrs)
+        if since:
+            clauses.append("ts >= ?")
+            params.append(_normalize_ts(since))
+        if until:
+            # Date-only bounds include the whole day
+            clauses.append("substr(ts, 1, ?) <= ?")
+            params.extend([len(until), _normalize_ts(until)])
+        if after_id is not None:
+            clauses.append("id > ?")
+            params.append(after_id)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, limit: Optional[int] = 100, newest_first: bool = True, **filters) -> List[Event]:
+        """Events matching filters (sejr, action, model, source, since, until, after_id, sejrs)."""
+        where, params = self._where(**filters)
+        order = "DESC" if newest_first else "ASC"
+        sql = f"SELECT id, ts, sejr, action, model, source, data FROM events{where} ORDER BY ts {order}, id {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            conn = self._db()
+            if conn is None:
+                return []
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            except sqlite3.Error:
+                return []
+        events = []
+        for id_, ts, sejr, action, model, source, raw in rows:
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                data = {}
+            events.append(Event(id_, ts, sejr, action, model, source, data))
+        return events
+
+    def count_by(self, field: str, **filters) -> Dict[str, int]:
+        """Event counts grouped by sejr, action, model, source or day (YYYY-MM-DD)."""
+        if field not in GROUP_FIELDS:
+            raise ValueError(f"Cannot group by {field!r} (one of {', '.join(GROUP_FIELDS)})")
+        column = "substr(ts, 1, 10)" if field == "day" else field
+        where, params = self._where(**filters)
+        sql = f"SELECT {column}, COUNT(*) FROM events{where} GROUP BY {column} ORDER BY COUNT(*) DESC"
+        with self._lock:
+            conn = self._db()
+            if conn is None:
+                return {}
+            try:
+                return {key: count for key, count in conn.execute(sql, params) if key is not None}
+            except sqlite3.Error:
+                return {}
+
+    def last_activity(self, **filters) -> Dict[str, str]:
+        """Latest event timestamp per sejr."""
+        where, params = self._where(**filters)
+        with self._lock:
+            conn = self._db()
+            if conn is None:
+                return {}
+            try:
+                return dict(conn.execute(f"SELECT sejr, MAX(ts) FROM events{where} GROUP BY sejr", params))
+            except sqlite3.Error:
+                return {}
+
+    def max_id(self) -> int:
+        with self._lock:
+            conn = self._db()
+            if conn is None:
+                return 0
+            try:
+                return conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+            except sqlite3.Error:
+                return 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_STORES: Dict[str, EventStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_event_store(system_path: Path) -> EventStore:
+    """Return the process-wide EventStore for a system path."""
+    key = str(Path(system_path).resolve())
+    with _STORES_LOCK:
+        if key not in _STORES:
+            _STORES[key] = EventStore(Path(key))
+        return _STORES[key]
+
+
+def record_event(sejr_path: Path, entry: dict, source: str = "auto_log") -> None:
+    """Best-effort write of one event for a sejr folder (system path = two levels up)."""
+    sejr_path = Path(sejr_path)
+    if sejr_path.parent.name not in SEJR_DIRS:
+        return  # Not inside a system tree (tests, scratch folders)
+    try:
+        get_event_store(sejr_path.parent.parent).record(sejr_path.name, entry, source)
+    except (OSError, sqlite3.Error):
+        pass
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+GRID WINDOW — Vindue- og nøgle-aritmetik bag den virtualiserede sejr-grid
+=========================================================================
+
+WHAT: Ren logik bag SejrGrid i app/sejr_app.py: hvilke kort ligger i (og
+      lige omkring) viewporten, hvor høje spacerne over/under skal være,
+      hvilke monterede kort der skal fjernes eller oprettes når vinduet
+      eller listen ændrer sig, og hvor markeringen lander når listen skrumper
+WHY:  Textual er ikke altid installeret, og widget-koden kan ikke testes uden.
+      Samme opdeling som list_sync.py: widgeten monterer/flytter, denne
+      modul regner
+WHO:  Importeret af app/sejr_app.py (SejrGrid)
+HOW:  from grid_window import visible_range, spacer_heights, reconcile, clamp_selection
+      first, last = visible_range(scroll_y, height, len(items), CARD_ROWS, CARD_OVERSCAN)
+      stale, new = reconcile(mounted_keys, [item.key for item in items[first:last]])
+
+Elementer identificeres på deres nøgle (sejr.key).
+
+Version: 3.0.0
+"""
+from typing import Iterable, List, Tuple
+
+DEFAULT_HEIGHT = 60  # Not laid out yet: assume a tall terminal
+
+
+def visible_range(scroll_y: float, height: int, count: int,
+                  row_height: int, overscan: int) -> Tuple[int, int]:
+    """(first, last) slice of items to mount for this scroll position"""
+    rows = height or DEFAULT_HEIGHT
+    first = max(int(scroll_y) // row_height - overscan, 0)
+    last = min(first + rows // row_height + 1 + 2 * overscan, count)
+    return min(first, last), last
+
+
+def spacer_heights(first: int, last: int, count: int, row_height: int) -> Tuple[int, int]:
+    """Heights of the top and bottom spacers standing in for unmounted items"""
+    return first * row_height, (count - last) * row_height
+
+
+def reconcile(mounted: Iterable[str], wanted: List[str]) -> Tuple[List[str], List[str]]:
+    """(stale keys to unmount, new keys to mount) turning mounted into wanted"""
+    mounted = list(mounted)
+    wanted_keys = set(wanted)
+    mounted_keys = set(mounted)
+    stale = [key for key in mounted if key not in wanted_keys]
+    new = [key for key in wanted if key not in mounted_keys]
+    return stale, new
+
+
+def clamp_selection(index: int, count: int) -> int:
+    """Keep a selected index inside a list of count items (0 for an empty list)"""
+    return min(max(index, 0), max(count - 1, 0))
@@ -17,6 +17,13 @@ HOW:   from intro_integration import scan_intro_system, IntroSystem
        system = scan_intro_system()
        for category in system.categories: ...
 
+       snapshot = scan_intro()   # One pass; every get_intro_* accepts it
+       get_intro_categories(snapshot), get_intro_health(snapshot)
+
+Scanning: scan_intro() lister roden og kategori-mapperne én gang (scandir,
+ingen fil-læsning). Linjetal og status læses kun når en fils
+(inode, mtime, size) har ændret sig — resten kommer fra IntroScanner-cachen.
+
 INTRO Kategorier:
   - I1-I12 System Intelligence files
   - B1-B10 Terminal Commands
@@ -38,6 +45,7 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -280,15 +288,6 @@ class IntroHealthReport:
 # INTERNAL HELPERS
 # ---------------------------------------------------------------------------
 
-def _count_lines(filepath: Path) -> int:
-    """Count the number of lines in a text file, returning 0 on failure."""
-    try:
-        with open(filepath, "r", encoding="utf-8", errors="replace") as fh:
-            return sum(1 for _ in fh)
-    except (OSError, UnicodeDecodeError):
-        return 0
-
-
 def _read_first_lines(filepath: Path, n: int = 15) -> list[str]:
     """Read the first N lines of a file for header parsing."""
     lines: list[str] = []
@@ -312,7 +311,11 @@ def _parse_file_status(filepath: Path) -> str:
         **Status:** FAERDIG (100%)
     within the first 15 lines.
     """
-    header_lines = _read_first_lines(filepath, 15)
+    return _status_from_header(_read_first_lines(filepath, 15))
+
+
+def _status_from_header(header_lines: list[str]) -> str:
+    """Normalized status from the first lines of a markdown file."""
     for line in header_lines:
         status_match = re.search(
             r"\*\*Status[:\*]*\*?\*?\s*[:]*\s*(.+)",
@@ -348,27 +351,9 @@ def _parse_file_status(filepath: Path) -> str:
     return "UNKNOWN"
 
 
-def _file_modified_iso(filepath: Path) -> str:
-    """Return the last-modified timestamp as an ISO 8601 string."""
-    try:
-        mtime = filepath.stat().st_mtime
-        return datetime.fromtimestamp(mtime).isoformat(timespec="seconds")
-    except OSError:
-        return ""
-
-
 def _scan_file(filepath: Path, category: str) -> IntroFile:
-    """Build an IntroFile from a real file on disk."""
-    stat = filepath.stat()
-    return IntroFile(
-        name=filepath.name,
-        path=filepath.resolve(),
-        category=category,
-        size=stat.st_size,
-        lines=_count_lines(filepath),
-        last_modified=_file_modified_iso(filepath),
-        status=_parse_file_status(filepath),
-    )
+    """Build an IntroFile from a real file on disk (cached by inode/mtime/size)."""
+    return _SCANNER.intro_file(filepath, category)
 
 
 def _natural_sort_key(intro_file: IntroFile) -> tuple[str, int]:
@@ -377,11 +362,179 @@ def _natural_sort_key(intro_file: IntroFile) -> tuple[str, int]:
     return (intro_file.category, num if num is not None else 9999)
 
 
+# ---------------------------------------------------------------------------
+# SNAPSHOT SCANNER
+# ---------------------------------------------------------------------------
+
+HEADER_LINES = 15  # Lines read for status parsing
+
+
+@dataclass
+class IntroEntry:
+    """One directory entry seen by the scanner (stat only, no content)."""
+    name: str
+    path: Path
+    is_file: bool
+    is_dir: bool
+    key: Tuple[int, int, int] = (0, 0, 0)  # (inode, mtime_ns, size)
+
+
+@dataclass
+class IntroSnapshot:
+    """One listing of the INTRO root and its category folders.
+
+    Attributes:
+        root: The INTRO root path
+        exists: Whether the root exists
+        dirs: Entries per listed directory ("" is the root itself),
+            sorted by name; folders that do not exist are absent
+        scan_time: ISO timestamp of the scan
+    """
+    root: Path
+    exists: bool
+    dirs: Dict[str, list[IntroEntry]] = field(default_factory=dict)
+    scan_time: str = ""
+
+    def entries(self, subfolder: Optional[str] = None) -> list[IntroEntry]:
+        return self.dirs.get(subfolder or "", [])
+
+    def file_names(self, subfolder: Optional[str] = None) -> list[str]:
+        return [e.name for e in self.entries(subfolder) if e.is_file]
+
+    def has_dir(self, subfolder: Optional[str] = None) -> bool:
+        return (subfolder or "") in self.dirs
+
+
+class IntroScanner:
+    """Lists the INTRO tree and caches per-file facts by (inode, mtime, size).
+
+    A snapshot only costs a scandir of the root and the category folders;
+    line counts and header status are read once per file version.
+    """
+
+    def __init__(self):
+        self._facts: Dict[str, Tuple[Tuple[int, int, int], Path, int, str]] = {}
+        self._lock = threading.Lock()
+        self.read_count = 0  # Files actually opened (for tests and diagnostics)
+
+    @staticmethod
+    def _list_dir(path: Path) -> Optional[list[IntroEntry]]:
+        entries: list[IntroEntry] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_file = entry.is_file()
+                        is_dir = entry.is_dir()
+                        key = (0, 0, 0)
+                        if is_file:
+                            st = entry.stat()
+                            key = (st.st_ino, st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+                    entries.append(IntroEntry(entry.name, Path(entry.path), is_file, is_dir, key))
+        except OSError:
+            return None
+        entries.sort(key=lambda e: e.name)
+        return entries
+
+    def snapshot(self, root: Path) -> IntroSnapshot:
+        """List the root and every category folder once (no file content is read)."""
+        snap = IntroSnapshot(
+            root=root,
+            exists=root.is_dir(),
+            scan_time=datetime.now().isoformat(timespec="seconds"),
+        )
+        if not snap.exists:
+            return snap
+
+        folders = [""] + sorted({sub for _, _, sub, _, _ in CATEGORY_DEFINITIONS if sub})
+        for folder in folders:
+            listing = self._list_dir(root / folder if folder else root)
+            if listing is not None:
+                snap.dirs[folder] = listing
+
+        # Forget cached files under this root that are gone
+        seen = {str(e.path) for listing in snap.dirs.values() for e in listing if e.is_file}
+        prefix = str(root) + os.sep
+        with self._lock:
+            for path in [p for p in self._facts if p.startswith(prefix) and p not in seen]:
+                del self._facts[path]
+        return snap
+
+    def _facts_for(self, path: Path, key: Tuple[int, int, int]) -> Tuple[Path, int, str]:
+        with self._lock:
+            cached = self._facts.get(str(path))
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2], cached[3]
+
+        # One read for both the line count and the header status
+        lines = 0
+        header: list[str] = []
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as fh:
+                for line in fh:
+                    if lines < HEADER_LINES:
+                        header.append(line.rstrip("\n"))
+                    lines += 1
+        except (OSError, UnicodeDecodeError):
+            lines = 0
+        resolved = path.resolve()
+        status = _status_from_header(header)
+        with self._lock:
+            self.read_count += 1
+            self._facts[str(path)] = (key, resolved, lines, status)
+        return resolved, lines, status
+
+    def intro_file(self, path: Path, category: str, entry: Optional[IntroEntry] = None) -> IntroFile:
+        """IntroFile for a file; its content is only read if it changed."""
+        if entry is None:
+            st = path.stat()
+            key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        else:
+            key = entry.key
+        resolved, lines, status = self._facts_for(path, key)
+        return IntroFile(
+            name=path.name,
+            path=resolved,
+            category=category,
+            size=key[2],
+            lines=lines,
+            last_modified=datetime.fromtimestamp(key[1] / 1e9).isoformat(timespec="seconds"),
+            status=status,
+        )
+
+
+_SCANNER = IntroScanner()
+
+
+def get_scanner() -> IntroScanner:
+    """The shared scanner (its file cache lives for the whole process)."""
+    return _SCANNER
+
+
+def scan_intro() -> IntroSnapshot:
+    """List the INTRO tree once; pass the result to the get_intro_* functions."""
+    return _SCANNER.snapshot(INTRO_PATH)
+
+
+def _category_files(snapshot: IntroSnapshot, letter: str, subfolder: Optional[str],
+                    prefix_re: str) -> list[IntroFile]:
+    file_pattern = re.compile(prefix_re)
+    files = [
+        _SCANNER.intro_file(entry.path, letter, entry)
+        for entry in snapshot.entries(subfolder)
+        if entry.is_file and file_pattern.match(entry.name)
+    ]
+    files.sort(key=_natural_sort_key)
+    return files
+
+
 # ---------------------------------------------------------------------------
 # PUBLIC API: SCANNING FUNCTIONS
 # ---------------------------------------------------------------------------
 
-def get_intro_structure() -> Dict[str, Any]:
+def get_intro_structure(snapshot: Optional[IntroSnapshot] = None) -> Dict[str, Any]:
     """Scan the INTRO folder structure and return a comprehensive dict.
 
     Returns a dict with keys:
@@ -395,33 +548,31 @@ def get_intro_structure() -> Dict[str, Any]:
         "total_lines": int
         "scan_time": str (ISO timestamp of scan)
     """
+    snapshot = snapshot or scan_intro()
     result: Dict[str, Any] = {
-        "root": INTRO_PATH,
-        "exists": INTRO_PATH.is_dir(),
+        "root": snapshot.root,
+        "exists": snapshot.exists,
         "categories": {},
         "root_files": [],
         "subdirectories": [],
         "total_files": 0,
         "total_size": 0,
         "total_lines": 0,
-        "scan_time": datetime.now().isoformat(timespec="seconds"),
+        "scan_time": snapshot.scan_time,
     }
 
-    if not INTRO_PATH.is_dir():
+    if not snapshot.exists:
         return result
 
     # Collect all subdirectory names
-    try:
-        result["subdirectories"] = sorted(
-            entry.name
-            for entry in INTRO_PATH.iterdir()
-            if entry.is_dir() and not entry.name.startswith(".")
-        )
-    except OSError:
-        pass
+    result["subdirectories"] = [
+        entry.name
+        for entry in snapshot.entries()
+        if entry.is_dir and not entry.name.startswith(".")
+    ]
 
     # Build categories
-    categories = get_intro_categories()
+    categories = get_intro_categories(snapshot)
     cat_dict: Dict[str, IntroCategory] = {}
     for cat in categories:
         cat_dict[cat.letter] = cat
@@ -434,13 +585,9 @@ def get_intro_structure() -> Dict[str, Any]:
         for f in cat.files:
             categorized_names.add(f.name)
 
-    try:
-        for entry in sorted(INTRO_PATH.iterdir()):
-            if entry.is_file() and entry.name not in categorized_names:
-                ifile = _scan_file(entry, "")
-                result["root_files"].append(ifile)
-    except OSError:
-        pass
+    for entry in snapshot.entries():
+        if entry.is_file and entry.name not in categorized_names:
+            result["root_files"].append(_SCANNER.intro_file(entry.path, "", entry))
 
     # Aggregate totals
     all_files: list[IntroFile] = list(result["root_files"])
@@ -454,7 +601,7 @@ def get_intro_structure() -> Dict[str, Any]:
     return result
 
 
-def get_intro_i_files() -> list[IntroFile]:
+def get_intro_i_files(snapshot: Optional[IntroSnapshot] = None) -> list[IntroFile]:
     """Return the I1-I12 System Intelligence files with title, size, date, and status.
 
     Each returned IntroFile has its category set to "I".
@@ -463,25 +610,13 @@ def get_intro_i_files() -> list[IntroFile]:
     Returns:
         Sorted list of IntroFile instances for all I-files found on disk.
     """
-    if not INTRO_PATH.is_dir():
-        return []
-
-    i_files: list[IntroFile] = []
-    pattern = re.compile(r"^I(\d+)_.*\.md$")
-
-    try:
-        for entry in INTRO_PATH.iterdir():
-            if entry.is_file() and pattern.match(entry.name):
-                ifile = _scan_file(entry, "I")
-                i_files.append(ifile)
-    except OSError:
+    snapshot = snapshot or scan_intro()
+    if not snapshot.exists:
         return []
+    return _category_files(snapshot, "I", None, r"^I(\d+)_.*\.md$")
 
-    i_files.sort(key=_natural_sort_key)
-    return i_files
 
-
-def get_intro_categories() -> list[IntroCategory]:
+def get_intro_categories(snapshot: Optional[IntroSnapshot] = None) -> list[IntroCategory]:
     """Return all INTRO file categories (B, C, D, E, F, G, H) plus I-files.
 
     Each IntroCategory contains a list of its IntroFile members, scanned
@@ -490,45 +625,26 @@ def get_intro_categories() -> list[IntroCategory]:
     Returns:
         List of IntroCategory instances, one per category letter.
     """
-    if not INTRO_PATH.is_dir():
+    snapshot = snapshot or scan_intro()
+    if not snapshot.exists:
         return []
 
     categories: list[IntroCategory] = []
 
     for letter, display_name, subfolder, description, prefix_re in CATEGORY_DEFINITIONS:
-        # Determine the directory to scan
-        if subfolder is not None:
-            scan_dir = INTRO_PATH / subfolder
-        else:
-            scan_dir = INTRO_PATH
-
         cat = IntroCategory(
             letter=letter,
             name=display_name,
             description=description,
         )
-
-        if not scan_dir.is_dir():
-            categories.append(cat)
-            continue
-
-        file_pattern = re.compile(prefix_re)
-        try:
-            for entry in sorted(scan_dir.iterdir()):
-                if entry.is_file() and file_pattern.match(entry.name):
-                    ifile = _scan_file(entry, letter)
-                    cat.files.append(ifile)
-        except OSError:
-            pass
-
-        # Sort files naturally
-        cat.files.sort(key=_natural_sort_key)
+        # Files sorted naturally; a missing folder leaves the category empty
+        cat.files = _category_files(snapshot, letter, subfolder, prefix_re)
         categories.append(cat)
 
     return categories
 
 
-def get_intro_health() -> IntroHealthReport:
+def get_intro_health(snapshot: Optional[IntroSnapshot] = None) -> IntroHealthReport:
     """Run verification checks on the INTRO folder system and return a health report.
 
     Checks performed:
@@ -546,16 +662,17 @@ def get_intro_health() -> IntroHealthReport:
     Returns:
         IntroHealthReport with all check results and computed score.
     """
+    snapshot = snapshot or scan_intro()
     report = IntroHealthReport(
         timestamp=datetime.now().isoformat(timespec="seconds"),
     )
 
     # Check 1: Root directory exists
-    root_exists = INTRO_PATH.is_dir()
+    root_exists = snapshot.exists
     report.checks.append(HealthCheckResult(
         check_name="Root directory exists",
         passed=root_exists,
-        message="INTRO root found" if root_exists else f"INTRO root NOT found at {INTRO_PATH}",
+        message="INTRO root found" if root_exists else f"INTRO root NOT found at {snapshot.root}",
     ))
 
     if not root_exists:
@@ -563,15 +680,11 @@ def get_intro_health() -> IntroHealthReport:
         return report
 
     # Check 2: I-files I1 through I12
+    root_names = snapshot.file_names()
     missing_i: list[str] = []
     for i in range(1, 13):
         pattern = f"I{i}_"
-        found = any(
-            f.name.startswith(pattern)
-            for f in INTRO_PATH.iterdir()
-            if f.is_file()
-        )
-        if not found:
+        if not any(name.startswith(pattern) for name in root_names):
             missing_i.append(f"I{i}")
 
     report.checks.append(HealthCheckResult(
@@ -591,17 +704,8 @@ def get_intro_health() -> IntroHealthReport:
         "ADMIRAL FLEET COLLABORATION",
         "BOGF\u00d8RINGSMAPPE (MED INDHOLDSFORTEGNELSERNE)",
     ]
-    missing_dirs: list[str] = []
-    for dirname in expected_dirs:
-        dirpath = INTRO_PATH / dirname
-        if not dirpath.is_dir():
-            # Try with special characters (Danish letters)
-            alt = INTRO_PATH / dirname.replace("O", "O")
-            if not alt.is_dir():
-                missing_dirs.append(dirname)
-
-    # Also check with actual encoding
-    actual_dirs = {d.name for d in INTRO_PATH.iterdir() if d.is_dir()}
+    # Match against the actual names (encoding of Danish letters may differ)
+    actual_dirs = {d.name for d in snapshot.entries() if d.is_dir}
     checked_dirs_found: list[str] = []
     checked_dirs_missing: list[str] = []
     for dirname in expected_dirs:
@@ -628,12 +732,13 @@ def get_intro_health() -> IntroHealthReport:
     ))
 
     # Check 4: B-files B1-B10
-    b_dir = INTRO_PATH / "PROJEKTS TERMINALS"
+    b_dir = "PROJEKTS TERMINALS"
     missing_b: list[str] = []
-    if b_dir.is_dir():
+    if snapshot.has_dir(b_dir):
+        b_names = snapshot.file_names(b_dir)
         for i in range(1, 11):
             pattern = f"B{i}_"
-            found = any(f.name.startswith(pattern) for f in b_dir.iterdir() if f.is_file())
+            found = any(name.startswith(pattern) for name in b_names)
             if not found:
                 missing_b.append(f"B{i}")
     else:
@@ -647,12 +752,13 @@ def get_intro_health() -> IntroHealthReport:
     ))
 
     # Check 5: C-files C1-C10
-    c_dir = INTRO_PATH / "PROJEKTS LOKAL ENV"
+    c_dir = "PROJEKTS LOKAL ENV"
     missing_c: list[str] = []
-    if c_dir.is_dir():
+    if snapshot.has_dir(c_dir):
+        c_names = snapshot.file_names(c_dir)
         for i in range(1, 11):
             pattern = f"C{i}_"
-            found = any(f.name.startswith(pattern) for f in c_dir.iterdir() if f.is_file())
+            found = any(name.startswith(pattern) for name in c_names)
             if not found:
                 missing_c.append(f"C{i}")
     else:
@@ -666,12 +772,13 @@ def get_intro_health() -> IntroHealthReport:
     ))
 
     # Check 6: D-files D1-D10
-    d_dir = INTRO_PATH / "PROJEKTS ARKITEKTUR(TEMPLATES)"
+    d_dir = "PROJEKTS ARKITEKTUR(TEMPLATES)"
     missing_d: list[str] = []
-    if d_dir.is_dir():
+    if snapshot.has_dir(d_dir):
+        d_names = snapshot.file_names(d_dir)
         for i in range(1, 11):
             pattern = f"D{i}_"
-            found = any(f.name.startswith(pattern) for f in d_dir.iterdir() if f.is_file())
+            found = any(name.startswith(pattern) for name in d_names)
             if not found:
                 missing_d.append(f"D{i}")
     else:
@@ -685,9 +792,9 @@ def get_intro_health() -> IntroHealthReport:
     ))
 
     # Check 7: NAVIGATION_INDEX.md exists and is non-empty
-    nav_index = INTRO_PATH / "NAVIGATION_INDEX.md"
-    nav_exists = nav_index.is_file()
-    nav_size = nav_index.stat().st_size if nav_exists else 0
+    root_files = {e.name: e for e in snapshot.entries() if e.is_file}
+    nav_exists = "NAVIGATION_INDEX.md" in root_files
+    nav_size = root_files["NAVIGATION_INDEX.md"].key[2] if nav_exists else 0
     report.checks.append(HealthCheckResult(
         check_name="NAVIGATION_INDEX.md present",
         passed=nav_exists and nav_size > 100,
@@ -699,25 +806,25 @@ def get_intro_health() -> IntroHealthReport:
     ))
 
     # Check 8: FOLDER_STRUCTURE_AND_RULES.md exists
-    rules_file = INTRO_PATH / "FOLDER_STRUCTURE_AND_RULES.md"
+    rules_exists = "FOLDER_STRUCTURE_AND_RULES.md" in root_files
     report.checks.append(HealthCheckResult(
         check_name="FOLDER_STRUCTURE_AND_RULES.md present",
-        passed=rules_file.is_file(),
+        passed=rules_exists,
         message=(
             "FOLDER_STRUCTURE_AND_RULES.md found"
-            if rules_file.is_file()
+            if rules_exists
             else "FOLDER_STRUCTURE_AND_RULES.md NOT found"
         ),
     ))
 
     # Check 9: verify_master_folders.py exists
-    verify_script = INTRO_PATH / "verify_master_folders.py"
+    verify_exists = "verify_master_folders.py" in root_files
     report.checks.append(HealthCheckResult(
         check_name="verify_master_folders.py present",
-        passed=verify_script.is_file(),
+        passed=verify_exists,
         message=(
             "Verification script found"
-            if verify_script.is_file()
+            if verify_exists
             else "Verification script NOT found"
         ),
     ))
@@ -728,7 +835,7 @@ def get_intro_health() -> IntroHealthReport:
     try:
         git_result = subprocess.run(
             ["git", "status", "--porcelain"],
-            cwd=str(INTRO_PATH),
+            cwd=str(snapshot.root),
             capture_output=True,
             text=True,
             timeout=10,
@@ -892,7 +999,7 @@ def parse_intro_navigation_index() -> Dict[str, Any]:
 # CONVENIENCE / SUMMARY FUNCTIONS
 # ---------------------------------------------------------------------------
 
-def get_intro_summary() -> Dict[str, Any]:
+def get_intro_summary(snapshot: Optional[IntroSnapshot] = None) -> Dict[str, Any]:
     """Return a quick summary of the INTRO system for sidebar display.
 
     Returns a dict with:
@@ -904,7 +1011,8 @@ def get_intro_summary() -> Dict[str, Any]:
         "health_score": float
         "latest_change": str
     """
-    if not INTRO_PATH.is_dir():
+    snapshot = snapshot or scan_intro()
+    if not snapshot.exists:
         return {
             "available": False,
             "i_file_count": 0,
@@ -915,8 +1023,8 @@ def get_intro_summary() -> Dict[str, Any]:
             "latest_change": "",
         }
 
-    i_files = get_intro_i_files()
-    categories = get_intro_categories()
+    categories = get_intro_categories(snapshot)
+    i_files = next((cat.files for cat in categories if cat.letter == "I"), [])
     total_files = sum(cat.file_count for cat in categories)
     total_size = sum(cat.total_size for cat in categories)
 
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+LINEN SCAN — Én gennemgang af INTRO for alle LINEN- og sync-regler
+==================================================================
+
+WHAT: Én walker over INTRO-mappen der læser hver .md fil højst én gang og
+      kører alle markdown-regler (ÆNDRINGSLOG, CHANGELOG, lokale links)
+      over teksten i samme pass. Mappe-reglerne (numerisk prefix,
+      _TODO_VERIFIKATION, STATUS/INDEX/VERSION filer) bruger listningen fra
+      samme walk. Resultatet giver alle LinenScore og SyncStatus på én gang
+WHY:  _scan_logging, _sync_aendringslog, _sync_cross_references og
+      _get_broken_links_detail kørte hver deres rglob("*.md") og læste
+      alle filer igen, og mappe-reglerne lavede iterdir/glob pr. mappe —
+      en fuld health refresh var ca. 8× den nødvendige I/O
+WHO:  Importeret af masterpiece_en (LINEN-, 3-Lags- og Sync-visningerne)
+HOW:  from linen_scan import scan_linen
+      report = scan_linen(INTRO_PATH)
+      scores = report.linen_scores()        # L, I, N, E, N2
+      statuses = report.sync_statuses()     # SYNC-2..SYNC-5
+      broken = report.broken_links()        # (fil, tekst, href, forslag)
+
+Regel-output caches pr. fil på (mtime, size): en uændret fil læses ikke
+igen. Link-mål stat'es ved hver rapport, da de kan forsvinde uden at
+kildefilen ændres.
+
+Nye regler: subklas MarkdownRule (name + visit(text)) og giv dem til
+LinenScanner(rules=...).
+
+Version: 3.0.0
+"""
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+NUMERIC_PREFIX = re.compile(r'^\d{2}_')
+MARKDOWN_LINK = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
+EXTERNAL_PREFIXES = ("http", "#", "mailto")
+
+
+@dataclass
+class LinenScore:
+    """Score for a single LINEN component"""
+    component: str       # L, I, N, E, N2
+    name: str            # Full name (LOGGING, INDEKSERING, etc.)
+    total_items: int     # Total files/folders checked
+    passing_items: int   # Items that pass validation
+    percentage: float    # 0.0 - 100.0
+    details: list = field(default_factory=list)  # List of (path, passed: bool) tuples
+    last_checked: str = ""
+
+
+@dataclass
+class SyncStatus:
+    """Status for a single sync component"""
+    component_id: str   # SYNC-1 through SYNC-6
+    name: str
+    priority: str       # P1, P2, P3
+    status: str         # "ok", "warning", "error", "unknown"
+    detail: str         # Human-readable detail string
+    count_ok: int = 0
+    count_total: int = 0
+
+
+# ============================================================================
+# RULES
+# ============================================================================
+
+class MarkdownRule:
+    """One check run over the text of every markdown file during the walk.
+
+    visit() must be pure (its output is cached until the file changes);
+    `default` is the output for a file that could not be read.
+    """
+    name = ""
+    default: Any = None
+
+    def visit(self, text: str) -> Any:
+        raise NotImplementedError
+
+
+class MarkerRule(MarkdownRule):
+    """True if the text contains any of the markers."""
+
+    def __init__(self, name: str, markers: Sequence[str]):
+        self.name = name
+        self.markers = tuple(markers)
+        self.default = False
+
+    def visit(self, text: str) -> bool:
+        return any(marker in text for marker in self.markers)
+
+
+class LocalLinksRule(MarkdownRule):
+    """(text, href) for every local [text](href) link."""
+    name = "links"
+    default = ()
+
+    def visit(self, text: str) -> Tuple[Tuple[str, str], ...]:
+        return tuple((label, href) for label, href in MARKDOWN_LINK.findall(text)
+                     if not href.startswith(EXTERNAL_PREFIXES))
+
+
+MARKDOWN_RULES: List[MarkdownRule] = [
+    MarkerRule("logging", ("ÆNDRINGSLOG", "ÆNDRINGS LOG")),   # LINEN L
+    MarkerRule("changelog", ("ÆNDRINGSLOG", "CHANGELOG")),    # SYNC-2
+    LocalLinksRule(),                                         # SYNC-4 + broken links
+]
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def _percent(passing: int, total: int) -> float:
+    return (passing / total * 100) if total > 0 else 0.0
+
+
+def _level(pct: float, ok: float, warning: float) -> str:
+    return "ok" if pct >= ok else ("warning" if pct >= warning else "error")
+
+
+def suggest_link_fix(base_dir: Path, broken_href: str) -> Optional[str]:
+    """Try to find a close match for a broken link"""
+    target_name = Path(broken_href).name
+    # Search in base_dir and parent
+    search_dirs = [base_dir, base_dir.parent]
+    for d in search_dirs:
+        if not d.exists():
+            continue
+        for entry in d.iterdir():
+            if entry.name.lower() == target_name.lower():
+                try:
+                    return str(entry.relative_to(base_dir))
+                except ValueError:
+                    return str(entry)
+    # Try fuzzy: same prefix
+    prefix = target_name[:5].lower() if len(target_name) > 5 else target_name.lower()
+    for d in search_dirs:
+        if not d.exists():
+            continue
+        for entry in d.iterdir():
+            if entry.name.lower().startswith(prefix):
+                try:
+                    return str(entry.relative_to(base_dir))
+                except ValueError:
+                    return str(entry)
+    return None
+
+
+@dataclass
+class LinenReport:
+    """Everything one walk of the INTRO tree found.
+
+    Attributes:
+        root: The scanned INTRO root
+        exists: Whether the root exists
+        top_level: Names in the root (dotfiles excluded), sorted
+        dirs: Top-level folder name -> names of its entries
+        subdirs: Top-level folder name -> names of its subfolders
+        markdown: Relative path of every .md file -> {rule name: output}
+        checked: Time of the scan (HH:MM:SS)
+    """
+    root: Path
+    exists: bool
+    top_level: List[str] = field(default_factory=list)
+    dirs: Dict[str, List[str]] = field(default_factory=dict)
+    subdirs: Dict[str, List[str]] = field(default_factory=dict)
+    markdown: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    checked: str = ""
+
+    def _dirs_with(self, *needles: str, skip_underscore: bool = False) -> List[Tuple[str, bool]]:
+        return [(name, any(n in entry for entry in names for n in needles))
+                for name, names in self.dirs.items()
+                if not (skip_underscore and name.startswith("_"))]
+
+    def _score(self, component: str, name: str, details: List[Tuple[str, bool]]) -> LinenScore:
+        passing = sum(1 for _, ok in details if ok)
+        return LinenScore(component, name, len(details), passing,
+                          _percent(passing, len(details)), details, self.checked)
+
+    # --- LINEN ---
+
+    def logging(self) -> LinenScore:
+        """L — Which .md files contain an ÆNDRINGSLOG section"""
+        return self._score("L", "LOGGING",
+                           [(rel, out["logging"]) for rel, out in self.markdown.items()])
+
+    def indeksering(self) -> LinenScore:
+        """I — Which top-level files/folders use a numeric prefix (00-99)"""
+        return self._score("I", "INDEKSERING",
+                           [(name, bool(NUMERIC_PREFIX.match(name))) for name in self.top_level])
+
+    def nesting(self) -> LinenScore:
+        """N — Which folders have a _TODO_VERIFIKATION subfolder"""
+        return self._score("N", "NESTING",
+                           [(name, "_TODO_VERIFIKATION" in self.subdirs[name]) for name in self.dirs])
+
+    def efterproevning(self) -> LinenScore:
+        """E — Which folders have STATUS files"""
+        return self._score("E", "EFTERPRØVNING", self._dirs_with("STATUS", "status"))
+
+    def navigation(self) -> LinenScore:
+        """N2 — Which folders have INDEX files"""
+        return self._score("N2", "NAVIGATION", self._dirs_with("INDEX", "index"))
+
+    def linen_scores(self) -> List[LinenScore]:
+        """All 5 LINEN components, in L-I-N-E-N order"""
+        return [self.logging(), self.indeksering(), self.nesting(),
+                self.efterproevning(), self.navigation()]
+
+    # --- SYNC ---
+
+    def aendringslog(self) -> SyncStatus:
+        """SYNC-2: Files with an ÆNDRINGSLOG/CHANGELOG section"""
+        has_log = sum(1 for out in self.markdown.values() if out["changelog"])
+        total = len(self.markdown) or 1
+        pct = _percent(has_log, total)
+        return SyncStatus("SYNC-2", "Ændringslog Tracking", "P1", _level(pct, 80, 50),
+                          f"{has_log}/{total} filer ({pct:.0f}%)", has_log, total)
+
+    def version_md(self) -> SyncStatus:
+        """SYNC-3: Folders with a VERSION file"""
+        details = self._dirs_with("VERSION", "version", skip_underscore=True)
+        has_version = sum(1 for _, ok in details if ok)
+        total = len(details) or 1
+        pct = _percent(has_version, total)
+        return SyncStatus("SYNC-3", "VERSION.md", "P2", _level(pct, 60, 30),
+                          f"{has_version}/{total} mapper ({pct:.0f}%)", has_version, total)
+
+    def cross_references(self) -> SyncStatus:
+        """SYNC-4: Local markdown links whose target is missing"""
+        total_links = sum(len(out["links"]) for out in self.markdown.values())
+        if total_links == 0:
+            return SyncStatus("SYNC-4", "Cross-Reference", "P2", "ok",
+                              "Ingen lokale links fundet", 0, 0)
+        broken_links = len(self._broken())
+        ok_links = total_links - broken_links
+        status = "ok" if broken_links == 0 else ("warning" if broken_links <= 3 else "error")
+        return SyncStatus("SYNC-4", "Cross-Reference", "P2", status,
+                          f"{ok_links} OK / {broken_links} broken", ok_links, total_links)
+
+    def status_md(self) -> SyncStatus:
+        """SYNC-5: Folders with a STATUS file"""
+        details = self._dirs_with("STATUS", skip_underscore=True)
+        has_status = sum(1 for _, ok in details if ok)
+        total = len(details) or 1
+        pct = _percent(has_status, total)
+        return SyncStatus("SYNC-5", "STATUS.md Auto", "P2", _level(pct, 60, 30),
+                          f"{has_status}/{total} mapper ({pct:.0f}%)", has_status, total)
+
+    def sync_statuses(self) -> List[SyncStatus]:
+        """The file-based sync components (SYNC-2 to SYNC-5); git ones are separate"""
+        return [self.aendringslog(), self.version_md(), self.cross_references(), self.status_md()]
+
+    # --- LINKS ---
+
+    def _broken(self) -> List[Tuple[str, str, str]]:
+        broken = []
+        for rel, out in self.markdown.items():
+            parent = (self.root / rel).parent
+            for text, href in out["links"]:
+                if not (parent / href).exists():
+                    broken.append((rel, text, href))
+        return broken
+
+    def broken_links(self) -> List[Tuple[str, str, str, Optional[str]]]:
+        """(source_file, link_text, href, suggested_fix) for every broken local link"""
+        return [(rel, text, href, suggest_link_fix((self.root / rel).parent, href))
+                for rel, text, href in self._broken()]
+
+
+# ============================================================================
+# SCANNER
+# ============================================================================
+
+class LinenScanner:
+    """Walks the INTRO tree once and caches rule outputs per file by (mtime, size)."""
+
+    def __init__(self, rules: Optional[Sequence[MarkdownRule]] = None):
+        self.rules = list(MARKDOWN_RULES if rules is None else rules)
+        self._cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.read_count = 0  # Files actually opened (for tests and diagnostics)
+
+    def _outputs(self, path: str, key: Tuple[int, int]) -> Dict[str, Any]:
+        with self._lock:
+            cached = self._cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+                text = fh.read()
+        except OSError:
+            outputs = {rule.name: rule.default for rule in self.rules}
+        else:
+            outputs = {rule.name: rule.visit(text) for rule in self.rules}
+        with self._lock:
+            self.read_count += 1
+            self._cache[path] = (key, outputs)
+        return outputs
+
+    def scan(self, root: Path) -> LinenReport:
+        """Walk root once: list the top level, visit every .md file"""
+        root = Path(root)
+        report = LinenReport(root=root, exists=root.is_dir(),
+                             checked=datetime.now().strftime("%H:%M:%S"))
+        if not report.exists:
+            return report
+
+        seen = set()
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, root)
+            if rel_dir == ".":
+                report.top_level = sorted(n for n in dirnames + filenames if not n.startswith("."))
+                for name in sorted(dirnames):
+                    if not name.startswith("."):
+                        report.dirs[name] = []
+                        report.subdirs[name] = []
+            elif rel_dir in report.dirs:
+                report.dirs[rel_dir] = sorted(dirnames + filenames)
+                report.subdirs[rel_dir] = sorted(dirnames)
+
+            for name in sorted(filenames):
+                if not name.endswith(".md"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                rel = name if rel_dir == "." else os.path.join(rel_dir, name)
+                report.markdown[rel] = self._outputs(path, (st.st_mtime_ns, st.st_size))
+
+        # Symlinked top-level folders are listed but not walked
+        for name, names in report.dirs.items():
+            if not names and (root / name).is_symlink():
+                try:
+                    entries = list(os.scandir(root / name))
+                except OSError:
+                    continue
+                report.dirs[name] = sorted(e.name for e in entries)
+                report.subdirs[name] = sorted(e.name for e in entries if e.is_dir())
+
+        # Forget cached files under this root that are gone
+        prefix = str(root) + os.sep
+        with self._lock:
+            for path in [p for p in self._cache if p.startswith(prefix) and p not in seen]:
+                del self._cache[path]
+        return report
+
+
+_SCANNER = LinenScanner()
+
+
+def get_scanner() -> LinenScanner:
+    """The shared scanner (its rule cache lives for the whole process)."""
+    return _SCANNER
+
+
+def scan_linen(root: Path) -> LinenReport:
+    """One walk of the INTRO tree with the shared scanner."""
+    return _SCANNER.scan(root)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+LIST SYNC — Minimal splice af en liste-model mod en ny liste
+===========================================================
+
+WHAT: Ren logik bag VirtualList.sync/update i masterpiece og masterpiece_en:
+      find det ene interval hvor den gamle og den nye liste er forskellige
+      og erstat kun det med én splice(). Virker på enhver store med
+      get_n_items / get_item / splice (Gio.ListStore, eller en fake i tests)
+WHY:  Hver splice udløser items-changed, og Gtk.ListView re-binder de rækker
+      der ligger i intervallet. En refresh hvor én sejr ændrede sig skal kun
+      re-binde den ene række, ikke hele sidebaren
+WHO:  Importeret af masterpiece og masterpiece_en (VirtualList)
+HOW:  from list_sync import sync_store, replace_item
+      sync_store(store, entries)          # Én splice, eller ingen
+      replace_item(store, entry, selection)  # Samme nøgle, bevarer markering
+
+Elementer sammenlignes med same_as(other) og findes på .key.
+
+Version: 3.0.0
+"""
+from typing import Callable, List, Optional, Tuple
+
+
+def store_items(store) -> list:
+    return [store.get_item(i) for i in range(store.get_n_items())]
+
+
+def find_key(store, key: str) -> int:
+    """Position of the item with this key, or -1"""
+    for i in range(store.get_n_items()):
+        if store.get_item(i).key == key:
+            return i
+    return -1
+
+
+def diff_range(old: list, new: list,
+               same: Callable[[object, object], bool] = lambda a, b: a.same_as(b)
+               ) -> Optional[Tuple[int, int, list]]:
+    """(position, n_removed, added) turning old into new, or None if they are equal"""
+    start = 0
+    while start < min(len(old), len(new)) and same(old[start], new[start]):
+        start += 1
+    if start == len(old) == len(new):
+        return None
+    end = 0
+    while (end < min(len(old), len(new)) - start
+           and same(old[len(old) - 1 - end], new[len(new) - 1 - end])):
+        end += 1
+    return start, len(old) - start - end, new[start:len(new) - end]
+
+
+def sync_store(store, entries: List) -> bool:
+    """Make the store equal to entries with at most one splice. True if it changed."""
+    change = diff_range(store_items(store), entries)
+    if change is None:
+        return False
+    store.splice(*change)
+    return True
+
+
+def replace_item(store, entry, selection=None) -> bool:
+    """Replace the item with the same key (keeps the selection on it). False if absent."""
+    position = find_key(store, entry.key)
+    if position < 0:
+        return False
+    was_selected = selection is not None and selection.is_selected(position)
+    store.splice(position, 1, [entry])
+    if was_selected:
+        selection.select_item(position, True)
+    return True
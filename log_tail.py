@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+LOG TAIL — Sidste linjer af en JSONL-fil uden at læse hele filen
+================================================================
+
+WHAT: Finder de sidste N hele linjer ved at søge baglæns fra slutningen af
+      filen i blokke på BLOCK_SIZE bytes
+WHY:  auto_track læste hele AUTO_LOG.jsonl for at få sidste linje, og
+      auto_log gjorde det samme for det varme segment. Logs vokser uden
+      grænse, så prisen voksede lineært med historikken
+WHO:  Importeret af auto_log (latest_entries) og scripts/auto_track
+HOW:  from log_tail import tail_lines, last_json
+      last = tail_lines(log_file, 1)                    # sidste linje, O(blok)
+      entry = last_json(log_file)                       # sidste linje som dict
+
+Kun hele linjer (afsluttet med newline) returneres; en halvskrevet sidste
+linje ignoreres.
+
+Version: 3.0.0
+"""
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+BLOCK_SIZE = 8192
+
+
+def _decode(lines: List[bytes]) -> List[str]:
+    return [line.decode("utf-8", errors="replace") for line in lines]
+
+
+def _tail_bytes(f, end: int, n: int) -> List[bytes]:
+    """Last n complete lines of a binary file ending at byte offset end."""
+    if n <= 0 or end <= 0:
+        return []
+    pos = end
+    data = b""
+    # n lines need n + 1 newlines before them (unless we reach the start)
+    while pos > 0 and data.count(b"\n") <= n:
+        step = min(BLOCK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        data = f.read(step) + data
+    lines = data.split(b"\n")
+    if lines and lines[-1] == b"":
+        lines.pop()          # Trailing newline
+    elif lines:
+        lines.pop()          # Incomplete last line
+    if pos > 0:
+        lines = lines[1:]    # First piece may be a partial line
+    return [line for line in lines if line.strip()][-n:]
+
+
+def tail_lines(path: Path, n: int) -> List[str]:
+    """Last n non-empty complete lines of a file, reading backwards in blocks."""
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            return _decode(_tail_bytes(f, size, n))
+    except OSError:
+        return []
+
+
+def last_json(path: Path) -> Optional[dict]:
+    """Last line of a JSONL file parsed as JSON (None if missing or invalid)."""
+    lines = tail_lines(path, 1)
+    if not lines:
+        return None
+    try:
+        return json.loads(lines[0])
+    except json.JSONDecodeError:
+        return None
+
@@ -28,7 +28,7 @@ Version: 3.0.0 | Author: Kv1nt (Claude Opus 4.5) | Opdateret: 2026-01-31
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, GLib, Gio, Pango, Gdk
+from gi.repository import Gtk, Adw, GLib, Gio, Pango, Gdk, GObject
 import cairo  # For konfetti drawing
 from pathlib import Path
 import re
@@ -1785,15 +1785,23 @@ class IntelligentSearch:
         self.system_path = system_path
         self.active_dir = system_path / "10_ACTIVE"
         self.archive_dir = system_path / "90_ARCHIVE"
+        # Sejr files only; INTRO rows indexed by masterpiece_en are left alone
+        self.index = get_search_index(system_path)
 
     def search(self, query: str, max_results: int = 50) -> list:
         """
         Search for query across all sejr folders.
         Returns list of dicts with: sejr, file, line_num, context, match_type
+
+        Uses the persistent full-text index (prefix match, ranked); falls
+        back to walking the folders if the index is unavailable.
         """
         if not query or len(query) < 2:
             return []
 
+        if self.index.available:
+            return [result for batch in self.search_iter(query, max_results) for result in batch]
+
         results = []
         query_lower = query.lower()
 
@@ -1814,6 +1822,69 @@ class IntelligentSearch:
 
         return results[:max_results]
 
+    def search_iter(self, query: str, max_results: int = 50, cancelled=None):
+        """
+        Yield search results in small batches as they are found, so a
+        worker thread can stream them to the UI. Stops early when
+        cancelled() returns True (e.g. the query changed).
+        """
+        if not query or len(query) < 2:
+            return
+        cancelled = cancelled or (lambda: False)
+        query_lower = query.lower()
+
+        if self.index.available:
+            for hits in self.index.search_batches(query, limit=max_results, cancelled=cancelled, include_intro=False):
+                yield [self._hit_to_result(hit, query_lower) for hit in hits]
+            return
+
+        # No index: walk the folders, one batch per sejr
+        remaining = max_results
+        for directory in (self.active_dir, self.archive_dir):
+            if not directory.exists():
+                continue
+            for sejr_folder in directory.iterdir():
+                if remaining <= 0 or cancelled():
+                    return
+                if sejr_folder.is_dir() and not sejr_folder.name.startswith("."):
+                    batch = self._search_sejr(sejr_folder, query_lower)[:remaining]
+                    if batch:
+                        remaining -= len(batch)
+                        yield batch
+
+    def _hit_to_result(self, hit, query: str) -> dict:
+        """Convert a SearchHit from the index to the result dict the UI expects"""
+        if hit.kind == "folder":
+            return {"sejr": hit.owner, "file": "(folder name)", "line_num": 0,
+                    "context": hit.name, "match": hit.name, "match_type": "folder"}
+
+        if hit.line_num == 0:
+            return {"sejr": hit.owner, "file": hit.name, "line_num": 0,
+                    "context": f"Filename: {hit.name}", "match": hit.name, "match_type": "filename"}
+
+        line = hit.text
+        context = line.strip()[:100]
+        if len(line.strip()) > 100:
+            context += "..."
+
+        match_type = "content"
+        if hit.kind == "log":
+            match_type = "log"
+            try:
+                data = json.loads(line)
+                context = f"{data.get('action', 'unknown')}: {data.get('detail', line[:50])}"[:100]
+            except Exception:
+                context = line[:100]
+
+        return {
+            "sejr": hit.owner,
+            "file": hit.name,
+            "line_num": hit.line_num,
+            "context": context,
+            "match": self._extract_match(line, query),
+            "match_type": match_type,
+        }
+
     def _search_sejr(self, sejr_folder: Path, query: str) -> list:
         """Search within a single sejr folder"""
         results = []
@@ -1937,118 +2008,221 @@ DNA_LAYERS = [
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from checkbox_utils import count_checkboxes  # Centralized — no more duplicates
-
-def get_sejr_info(path: Path) -> dict:
-    """Get comprehensive info about a sejr"""
-    sejr_file = path / "SEJR_LISTE.md"
-    status_file = path / "STATUS.yaml"
-
+from sejr_index import folder_signature, get_index  # Shared on-disk index (_CURRENT/sejr_index.db)
+from search_index import get_search_index  # Persistent full-text index (_CURRENT/search_index.db)
+from event_store import get_event_store  # Cross-sejr activity store (_CURRENT/events.db)
+from script_jobs import get_job_queue  # In-process DNA script runs, one at a time per script
+from auto_log import LOG_FILENAME, latest_entries  # Segmented AUTO_LOG (reads only what it needs)
+from sejr_daemon import SejrClient  # Push updates from the shared state daemon, if running
+from list_sync import find_key, replace_item, store_items, sync_store  # Minimal ListStore splices
+
+SEJR_INDEX = get_index(SYSTEM_PATH)
+
+def _info_from_record(record: dict) -> dict:
+    """Byg sejr info dict fra en sejr_index record"""
+    name = record["name"]
     info = {
-        "name": path.name,
-        "path": str(path),
-        "display_name": path.name.split("_2026")[0].replace("_", " "),
-        "progress": 0,
-        "done": 0,
-        "total": 0,
-        "current_pass": "1",
-        "is_archived": "90_ARCHIVE" in str(path),
-        "files": [],
+        "name": name,
+        "path": record["path"],
+        "display_name": name.split("_2026")[0].replace("_", " "),
+        "progress": record["progress"],
+        "done": record["checkboxes_done"],
+        "total": record["checkboxes_total"],
+        "current_pass": record["content_pass"],
+        "is_archived": record["is_archived"],
+        "files": record["files"],
         "date": "Unknown",
     }
 
     # Extract date from folder name
-    if "2026-01-" in path.name:
+    if "2026-01-" in name:
         try:
-            date_part = path.name.split("2026-01-")[1][:2]
+            date_part = name.split("2026-01-")[1][:2]
             info["date"] = f"Jan {date_part}, 2026"
         except Exception:
             pass
 
-    # Count checkboxes
-    if sejr_file.exists():
-        content = sejr_file.read_text()
-        done, total = count_checkboxes(content)
-        info["done"] = done
-        info["total"] = total
-        info["progress"] = int((done / total * 100) if total > 0 else 0)
-
-        # Find current pass
-        if "Pass 3" in content and "PASS 3" in content.upper():
-            info["current_pass"] = "3"
-        elif "Pass 2" in content and "PASS 2" in content.upper():
-            info["current_pass"] = "2"
-
-    # List files
-    if path.exists():
-        info["files"] = [f.name for f in path.iterdir() if f.is_file()]
-
     return info
 
+def get_sejr_info(path: Path) -> dict:
+    """Get comprehensive info about a sejr (re-parses kun hvis dens filer er ændret)"""
+    return _info_from_record(SEJR_INDEX.get(path))
+
 def get_all_sejrs() -> list:
     """Get all sejrs sorted by date"""
-    sejrs = []
-
-    if ACTIVE_DIR.exists():
-        for folder in sorted(ACTIVE_DIR.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-            if folder.is_dir() and not folder.name.startswith("."):
-                sejrs.append(get_sejr_info(folder))
-
-    if ARCHIVE_DIR.exists():
-        for folder in sorted(ARCHIVE_DIR.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-            if folder.is_dir() and not folder.name.startswith("."):
-                sejrs.append(get_sejr_info(folder))
-
-    return sejrs
+    records = SEJR_INDEX.scan_dir(ACTIVE_DIR) + SEJR_INDEX.scan_dir(ARCHIVE_DIR)
+    return [_info_from_record(r) for r in records]
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CUSTOM WIDGETS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-class SejrRow(Adw.ActionRow):
-    """A row representing a sejr in the sidebar"""
+class ListEntry(GObject.Object):
+    """One item in a VirtualList: a stable key, a kind ("row", "header", "empty") and its data"""
 
-    def __init__(self, sejr_info: dict):
+    __gtype_name__ = "SejrListEntry"
+
+    def __init__(self, key: str, kind: str = "row", data: Optional[dict] = None):
         super().__init__()
-        self.sejr_info = sejr_info
+        self.key = key
+        self.kind = kind
+        self.data = data or {}
 
-        self.set_title(sejr_info["display_name"])
-        self.set_subtitle(f"Pass {sejr_info['current_pass']}/3 • {sejr_info['date']}")
+    def same_as(self, other: "ListEntry") -> bool:
+        return self.key == other.key and self.kind == other.kind and self.data == other.data
 
-        # Icon based on status
-        if sejr_info["is_archived"]:
-            icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-            icon.add_css_class("success")
-        elif sejr_info["progress"] >= 80:
-            icon = Gtk.Image.new_from_icon_name("emblem-important-symbolic")
-            icon.add_css_class("warning")
+
+class VirtualList(Gtk.ListView):
+    """Gtk.ListView over a Gio.ListStore of ListEntry items.
+
+    Only rows on screen get widgets, so the widget count follows the
+    viewport, not the data. Without update_row the factory asks
+    build_row(entry) for a widget on every bind. With update_row, each
+    list item keeps the widget it built per kind and GTK's recycling
+    just calls update_row(widget, entry) to refill it (returning False
+    means "rebuild"). sync(), append() and update() change the store
+    item by item (see list_sync), so a refresh re-binds only the rows
+    that actually changed.
+    """
+
+    def __init__(self, build_row, on_activate=None, selectable: bool = False, update_row=None):
+        store = Gio.ListStore.new(ListEntry)
+        if selectable:
+            selection = Gtk.SingleSelection.new(store)
+            selection.set_autoselect(False)
+            selection.set_can_unselect(True)
         else:
-            icon = Gtk.Image.new_from_icon_name("folder-open-symbolic")
+            selection = Gtk.NoSelection.new(store)
+        factory = Gtk.SignalListItemFactory()
+        super().__init__(model=selection, factory=factory)
+
+        self.store = store
+        self.selection = selection
+        factory.connect("setup", self._on_setup)
+        factory.connect("bind", self._on_bind)
+        factory.connect("unbind", self._on_unbind)
+        factory.connect("teardown", self._on_teardown)
+        self.build_row = build_row
+        self.update_row = update_row
+        self.on_activate = on_activate
+        self._pool = {}   # Gtk.ListItem -> {kind: widget} kept for reuse
+        self._bound = {}  # Gtk.ListItem -> widget currently on screen
+        self.set_single_click_activate(True)
+        self.connect("activate", self._on_activated)
+
+    def _on_setup(self, factory, list_item):
+        self._pool[list_item] = {}
+
+    def _on_bind(self, factory, list_item):
+        entry = list_item.get_item()
+        pool = self._pool.setdefault(list_item, {})
+        widget = pool.get(entry.kind)
+        if widget is None or self.update_row is None or not self.update_row(widget, entry):
+            widget = self.build_row(entry)
+            if self.update_row is not None:
+                pool[entry.kind] = widget
+        if list_item.get_child() is not widget:
+            list_item.set_child(widget)
+        list_item.set_activatable(entry.kind == "row")
+        list_item.set_selectable(entry.kind == "row")
+        self._bound[list_item] = widget
+
+    def _on_unbind(self, factory, list_item):
+        self._bound.pop(list_item, None)
+        if self.update_row is None:
+            list_item.set_child(None)
+
+    def _on_teardown(self, factory, list_item):
+        self._pool.pop(list_item, None)
+        list_item.set_child(None)
+
+    def _on_activated(self, view, position):
+        entry = self.store.get_item(position)
+        if entry is not None and entry.kind == "row" and self.on_activate:
+            self.on_activate(entry.data)
+
+    def entries(self) -> list:
+        return store_items(self.store)
+
+    def bound_rows(self) -> list:
+        """Widgets for the rows currently on screen"""
+        return list(self._bound.values())
+
+    def find(self, key: str) -> int:
+        return find_key(self.store, key)
+
+    def sync(self, entries: list) -> None:
+        """Make the store equal to entries, splicing only the range that differs"""
+        sync_store(self.store, entries)
+
+    def append(self, entries: list) -> None:
+        self.store.splice(self.store.get_n_items(), 0, entries)
+
+    def update(self, entry: "ListEntry") -> bool:
+        """Replace the item with the same key (keeps the selection on it)"""
+        return replace_item(self.store, entry, self.selection)
+
+    def clear(self) -> None:
+        self.store.remove_all()
+
+    def unselect_all(self) -> None:
+        self.selection.unselect_all()
+
+
+class SejrRow(Adw.ActionRow):
+    """A row representing a sejr in the sidebar"""
+
+    def __init__(self, sejr_info: dict):
+        super().__init__()
 
-        self.add_prefix(icon)
+        # Widgets are built once; set_sejr() refills them when the list recycles the row
+        self.icon = Gtk.Image()
+        self.add_prefix(self.icon)
 
         # Progress indicator
         progress_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
         progress_box.set_valign(Gtk.Align.CENTER)
 
-        progress_label = Gtk.Label(label=f"{sejr_info['progress']}%")
-        progress_label.add_css_class("caption")
-        progress_box.append(progress_label)
-
-        progress_bar = Gtk.ProgressBar()
-        progress_bar.set_fraction(sejr_info["progress"] / 100)
-        progress_bar.set_size_request(60, 4)
-
-        if sejr_info["progress"] >= 80:
-            progress_bar.add_css_class("success")
-        elif sejr_info["progress"] >= 50:
-            progress_bar.add_css_class("warning")
+        self.progress_label = Gtk.Label()
+        self.progress_label.add_css_class("caption")
+        progress_box.append(self.progress_label)
 
-        progress_box.append(progress_bar)
+        self.progress_bar = Gtk.ProgressBar()
+        self.progress_bar.set_size_request(60, 4)
+        progress_box.append(self.progress_bar)
         self.add_suffix(progress_box)
 
+        self.set_sejr(sejr_info)
+
         # Make it activatable
         self.set_activatable(True)
 
+    def set_sejr(self, sejr_info: dict):
+        """Show a sejr in this row (title, subtitle, icon and progress)"""
+        self.sejr_info = sejr_info
+        self.set_title(sejr_info["display_name"])
+        self.set_subtitle(f"Pass {sejr_info['current_pass']}/3 • {sejr_info['date']}")
+
+        # Icon based on status
+        for cls in ("success", "warning"):
+            self.icon.remove_css_class(cls)
+            self.progress_bar.remove_css_class(cls)
+        if sejr_info["is_archived"]:
+            self.icon.set_from_icon_name("emblem-ok-symbolic")
+            self.icon.add_css_class("success")
+        elif sejr_info["progress"] >= 80:
+            self.icon.set_from_icon_name("emblem-important-symbolic")
+            self.icon.add_css_class("warning")
+        else:
+            self.icon.set_from_icon_name("folder-open-symbolic")
+
+        self.progress_label.set_label(f"{sejr_info['progress']}%")
+        self.progress_bar.set_fraction(sejr_info["progress"] / 100)
+        if sejr_info["progress"] >= 80:
+            self.progress_bar.add_css_class("success")
+        elif sejr_info["progress"] >= 50:
+            self.progress_bar.add_css_class("warning")
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CHAT STREAM WIDGET - MESSENGER-STYLE INTERFACE
@@ -2241,9 +2415,18 @@ class ChatStream(Gtk.Box):
             self._load_from_log(sejr_path)
 
     def _load_from_log(self, sejr_path: Path):
-        """Load messages from AUTO_LOG.jsonl"""
-        log_file = sejr_path / "AUTO_LOG.jsonl"
-        if not log_file.exists():
+        """Load the last 20 messages from AUTO_LOG (rotated segments included)"""
+        try:
+            entries = latest_entries(sejr_path, 20)
+        except Exception as e:
+            self.add_message(
+                sender="System",
+                content=f"Kunne ikke læse log: {e}",
+                msg_type="error"
+            )
+            return
+
+        if not entries and not (sejr_path / LOG_FILENAME).exists():
             # Add welcome message
             self.add_message(
                 sender="Kv1nt",
@@ -2252,56 +2435,41 @@ class ChatStream(Gtk.Box):
             )
             return
 
-        try:
-            content = log_file.read_text()
-            for line in content.strip().split("\n")[-20:]:  # Last 20 entries
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-
-                    # Determine sender based on action
-                    action = data.get("action", "unknown")
-                    if "verify" in action.lower():
-                        sender = "Verify"
-                    elif "dna" in action.lower():
-                        sender = "DNA"
-                    elif "user" in action.lower() or "rasmus" in action.lower():
-                        sender = "Rasmus"
-                    else:
-                        sender = "System"
-
-                    # Extract content
-                    detail = data.get("detail", data.get("message", str(data)))
-                    timestamp = data.get("timestamp", "")
-                    if timestamp and len(timestamp) > 16:
-                        timestamp = timestamp[11:16]  # Just HH:MM
-
-                    # File link if present
-                    file_link = data.get("file", data.get("path"))
-
-                    # Verification if present
-                    verification = None
-                    if "verify" in action.lower() or "test" in action.lower():
-                        verification = {
-                            "passed": data.get("passed", data.get("success", True)),
-                            "message": data.get("result", "Verificeret")
-                        }
-
-                    self.add_message(
-                        sender=sender,
-                        content=detail[:200],
-                        timestamp=timestamp,
-                        file_link=file_link,
-                        verification=verification
-                    )
-                except json.JSONDecodeError:
-                    pass
-        except Exception as e:
+        for data in entries:
+            # Determine sender based on action
+            action = data.get("action", "unknown")
+            if "verify" in action.lower():
+                sender = "Verify"
+            elif "dna" in action.lower():
+                sender = "DNA"
+            elif "user" in action.lower() or "rasmus" in action.lower():
+                sender = "Rasmus"
+            else:
+                sender = "System"
+
+            # Extract content
+            detail = data.get("detail", data.get("message", str(data)))
+            timestamp = data.get("timestamp", "")
+            if timestamp and len(timestamp) > 16:
+                timestamp = timestamp[11:16]  # Just HH:MM
+
+            # File link if present
+            file_link = data.get("file", data.get("path"))
+
+            # Verification if present
+            verification = None
+            if "verify" in action.lower() or "test" in action.lower():
+                verification = {
+                    "passed": data.get("passed", data.get("success", True)),
+                    "message": data.get("result", "Verificeret")
+                }
+
             self.add_message(
-                sender="System",
-                content=f"Kunne ikke læse log: {e}",
-                msg_type="error"
+                sender=sender,
+                content=str(detail)[:200],
+                timestamp=timestamp,
+                file_link=file_link,
+                verification=verification
             )
 
     def add_message(self, sender: str, content: str, timestamp: str = None,
@@ -2851,6 +3019,8 @@ class LiveActivityMonitor(Gtk.Box):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         self.add_css_class("live-activity-monitor")
         self.activities = []
+        self._events = get_event_store(SYSTEM_PATH)
+        self._last_event_id = None  # Newest event already shown (None = first poll)
         self._build_ui()
         self._start_monitoring()
 
@@ -2954,53 +3124,40 @@ class LiveActivityMonitor(Gtk.Box):
         return True  # Fortsæt
 
     def _check_for_activities(self):
-        """Tjek for nye aktiviteter fra AUTO_LOG.jsonl"""
+        """Tjek for nye aktiviteter via event store (AUTO_LOG + enforcement)"""
         try:
-            # Tjek aktive sejrs for nye log entries
-            if ACTIVE_DIR.exists():
-                for sejr_folder in ACTIVE_DIR.iterdir():
-                    if sejr_folder.is_dir():
-                        log_file = sejr_folder / "AUTO_LOG.jsonl"
-                        if log_file.exists():
-                            self._read_new_log_entries(log_file, sejr_folder.name)
+            # Stat-only for uændrede logs; nye linjer importeres fra deres offset
+            self._events.sync(("10_ACTIVE",))
+            active = [f for f in ACTIVE_DIR.iterdir() if f.is_dir()] if ACTIVE_DIR.exists() else []
+            self._show_new_events([f.name for f in active])
         except Exception:
             pass
         return True  # Fortsæt overvågning
 
-    def _read_new_log_entries(self, log_file: Path, sejr_name: str):
-        """Læs nye log entries fra en AUTO_LOG.jsonl fil"""
+    def _show_new_events(self, sejr_names: list):
+        """Vis hændelser for aktive sejr der er kommet til siden sidste poll"""
         try:
-            with open(log_file, 'r') as f:
-                lines = f.readlines()[-5:]  # Kun de seneste 5 linjer
+            if self._last_event_id is None:
+                # Første poll: kun de seneste 5, ikke hele historikken
+                self._last_event_id = self._events.max_id()
+                events = list(reversed(self._events.query(limit=5, sejrs=sejr_names)))
+            else:
+                events = self._events.query(limit=None, newest_first=False,
+                                            after_id=self._last_event_id, sejrs=sejr_names)
+                if events:
+                    self._last_event_id = max(e.id for e in events)
+
+            for event in events[-5:]:  # Kun de seneste 5
+                # Tilføj aktivitet
+                action = event.action or 'handling'
+                self._add_activity(
+                    event.sejr[:20],
+                    f"{action}: {str(event.data.get('details', ''))[:50]}",
+                    self._get_icon_for_action(action)
+                )
 
-            for line in lines:
-                try:
-                    entry = json.loads(line.strip())
-                    entry_id = f"{log_file}:{entry.get('timestamp', '')}"
-
-                    # Tjek om vi allerede har set denne entry
-                    if not hasattr(self, '_seen_entries'):
-                        self._seen_entries = set()
-
-                    if entry_id not in self._seen_entries:
-                        self._seen_entries.add(entry_id)
-
-                        # Begræns set størrelse
-                        if len(self._seen_entries) > 100:
-                            self._seen_entries = set(list(self._seen_entries)[-50:])
-
-                        # Tilføj aktivitet
-                        action = entry.get('action', 'handling')
-                        self._add_activity(
-                            sejr_name[:20],
-                            f"{action}: {entry.get('details', '')[:50]}",
-                            self._get_icon_for_action(action)
-                        )
-
-                        # Opdater 5W
-                        self._update_five_w(sejr_name, action)
-                except json.JSONDecodeError:
-                    pass
+                # Opdater 5W
+                self._update_five_w(event.sejr, action)
         except Exception:
             pass
 
@@ -3203,18 +3360,17 @@ class Vindertavle(Gtk.Box):
                     # Try to get score from STATUS.yaml (unified v3.0.0)
                     if status_file.exists():
                         try:
-                            import yaml
-                            with open(status_file) as f:
-                                data = yaml.safe_load(f) or {}
-                                # Handle both nested (v3.0.0) and flat (legacy) formats
-                                if isinstance(data.get("score_tracking"), dict):
-                                    victory_data["score"] = data["score_tracking"].get("totals", {}).get("total_score", 0)
-                                else:
-                                    victory_data["score"] = data.get("current_score", data.get("total_score", 0))
-                                if isinstance(data.get("pass_tracking"), dict):
-                                    victory_data["pass_level"] = data["pass_tracking"].get("current_pass", 1)
-                                else:
-                                    victory_data["pass_level"] = data.get("current_pass", 1)
+                            from sejr_yaml import load_yaml_file
+                            data = load_yaml_file(status_file)
+                            # Handle both nested (v3.0.0) and flat (legacy) formats
+                            if isinstance(data.get("score_tracking"), dict):
+                                victory_data["score"] = data["score_tracking"].get("totals", {}).get("total_score", 0)
+                            else:
+                                victory_data["score"] = data.get("current_score", data.get("total_score", 0))
+                            if isinstance(data.get("pass_tracking"), dict):
+                                victory_data["pass_level"] = data["pass_tracking"].get("current_pass", 1)
+                            else:
+                                victory_data["pass_level"] = data.get("current_pass", 1)
                         except Exception:
                             pass
 
@@ -3460,12 +3616,8 @@ class DNALayerRow(Gtk.Box):
         }
         script = scripts.get(self.layer_num)
         if script:
-            script_path = SYSTEM_PATH / "scripts" / script
-            if script_path.exists():
-                try:
-                    subprocess.Popen(["python3", str(script_path)])
-                except Exception as e:
-                    print(f"Kunne ikke køre script: {e}")
+            # Runs in-process on the shared job queue; repeated clicks join the running job
+            get_job_queue(SYSTEM_PATH).submit(script, use_cache=False)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -3968,7 +4120,7 @@ class PrioritetsOverblik(Gtk.Box):
         """Trigger ny sejr oprettelse."""
         script = SCRIPTS_DIR / "generate_sejr.py"
         if script.exists():
-            subprocess.Popen(["python3", str(script)])
+            get_job_queue(SYSTEM_PATH).submit(script.name, use_cache=False)
             send_notification("Ny Sejr", "Opretter ny sejr...", "list-add-symbolic")
 
 
@@ -3990,13 +4142,19 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         self.search_mode = False
         self.zoom_level = 1.0  # For zoom functionality
         self.file_monitors = []  # Real-time file monitoring
+        self._daemon_connected = False  # Subscribed to sejr_daemon (no local monitors needed)
+
+        self._sejr_signatures = {}  # Folder path -> signature as last rendered
+        self._dirty_sejrs = set()  # Folders to re-render on the next flush
+        self._list_dirty = False  # Folders added/removed: rebuild the list
+        self._dirty_flush_id = None
 
         self._build_ui()
         self._load_sejrs()
         self._setup_file_monitoring()
         self._setup_drag_drop()
 
-        # Auto-refresh every 5 seconds (backup to file monitoring)
+        # Cheap consistency check every 5 seconds (backup to file monitoring)
         GLib.timeout_add_seconds(5, self._auto_refresh)
 
     def _build_ui(self):
@@ -4131,9 +4289,8 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         self.search_results_scroll.set_vexpand(True)
         self.search_results_scroll.set_visible(False)
 
-        self.search_results_list = Gtk.ListBox()
+        self.search_results_list = VirtualList(self._build_search_row, self._on_search_result_activated)
         self.search_results_list.add_css_class("boxed-list")
-        self.search_results_list.connect("row-activated", self._on_search_result_activated)
         self.search_results_scroll.set_child(self.search_results_list)
         sidebar_box.append(self.search_results_scroll)
 
@@ -4176,10 +4333,9 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scroll.set_vexpand(True)
 
-        self.sejr_list = Gtk.ListBox()
+        self.sejr_list = VirtualList(self._build_sidebar_row, self._on_sejr_selected, selectable=True,
+                                     update_row=self._update_sidebar_row)
         self.sejr_list.add_css_class("navigation-sidebar")
-        self.sejr_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.sejr_list.connect("row-activated", self._on_sejr_selected)
         scroll.set_child(self.sejr_list)
 
         sidebar_box.append(scroll)
@@ -4638,66 +4794,33 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         chat_group.add(chat_card)
         self.detail_box.append(chat_group)
 
+    def _remember_signatures(self):
+        """Record what is about to be rendered (before reading, so no change is missed)"""
+        self._sejr_signatures = self._scan_sejr_folders()
+        self._sync_sejr_monitors()
+
     def _load_sejrs(self):
         """Load all sejrs into the sidebar"""
+        self._remember_signatures()
         self.sejrs = get_all_sejrs()
 
         # Log til aktivitetsmonitor
         if hasattr(self, 'activity_monitor'):
             self.activity_monitor.log_event("system", f"Indlæste {len(self.sejrs)} sejrs", "")
 
-        # Clear list
-        while row := self.sejr_list.get_first_child():
-            self.sejr_list.remove(row)
-
-        active_count = 0
-        archived_count = 0
-
-        # Active section header
-        active_header = Gtk.Label(label="AKTIVE")
-        active_header.add_css_class("caption")
-        active_header.add_css_class("dim-label")
-        active_header.set_halign(Gtk.Align.START)
-        active_header.set_margin_start(12)
-        active_header.set_margin_top(12)
-        active_header.set_margin_bottom(6)
-        self.sejr_list.append(active_header)
-
-        for sejr in self.sejrs:
-            if not sejr["is_archived"]:
-                row = SejrRow(sejr)
-                self.sejr_list.append(row)
-                active_count += 1
-
+        entries = [ListEntry("header:active", "header", {"label": "AKTIVE", "top": 12})]
+        entries += [ListEntry(str(sejr["path"]), "row", sejr) for sejr in self.sejrs if not sejr["is_archived"]]
+        active_count = len(entries) - 1
         if active_count == 0:
-            empty = Gtk.Label(label="Ingen aktive sejrs")
-            empty.add_css_class("dim-label")
-            empty.set_margin_start(12)
-            empty.set_margin_bottom(12)
-            self.sejr_list.append(empty)
-
-        # Archived section header
-        archive_header = Gtk.Label(label="ARKIVEREDE")
-        archive_header.add_css_class("caption")
-        archive_header.add_css_class("dim-label")
-        archive_header.set_halign(Gtk.Align.START)
-        archive_header.set_margin_start(12)
-        archive_header.set_margin_top(18)
-        archive_header.set_margin_bottom(6)
-        self.sejr_list.append(archive_header)
+            entries.append(ListEntry("empty:active", "empty", {"label": "Ingen aktive sejrs"}))
 
-        for sejr in self.sejrs:
-            if sejr["is_archived"]:
-                row = SejrRow(sejr)
-                self.sejr_list.append(row)
-                archived_count += 1
-
-        if archived_count == 0:
-            empty = Gtk.Label(label="Ingen arkiverede sejrs")
-            empty.add_css_class("dim-label")
-            empty.set_margin_start(12)
-            empty.set_margin_bottom(12)
-            self.sejr_list.append(empty)
+        entries.append(ListEntry("header:archived", "header", {"label": "ARKIVEREDE", "top": 18}))
+        archived = [ListEntry(str(sejr["path"]), "row", sejr) for sejr in self.sejrs if sejr["is_archived"]]
+        archived_count = len(archived)
+        entries += archived or [ListEntry("empty:archived", "empty", {"label": "Ingen arkiverede sejrs"})]
+
+        # Only rows whose data changed are re-bound
+        self.sejr_list.sync(entries)
 
         # Update stats
         self.active_label.set_label(f"{active_count} Aktiv")
@@ -4723,6 +4846,7 @@ class MasterpieceWindow(Adw.ApplicationWindow):
 
     def _load_sejrs_filtered(self):
         """Load sejrs with current filter and sort applied"""
+        self._remember_signatures()
         self.sejrs = get_all_sejrs()
 
         # Apply filter
@@ -4742,81 +4866,67 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         elif sort_idx == 2:  # Navn
             filtered_sejrs.sort(key=lambda s: s.get("display_name", ""))
 
-        # Clear list
-        while row := self.sejr_list.get_first_child():
-            self.sejr_list.remove(row)
-
         active_count = len([s for s in self.sejrs if not s["is_archived"]])
         archived_count = len([s for s in self.sejrs if s["is_archived"]])
 
         # Show appropriate header based on filter
+        entries = []
         if self.current_filter == "all":
-            # Active section header
-            if any(not s["is_archived"] for s in filtered_sejrs):
-                active_header = Gtk.Label(label=" AKTIVE")
-                active_header.add_css_class("caption")
-                active_header.add_css_class("dim-label")
-                active_header.set_halign(Gtk.Align.START)
-                active_header.set_margin_start(12)
-                active_header.set_margin_top(12)
-                active_header.set_margin_bottom(6)
-                self.sejr_list.append(active_header)
-
-                for sejr in filtered_sejrs:
-                    if not sejr["is_archived"]:
-                        row = SejrRow(sejr)
-                        self.sejr_list.append(row)
-
-            # Archived section header
-            if any(s["is_archived"] for s in filtered_sejrs):
-                archive_header = Gtk.Label(label="[OK] ARKIVEREDE")
-                archive_header.add_css_class("caption")
-                archive_header.add_css_class("dim-label")
-                archive_header.set_halign(Gtk.Align.START)
-                archive_header.set_margin_start(12)
-                archive_header.set_margin_top(18)
-                archive_header.set_margin_bottom(6)
-                self.sejr_list.append(archive_header)
-
-                for sejr in filtered_sejrs:
-                    if sejr["is_archived"]:
-                        row = SejrRow(sejr)
-                        self.sejr_list.append(row)
+            active = [s for s in filtered_sejrs if not s["is_archived"]]
+            if active:
+                entries.append(ListEntry("header:active", "header", {"label": " AKTIVE", "top": 12}))
+                entries += [ListEntry(str(sejr["path"]), "row", sejr) for sejr in active]
+
+            archived = [s for s in filtered_sejrs if s["is_archived"]]
+            if archived:
+                entries.append(ListEntry("header:archived", "header", {"label": "[OK] ARKIVEREDE", "top": 18}))
+                entries += [ListEntry(str(sejr["path"]), "row", sejr) for sejr in archived]
         else:
             # Single section (filtered view)
             header_text = " AKTIVE" if self.current_filter == "active" else "[OK] ARKIVEREDE"
-            header = Gtk.Label(label=header_text)
-            header.add_css_class("caption")
-            header.add_css_class("dim-label")
-            header.set_halign(Gtk.Align.START)
-            header.set_margin_start(12)
-            header.set_margin_top(12)
-            header.set_margin_bottom(6)
-            self.sejr_list.append(header)
-
-            for sejr in filtered_sejrs:
-                row = SejrRow(sejr)
-                self.sejr_list.append(row)
+            entries.append(ListEntry(f"header:{self.current_filter}", "header", {"label": header_text, "top": 12}))
+            entries += [ListEntry(str(sejr["path"]), "row", sejr) for sejr in filtered_sejrs]
 
             if not filtered_sejrs:
                 empty_text = "Ingen aktive sejrs" if self.current_filter == "active" else "Ingen arkiverede sejrs"
-                empty = Gtk.Label(label=empty_text)
-                empty.add_css_class("dim-label")
-                empty.set_margin_start(12)
-                empty.set_margin_bottom(12)
-                self.sejr_list.append(empty)
+                entries.append(ListEntry(f"empty:{self.current_filter}", "empty", {"label": empty_text}))
+
+        self.sejr_list.sync(entries)
 
         # Update stats
         self.active_label.set_label(f"{active_count} Aktiv")
         self.archived_label.set_label(f"{archived_count} Arkiveret")
 
-    def _on_sejr_selected(self, listbox, row):
+    def _build_sidebar_row(self, entry):
+        """Widget for one sidebar entry (called by the list factory for rows on screen)"""
+        if entry.kind == "row":
+            return SejrRow(entry.data)
+
+        label = Gtk.Label(label=entry.data["label"])
+        label.add_css_class("dim-label")
+        label.set_halign(Gtk.Align.START)
+        label.set_margin_start(12)
+        if entry.kind == "header":
+            label.add_css_class("caption")
+            label.set_margin_top(entry.data.get("top", 12))
+            label.set_margin_bottom(6)
+        else:
+            label.set_margin_bottom(12)
+        return label
+
+    def _update_sidebar_row(self, widget, entry) -> bool:
+        """Refill a recycled sidebar row in place (headers and labels are rebuilt)"""
+        if entry.kind != "row":
+            return False
+        widget.set_sejr(entry.data)
+        return True
+
+    def _on_sejr_selected(self, sejr_info):
         """Handle sejr selection"""
-        if hasattr(row, 'sejr_info'):
-            self.selected_sejr = row.sejr_info
-            self._build_detail_page(row.sejr_info)
-            self.content_stack.set_visible_child_name("detail")
-            self.split_view.set_show_content(True)
+        self.selected_sejr = sejr_info
+        self._build_detail_page(sejr_info)
+        self.content_stack.set_visible_child_name("detail")
+        self.split_view.set_show_content(True)
 
     def _on_new_sejr(self, button):
         """Create a new sejr with dialog for name input"""
@@ -5173,47 +5283,41 @@ class MasterpieceWindow(Adw.ApplicationWindow):
             )
 
         if script_path.exists():
-            try:
-                result = subprocess.run(
-                    ["python3", str(script_path)],
-                    cwd=str(SYSTEM_PATH),
-                    capture_output=True,
-                    text=True
-                )
-                self._load_sejrs()
+            import threading
 
-                # Add success message to chat
-                if hasattr(self, 'chat_stream') and self.chat_stream:
-                    # Check if there was output
-                    output = result.stdout.strip() if result.stdout else info["success_msg"]
-                    if len(output) > 200:
-                        output = output[:200] + "..."
+            # In-process on the shared job queue; the main loop only sees the result
+            job = get_job_queue(SYSTEM_PATH).submit(script_name, use_cache=False)
 
-                    self.chat_stream.add_message(
-                        sender=info["sender"],
-                        content=output if output else info["success_msg"],
-                        msg_type="info",
-                        verification={"passed": result.returncode == 0, "message": "Verified" if result.returncode == 0 else "Fejl"}
-                    )
+            def _wait():
+                job.wait()
+                GLib.idle_add(self._on_script_done, job, info)
 
-                # Send desktop notification
-                send_notification(info["title"], info["body"])
+            threading.Thread(target=_wait, daemon=True).start()
 
-                # Special celebration for archive
-                if script_name == "auto_archive.py":
-                    self._show_celebration()
+    def _on_script_done(self, job, info):
+        """Show a finished DNA script's result (called on the GTK main loop)."""
+        self._load_sejrs()
 
-            except Exception as e:
-                # Add error to chat
-                if hasattr(self, 'chat_stream') and self.chat_stream:
-                    self.chat_stream.add_message(
-                        sender="Error",
-                        content=f"Script fejlede: {e}",
-                        msg_type="error",
-                        verification={"passed": False, "message": str(e)}
-                    )
-                send_notification("[FAIL] Fejl", f"Script fejlede: {e}")
-                print(f"Error: {e}")
+        # Add result message to chat
+        if hasattr(self, 'chat_stream') and self.chat_stream:
+            output = job.output().strip() or info["success_msg"]
+            if len(output) > 200:
+                output = output[:200] + "..."
+
+            self.chat_stream.add_message(
+                sender=info["sender"],
+                content=output,
+                msg_type="info",
+                verification={"passed": job.ok, "message": "Verified" if job.ok else "Fejl"}
+            )
+
+        # Send desktop notification
+        send_notification(info["title"], info["body"])
+
+        # Special celebration for archive
+        if job.script == "auto_archive.py":
+            self._show_celebration()
+        return False
 
     def _show_celebration(self):
         """Show celebration dialog when sejr is archived"""
@@ -5257,14 +5361,88 @@ Du er på vej mod Admiral niveau!"""
             subprocess.Popen(["nautilus", str(SYSTEM_PATH)])
 
     def _auto_refresh(self):
-        """Auto-refresh every 5 seconds"""
-        self._load_sejrs()
-        if self.selected_sejr:
-            # Refresh current view
+        """Consistency check every 5 seconds (file monitors do the real work).
+
+        Only stats files: compares the folder listing and each active
+        folder's signature with what is on screen and marks differences
+        dirty, in case a monitor event was missed. Idle cost is a few stat
+        calls; nothing is re-parsed or re-rendered unless something changed.
+        Skipped while the sejr daemon pushes changes.
+        """
+        if self._daemon_connected:
+            return True
+        listing = self._scan_sejr_folders()
+        if set(listing) != set(self._sejr_signatures):
+            self._list_dirty = True
+        else:
+            for path, signature in listing.items():
+                if signature is not None and signature != self._sejr_signatures.get(path):
+                    self._dirty_sejrs.add(path)
+        if self._list_dirty or self._dirty_sejrs:
+            self._schedule_dirty_flush()
+        return True
+
+    def _scan_sejr_folders(self) -> dict:
+        """{folder path: signature} — signature only for active folders (archives don't change)"""
+        listing = {}
+        for directory, track in ((ACTIVE_DIR, True), (ARCHIVE_DIR, False)):
+            if not directory.exists():
+                continue
+            for folder in directory.iterdir():
+                if folder.is_dir() and not folder.name.startswith("."):
+                    listing[str(folder)] = folder_signature(folder) if track else None
+        return listing
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # DIRTY TRACKING — monitors mark sejrs dirty, one debounced flush renders
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def _mark_sejr_dirty(self, path: Path):
+        """Mark a sejr folder for re-render (or the whole list if it is new/gone)"""
+        if str(path) in self._sejr_signatures and path.exists():
+            self._dirty_sejrs.add(str(path))
+        else:
+            self._list_dirty = True
+        self._schedule_dirty_flush()
+
+    def _schedule_dirty_flush(self):
+        """Coalesce bursts of events into a single flush 500ms after the first"""
+        if self._dirty_flush_id is None:
+            self._dirty_flush_id = GLib.timeout_add(500, self._flush_dirty)
+
+    def _flush_dirty(self):
+        """Re-render only what was marked dirty"""
+        self._dirty_flush_id = None
+        dirty, self._dirty_sejrs = self._dirty_sejrs, set()
+
+        if self._list_dirty:
+            self._list_dirty = False
+            before = self._sejr_signatures
+            self._load_sejrs()
+            changed = {p for p, signature in self._sejr_signatures.items()
+                       if signature != before.get(p)}
+        else:
+            changed = {path for path in dirty if self._refresh_sejr_row(path)}
+
+        # Rebuild the detail page only if the selected folder's signature changed
+        if self.selected_sejr and self.selected_sejr["path"] in changed:
             for sejr in self.sejrs:
                 if sejr["path"] == self.selected_sejr["path"]:
+                    self.selected_sejr = sejr
                     self._build_detail_page(sejr)
                     break
+        return False  # Don't repeat
+
+    def _refresh_sejr_row(self, path: str) -> bool:
+        """Re-read one sejr and replace its sidebar row in place. False if it was unchanged."""
+        folder = Path(path)
+        signature = folder_signature(folder)
+        if signature == self._sejr_signatures.get(path):
+            return False
+        self._sejr_signatures[path] = signature
+        sejr = get_sejr_info(folder)
+        self.sejrs = [sejr if s["path"] == path else s for s in self.sejrs]
+        self.sejr_list.update(ListEntry(str(sejr["path"]), "row", sejr))
         return True
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -5272,7 +5450,37 @@ Du er på vej mod Admiral niveau!"""
     # ═══════════════════════════════════════════════════════════════════════════
 
     def _setup_file_monitoring(self):
+        """Subscribe to the sejr daemon if it runs, otherwise watch with Gio.FileMonitor
+
+        With the daemon, its single watcher pushes the names of changed
+        sejrs and this window runs no monitors or consistency poll of its own.
+        """
+        self._daemon_connected = SejrClient(SYSTEM_PATH).subscribe(
+            lambda change: GLib.idle_add(self._on_daemon_change, change),
+            lambda: GLib.idle_add(self._on_daemon_lost)) is not None
+        if not self._daemon_connected:
+            self._setup_local_monitoring()
+
+    def _on_daemon_change(self, change: dict):
+        """One pushed change from the sejr daemon: mark exactly the named sejrs dirty"""
+        for names, directory in ((change.get("active", []) + change.get("logs", []), ACTIVE_DIR),
+                                 (change.get("archived", []), ARCHIVE_DIR)):
+            for name in names:
+                self._mark_sejr_dirty(directory / name)
+        return False
+
+    def _on_daemon_lost(self):
+        """The daemon stopped: fall back to local monitors and catch up on missed changes"""
+        self._daemon_connected = False
+        self._setup_local_monitoring()
+        self._list_dirty = True
+        self._schedule_dirty_flush()
+        return False
+
+    def _setup_local_monitoring(self):
         """Setup Gio.FileMonitor for real-time updates"""
+        self._sejr_monitors = {}  # Active sejr folder -> Gio.FileMonitor
+
         # Monitor active folder
         active_gfile = Gio.File.new_for_path(str(ACTIVE_DIR))
         if active_gfile.query_exists():
@@ -5293,15 +5501,34 @@ Du er på vej mod Admiral niveau!"""
             except Exception as e:
                 print(f"Could not setup archive monitoring: {e}")
 
+        self._sync_sejr_monitors()
+
+    def _sync_sejr_monitors(self):
+        """Directory monitors are not recursive: watch each active sejr folder"""
+        if not hasattr(self, "_sejr_monitors"):
+            return
+        active = {p for p in self._sejr_signatures if Path(p).parent == ACTIVE_DIR}
+        for path in list(self._sejr_monitors):
+            if path not in active:
+                self._sejr_monitors.pop(path).cancel()
+        for path in active - set(self._sejr_monitors):
+            try:
+                monitor = Gio.File.new_for_path(path).monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+                monitor.connect("changed", self._on_file_changed)
+                self._sejr_monitors[path] = monitor
+            except Exception as e:
+                print(f"Could not monitor {path}: {e}")
+
     def _on_file_changed(self, monitor, file, other_file, event_type):
-        """Handle file system changes - real-time refresh"""
+        """Handle file system changes - mark the affected sejr dirty"""
         if event_type in [Gio.FileMonitorEvent.CREATED, Gio.FileMonitorEvent.DELETED,
                          Gio.FileMonitorEvent.CHANGED, Gio.FileMonitorEvent.MOVED_IN,
-                         Gio.FileMonitorEvent.MOVED_OUT]:
+                         Gio.FileMonitorEvent.MOVED_OUT, Gio.FileMonitorEvent.RENAMED]:
+
+            file_path = file.get_path() if file else None
 
             # Log til aktivitetsmonitor
             if hasattr(self, 'activity_monitor'):
-                file_path = file.get_path() if file else "ukendt"
                 file_name = Path(file_path).name if file_path else "fil"
 
                 event_icons = {
@@ -5314,13 +5541,19 @@ Du er på vej mod Admiral niveau!"""
                 icon, action = event_icons.get(event_type, ("", "Handling"))
                 self.activity_monitor.log_event("fil", f"{action}: {file_name[:40]}", icon)
 
-            # Debounce rapid changes - refresh after 500ms
-            GLib.timeout_add(500, self._debounced_refresh)
-
-    def _debounced_refresh(self):
-        """Debounced refresh to avoid rapid-fire updates"""
-        self._load_sejrs()
-        return False  # Don't repeat
+            if file_path:
+                for base in (ACTIVE_DIR, ARCHIVE_DIR):
+                    try:
+                        rel = Path(file_path).relative_to(base.resolve())
+                    except ValueError:
+                        continue
+                    if len(rel.parts) == 1:
+                        # A folder itself was created, deleted or moved
+                        self._list_dirty = True
+                        self._schedule_dirty_flush()
+                    else:
+                        self._mark_sejr_dirty(base / rel.parts[0])
+                    break
 
     # ═══════════════════════════════════════════════════════════════════════════
     # DRAG & DROP SUPPORT
@@ -5466,7 +5699,7 @@ Du er på vej mod Admiral niveau!"""
         script_path = SYSTEM_PATH / "scripts" / "auto_verify.py"
         if script_path.exists():
             try:
-                subprocess.Popen(["python3", str(script_path)])
+                get_job_queue(SYSTEM_PATH).submit(script_path.name, use_cache=False)
                 self._show_toast("Kører verifikation...")
             except Exception as e:
                 self._show_toast(f"Fejl: {e}")
@@ -5480,7 +5713,8 @@ Du er på vej mod Admiral niveau!"""
         script_path = SYSTEM_PATH / "scripts" / "auto_archive.py"
         if script_path.exists():
             try:
-                subprocess.Popen(["python3", str(script_path), str(self.selected_sejr["path"])])
+                get_job_queue(SYSTEM_PATH).submit(
+                    script_path.name, ["--sejr", Path(self.selected_sejr["path"]).name], use_cache=False)
                 self._show_toast("Arkiverer sejr...")
             except Exception as e:
                 self._show_toast(f"Fejl: {e}")
@@ -5490,7 +5724,7 @@ Du er på vej mod Admiral niveau!"""
         script_path = SYSTEM_PATH / "scripts" / "auto_predict.py"
         if script_path.exists():
             try:
-                subprocess.Popen(["python3", str(script_path)])
+                get_job_queue(SYSTEM_PATH).submit(script_path.name, use_cache=False)
                 self._show_toast("Genererer forudsigelser...")
             except Exception as e:
                 self._show_toast(f"Fejl: {e}")
@@ -5579,9 +5813,8 @@ Ctrl+Q    Afslut
             self._clear_search_results()
             return
 
-        # Perform search
-        results = self.search_engine.search(query, max_results=30)
-        self._display_search_results(results, query)
+        # Search on a worker thread; results stream in as they are found
+        self._start_search(query, max_results=30)
 
     def _on_search_activate(self, entry):
         """Handle Enter press in search - perform full search"""
@@ -5590,93 +5823,152 @@ Ctrl+Q    Afslut
         if len(query) < 2:
             return
 
-        results = self.search_engine.search(query, max_results=50)
-        self._display_search_results(results, query)
+        self._start_search(query, max_results=50)
+
+    def _start_search(self, query, max_results):
+        """Run a search on a worker thread, cancelling any search in flight.
+
+        Batches are handed to the main loop with GLib.idle_add as soon as
+        they are found, so the first hits are drawn while the rest are
+        still being collected and typing never blocks on file I/O.
+        """
+        import threading
+
+        self._begin_search_results(query)
+        cancel = threading.Event()
+        self._search_cancel = cancel
+
+        def _append(batch):
+            if not cancel.is_set():
+                self._append_search_results(batch)
+            return False
+
+        def _finish():
+            if not cancel.is_set():
+                self._finish_search_results(query)
+            return False
+
+        def _worker():
+            try:
+                for batch in self.search_engine.search_iter(query, max_results, cancel.is_set):
+                    if cancel.is_set():
+                        return
+                    GLib.idle_add(_append, batch)
+            except Exception as e:
+                print(f"[SEARCH] {e}")
+            GLib.idle_add(_finish)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _cancel_search(self):
+        """Stop the search in flight (its pending batches are dropped)"""
+        cancel = getattr(self, "_search_cancel", None)
+        if cancel is not None:
+            cancel.set()
+            self._search_cancel = None
 
     def _clear_search_results(self):
-        """Clear all search result rows"""
-        while row := self.search_results_list.get_first_child():
-            self.search_results_list.remove(row)
+        """Clear all search result rows (and cancel the search in flight)"""
+        self._cancel_search()
+        self.search_results_list.clear()
 
-    def _display_search_results(self, results, query):
-        """Display search results in the list"""
+    def _begin_search_results(self, query):
+        """Clear the list and add the result header for a new search"""
         self._clear_search_results()
+        self._search_count = 0
+        self._search_current = None
 
-        if not results:
-            # Show no results message
+        # Add header showing result count
+        self.search_results_list.append([ListEntry("header", "header", {"label": "RESULTATER (...)"})])
+
+    def _finish_search_results(self, query):
+        """Show the final result count (or the empty state)"""
+        if self._search_count:
+            self.search_results_list.update(
+                ListEntry("header", "header", {"label": f"RESULTATER ({self._search_count})"}))
+            return
+
+        # Show no results message
+        self.search_results_list.sync([ListEntry("empty", "empty", {"query": query})])
+
+    def _append_search_results(self, results):
+        """Append a batch of result rows, grouped by sejr (one store update per batch)"""
+        entries = []
+        for result in results:
+            self._search_count += 1
+            # Add sejr separator if new sejr
+            if result["sejr"] != self._search_current:
+                self._search_current = result["sejr"]
+                label = self._search_current.split("_2026")[0].replace("_", " ")
+                entries.append(ListEntry(f"group:{self._search_count}", "group", {"label": label}))
+            entries.append(ListEntry(f"result:{self._search_count}", "row", result))
+        self.search_results_list.append(entries)
+
+    def _build_search_row(self, entry):
+        """Widget for one search list entry (called by the list factory for rows on screen)"""
+        if entry.kind == "header":
+            header = Gtk.Label(label=entry.data["label"])
+            header.add_css_class("caption")
+            header.add_css_class("dim-label")
+            header.set_halign(Gtk.Align.START)
+            header.set_margin_start(12)
+            header.set_margin_top(12)
+            header.set_margin_bottom(6)
+            return header
+
+        if entry.kind == "group":
+            sejr_header = Gtk.Label(label=entry.data["label"])
+            sejr_header.add_css_class("heading")
+            sejr_header.set_halign(Gtk.Align.START)
+            sejr_header.set_margin_start(12)
+            sejr_header.set_margin_top(8)
+            sejr_header.set_margin_bottom(4)
+            return sejr_header
+
+        if entry.kind == "empty":
             empty_row = Adw.ActionRow()
             empty_row.set_title("Ingen resultater")
-            empty_row.set_subtitle(f'Ingen match for "{query}"')
+            empty_row.set_subtitle(f'Ingen match for "{entry.data["query"]}"')
             empty_row.add_prefix(Gtk.Image.new_from_icon_name("dialog-question-symbolic"))
-            self.search_results_list.append(empty_row)
-            return
+            return empty_row
 
-        # Add header showing result count
-        header = Gtk.Label(label=f"RESULTATER ({len(results)})")
-        header.add_css_class("caption")
-        header.add_css_class("dim-label")
-        header.set_halign(Gtk.Align.START)
-        header.set_margin_start(12)
-        header.set_margin_top(12)
-        header.set_margin_bottom(6)
-        self.search_results_list.append(header)
+        # Create result row
+        result = entry.data
+        row = Adw.ActionRow()
 
-        # Group by sejr
-        current_sejr = None
+        # Icon based on match type
+        icon_name = {
+            "folder": "folder-symbolic",
+            "filename": "text-x-generic-symbolic",
+            "content": "format-text-rich-symbolic",
+            "log": "text-x-log-symbolic"
+        }.get(result["match_type"], "text-x-generic-symbolic")
 
-        for result in results:
-            # Add sejr separator if new sejr
-            if result["sejr"] != current_sejr:
-                current_sejr = result["sejr"]
-                sejr_header = Gtk.Label(label=current_sejr.split("_2026")[0].replace("_", " "))
-                sejr_header.add_css_class("heading")
-                sejr_header.set_halign(Gtk.Align.START)
-                sejr_header.set_margin_start(12)
-                sejr_header.set_margin_top(8)
-                sejr_header.set_margin_bottom(4)
-                self.search_results_list.append(sejr_header)
-
-            # Create result row
-            row = Adw.ActionRow()
-            row.result_data = result  # Store data for click handler
-
-            # Icon based on match type
-            icon_name = {
-                "folder": "folder-symbolic",
-                "filename": "text-x-generic-symbolic",
-                "content": "format-text-rich-symbolic",
-                "log": "text-x-log-symbolic"
-            }.get(result["match_type"], "text-x-generic-symbolic")
-
-            row.add_prefix(Gtk.Image.new_from_icon_name(icon_name))
-
-            # Title with highlighted match
-            title = result["context"][:80]
-            if len(result["context"]) > 80:
-                title += "..."
-            row.set_title(title)
-
-            # Subtitle with file info
-            if result["line_num"] > 0:
-                row.set_subtitle(f'{result["file"]} : linje {result["line_num"]}')
-            else:
-                row.set_subtitle(result["file"])
+        row.add_prefix(Gtk.Image.new_from_icon_name(icon_name))
 
-            # Type badge
-            type_badge = Gtk.Label(label=result["match_type"].upper())
-            type_badge.add_css_class("caption")
-            type_badge.add_css_class("dim-label")
-            row.add_suffix(type_badge)
+        # Title with highlighted match
+        title = result["context"][:80]
+        if len(result["context"]) > 80:
+            title += "..."
+        row.set_title(title)
 
-            row.set_activatable(True)
-            self.search_results_list.append(row)
+        # Subtitle with file info
+        if result["line_num"] > 0:
+            row.set_subtitle(f'{result["file"]} : linje {result["line_num"]}')
+        else:
+            row.set_subtitle(result["file"])
 
-    def _on_search_result_activated(self, listbox, row):
-        """Handle click on a search result"""
-        if not hasattr(row, 'result_data'):
-            return
+        # Type badge
+        type_badge = Gtk.Label(label=result["match_type"].upper())
+        type_badge.add_css_class("caption")
+        type_badge.add_css_class("dim-label")
+        row.add_suffix(type_badge)
 
-        result = row.result_data
+        row.set_activatable(True)
+        return row
+
+    def _on_search_result_activated(self, result):
+        """Handle click on a search result"""
 
         # Find the sejr folder path
         sejr_path = None
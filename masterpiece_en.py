@@ -2632,16 +2632,11 @@ def get_system_stats() -> dict:
         "grand_admirals": 0,
     }
 
-    if ACTIVE_DIR.exists():
-        for folder in ACTIVE_DIR.iterdir():
-            if folder.is_dir() and not folder.name.startswith("."):
-                stats["active"] += 1
-                stats["total_victorys"] += 1
-                sejr_file = folder / "SEJR_LISTE.md"
-                if sejr_file.exists():
-                    done, total = count_checkboxes(sejr_file.read_text())
-                    stats["total_checkboxes"] += total
-                    stats["completed_checkboxes"] += done
+    for record in SEJR_INDEX.scan_dir(ACTIVE_DIR):
+        stats["active"] += 1
+        stats["total_victorys"] += 1
+        stats["total_checkboxes"] += record["checkboxes_total"]
+        stats["completed_checkboxes"] += record["checkboxes_done"]
 
     if ARCHIVE_DIR.exists():
         for folder in ARCHIVE_DIR.iterdir():
@@ -2944,15 +2939,23 @@ class IntelligentSearch:
         self.system_path = system_path
         self.active_dir = system_path / "10_ACTIVE"
         self.archive_dir = system_path / "90_ARCHIVE"
+        self.index = get_search_index(
+            system_path, intro_path=Path.home() / "Desktop" / "MASTER FOLDERS(INTRO)")
 
     def search(self, query: str, max_results: int = 50) -> list:
         """
         Search for query across all sejr folders AND INTRO files.
         Returns list of dicts with: sejr/victory, file, line_num, context, match_type
+
+        Uses the persistent full-text index (prefix match, ranked); falls
+        back to walking the folders if the index is unavailable.
         """
         if not query or len(query) < 2:
             return []
 
+        if self.index.available:
+            return [result for batch in self.search_iter(query, max_results) for result in batch]
+
         results = []
         query_lower = query.lower()
 
@@ -2976,6 +2979,88 @@ class IntelligentSearch:
 
         return results[:max_results]
 
+    def search_iter(self, query: str, max_results: int = 50, cancelled=None):
+        """
+        Yield search results in small batches as they are found, so a
+        worker thread can stream them to the UI. Stops early when
+        cancelled() returns True (e.g. the query changed).
+        """
+        if not query or len(query) < 2:
+            return
+        cancelled = cancelled or (lambda: False)
+        query_lower = query.lower()
+
+        if self.index.available:
+            for hits in self.index.search_batches(query, limit=max_results, cancelled=cancelled):
+                yield [self._hit_to_result(hit, query_lower) for hit in hits]
+            return
+
+        # No index: walk the folders, one batch per victory
+        remaining = max_results
+        for directory in (self.active_dir, self.archive_dir):
+            if not directory.exists():
+                continue
+            for sejr_folder in directory.iterdir():
+                if remaining <= 0 or cancelled():
+                    return
+                if sejr_folder.is_dir() and not sejr_folder.name.startswith("."):
+                    batch = self._search_sejr(sejr_folder, query_lower)[:remaining]
+                    if batch:
+                        remaining -= len(batch)
+                        yield batch
+
+        # INTRO files in MASTER FOLDERS(INTRO)
+        if remaining > 0 and not cancelled():
+            batch = self._search_intro(query_lower)[:remaining]
+            if batch:
+                yield batch
+
+    def _hit_to_result(self, hit, query: str) -> dict:
+        """Convert a SearchHit from the index to the result dict the UI expects"""
+        line = hit.text
+        context = line.strip()[:100]
+        if len(line.strip()) > 100:
+            context += "..."
+
+        if hit.kind == "intro":
+            category = self._categorize_intro_file(hit.name)
+            return {
+                "victory": hit.owner,
+                "file": hit.name,
+                "line_num": hit.line_num,
+                "context": f"[{category}] Filename: {hit.name}" if hit.line_num == 0 else f"[{category}] {context}",
+                "match": hit.name if hit.line_num == 0 else self._extract_match(line, query),
+                "match_type": "intro_file" if hit.line_num == 0 else "intro_content",
+                "intro_category": category,
+                "intro_path": hit.path,
+            }
+
+        if hit.kind == "folder":
+            return {"victory": hit.owner, "file": "(folder name)", "line_num": 0,
+                    "context": hit.name, "match": hit.name, "match_type": "folder"}
+
+        if hit.line_num == 0:
+            return {"victory": hit.owner, "file": hit.name, "line_num": 0,
+                    "context": f"Filename: {hit.name}", "match": hit.name, "match_type": "filename"}
+
+        match_type = "content"
+        if hit.kind == "log":
+            match_type = "log"
+            try:
+                data = json.loads(line)
+                context = f"{data.get('action', 'unknown')}: {data.get('detail', line[:50])}"[:100]
+            except Exception:
+                context = line[:100]
+
+        return {
+            "victory": hit.owner,
+            "file": hit.name,
+            "line_num": hit.line_num,
+            "context": context,
+            "match": self._extract_match(line, query),
+            "match_type": match_type,
+        }
+
     def _search_sejr(self, sejr_folder: Path, query: str) -> list:
         """Search within a single victory folder"""
         results = []
@@ -3193,18 +3278,6 @@ LINEN_COLORS = {
 }
 
 
-@dataclass
-class LinenScore:
-    """Score for a single LINEN component"""
-    component: str       # L, I, N, E, N2
-    name: str            # Full name (LOGGING, INDEKSERING, etc.)
-    total_items: int     # Total files/folders checked
-    passing_items: int   # Items that pass validation
-    percentage: float    # 0.0 - 100.0
-    details: list = field(default_factory=list)  # List of (path, passed: bool) tuples
-    last_checked: str = ""
-
-
 # 3-Lags Arkitektur — INTRO system architecture model
 ARCHITECTURE_LAYERS = [
     ("1", "PRESENTATIONS LAG", "Markdown filer — human readable, git versionable", "text-x-generic-symbolic"),
@@ -3358,214 +3431,105 @@ SYNC_COMPONENT_COLORS = {
 }
 
 
-@dataclass
-class SyncStatus:
-    """Status for a single sync component"""
-    component_id: str   # SYNC-1 through SYNC-6
-    name: str
-    priority: str       # P1, P2, P3
-    status: str         # "ok", "warning", "error", "unknown"
-    detail: str         # Human-readable detail string
-    count_ok: int = 0
-    count_total: int = 0
-
-
 # 
 # HELPERS
 # 
 
 from checkbox_utils import count_checkboxes  # Centralized — no more duplicates
-
-def get_sejr_info(path: Path) -> dict:
-    """Get comprehensive info about a victory"""
-    sejr_file = path / "SEJR_LISTE.md"
-    status_file = path / "STATUS.yaml"
-
+from sejr_index import folder_signature, get_index  # Shared on-disk index (_CURRENT/sejr_index.db)
+from sejr_delta import get_delta_engine  # Incremental checkbox deltas
+from search_index import get_search_index  # Persistent full-text index (_CURRENT/search_index.db)
+from event_store import get_event_store  # Cross-sejr activity store (_CURRENT/events.db)
+from script_jobs import get_job_queue  # In-process DNA script runs, one at a time per script
+from auto_log import LOG_FILENAME, latest_entries  # Segmented AUTO_LOG (reads only what it needs)
+from sejr_daemon import SejrClient  # Push updates from the shared state daemon, if running
+from list_sync import find_key, replace_item, store_items, sync_store  # Minimal ListStore splices
+from linen_scan import LinenReport, LinenScore, SyncStatus, scan_linen  # One walk for all LINEN/sync rules
+
+SEJR_INDEX = get_index(SYSTEM_PATH)
+
+def _info_from_record(record: dict) -> dict:
+    """Build the victory info dict from a sejr_index record"""
+    name = record["name"]
     info = {
-        "name": path.name,
-        "path": str(path),
-        "display_name": path.name.split("_2026")[0].replace("_", " "),
-        "progress": 0,
-        "done": 0,
-        "total": 0,
-        "current_pass": "1",
-        "is_archived": "90_ARCHIVE" in str(path),
-        "files": [],
+        "name": name,
+        "path": record["path"],
+        "display_name": name.split("_2026")[0].replace("_", " "),
+        "progress": record["progress"],
+        "done": record["checkboxes_done"],
+        "total": record["checkboxes_total"],
+        "current_pass": record["content_pass"],
+        "is_archived": record["is_archived"],
+        "files": record["files"],
         "date": "Unknown",
     }
 
     # Extract date from folder name
-    if "2026-01-" in path.name:
+    if "2026-01-" in name:
         try:
-            date_part = path.name.split("2026-01-")[1][:2]
+            date_part = name.split("2026-01-")[1][:2]
             info["date"] = f"Yesn {date_part}, 2026"
         except Exception:
             pass
 
-    # Count checkboxes
-    if sejr_file.exists():
-        content = sejr_file.read_text()
-        done, total = count_checkboxes(content)
-        info["done"] = done
-        info["total"] = total
-        info["progress"] = int((done / total * 100) if total > 0 else 0)
-
-        # Find current pass
-        if "Pass 3" in content and "PASS 3" in content.upper():
-            info["current_pass"] = "3"
-        elif "Pass 2" in content and "PASS 2" in content.upper():
-            info["current_pass"] = "2"
-
-    # List files
-    if path.exists():
-        info["files"] = [f.name for f in path.iterdir() if f.is_file()]
-
     return info
 
+def get_sejr_info(path: Path) -> dict:
+    """Get comprehensive info about a victory (re-parsed only if its files changed)"""
+    return _info_from_record(SEJR_INDEX.get(path))
+
 def get_all_sejrs() -> list:
     """Get all victorys sorted by date"""
-    sejrs = []
-
-    if ACTIVE_DIR.exists():
-        for folder in sorted(ACTIVE_DIR.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-            if folder.is_dir() and not folder.name.startswith("."):
-                sejrs.append(get_sejr_info(folder))
-
-    if ARCHIVE_DIR.exists():
-        for folder in sorted(ARCHIVE_DIR.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-            if folder.is_dir() and not folder.name.startswith("."):
-                sejrs.append(get_sejr_info(folder))
-
-    return sejrs
+    records = SEJR_INDEX.scan_dir(ACTIVE_DIR) + SEJR_INDEX.scan_dir(ARCHIVE_DIR)
+    return [_info_from_record(r) for r in records]
 
 
 # 
 # LINEN SCANNING FUNCTIONS
 # 
 
-def _scan_logging(intro_path: Path) -> LinenScore:
-    """L — Check which .md files contain ÆNDRINGSLOG section"""
-    details = []
-    if not intro_path.exists():
-        return LinenScore("L", "LOGGING", 0, 0, 0.0, details,
-                          datetime.now().strftime("%H:%M:%S"))
+def scan_linen_report(intro_path: Path = None) -> LinenReport:
+    """One walk of INTRO for every LINEN and sync rule (unchanged files are not re-read)"""
+    if intro_path is None:
+        intro_path = INTRO_PATH
+    return scan_linen(intro_path)
 
-    md_files = list(intro_path.rglob("*.md"))
-    for f in md_files:
-        try:
-            content = f.read_text(encoding="utf-8", errors="ignore")
-            has_log = "ÆNDRINGSLOG" in content or "ÆNDRINGS LOG" in content
-            details.append((str(f.relative_to(intro_path)), has_log))
-        except (PermissionError, OSError):
-            details.append((str(f.relative_to(intro_path)), False))
 
-    passing = sum(1 for _, ok in details if ok)
-    total = len(details)
-    pct = (passing / total * 100) if total > 0 else 0.0
-    return LinenScore("L", "LOGGING", total, passing, pct, details,
-                      datetime.now().strftime("%H:%M:%S"))
+def _scan_logging(intro_path: Path) -> LinenScore:
+    """L — Check which .md files contain ÆNDRINGSLOG section"""
+    return scan_linen_report(intro_path).logging()
 
 
 def _scan_indeksering(intro_path: Path) -> LinenScore:
     """I — Check which files/folders use numeric prefix (00-99)"""
-    details = []
-    if not intro_path.exists():
-        return LinenScore("I", "INDEKSERING", 0, 0, 0.0, details,
-                          datetime.now().strftime("%H:%M:%S"))
-
-    # Check top-level items (folders and files directly in INTRO)
-    items = [p for p in intro_path.iterdir() if not p.name.startswith(".")]
-    for item in items:
-        has_prefix = bool(re.match(r'^\d{2}_', item.name))
-        details.append((item.name, has_prefix))
-
-    passing = sum(1 for _, ok in details if ok)
-    total = len(details)
-    pct = (passing / total * 100) if total > 0 else 0.0
-    return LinenScore("I", "INDEKSERING", total, passing, pct, details,
-                      datetime.now().strftime("%H:%M:%S"))
+    return scan_linen_report(intro_path).indeksering()
 
 
 def _scan_nesting(intro_path: Path) -> LinenScore:
     """N — Check which directories have _TODO_VERIFIKATION subfolder"""
-    details = []
-    if not intro_path.exists():
-        return LinenScore("N", "NESTING", 0, 0, 0.0, details,
-                          datetime.now().strftime("%H:%M:%S"))
-
-    # Check all directories (top-level and one level deep)
-    dirs = [d for d in intro_path.iterdir()
-            if d.is_dir() and not d.name.startswith(".")]
-    for d in dirs:
-        has_todo = (d / "_TODO_VERIFIKATION").is_dir()
-        details.append((d.name, has_todo))
-
-    passing = sum(1 for _, ok in details if ok)
-    total = len(details)
-    pct = (passing / total * 100) if total > 0 else 0.0
-    return LinenScore("N", "NESTING", total, passing, pct, details,
-                      datetime.now().strftime("%H:%M:%S"))
+    return scan_linen_report(intro_path).nesting()
 
 
 def _scan_efterproevning(intro_path: Path) -> LinenScore:
     """E — Check which directories have STATUS.md files"""
-    details = []
-    if not intro_path.exists():
-        return LinenScore("E", "EFTERPRØVNING", 0, 0, 0.0, details,
-                          datetime.now().strftime("%H:%M:%S"))
-
-    dirs = [d for d in intro_path.iterdir()
-            if d.is_dir() and not d.name.startswith(".")]
-    for d in dirs:
-        status_files = list(d.glob("*STATUS*")) + list(d.glob("*status*"))
-        has_status = len(status_files) > 0
-        details.append((d.name, has_status))
-
-    passing = sum(1 for _, ok in details if ok)
-    total = len(details)
-    pct = (passing / total * 100) if total > 0 else 0.0
-    return LinenScore("E", "EFTERPRØVNING", total, passing, pct, details,
-                      datetime.now().strftime("%H:%M:%S"))
+    return scan_linen_report(intro_path).efterproevning()
 
 
 def _scan_navigation(intro_path: Path) -> LinenScore:
     """N2 — Check which sections have INDEX files"""
-    details = []
-    if not intro_path.exists():
-        return LinenScore("N2", "NAVIGATION", 0, 0, 0.0, details,
-                          datetime.now().strftime("%H:%M:%S"))
-
-    dirs = [d for d in intro_path.iterdir()
-            if d.is_dir() and not d.name.startswith(".")]
-    for d in dirs:
-        index_files = list(d.glob("*INDEX*")) + list(d.glob("*index*"))
-        has_index = len(index_files) > 0
-        details.append((d.name, has_index))
+    return scan_linen_report(intro_path).navigation()
 
-    passing = sum(1 for _, ok in details if ok)
-    total = len(details)
-    pct = (passing / total * 100) if total > 0 else 0.0
-    return LinenScore("N2", "NAVIGATION", total, passing, pct, details,
-                      datetime.now().strftime("%H:%M:%S"))
 
-
-def get_linen_status(intro_path: Path = None) -> List[LinenScore]:
+def get_linen_status(intro_path: Path = None, report: LinenReport = None) -> List[LinenScore]:
     """Scan INTRO folder and return scores for all 5 LINEN components"""
-    if intro_path is None:
-        intro_path = INTRO_PATH
-
-    return [
-        _scan_logging(intro_path),
-        _scan_indeksering(intro_path),
-        _scan_nesting(intro_path),
-        _scan_efterproevning(intro_path),
-        _scan_navigation(intro_path),
-    ]
+    if report is None:
+        report = scan_linen_report(intro_path)
+    return report.linen_scores()
 
 
-def get_linen_health(intro_path: Path = None) -> float:
+def get_linen_health(intro_path: Path = None, report: LinenReport = None) -> float:
     """Return overall LINEN health as 0-100% (average of 5 components)"""
-    scores = get_linen_status(intro_path)
+    scores = get_linen_status(intro_path, report)
     if not scores:
         return 0.0
     return sum(s.percentage for s in scores) / len(scores)
@@ -3575,33 +3539,32 @@ def get_linen_health(intro_path: Path = None) -> float:
 # 3-LAGS ARKITEKTUR SCANNING
 # 
 
-def get_layer_stats(intro_path: Path = None) -> List[ArchitectureStats]:
+def get_layer_stats(intro_path: Path = None, report: LinenReport = None) -> List[ArchitectureStats]:
     """Get statistics for each of the 3 architecture layers"""
-    if intro_path is None:
-        intro_path = INTRO_PATH
+    if report is None:
+        report = scan_linen_report(intro_path)
 
     stats = []
 
-    if not intro_path.exists():
+    if not report.exists:
         for i, (num, name, desc, _icon) in enumerate(ARCHITECTURE_LAYERS, 1):
             stats.append(ArchitectureStats(i, name, 0, desc))
         return stats
 
     # Layer 1: Presentation — count .md files
-    md_count = len(list(intro_path.rglob("*.md")))
+    md_count = len(report.markdown)
     stats.append(ArchitectureStats(1, "PRESENTATIONS LAG", md_count,
                                    f"{md_count} Markdown filer"))
 
     # Layer 2: Structure — count items with numeric prefix
-    all_items = [p for p in intro_path.iterdir() if not p.name.startswith(".")]
-    numeric_items = [p for p in all_items if re.match(r'^\d{2}_', p.name)]
-    stats.append(ArchitectureStats(2, "STRUKTURELT LAG", len(numeric_items),
-                                   f"{len(numeric_items)}/{len(all_items)} numerisk"))
+    numeric = report.indeksering()
+    stats.append(ArchitectureStats(2, "STRUKTURELT LAG", numeric.passing_items,
+                                   f"{numeric.passing_items}/{numeric.total_items} numerisk"))
 
     # Layer 3: Verification — count _TODO_VERIFIKATION + STATUS.md
-    dirs = [d for d in intro_path.iterdir() if d.is_dir() and not d.name.startswith(".")]
-    todo_dirs = sum(1 for d in dirs if (d / "_TODO_VERIFIKATION").is_dir())
-    status_files = sum(1 for d in dirs if list(d.glob("*STATUS*")))
+    todo_dirs = report.nesting().passing_items
+    status_files = sum(1 for names in report.dirs.values()
+                       if any("STATUS" in n for n in names))
     stats.append(ArchitectureStats(3, "VERIFIKATIONS LAG", todo_dirs + status_files,
                                    f"{todo_dirs} _TODO + {status_files} STATUS"))
 
@@ -3687,129 +3650,27 @@ def _sync_git_status(intro_path: Path) -> SyncStatus:
 
 def _sync_aendringslog(intro_path: Path) -> SyncStatus:
     """SYNC-2: Count files with ÆNDRINGSLOG section"""
-    md_files = list(intro_path.rglob("*.md"))
-    has_log = 0
-    for f in md_files:
-        try:
-            content = f.read_text(encoding="utf-8", errors="ignore")
-            if "ÆNDRINGSLOG" in content or "CHANGELOG" in content:
-                has_log += 1
-        except Exception:
-            pass
-    total = len(md_files) if md_files else 1
-    pct = (has_log / total * 100) if total > 0 else 0
-    status = "ok" if pct >= 80 else ("warning" if pct >= 50 else "error")
-    return SyncStatus("SYNC-2", "Ændringslog Tracking", "P1", status,
-                      f"{has_log}/{total} filer ({pct:.0f}%)", has_log, total)
+    return scan_linen_report(intro_path).aendringslog()
 
 
 def _sync_version_md(intro_path: Path) -> SyncStatus:
     """SYNC-3: Count directories with VERSION.md"""
-    dirs = [d for d in intro_path.iterdir()
-            if d.is_dir() and not d.name.startswith(".") and not d.name.startswith("_")]
-    has_version = 0
-    for d in dirs:
-        if list(d.glob("*VERSION*")) or list(d.glob("*version*")):
-            has_version += 1
-    total = len(dirs) if dirs else 1
-    pct = (has_version / total * 100) if total > 0 else 0
-    status = "ok" if pct >= 60 else ("warning" if pct >= 30 else "error")
-    return SyncStatus("SYNC-3", "VERSION.md", "P2", status,
-                      f"{has_version}/{total} mapper ({pct:.0f}%)", has_version, total)
+    return scan_linen_report(intro_path).version_md()
 
 
 def _sync_cross_references(intro_path: Path) -> SyncStatus:
     """SYNC-4: Check for broken markdown links"""
-    md_files = list(intro_path.rglob("*.md"))
-    total_links = 0
-    broken_links = 0
-    for f in md_files:
-        try:
-            content = f.read_text(encoding="utf-8", errors="ignore")
-            # Find [text](path) links — only local, not http
-            links = re.findall(r'\[([^\]]*)\]\(([^)]+)\)', content)
-            for _text, href in links:
-                if href.startswith("http") or href.startswith("#") or href.startswith("mailto"):
-                    continue
-                total_links += 1
-                # Resolve relative path
-                target = f.parent / href
-                if not target.exists():
-                    broken_links += 1
-        except Exception:
-            pass
-
-    ok_links = total_links - broken_links
-    if total_links == 0:
-        return SyncStatus("SYNC-4", "Cross-Reference", "P2", "ok",
-                          "Ingen lokale links fundet", 0, 0)
-    status = "ok" if broken_links == 0 else ("warning" if broken_links <= 3 else "error")
-    return SyncStatus("SYNC-4", "Cross-Reference", "P2", status,
-                      f"{ok_links} OK / {broken_links} broken", ok_links, total_links)
+    return scan_linen_report(intro_path).cross_references()
 
 
 def _get_broken_links_detail(intro_path: Path):
-    """Return list of (source_file, link_text, target_path) for broken links"""
-    broken = []
-    md_files = list(intro_path.rglob("*.md"))
-    for f in md_files:
-        try:
-            content = f.read_text(encoding="utf-8", errors="ignore")
-            links = re.findall(r'\[([^\]]*)\]\(([^)]+)\)', content)
-            for text, href in links:
-                if href.startswith("http") or href.startswith("#") or href.startswith("mailto"):
-                    continue
-                target = f.parent / href
-                if not target.exists():
-                    # Try to find a close match for auto-suggest
-                    suggested = _suggest_link_fix(f.parent, href)
-                    broken.append((str(f.relative_to(intro_path)), text, href, suggested))
-        except Exception:
-            pass
-    return broken
-
-
-def _suggest_link_fix(base_dir: Path, broken_href: str):
-    """Try to find a close match for a broken link"""
-    target_name = Path(broken_href).name
-    # Search in base_dir and parent
-    search_dirs = [base_dir, base_dir.parent]
-    for d in search_dirs:
-        if not d.exists():
-            continue
-        for entry in d.iterdir():
-            if entry.name.lower() == target_name.lower():
-                try:
-                    return str(entry.relative_to(base_dir))
-                except ValueError:
-                    return str(entry)
-    # Try fuzzy: same prefix
-    prefix = target_name[:5].lower() if len(target_name) > 5 else target_name.lower()
-    for d in search_dirs:
-        if not d.exists():
-            continue
-        for entry in d.iterdir():
-            if entry.name.lower().startswith(prefix):
-                try:
-                    return str(entry.relative_to(base_dir))
-                except ValueError:
-                    return str(entry)
-    return None
+    """Return list of (source_file, link_text, target_path, suggestion) for broken links"""
+    return scan_linen_report(intro_path).broken_links()
 
 
 def _sync_status_md(intro_path: Path) -> SyncStatus:
     """SYNC-5: Count STATUS.md files that are up-to-date"""
-    dirs = [d for d in intro_path.iterdir()
-            if d.is_dir() and not d.name.startswith(".") and not d.name.startswith("_")]
-    has_status = 0
-    for d in dirs:
-        if list(d.glob("*STATUS*")):
-            has_status += 1
-    total = len(dirs) if dirs else 1
-    pct = (has_status / total * 100) if total > 0 else 0
-    status = "ok" if pct >= 60 else ("warning" if pct >= 30 else "error")
-    return SyncStatus("SYNC-5", "STATUS.md Auto", "P2", status,
-                      f"{has_status}/{total} mapper ({pct:.0f}%)", has_status, total)
+    return scan_linen_report(intro_path).status_md()
 
 
 def _sync_remote_check(intro_path: Path) -> SyncStatus:
@@ -3835,27 +3696,25 @@ def _sync_remote_check(intro_path: Path) -> SyncStatus:
                           "Remote check fejlede", 0, 1)
 
 
-def get_sync_status(intro_path: Path = None) -> list:
-    """Get status for all 6 sync components"""
+def get_sync_status(intro_path: Path = None, report: LinenReport = None) -> list:
+    """Get status for all 6 sync components (SYNC-2..5 from one LINEN walk)"""
     if intro_path is None:
         intro_path = INTRO_PATH
     if not intro_path.exists():
         return [SyncStatus(cid, name, pri, "error", "INTRO path not found", 0, 1)
                 for cid, name, _desc, _icon, pri in SYNC_COMPONENTS]
 
-    return [
-        _sync_git_status(intro_path),
-        _sync_aendringslog(intro_path),
-        _sync_version_md(intro_path),
-        _sync_cross_references(intro_path),
-        _sync_status_md(intro_path),
-        _sync_remote_check(intro_path),
-    ]
+    if report is None:
+        report = scan_linen_report(intro_path)
+    return ([_sync_git_status(intro_path)]
+            + report.sync_statuses()
+            + [_sync_remote_check(intro_path)])
 
 
-def get_sync_health(intro_path: Path = None) -> float:
-    """Get overall sync health as 0-100%"""
-    statuses = get_sync_status(intro_path)
+def get_sync_health(intro_path: Path = None, statuses: list = None) -> float:
+    """Get overall sync health as 0-100% (pass statuses to skip rescanning)"""
+    if statuses is None:
+        statuses = get_sync_status(intro_path)
     if not statuses:
         return 0.0
     ok_count = sum(1 for s in statuses if s.status == "ok")
@@ -3866,48 +3725,143 @@ def get_sync_health(intro_path: Path = None) -> float:
 # CUSTOM WIDGETS
 # 
 
-class SejrRow(Adw.ActionRow):
-    """A row representing a victory in the sidebar"""
+class ListEntry(GObject.Object):
+    """One item in a VirtualList: a stable key, a kind ("row", "header", "empty") and its data"""
 
-    def __init__(self, sejr_info: dict):
+    __gtype_name__ = "SejrListEntry"
+
+    def __init__(self, key: str, kind: str = "row", data: Optional[dict] = None):
         super().__init__()
-        self.sejr_info = sejr_info
+        self.key = key
+        self.kind = kind
+        self.data = data or {}
 
-        self.set_title(sejr_info["display_name"])
-        self.set_subtitle(f"Pass {sejr_info['current_pass']}/3 • {sejr_info['date']}")
+    def same_as(self, other: "ListEntry") -> bool:
+        return self.key == other.key and self.kind == other.kind and self.data == other.data
 
-        # Icon based on status
-        if sejr_info["is_archived"]:
-            icon = Gtk.Image.new_from_icon_name("emblem-ok-symbolic")
-            icon.add_css_class("success")
-        elif sejr_info["progress"] >= 80:
-            icon = Gtk.Image.new_from_icon_name("emblem-important-symbolic")
-            icon.add_css_class("warning")
+
+class VirtualList(Gtk.ListView):
+    """Gtk.ListView over a Gio.ListStore of ListEntry items.
+
+    Only rows on screen get widgets, so the widget count follows the
+    viewport, not the data. Without update_row the factory asks
+    build_row(entry) for a widget on every bind. With update_row, each
+    list item keeps the widget it built per kind and GTK's recycling
+    just calls update_row(widget, entry) to refill it (returning False
+    means "rebuild"). sync(), append() and update() change the store
+    item by item (see list_sync), so a refresh re-binds only the rows
+    that actually changed.
+    """
+
+    def __init__(self, build_row, on_activate=None, selectable: bool = False, update_row=None):
+        store = Gio.ListStore.new(ListEntry)
+        if selectable:
+            selection = Gtk.SingleSelection.new(store)
+            selection.set_autoselect(False)
+            selection.set_can_unselect(True)
         else:
-            icon = Gtk.Image.new_from_icon_name("folder-open-symbolic")
+            selection = Gtk.NoSelection.new(store)
+        factory = Gtk.SignalListItemFactory()
+        super().__init__(model=selection, factory=factory)
+
+        self.store = store
+        self.selection = selection
+        factory.connect("setup", self._on_setup)
+        factory.connect("bind", self._on_bind)
+        factory.connect("unbind", self._on_unbind)
+        factory.connect("teardown", self._on_teardown)
+        self.build_row = build_row
+        self.update_row = update_row
+        self.on_activate = on_activate
+        self._pool = {}   # Gtk.ListItem -> {kind: widget} kept for reuse
+        self._bound = {}  # Gtk.ListItem -> widget currently on screen
+        self.set_single_click_activate(True)
+        self.connect("activate", self._on_activated)
+
+    def _on_setup(self, factory, list_item):
+        self._pool[list_item] = {}
+
+    def _on_bind(self, factory, list_item):
+        entry = list_item.get_item()
+        pool = self._pool.setdefault(list_item, {})
+        widget = pool.get(entry.kind)
+        if widget is None or self.update_row is None or not self.update_row(widget, entry):
+            widget = self.build_row(entry)
+            if self.update_row is not None:
+                pool[entry.kind] = widget
+        if list_item.get_child() is not widget:
+            list_item.set_child(widget)
+        list_item.set_activatable(entry.kind == "row")
+        list_item.set_selectable(entry.kind == "row")
+        self._bound[list_item] = widget
+
+    def _on_unbind(self, factory, list_item):
+        self._bound.pop(list_item, None)
+        if self.update_row is None:
+            list_item.set_child(None)
+
+    def _on_teardown(self, factory, list_item):
+        self._pool.pop(list_item, None)
+        list_item.set_child(None)
+
+    def _on_activated(self, view, position):
+        entry = self.store.get_item(position)
+        if entry is not None and entry.kind == "row" and self.on_activate:
+            self.on_activate(entry.data)
+
+    def entries(self) -> list:
+        return store_items(self.store)
+
+    def bound_rows(self) -> list:
+        """Widgets for the rows currently on screen"""
+        return list(self._bound.values())
+
+    def find(self, key: str) -> int:
+        return find_key(self.store, key)
+
+    def sync(self, entries: list) -> None:
+        """Make the store equal to entries, splicing only the range that differs"""
+        sync_store(self.store, entries)
+
+    def append(self, entries: list) -> None:
+        self.store.splice(self.store.get_n_items(), 0, entries)
+
+    def update(self, entry: "ListEntry") -> bool:
+        """Replace the item with the same key (keeps the selection on it)"""
+        return replace_item(self.store, entry, self.selection)
+
+    def clear(self) -> None:
+        self.store.remove_all()
+
+    def unselect_all(self) -> None:
+        self.selection.unselect_all()
+
+
+class SejrRow(Adw.ActionRow):
+    """A row representing a victory in the sidebar"""
+
+    def __init__(self, sejr_info: dict):
+        super().__init__()
 
-        self.add_prefix(icon)
+        # Widgets are built once; set_sejr() refills them when the list recycles the row
+        self.icon = Gtk.Image()
+        self.add_prefix(self.icon)
 
         # Progress indicator
         progress_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
         progress_box.set_valign(Gtk.Align.CENTER)
 
-        progress_label = Gtk.Label(label=f"{sejr_info['progress']}%")
-        progress_label.add_css_class("caption")
-        progress_box.append(progress_label)
-
-        progress_bar = Gtk.ProgressBar()
-        progress_bar.set_fraction(sejr_info["progress"] / 100)
-        progress_bar.set_size_request(60, 4)
-
-        if sejr_info["progress"] >= 80:
-            progress_bar.add_css_class("success")
-        elif sejr_info["progress"] >= 50:
-            progress_bar.add_css_class("warning")
+        self.progress_label = Gtk.Label()
+        self.progress_label.add_css_class("caption")
+        progress_box.append(self.progress_label)
 
-        progress_box.append(progress_bar)
+        self.progress_bar = Gtk.ProgressBar()
+        self.progress_bar.set_size_request(60, 4)
+        progress_box.append(self.progress_bar)
         self.add_suffix(progress_box)
 
+        self.set_sejr(sejr_info)
+
         # Make it activatable
         self.set_activatable(True)
 
@@ -3933,6 +3887,32 @@ class SejrRow(Adw.ActionRow):
         drop_target.connect("leave", self._on_reorder_leave)
         self.add_controller(drop_target)
 
+    def set_sejr(self, sejr_info: dict):
+        """Show a victory in this row (title, subtitle, icon and progress)"""
+        self.sejr_info = sejr_info
+        self.set_title(sejr_info["display_name"])
+        self.set_subtitle(f"Pass {sejr_info['current_pass']}/3 • {sejr_info['date']}")
+
+        # Icon based on status
+        for cls in ("success", "warning"):
+            self.icon.remove_css_class(cls)
+            self.progress_bar.remove_css_class(cls)
+        if sejr_info["is_archived"]:
+            self.icon.set_from_icon_name("emblem-ok-symbolic")
+            self.icon.add_css_class("success")
+        elif sejr_info["progress"] >= 80:
+            self.icon.set_from_icon_name("emblem-important-symbolic")
+            self.icon.add_css_class("warning")
+        else:
+            self.icon.set_from_icon_name("folder-open-symbolic")
+
+        self.progress_label.set_label(f"{sejr_info['progress']}%")
+        self.progress_bar.set_fraction(sejr_info["progress"] / 100)
+        if sejr_info["progress"] >= 80:
+            self.progress_bar.add_css_class("success")
+        elif sejr_info["progress"] >= 50:
+            self.progress_bar.add_css_class("warning")
+
     def _on_multi_click(self, gesture, n_press, x, y):
         """Handle Ctrl+Click for multi-select"""
         state = gesture.get_current_event_state()
@@ -3962,15 +3942,10 @@ class SejrRow(Adw.ActionRow):
 
     @staticmethod
     def _get_all_rows(window):
-        """Get all SejrRow widgets from the sidebar list"""
-        rows = []
+        """Get the SejrRow widgets currently on screen in the sidebar list"""
         if hasattr(window, 'sejr_list'):
-            child = window.sejr_list.get_first_child()
-            while child:
-                if isinstance(child, SejrRow):
-                    rows.append(child)
-                child = child.get_next_sibling()
-        return rows
+            return [row for row in window.sejr_list.bound_rows() if isinstance(row, SejrRow)]
+        return []
 
     def _on_drag_prepare(self, source, x, y):
         """Provide the sejr path(s) as drag data — supports multi-select + external app export"""
@@ -4365,9 +4340,18 @@ class ChatStream(Gtk.Box):
             self._load_from_log(sejr_path)
 
     def _load_from_log(self, sejr_path: Path):
-        """Load messages from AUTO_LOG.jsonl"""
-        log_file = sejr_path / "AUTO_LOG.jsonl"
-        if not log_file.exists():
+        """Load the last 20 messages from AUTO_LOG (rotated segments included)"""
+        try:
+            entries = latest_entries(sejr_path, 20)
+        except Exception as e:
+            self.add_message(
+                sender="System",
+                content=f"Could not read log: {e}",
+                msg_type="error"
+            )
+            return
+
+        if not entries and not (sejr_path / LOG_FILENAME).exists():
             # Add welcome message
             self.add_message(
                 sender="Kv1nt",
@@ -4376,56 +4360,41 @@ class ChatStream(Gtk.Box):
             )
             return
 
-        try:
-            content = log_file.read_text()
-            for line in content.strip().split("\n")[-20:]:  # Last 20 entries
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-
-                    # Determine sender based on action
-                    action = data.get("action", "unknown")
-                    if "verify" in action.lower():
-                        sender = "Verify"
-                    elif "dna" in action.lower():
-                        sender = "DNA"
-                    elif "user" in action.lower() or "rasmus" in action.lower():
-                        sender = "Rasmus"
-                    else:
-                        sender = "System"
-
-                    # Extract content
-                    detail = data.get("detail", data.get("message", str(data)))
-                    timestamp = data.get("timestamp", "")
-                    if timestamp and len(timestamp) > 16:
-                        timestamp = timestamp[11:16]  # Just HH:MM
-
-                    # File link if present
-                    file_link = data.get("file", data.get("path"))
-
-                    # Verification if present
-                    verification = None
-                    if "verify" in action.lower() or "test" in action.lower():
-                        verification = {
-                            "passed": data.get("passed", data.get("success", True)),
-                            "message": data.get("result", "Verifyet")
-                        }
-
-                    self.add_message(
-                        sender=sender,
-                        content=detail[:200],
-                        timestamp=timestamp,
-                        file_link=file_link,
-                        verification=verification
-                    )
-                except json.JSONDecodeError:
-                    pass
-        except Exception as e:
+        for data in entries:
+            # Determine sender based on action
+            action = data.get("action", "unknown")
+            if "verify" in action.lower():
+                sender = "Verify"
+            elif "dna" in action.lower():
+                sender = "DNA"
+            elif "user" in action.lower() or "rasmus" in action.lower():
+                sender = "Rasmus"
+            else:
+                sender = "System"
+
+            # Extract content
+            detail = data.get("detail", data.get("message", str(data)))
+            timestamp = data.get("timestamp", "")
+            if timestamp and len(timestamp) > 16:
+                timestamp = timestamp[11:16]  # Just HH:MM
+
+            # File link if present
+            file_link = data.get("file", data.get("path"))
+
+            # Verification if present
+            verification = None
+            if "verify" in action.lower() or "test" in action.lower():
+                verification = {
+                    "passed": data.get("passed", data.get("success", True)),
+                    "message": data.get("result", "Verifyet")
+                }
+
             self.add_message(
-                sender="System",
-                content=f"Could not read log: {e}",
-                msg_type="error"
+                sender=sender,
+                content=str(detail)[:200],
+                timestamp=timestamp,
+                file_link=file_link,
+                verification=verification
             )
 
     def add_message(self, sender: str, content: str, timestamp: str = None,
@@ -4975,6 +4944,8 @@ class LiveActivityMonitor(Gtk.Box):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         self.add_css_class("live-activity-monitor")
         self.activities = []
+        self._events = get_event_store(SYSTEM_PATH)
+        self._last_event_id = None  # Newest event already shown (None = first poll)
         self._build_ui()
         self._start_monitoring()
 
@@ -5078,53 +5049,53 @@ class LiveActivityMonitor(Gtk.Box):
         return True  # Fortsæt
 
     def _check_for_activities(self):
-        """Tjek for nye activityer fra AUTO_LOG.jsonl"""
+        """Tjek for nye activityer via event store (AUTO_LOG + enforcement)"""
         try:
-            # Tjek aktive victorys for nye log entries
-            if ACTIVE_DIR.exists():
-                for sejr_folder in ACTIVE_DIR.iterdir():
-                    if sejr_folder.is_dir():
-                        log_file = sejr_folder / "AUTO_LOG.jsonl"
-                        if log_file.exists():
-                            self._read_new_log_entries(log_file, sejr_folder.name)
+            # Stat-only for uændrede logs; nye linjer importeres fra deres offset
+            self._events.sync(("10_ACTIVE",))
+            active = [f for f in ACTIVE_DIR.iterdir() if f.is_dir()] if ACTIVE_DIR.exists() else []
+            self._show_new_events([f.name for f in active])
+            for sejr_folder in active:
+                self._check_checkbox_delta(sejr_folder)
         except Exception:
             pass
         return True  # Fortsæt overvågning
 
-    def _read_new_log_entries(self, log_file: Path, sejr_name: str):
-        """Read new log entries fra en AUTO_LOG.jsonl fil"""
+    def _check_checkbox_delta(self, sejr_folder: Path):
+        """Vis checkbox-ændringer i SEJR_LISTE.md (kun ændrede linjer parses)"""
+        result = get_delta_engine().update(sejr_folder)
+        for event in result.events[-5:]:
+            self._add_activity(
+                sejr_folder.name[:20],
+                f"{event.describe()}: {event.text[:40]}",
+                self._get_icon_for_action("complete" if event.kind == "checked" else "update")
+            )
+            self._update_five_w(sejr_folder.name, event.describe())
+
+    def _show_new_events(self, sejr_names: list):
+        """Vis hændelser for aktive sejr der er kommet til siden sidste poll"""
         try:
-            with open(log_file, 'r') as f:
-                lines = f.readlines()[-5:]  # Kun de seneste 5 linjer
+            if self._last_event_id is None:
+                # Første poll: kun de seneste 5, ikke hele historikken
+                self._last_event_id = self._events.max_id()
+                events = list(reversed(self._events.query(limit=5, sejrs=sejr_names)))
+            else:
+                events = self._events.query(limit=None, newest_first=False,
+                                            after_id=self._last_event_id, sejrs=sejr_names)
+                if events:
+                    self._last_event_id = max(e.id for e in events)
+
+            for event in events[-5:]:  # Kun de seneste 5
+                # Tilføj activity
+                action = event.action or 'action'
+                self._add_activity(
+                    event.sejr[:20],
+                    f"{action}: {str(event.data.get('details', ''))[:50]}",
+                    self._get_icon_for_action(action)
+                )
 
-            for line in lines:
-                try:
-                    entry = json.loads(line.strip())
-                    entry_id = f"{log_file}:{entry.get('timestamp', '')}"
-
-                    # Tjek om vi allerede har set denne entry
-                    if not hasattr(self, '_seen_entries'):
-                        self._seen_entries = set()
-
-                    if entry_id not in self._seen_entries:
-                        self._seen_entries.add(entry_id)
-
-                        # Begræns set size
-                        if len(self._seen_entries) > 100:
-                            self._seen_entries = set(list(self._seen_entries)[-50:])
-
-                        # Tilføj activity
-                        action = entry.get('action', 'action')
-                        self._add_activity(
-                            sejr_name[:20],
-                            f"{action}: {entry.get('details', '')[:50]}",
-                            self._get_icon_for_action(action)
-                        )
-
-                        # Update 5W
-                        self._update_five_w(sejr_name, action)
-                except json.JSONDecodeError:
-                    pass
+                # Update 5W
+                self._update_five_w(event.sejr, action)
         except Exception:
             pass
 
@@ -5327,18 +5298,17 @@ class Vindertavle(Gtk.Box):
                     # Try to get score from STATUS.yaml (unified v3.0.0)
                     if status_file.exists():
                         try:
-                            import yaml
-                            with open(status_file) as f:
-                                data = yaml.safe_load(f) or {}
-                                # Handle both nested (v3.0.0) and flat (legacy) formats
-                                if isinstance(data.get("score_tracking"), dict):
-                                    victory_data["score"] = data["score_tracking"].get("totals", {}).get("total_score", 0)
-                                else:
-                                    victory_data["score"] = data.get("current_score", data.get("total_score", 0))
-                                if isinstance(data.get("pass_tracking"), dict):
-                                    victory_data["pass_level"] = data["pass_tracking"].get("current_pass", 1)
-                                else:
-                                    victory_data["pass_level"] = data.get("current_pass", 1)
+                            from sejr_yaml import load_yaml_file
+                            data = load_yaml_file(status_file)
+                            # Handle both nested (v3.0.0) and flat (legacy) formats
+                            if isinstance(data.get("score_tracking"), dict):
+                                victory_data["score"] = data["score_tracking"].get("totals", {}).get("total_score", 0)
+                            else:
+                                victory_data["score"] = data.get("current_score", data.get("total_score", 0))
+                            if isinstance(data.get("pass_tracking"), dict):
+                                victory_data["pass_level"] = data["pass_tracking"].get("current_pass", 1)
+                            else:
+                                victory_data["pass_level"] = data.get("current_pass", 1)
                         except Exception:
                             pass
 
@@ -5584,12 +5554,8 @@ class DNALayerRow(Gtk.Box):
         }
         script = scripts.get(self.layer_num)
         if script:
-            script_path = SYSTEM_PATH / "scripts" / script
-            if script_path.exists():
-                try:
-                    subprocess.Popen(["python3", str(script_path)])
-                except Exception as e:
-                    print(f"Could not run script: {e}")
+            # Runs in-process on the shared job queue; repeated clicks join the running job
+            get_job_queue(SYSTEM_PATH).submit(script, use_cache=False)
 
 
 # 
@@ -6092,7 +6058,7 @@ class PrioritetsOverblik(Gtk.Box):
         """Trigger ny victory oprettelse."""
         script = SCRIPTS_DIR / "generate_sejr.py"
         if script.exists():
-            subprocess.Popen(["python3", str(script)])
+            get_job_queue(SYSTEM_PATH).submit(script.name, use_cache=False)
             send_notification("New Victory", "Opretter ny victory...", "list-add-symbolic")
 
 
@@ -7974,8 +7940,8 @@ class SyncDashboardView(Gtk.Box):
         steps.append(f"Links: {link_status.detail}")
 
         # Step 3: Refresh status
-        self._populate_cards()
-        health = get_sync_health()
+        statuses = self._populate_cards()
+        health = get_sync_health(statuses=statuses)
         self.health_label.set_label(f"Sync Health: {health:.0f}%")
         self.health_bar.set_fraction(health / 100)
         steps.append(f"Health: {health:.0f}%")
@@ -8025,8 +7991,8 @@ class SyncDashboardView(Gtk.Box):
     def _background_sync(self):
         """Background sync every 5 minutes (Pass 3) — only notify on changes"""
         try:
-            self._populate_cards()
-            health = get_sync_health()
+            statuses = self._populate_cards()
+            health = get_sync_health(statuses=statuses)
             self.health_label.set_label(f"Sync Health: {health:.0f}%")
             self.health_bar.set_fraction(health / 100)
             self._update_timestamp()
@@ -8070,6 +8036,7 @@ class SyncDashboardView(Gtk.Box):
         for s in statuses:
             card = SyncComponentCard(s)
             self.cards_box.append(card)
+        return statuses
 
     def _on_git_pull(self, button):
         """Run git pull in MASTER FOLDERS"""
@@ -8111,8 +8078,8 @@ class SyncDashboardView(Gtk.Box):
 
     def _on_refresh(self, button):
         """Refresh all sync status"""
-        self._populate_cards()
-        health = get_sync_health()
+        statuses = self._populate_cards()
+        health = get_sync_health(statuses=statuses)
         self.health_label.set_label(f"Sync Health: {health:.0f}%")
         self.health_bar.set_fraction(health / 100)
         self.health_bar.set_text(f"{health:.0f}%")
@@ -9521,7 +9488,16 @@ class IntroSystemView(Gtk.Box):
         GLib.idle_add(self._auto_refresh_current_view)
 
     def _auto_refresh_current_view(self):
-        """Re-render the currently visible INTRO view after file change."""
+        """Re-render the currently visible INTRO view after file change.
+
+        Category file lists are updated item by item (only changed rows
+        are re-bound); other views are rebuilt.
+        """
+        if self._current_view and self._current_view == getattr(self, "_category_letter", None):
+            for cat in intro_integration.get_intro_categories():
+                if cat.letter == self._current_view and cat.files:
+                    self._category_files.sync(self._category_file_entries(cat))
+                    return False
         if self._current_view:
             self.show_category(self._current_view)
         return False  # One-shot idle callback
@@ -9589,6 +9565,7 @@ class IntroSystemView(Gtk.Box):
                           'naughty_not', 'git_status'
         """
         self._current_view = category_key
+        self._category_letter = None
         self._clear()
         # Add smooth fade-in animation (PASS 3 FASE 1)
         self._container.add_css_class("intro-fade-in")
@@ -9717,62 +9694,76 @@ class IntroSystemView(Gtk.Box):
         summary.set_xalign(0)
         self._container.append(summary)
 
-        # File rows
-        files_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        # File rows — virtualized, so large categories only build the rows on screen
+        self._category_files = VirtualList(lambda entry: self._build_category_file_row(letter, entry.data["file"]))
+        self._category_files.add_css_class("intro-file-list")
+        self._category_files.sync(self._category_file_entries(target_cat))
+        self._category_letter = letter
 
-        for f in target_cat.files:
-            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-            row.add_css_class("intro-file-row")
+        files_scroll = Gtk.ScrolledWindow()
+        files_scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        files_scroll.set_min_content_height(480)
+        files_scroll.set_vexpand(True)
+        files_scroll.set_child(self._category_files)
+        self._container.append(files_scroll)
 
-            # File number
-            num = f.category_number
-            num_str = f"{letter}{num}" if num is not None else f.name[:3]
-            number_label = Gtk.Label(label=num_str)
-            number_label.add_css_class("intro-file-number")
-            number_label.set_valign(Gtk.Align.CENTER)
-            row.append(number_label)
+    @staticmethod
+    def _category_file_entries(category) -> list:
+        return [ListEntry(str(f.path), "row", {"file": f}) for f in category.files]
 
-            # Info
-            info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-            info_box.set_hexpand(True)
+    def _build_category_file_row(self, letter: str, f):
+        """Build a single file row for a category view (called by the list factory)."""
+        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        row.add_css_class("intro-file-row")
 
-            name_label = Gtk.Label(label=f.name)
-            name_label.add_css_class("intro-file-title")
-            name_label.set_xalign(0)
-            name_label.set_ellipsize(Pango.EllipsizeMode.END)
-            info_box.append(name_label)
+        # File number
+        num = f.category_number
+        num_str = f"{letter}{num}" if num is not None else f.name[:3]
+        number_label = Gtk.Label(label=num_str)
+        number_label.add_css_class("intro-file-number")
+        number_label.set_valign(Gtk.Align.CENTER)
+        row.append(number_label)
 
-            mod_date = f.last_modified[:10] if f.last_modified else "?"
-            meta = Gtk.Label(label=f"{f.size_human}  |  {f.lines:,} lines  |  {mod_date}")
-            meta.add_css_class("intro-file-meta")
-            meta.set_xalign(0)
-            info_box.append(meta)
+        # Info
+        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+        info_box.set_hexpand(True)
 
-            row.append(info_box)
+        name_label = Gtk.Label(label=f.name)
+        name_label.add_css_class("intro-file-title")
+        name_label.set_xalign(0)
+        name_label.set_ellipsize(Pango.EllipsizeMode.END)
+        info_box.append(name_label)
 
-            # Status badge
-            status = Gtk.Label(label=f.status)
-            status.add_css_class("intro-status-badge")
-            if f.status in ("COMPLETE", "VERIFIED", "ALL_WORKING", "OPERATIONAL", "ESTABLISHED", "STABLE"):
-                status.add_css_class("intro-status-complete")
-            elif f.status in ("ACTIVE", "IN_PROGRESS"):
-                status.add_css_class("intro-status-active")
-            else:
-                status.add_css_class("intro-status-unknown")
-            status.set_valign(Gtk.Align.CENTER)
-            row.append(status)
+        mod_date = f.last_modified[:10] if f.last_modified else "?"
+        meta = Gtk.Label(label=f"{f.size_human}  |  {f.lines:,} lines  |  {mod_date}")
+        meta.add_css_class("intro-file-meta")
+        meta.set_xalign(0)
+        info_box.append(meta)
 
-            # Open button
-            open_btn = Gtk.Button(label="Open")
-            open_btn.add_css_class("intro-open-btn")
-            open_btn.set_valign(Gtk.Align.CENTER)
-            fpath = str(f.path)
-            open_btn.connect("clicked", lambda b, p=fpath: self._open_file(p))
-            row.append(open_btn)
+        row.append(info_box)
 
-            files_box.append(row)
+        # Status badge
+        status = Gtk.Label(label=f.status)
+        status.add_css_class("intro-status-badge")
+        if f.status in ("COMPLETE", "VERIFIED", "ALL_WORKING", "OPERATIONAL", "ESTABLISHED", "STABLE"):
+            status.add_css_class("intro-status-complete")
+        elif f.status in ("ACTIVE", "IN_PROGRESS"):
+            status.add_css_class("intro-status-active")
+        else:
+            status.add_css_class("intro-status-unknown")
+        status.set_valign(Gtk.Align.CENTER)
+        row.append(status)
 
-        self._container.append(files_box)
+        # Open button
+        open_btn = Gtk.Button(label="Open")
+        open_btn.add_css_class("intro-open-btn")
+        open_btn.set_valign(Gtk.Align.CENTER)
+        fpath = str(f.path)
+        open_btn.connect("clicked", lambda b, p=fpath: self._open_file(p))
+        row.append(open_btn)
+
+        row.set_margin_bottom(6)
+        return row
 
     # -----------------------------------------------------------------
     # STRUCTURE VIEW (Folder governance + rules)
@@ -13444,16 +13435,22 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         self.search_mode = False
         self.zoom_level = 1.0  # For zoom functionality
         self.file_monitors = []  # Real-time file monitoring
+        self._daemon_connected = False  # Subscribed to sejr_daemon (no local monitors needed)
         self._drag_history = []  # Undo stack for drag operations
         self._selected_rows = set()  # Multi-select tracking
         self._active_drag_row = None  # Currently dragged row
 
+        self._sejr_signatures = {}  # Folder path -> signature as last rendered
+        self._dirty_sejrs = set()  # Folders to re-render on the next flush
+        self._list_dirty = False  # Folders added/removed: rebuild the list
+        self._dirty_flush_id = None
+
         self._build_ui()
         self._load_sejrs()
         self._setup_file_monitoring()
         self._setup_drag_drop()
 
-        # Auto-refresh every 5 seconds (backup to file monitoring)
+        # Cheap consistency check every 5 seconds (backup to file monitoring)
         GLib.timeout_add_seconds(5, self._auto_refresh)
 
     def _build_ui(self):
@@ -13590,9 +13587,8 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         self.search_results_scroll.set_vexpand(True)
         self.search_results_scroll.set_visible(False)
 
-        self.search_results_list = Gtk.ListBox()
+        self.search_results_list = VirtualList(self._build_search_row, self._on_search_result_activated)
         self.search_results_list.add_css_class("boxed-list")
-        self.search_results_list.connect("row-activated", self._on_search_result_activated)
         self.search_results_scroll.set_child(self.search_results_list)
         sidebar_box.append(self.search_results_scroll)
 
@@ -13635,10 +13631,9 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scroll.set_vexpand(True)
 
-        self.sejr_list = Gtk.ListBox()
+        self.sejr_list = VirtualList(self._build_sidebar_row, self._on_sejr_selected, selectable=True,
+                                     update_row=self._update_sidebar_row)
         self.sejr_list.add_css_class("navigation-sidebar")
-        self.sejr_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.sejr_list.connect("row-activated", self._on_sejr_selected)
         scroll.set_child(self.sejr_list)
 
         sidebar_box.append(scroll)
@@ -13660,8 +13655,9 @@ class MasterpieceWindow(Adw.ApplicationWindow):
 
         # Pre-fetch category data for file counts and dates
         try:
-            intro_summary = intro_integration.get_intro_summary()
-            intro_cats = intro_integration.get_intro_categories()
+            intro_snapshot = intro_integration.scan_intro()
+            intro_summary = intro_integration.get_intro_summary(intro_snapshot)
+            intro_cats = intro_integration.get_intro_categories(intro_snapshot)
             intro_cat_dict = {cat.letter: cat for cat in intro_cats}
         except Exception:
             intro_summary = {"available": False}
@@ -14328,66 +14324,33 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         chat_group.add(chat_card)
         self.detail_box.append(chat_group)
 
+    def _remember_signatures(self):
+        """Record what is about to be rendered (before reading, so no change is missed)"""
+        self._sejr_signatures = self._scan_sejr_folders()
+        self._sync_sejr_monitors()
+
     def _load_sejrs(self):
         """Load all victorys into the sidebar"""
+        self._remember_signatures()
         self.sejrs = get_all_sejrs()
 
         # Log til activitysmonitor
         if hasattr(self, 'activity_monitor'):
             self.activity_monitor.log_event("system", f"Indlæste {len(self.sejrs)} victorys", "")
 
-        # Clear list
-        while row := self.sejr_list.get_first_child():
-            self.sejr_list.remove(row)
-
-        active_count = 0
-        archived_count = 0
-
-        # Active section header
-        active_header = Gtk.Label(label="AKTIVE")
-        active_header.add_css_class("caption")
-        active_header.add_css_class("dim-label")
-        active_header.set_halign(Gtk.Align.START)
-        active_header.set_margin_start(12)
-        active_header.set_margin_top(12)
-        active_header.set_margin_bottom(6)
-        self.sejr_list.append(active_header)
-
-        for sejr in self.sejrs:
-            if not sejr["is_archived"]:
-                row = SejrRow(sejr)
-                self.sejr_list.append(row)
-                active_count += 1
-
+        entries = [ListEntry("header:active", "header", {"label": "AKTIVE", "top": 12})]
+        entries += [ListEntry(str(sejr["path"]), "row", sejr) for sejr in self.sejrs if not sejr["is_archived"]]
+        active_count = len(entries) - 1
         if active_count == 0:
-            empty = Gtk.Label(label="No active victoriess")
-            empty.add_css_class("dim-label")
-            empty.set_margin_start(12)
-            empty.set_margin_bottom(12)
-            self.sejr_list.append(empty)
-
-        # Archived section header
-        archive_header = Gtk.Label(label="ARKIVEREDE")
-        archive_header.add_css_class("caption")
-        archive_header.add_css_class("dim-label")
-        archive_header.set_halign(Gtk.Align.START)
-        archive_header.set_margin_start(12)
-        archive_header.set_margin_top(18)
-        archive_header.set_margin_bottom(6)
-        self.sejr_list.append(archive_header)
+            entries.append(ListEntry("empty:active", "empty", {"label": "No active victoriess"}))
 
-        for sejr in self.sejrs:
-            if sejr["is_archived"]:
-                row = SejrRow(sejr)
-                self.sejr_list.append(row)
-                archived_count += 1
+        entries.append(ListEntry("header:archived", "header", {"label": "ARKIVEREDE", "top": 18}))
+        archived = [ListEntry(str(sejr["path"]), "row", sejr) for sejr in self.sejrs if sejr["is_archived"]]
+        archived_count = len(archived)
+        entries += archived or [ListEntry("empty:archived", "empty", {"label": "No archived victoriess"})]
 
-        if archived_count == 0:
-            empty = Gtk.Label(label="No archived victoriess")
-            empty.add_css_class("dim-label")
-            empty.set_margin_start(12)
-            empty.set_margin_bottom(12)
-            self.sejr_list.append(empty)
+        # Only rows whose data changed are re-bound
+        self.sejr_list.sync(entries)
 
         # Update stats
         self.active_label.set_label(f"{active_count} Active")
@@ -14421,6 +14384,7 @@ class MasterpieceWindow(Adw.ApplicationWindow):
 
     def _load_sejrs_filtered(self):
         """Load victorys with current filter and sort applied"""
+        self._remember_signatures()
         self.sejrs = get_all_sejrs()
 
         # Apply filter
@@ -14440,81 +14404,74 @@ class MasterpieceWindow(Adw.ApplicationWindow):
         elif sort_idx == 2:  # Navn
             filtered_sejrs.sort(key=lambda s: s.get("display_name", ""))
 
-        # Clear list
-        while row := self.sejr_list.get_first_child():
-            self.sejr_list.remove(row)
-
         active_count = len([s for s in self.sejrs if not s["is_archived"]])
         archived_count = len([s for s in self.sejrs if s["is_archived"]])
 
         # Show appropriate header based on filter
+        entries = []
         if self.current_filter == "all":
-            # Active section header
-            if any(not s["is_archived"] for s in filtered_sejrs):
-                active_header = Gtk.Label(label=" AKTIVE")
-                active_header.add_css_class("caption")
-                active_header.add_css_class("dim-label")
-                active_header.set_halign(Gtk.Align.START)
-                active_header.set_margin_start(12)
-                active_header.set_margin_top(12)
-                active_header.set_margin_bottom(6)
-                self.sejr_list.append(active_header)
-
-                for sejr in filtered_sejrs:
-                    if not sejr["is_archived"]:
-                        row = SejrRow(sejr)
-                        self.sejr_list.append(row)
-
-            # Archived section header
-            if any(s["is_archived"] for s in filtered_sejrs):
-                archive_header = Gtk.Label(label=" ARKIVEREDE")
-                archive_header.add_css_class("caption")
-                archive_header.add_css_class("dim-label")
-                archive_header.set_halign(Gtk.Align.START)
-                archive_header.set_margin_start(12)
-                archive_header.set_margin_top(18)
-                archive_header.set_margin_bottom(6)
-                self.sejr_list.append(archive_header)
-
-                for sejr in filtered_sejrs:
-                    if sejr["is_archived"]:
-                        row = SejrRow(sejr)
-                        self.sejr_list.append(row)
+            active = [s for s in filtered_sejrs if not s["is_archived"]]
+            if active:
+                entries.append(ListEntry("header:active", "header", {"label": " AKTIVE", "top": 12}))
+                entries += [ListEntry(str(sejr["path"]), "row", sejr) for sejr in active]
+
+            archived = [s for s in filtered_sejrs if s["is_archived"]]
+            if archived:
+                entries.append(ListEntry("header:archived", "header", {"label": " ARKIVEREDE", "top": 18}))
+                entries += [ListEntry(str(sejr["path"]), "row", sejr) for sejr in archived]
         else:
             # Single section (filtered view)
             header_text = " AKTIVE" if self.current_filter == "active" else " ARKIVEREDE"
-            header = Gtk.Label(label=header_text)
-            header.add_css_class("caption")
-            header.add_css_class("dim-label")
-            header.set_halign(Gtk.Align.START)
-            header.set_margin_start(12)
-            header.set_margin_top(12)
-            header.set_margin_bottom(6)
-            self.sejr_list.append(header)
-
-            for sejr in filtered_sejrs:
-                row = SejrRow(sejr)
-                self.sejr_list.append(row)
+            entries.append(ListEntry(f"header:{self.current_filter}", "header", {"label": header_text, "top": 12}))
+            entries += [ListEntry(str(sejr["path"]), "row", sejr) for sejr in filtered_sejrs]
 
             if not filtered_sejrs:
                 empty_text = "No active victoriess" if self.current_filter == "active" else "No archived victoriess"
-                empty = Gtk.Label(label=empty_text)
-                empty.add_css_class("dim-label")
-                empty.set_margin_start(12)
-                empty.set_margin_bottom(12)
-                self.sejr_list.append(empty)
+                entries.append(ListEntry(f"empty:{self.current_filter}", "empty", {"label": empty_text}))
+
+        self.sejr_list.sync(entries)
 
         # Update stats
         self.active_label.set_label(f"{active_count} Active")
         self.archived_label.set_label(f"{archived_count} Archived")
 
-    def _on_sejr_selected(self, listbox, row):
+    def _build_sidebar_row(self, entry):
+        """Widget for one sidebar entry (called by the list factory for rows on screen)"""
+        if entry.kind == "row":
+            row = SejrRow(entry.data)
+            if str(entry.data.get("path", "")) in self._selected_rows:
+                row.add_css_class("selected-multi")
+            return row
+
+        label = Gtk.Label(label=entry.data["label"])
+        label.add_css_class("dim-label")
+        label.set_halign(Gtk.Align.START)
+        label.set_margin_start(12)
+        if entry.kind == "header":
+            label.add_css_class("caption")
+            label.set_margin_top(entry.data.get("top", 12))
+            label.set_margin_bottom(6)
+        else:
+            label.set_margin_bottom(12)
+        return label
+
+    def _update_sidebar_row(self, widget, entry) -> bool:
+        """Refill a recycled sidebar row in place (headers and labels are rebuilt)"""
+        if entry.kind != "row":
+            return False
+        widget.set_sejr(entry.data)
+        if str(entry.data.get("path", "")) in self._selected_rows:
+            widget.add_css_class("selected-multi")
+        else:
+            widget.remove_css_class("selected-multi")
+        return True
+
+    def _on_sejr_selected(self, sejr_info):
         """Handle victory selection"""
-        if hasattr(row, 'victory_info'):
-            self.selected_sejr = row.sejr_info
-            self._build_detail_page(row.sejr_info)
-            self.content_stack.set_visible_child_name("detail")
-            self.split_view.set_show_content(True)
+        self.selected_sejr = sejr_info
+        self._build_detail_page(sejr_info)
+        self.content_stack.set_visible_child_name("detail")
+        self.split_view.set_show_content(True)
 
     def _on_linen_clicked(self, button):
         """Navigate to LINEN Health view"""
@@ -14964,47 +14921,41 @@ class MasterpieceWindow(Adw.ApplicationWindow):
             )
 
         if script_path.exists():
-            try:
-                result = subprocess.run(
-                    ["python3", str(script_path)],
-                    cwd=str(SYSTEM_PATH),
-                    capture_output=True,
-                    text=True
-                )
-                self._load_sejrs()
+            import threading
 
-                # Add success message to chat
-                if hasattr(self, 'chat_stream') and self.chat_stream:
-                    # Check if there was output
-                    output = result.stdout.strip() if result.stdout else info["success_msg"]
-                    if len(output) > 200:
-                        output = output[:200] + "..."
+            # In-process on the shared job queue; the main loop only sees the result
+            job = get_job_queue(SYSTEM_PATH).submit(script_name, use_cache=False)
 
-                    self.chat_stream.add_message(
-                        sender=info["sender"],
-                        content=output if output else info["success_msg"],
-                        msg_type="info",
-                        verification={"passed": result.returncode == 0, "message": "Verified" if result.returncode == 0 else "Error"}
-                    )
+            def _wait():
+                job.wait()
+                GLib.idle_add(self._on_script_done, job, info)
 
-                # Send desktop notification
-                send_notification(info["title"], info["body"])
+            threading.Thread(target=_wait, daemon=True).start()
 
-                # Special celebration for archive
-                if script_name == "auto_archive.py":
-                    self._show_celebration()
+    def _on_script_done(self, job, info):
+        """Show a finished DNA script's result (called on the GTK main loop)."""
+        self._load_sejrs()
 
-            except Exception as e:
-                # Add error to chat
-                if hasattr(self, 'chat_stream') and self.chat_stream:
-                    self.chat_stream.add_message(
-                        sender="Error",
-                        content=f"Script fejlede: {e}",
-                        msg_type="error",
-                        verification={"passed": False, "message": str(e)}
-                    )
-                send_notification(" Error", f"Script fejlede: {e}")
-                print(f"Error: {e}")
+        # Add result message to chat
+        if hasattr(self, 'chat_stream') and self.chat_stream:
+            output = job.output().strip() or info["success_msg"]
+            if len(output) > 200:
+                output = output[:200] + "..."
+
+            self.chat_stream.add_message(
+                sender=info["sender"],
+                content=output,
+                msg_type="info",
+                verification={"passed": job.ok, "message": "Verified" if job.ok else "Error"}
+            )
+
+        # Send desktop notification
+        send_notification(info["title"], info["body"])
+
+        # Special celebration for archive
+        if job.script == "auto_archive.py":
+            self._show_celebration()
+        return False
 
     def _show_celebration(self):
         """Show celebration dialog when victory is archived"""
@@ -15048,16 +14999,38 @@ Du er på vej mod Admiral niveau!"""
             subprocess.Popen(["nautilus", str(SYSTEM_PATH)])
 
     def _auto_refresh(self):
-        """Auto-refresh every 5 seconds"""
-        self._load_sejrs()
-        if self.selected_sejr:
-            # Refresh current view
-            for sejr in self.sejrs:
-                if sejr["path"] == self.selected_sejr["path"]:
-                    self._build_detail_page(sejr)
-                    break
+        """Consistency check every 5 seconds (file monitors do the real work).
+
+        Only stats files: compares the folder listing and each active
+        folder's signature with what is on screen and marks differences
+        dirty, in case a monitor event was missed. Idle cost is a few stat
+        calls; nothing is re-parsed or re-rendered unless something changed.
+        Skipped while the sejr daemon pushes changes.
+        """
+        if self._daemon_connected:
+            return True
+        listing = self._scan_sejr_folders()
+        if set(listing) != set(self._sejr_signatures):
+            self._list_dirty = True
+        else:
+            for path, signature in listing.items():
+                if signature is not None and signature != self._sejr_signatures.get(path):
+                    self._dirty_sejrs.add(path)
+        if self._list_dirty or self._dirty_sejrs:
+            self._schedule_dirty_flush()
         return True
 
+    def _scan_sejr_folders(self) -> dict:
+        """{folder path: signature} — signature only for active folders (archives don't change)"""
+        listing = {}
+        for directory, track in ((ACTIVE_DIR, True), (ARCHIVE_DIR, False)):
+            if not directory.exists():
+                continue
+            for folder in directory.iterdir():
+                if folder.is_dir() and not folder.name.startswith("."):
+                    listing[str(folder)] = folder_signature(folder) if track else None
+        return listing
+
     #
     # DRAG UNDO SYSTEM
     #
@@ -15144,12 +15117,94 @@ Du er på vej mod Admiral niveau!"""
             toast.set_timeout(3)
             self._toast_overlay.add_toast(toast)
 
+    #
+    # DIRTY TRACKING — monitors mark victorys dirty, one debounced flush renders
+    #
+
+    def _mark_sejr_dirty(self, path: Path):
+        """Mark a victory folder for re-render (or the whole list if it is new/gone)"""
+        if str(path) in self._sejr_signatures and path.exists():
+            self._dirty_sejrs.add(str(path))
+        else:
+            self._list_dirty = True
+        self._schedule_dirty_flush()
+
+    def _schedule_dirty_flush(self):
+        """Coalesce bursts of events into a single flush 500ms after the first"""
+        if self._dirty_flush_id is None:
+            self._dirty_flush_id = GLib.timeout_add(500, self._flush_dirty)
+
+    def _flush_dirty(self):
+        """Re-render only what was marked dirty"""
+        self._dirty_flush_id = None
+        dirty, self._dirty_sejrs = self._dirty_sejrs, set()
+
+        if self._list_dirty:
+            self._list_dirty = False
+            before = self._sejr_signatures
+            self._load_sejrs()
+            changed = {p for p, signature in self._sejr_signatures.items()
+                       if signature != before.get(p)}
+        else:
+            changed = {path for path in dirty if self._refresh_sejr_row(path)}
+
+        # Rebuild the detail page only if the selected folder's signature changed
+        if self.selected_sejr and self.selected_sejr["path"] in changed:
+            for sejr in self.sejrs:
+                if sejr["path"] == self.selected_sejr["path"]:
+                    self.selected_sejr = sejr
+                    self._build_detail_page(sejr)
+                    break
+        return False  # Don't repeat
+
+    def _refresh_sejr_row(self, path: str) -> bool:
+        """Re-read one victory and replace its sidebar row in place. False if it was unchanged."""
+        folder = Path(path)
+        signature = folder_signature(folder)
+        if signature == self._sejr_signatures.get(path):
+            return False
+        self._sejr_signatures[path] = signature
+        sejr = get_sejr_info(folder)
+        self.sejrs = [sejr if s["path"] == path else s for s in self.sejrs]
+        self.sejr_list.update(ListEntry(str(sejr["path"]), "row", sejr))
+        return True
+
     #
     # REAL-TIME FILE MONITORING
     #
 
     def _setup_file_monitoring(self):
+        """Subscribe to the sejr daemon if it runs, otherwise watch with Gio.FileMonitor
+
+        With the daemon, its single watcher pushes the names of changed
+        victorys and this window runs no monitors or consistency poll of its own.
+        """
+        self._daemon_connected = SejrClient(SYSTEM_PATH).subscribe(
+            lambda change: GLib.idle_add(self._on_daemon_change, change),
+            lambda: GLib.idle_add(self._on_daemon_lost)) is not None
+        if not self._daemon_connected:
+            self._setup_local_monitoring()
+
+    def _on_daemon_change(self, change: dict):
+        """One pushed change from the sejr daemon: mark exactly the named victorys dirty"""
+        for names, directory in ((change.get("active", []) + change.get("logs", []), ACTIVE_DIR),
+                                 (change.get("archived", []), ARCHIVE_DIR)):
+            for name in names:
+                self._mark_sejr_dirty(directory / name)
+        return False
+
+    def _on_daemon_lost(self):
+        """The daemon stopped: fall back to local monitors and catch up on missed changes"""
+        self._daemon_connected = False
+        self._setup_local_monitoring()
+        self._list_dirty = True
+        self._schedule_dirty_flush()
+        return False
+
+    def _setup_local_monitoring(self):
         """Setup Gio.FileMonitor for real-time updates"""
+        self._sejr_monitors = {}  # Active victory folder -> Gio.FileMonitor
+
         # Monitor active folder
         active_gfile = Gio.File.new_for_path(str(ACTIVE_DIR))
         if active_gfile.query_exists():
@@ -15170,15 +15225,34 @@ Du er på vej mod Admiral niveau!"""
             except Exception as e:
                 print(f"Could not setup archive monitoring: {e}")
 
+        self._sync_sejr_monitors()
+
+    def _sync_sejr_monitors(self):
+        """Directory monitors are not recursive: watch each active victory folder"""
+        if not hasattr(self, "_sejr_monitors"):
+            return
+        active = {p for p in self._sejr_signatures if Path(p).parent == ACTIVE_DIR}
+        for path in list(self._sejr_monitors):
+            if path not in active:
+                self._sejr_monitors.pop(path).cancel()
+        for path in active - set(self._sejr_monitors):
+            try:
+                monitor = Gio.File.new_for_path(path).monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+                monitor.connect("changed", self._on_file_changed)
+                self._sejr_monitors[path] = monitor
+            except Exception as e:
+                print(f"Could not monitor {path}: {e}")
+
     def _on_file_changed(self, monitor, file, other_file, event_type):
-        """Handle file system changes - real-time refresh"""
+        """Handle file system changes - mark the affected victory dirty"""
         if event_type in [Gio.FileMonitorEvent.CREATED, Gio.FileMonitorEvent.DELETED,
                          Gio.FileMonitorEvent.CHANGED, Gio.FileMonitorEvent.MOVED_IN,
-                         Gio.FileMonitorEvent.MOVED_OUT]:
+                         Gio.FileMonitorEvent.MOVED_OUT, Gio.FileMonitorEvent.RENAMED]:
+
+            file_path = file.get_path() if file else None
 
             # Log til activitysmonitor
             if hasattr(self, 'activity_monitor'):
-                file_path = file.get_path() if file else "ukendt"
                 file_name = Path(file_path).name if file_path else "fil"
 
                 event_icons = {
@@ -15191,13 +15265,19 @@ Du er på vej mod Admiral niveau!"""
                 icon, action = event_icons.get(event_type, ("", "Handling"))
                 self.activity_monitor.log_event("fil", f"{action}: {file_name[:40]}", icon)
 
-            # Debounce rapid changes - refresh after 500ms
-            GLib.timeout_add(500, self._debounced_refresh)
-
-    def _debounced_refresh(self):
-        """Debounced refresh to avoid rapid-fire updates"""
-        self._load_sejrs()
-        return False  # Don't repeat
+            if file_path:
+                for base in (ACTIVE_DIR, ARCHIVE_DIR):
+                    try:
+                        rel = Path(file_path).relative_to(base.resolve())
+                    except ValueError:
+                        continue
+                    if len(rel.parts) == 1:
+                        # A folder itself was created, deleted or moved
+                        self._list_dirty = True
+                        self._schedule_dirty_flush()
+                    else:
+                        self._mark_sejr_dirty(base / rel.parts[0])
+                    break
 
     # 
     # DRAG & DROP SUPPORT
@@ -15550,7 +15630,7 @@ Du er på vej mod Admiral niveau!"""
         script_path = SYSTEM_PATH / "scripts" / "auto_verify.py"
         if script_path.exists():
             try:
-                subprocess.Popen(["python3", str(script_path)])
+                get_job_queue(SYSTEM_PATH).submit(script_path.name, use_cache=False)
                 self._show_toast("Runer verifikation...")
             except Exception as e:
                 self._show_toast(f"Error: {e}")
@@ -15564,7 +15644,8 @@ Du er på vej mod Admiral niveau!"""
         script_path = SYSTEM_PATH / "scripts" / "auto_archive.py"
         if script_path.exists():
             try:
-                subprocess.Popen(["python3", str(script_path), str(self.selected_sejr["path"])])
+                get_job_queue(SYSTEM_PATH).submit(
+                    script_path.name, ["--sejr", Path(self.selected_sejr["path"]).name], use_cache=False)
                 self._show_toast("Archiveer victory...")
             except Exception as e:
                 self._show_toast(f"Error: {e}")
@@ -15574,7 +15655,7 @@ Du er på vej mod Admiral niveau!"""
         script_path = SYSTEM_PATH / "scripts" / "auto_predict.py"
         if script_path.exists():
             try:
-                subprocess.Popen(["python3", str(script_path)])
+                get_job_queue(SYSTEM_PATH).submit(script_path.name, use_cache=False)
                 self._show_toast("Genererer forudsigelser...")
             except Exception as e:
                 self._show_toast(f"Error: {e}")
@@ -15669,9 +15750,8 @@ Ctrl+Q    Afslut
             self._clear_search_results()
             return
 
-        # Perform search
-        results = self.search_engine.search(query, max_results=30)
-        self._display_search_results(results, query)
+        # Search on a worker thread; results stream in as they are found
+        self._start_search(query, max_results=30)
 
     def _on_search_activate(self, entry):
         """Handle Enter press in search - perform full search"""
@@ -15680,99 +15760,158 @@ Ctrl+Q    Afslut
         if len(query) < 2:
             return
 
-        results = self.search_engine.search(query, max_results=50)
-        self._display_search_results(results, query)
+        self._start_search(query, max_results=50)
+
+    def _start_search(self, query, max_results):
+        """Run a search on a worker thread, cancelling any search in flight.
+
+        Batches are handed to the main loop with GLib.idle_add as soon as
+        they are found, so the first hits are drawn while the rest are
+        still being collected and typing never blocks on file I/O.
+        """
+        import threading
+
+        self._begin_search_results(query)
+        cancel = threading.Event()
+        self._search_cancel = cancel
+
+        def _append(batch):
+            if not cancel.is_set():
+                self._append_search_results(batch)
+            return False
+
+        def _finish():
+            if not cancel.is_set():
+                self._finish_search_results(query)
+            return False
+
+        def _worker():
+            try:
+                for batch in self.search_engine.search_iter(query, max_results, cancel.is_set):
+                    if cancel.is_set():
+                        return
+                    GLib.idle_add(_append, batch)
+            except Exception as e:
+                print(f"[SEARCH] {e}")
+            GLib.idle_add(_finish)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _cancel_search(self):
+        """Stop the search in flight (its pending batches are dropped)"""
+        cancel = getattr(self, "_search_cancel", None)
+        if cancel is not None:
+            cancel.set()
+            self._search_cancel = None
 
     def _clear_search_results(self):
-        """Clear all search result rows"""
-        while row := self.search_results_list.get_first_child():
-            self.search_results_list.remove(row)
+        """Clear all search result rows (and cancel the search in flight)"""
+        self._cancel_search()
+        self.search_results_list.clear()
 
-    def _display_search_results(self, results, query):
-        """Display search results in the list"""
+    def _begin_search_results(self, query):
+        """Clear the list and add the result header for a new search"""
         self._clear_search_results()
+        self._search_count = 0
+        self._search_current = None
+
+        # Add header showing result count
+        self.search_results_list.append([ListEntry("header", "header", {"label": "RESULTATER (...)"})])
+
+    def _finish_search_results(self, query):
+        """Show the final result count (or the empty state)"""
+        if self._search_count:
+            self.search_results_list.update(
+                ListEntry("header", "header", {"label": f"RESULTATER ({self._search_count})"}))
+            return
+
+        # Show no results message
+        self.search_results_list.sync([ListEntry("empty", "empty", {"query": query})])
 
-        if not results:
-            # Show no results message
+    def _append_search_results(self, results):
+        """Append a batch of result rows, grouped by victory (one store update per batch)"""
+        entries = []
+        for result in results:
+            self._search_count += 1
+            # Add victory separator if new victory
+            if result["victory"] != self._search_current:
+                self._search_current = result["victory"]
+                label = self._search_current.split("_2026")[0].replace("_", " ")
+                entries.append(ListEntry(f"group:{self._search_count}", "group", {"label": label}))
+            entries.append(ListEntry(f"result:{self._search_count}", "row", result))
+        self.search_results_list.append(entries)
+
+    def _build_search_row(self, entry):
+        """Widget for one search list entry (called by the list factory for rows on screen)"""
+        if entry.kind == "header":
+            header = Gtk.Label(label=entry.data["label"])
+            header.add_css_class("caption")
+            header.add_css_class("dim-label")
+            header.set_halign(Gtk.Align.START)
+            header.set_margin_start(12)
+            header.set_margin_top(12)
+            header.set_margin_bottom(6)
+            return header
+
+        if entry.kind == "group":
+            sejr_header = Gtk.Label(label=entry.data["label"])
+            sejr_header.add_css_class("heading")
+            sejr_header.set_halign(Gtk.Align.START)
+            sejr_header.set_margin_start(12)
+            sejr_header.set_margin_top(8)
+            sejr_header.set_margin_bottom(4)
+            return sejr_header
+
+        if entry.kind == "empty":
             empty_row = Adw.ActionRow()
             empty_row.set_title("No results")
-            empty_row.set_subtitle(f'None match for "{query}"')
+            empty_row.set_subtitle(f'None match for "{entry.data["query"]}"')
             empty_row.add_prefix(Gtk.Image.new_from_icon_name("dialog-question-symbolic"))
-            self.search_results_list.append(empty_row)
-            return
+            return empty_row
 
-        # Add header showing result count
-        header = Gtk.Label(label=f"RESULTATER ({len(results)})")
-        header.add_css_class("caption")
-        header.add_css_class("dim-label")
-        header.set_halign(Gtk.Align.START)
-        header.set_margin_start(12)
-        header.set_margin_top(12)
-        header.set_margin_bottom(6)
-        self.search_results_list.append(header)
+        # Create result row
+        result = entry.data
+        row = Adw.ActionRow()
 
-        # Group by victory
-        current_sejr = None
+        # Icon based on match type
+        icon_name = {
+            "folder": "folder-symbolic",
+            "filename": "text-x-generic-symbolic",
+            "content": "format-text-rich-symbolic",
+            "log": "text-x-log-symbolic",
+            "intro_file": "accessories-text-editor-symbolic",
+            "intro_content": "accessories-text-editor-symbolic",
+        }.get(result["match_type"], "text-x-generic-symbolic")
 
-        for result in results:
-            # Add victory separator if new victory
-            if result["victory"] != current_sejr:
-                current_sejr = result["victory"]
-                sejr_header = Gtk.Label(label=current_sejr.split("_2026")[0].replace("_", " "))
-                sejr_header.add_css_class("heading")
-                sejr_header.set_halign(Gtk.Align.START)
-                sejr_header.set_margin_start(12)
-                sejr_header.set_margin_top(8)
-                sejr_header.set_margin_bottom(4)
-                self.search_results_list.append(sejr_header)
-
-            # Create result row
-            row = Adw.ActionRow()
-            row.result_data = result  # Store data for click handler
-
-            # Icon based on match type
-            icon_name = {
-                "folder": "folder-symbolic",
-                "filename": "text-x-generic-symbolic",
-                "content": "format-text-rich-symbolic",
-                "log": "text-x-log-symbolic",
-                "intro_file": "accessories-text-editor-symbolic",
-                "intro_content": "accessories-text-editor-symbolic",
-            }.get(result["match_type"], "text-x-generic-symbolic")
-
-            row.add_prefix(Gtk.Image.new_from_icon_name(icon_name))
-
-            # Title with highlighted match
-            title = result["context"][:80]
-            if len(result["context"]) > 80:
-                title += "..."
-            row.set_title(title)
-
-            # Subtitle with file info
-            if result["line_num"] > 0:
-                row.set_subtitle(f'{result["file"]} : linje {result["line_num"]}')
-            else:
-                row.set_subtitle(result["file"])
+        row.add_prefix(Gtk.Image.new_from_icon_name(icon_name))
 
-            # Type badge — show INTRO category for INTRO results
-            if result["match_type"] in ("intro_file", "intro_content"):
-                badge_text = result.get("intro_category", "INTRO").upper()
-            else:
-                badge_text = result["match_type"].upper()
-            type_badge = Gtk.Label(label=badge_text)
-            type_badge.add_css_class("caption")
-            type_badge.add_css_class("dim-label")
-            row.add_suffix(type_badge)
+        # Title with highlighted match
+        title = result["context"][:80]
+        if len(result["context"]) > 80:
+            title += "..."
+        row.set_title(title)
 
-            row.set_activatable(True)
-            self.search_results_list.append(row)
+        # Subtitle with file info
+        if result["line_num"] > 0:
+            row.set_subtitle(f'{result["file"]} : linje {result["line_num"]}')
+        else:
+            row.set_subtitle(result["file"])
 
-    def _on_search_result_activated(self, listbox, row):
-        """Handle click on a search result"""
-        if not hasattr(row, 'result_data'):
-            return
+        # Type badge — show INTRO category for INTRO results
+        if result["match_type"] in ("intro_file", "intro_content"):
+            badge_text = result.get("intro_category", "INTRO").upper()
+        else:
+            badge_text = result["match_type"].upper()
+        type_badge = Gtk.Label(label=badge_text)
+        type_badge.add_css_class("caption")
+        type_badge.add_css_class("dim-label")
+        row.add_suffix(type_badge)
 
-        result = row.result_data
+        row.set_activatable(True)
+        return row
+
+    def _on_search_result_activated(self, result):
+        """Handle click on a search result"""
 
         # --- INTRO result: navigate to INTRO view ---
         if result["match_type"] in ("intro_file", "intro_content"):
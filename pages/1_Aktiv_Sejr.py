@@ -6,9 +6,7 @@ Like continuing a conversation - each sejr is a page
 import streamlit as st
 from pathlib import Path
 from datetime import datetime
-import json
 import re
-import subprocess
 import sys
 
 st.set_page_config(page_title="Aktiv Sejr", page_icon="[LIST]", layout="wide")
@@ -19,22 +17,15 @@ SCRIPTS_DIR = SYSTEM_PATH / "scripts"
 
 sys.path.insert(0, str(SYSTEM_PATH))
 from checkbox_utils import count_checkboxes  # Centralized — no more duplicates
+from web_data import load_active_sejrs, load_latest_log, read_text, stream_job  # Cached, fingerprint-keyed
+from script_jobs import get_job_queue  # Background runs shared by all sessions
 
 def get_active_sejr():
-    if ACTIVE_DIR.exists():
-        return sorted([f for f in ACTIVE_DIR.iterdir() if f.is_dir()], reverse=True)
-    return []
+    return sorted((Path(r["path"]) for r in load_active_sejrs()), reverse=True)
 
 def run_script(script_name: str, args=None):
-    script_path = SCRIPTS_DIR / script_name
-    cmd = ["python3", str(script_path)]
-    if args:
-        cmd.extend(args)
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, cwd=str(SYSTEM_PATH))
-        return result.stdout + result.stderr
-    except Exception as e:
-        return f"Error: {e}"
+    job = stream_job(get_job_queue(SYSTEM_PATH).submit(script_name, args or ()))
+    return job.output()
 
 # Header
 st.title("[LIST] Aktiv Sejr")
@@ -62,9 +53,8 @@ else:
         st.subheader(f"[TEXT] {selected_name}")
 
         # Read SEJR_LISTE.md
-        sejr_file = selected_sejr / "SEJR_LISTE.md"
-        if sejr_file.exists():
-            content = sejr_file.read_text(encoding="utf-8")
+        content = read_text(selected_sejr / "SEJR_LISTE.md")
+        if content is not None:
 
             # Show checkboxes
             st.markdown("### Checkboxes")
@@ -84,24 +74,17 @@ else:
 
         # AUTO_LOG stream
         st.markdown("###  Live Log")
-        log_file = selected_sejr / "AUTO_LOG.jsonl"
-        if log_file.exists():
-            lines = log_file.read_text().strip().split("\n")[-5:]
-            for line in reversed(lines):
-                try:
-                    entry = json.loads(line)
-                    ts = entry.get("timestamp", "")[:19]
-                    action = entry.get("action", "")
-                    st.code(f"[{ts}] {action}")
-                except Exception:
-                    pass
+        for entry in reversed(load_latest_log(selected_sejr, 5)):
+            ts = entry.get("timestamp", "")[:19]
+            action = entry.get("action", "")
+            st.code(f"[{ts}] {action}")
 
     with col2:
         st.subheader(" Actions")
 
         if st.button("[SCAN] Verify", use_container_width=True):
             with st.spinner("Verifying..."):
-                output = run_script("auto_verify.py", [str(selected_sejr)])
+                output = run_script("auto_verify.py", ["--sejr", selected_name])
                 st.code(output[:500])
 
         if st.button("[DATA] Track", use_container_width=True):
@@ -122,10 +105,9 @@ else:
         st.divider()
 
         # Status
-        status_file = selected_sejr / "STATUS.yaml"
-        if status_file.exists():
+        status_content = read_text(selected_sejr / "STATUS.yaml")
+        if status_content is not None:
             st.markdown("### [DATA] Status")
-            status_content = status_file.read_text()
             for line in status_content.split("\n"):
                 if "score" in line.lower():
                     st.write(line)
@@ -134,7 +116,7 @@ else:
         st.divider()
         if st.button(" Archive Sejr", use_container_width=True, type="primary"):
             with st.spinner("Archiving..."):
-                output = run_script("auto_archive.py", [str(selected_sejr)])
+                output = run_script("auto_archive.py", ["--sejr", selected_name])
                 st.code(output[:500])
                 if "[OK]" in output:
                     st.success("Arkiveret!")
@@ -1,38 +1,55 @@
 #!/usr/bin/env python3
 """
 ARKIV PAGE - Browse all archived sejr with diplomas
+
+Paged and filtered server-side; diplomas and conclusions are read only
+for entries that are opened.
 """
 import streamlit as st
 from pathlib import Path
 import re
+import sys
 
 st.set_page_config(page_title="Sejr Arkiv", page_icon="", layout="wide")
 
 SYSTEM_PATH = Path(__file__).parent.parent
 ARCHIVE_DIR = SYSTEM_PATH / "90_ARCHIVE"
 
+sys.path.insert(0, str(SYSTEM_PATH))
+from web_data import archive_rank, load_archive_stats, query_archive, read_text  # Cached archive snapshot + file reads
+
+RANK_COLORS = {"GRAND ADMIRAL": "gold", "ADMIRAL": "silver", "KAPTAJN": "bronze",
+               "LØJTNANT": "blue", "KADET": "gray"}
+PAGE_SIZES = [10, 20, 50]
+
 def get_rank(score: int):
-    if score >= 27: return " GRAND ADMIRAL", "gold"
-    elif score >= 24: return " ADMIRAL", "silver"
-    elif score >= 21: return " KAPTAJN", "bronze"
-    elif score >= 18: return " LØJTNANT", "blue"
-    else: return " KADET", "gray"
-
-def get_sejr_status(sejr_path: Path):
-    status_file = sejr_path / "STATUS.yaml"
-    result = {"score": 0, "p1": 0, "p2": 0, "p3": 0}
-    if status_file.exists():
-        content = status_file.read_text()
-        for line in content.split("\n"):
-            if "total_score:" in line:
-                result["score"] = int(line.split(":")[1].strip())
-            elif "pass_1_score:" in line:
-                result["p1"] = int(line.split(":")[1].strip())
-            elif "pass_2_score:" in line:
-                result["p2"] = int(line.split(":")[1].strip())
-            elif "pass_3_score:" in line:
-                result["p3"] = int(line.split(":")[1].strip())
-    return result
+    rank = archive_rank(score)
+    return f" {rank}", RANK_COLORS[rank]
+
+def show_details(archive: Path, status: dict):
+    """Diplom, scores og konklusion — læses først når entry åbnes"""
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # Diploma
+        diploma = read_text(archive / "SEJR_DIPLOM.md") if status["has_diplom"] else None
+        if diploma is not None:
+            st.markdown(diploma[:2000])
+        else:
+            st.info("Intet diplom fundet")
+
+    with col2:
+        st.markdown("### Scores")
+        st.metric("Pass 1", f"{status['p1']}/10")
+        st.metric("Pass 2", f"{status['p2']}/10")
+        st.metric("Pass 3", f"{status['p3']}/10")
+        st.metric("Total", f"{status['score']}/30")
+
+        # Conclusion
+        conclusion = read_text(archive / "CONCLUSION.md") if status["has_conclusion"] else None
+        if conclusion is not None:
+            st.markdown("### Konklusion")
+            st.text(conclusion[:500])
 
 st.title(" Sejr Arkiv")
 st.caption("Alle færdige sejr med diplomer - permanent bevis")
@@ -40,50 +57,78 @@ st.caption("Alle færdige sejr med diplomer - permanent bevis")
 if not ARCHIVE_DIR.exists():
     st.warning("Ingen arkiverede sejr endnu")
 else:
-    archives = sorted([f for f in ARCHIVE_DIR.iterdir() if f.is_dir()], reverse=True)
+    # Precomputed from the archive snapshot, re-computed only when 90_ARCHIVE changes
+    stats = load_archive_stats()
+    total = stats["count"]
+    ga_count = stats["ranks"]["GRAND ADMIRAL"]
 
     # Stats
     col1, col2, col3, col4 = st.columns(4)
-    ga_count = sum(1 for a in archives if get_sejr_status(a)["score"] >= 27)
 
     with col1:
-        st.metric("Total", len(archives))
+        st.metric("Total", total)
     with col2:
         st.metric(" Grand Admiral", ga_count)
     with col3:
-        avg_score = sum(get_sejr_status(a)["score"] for a in archives) / len(archives) if archives else 0
-        st.metric("Gns. Score", f"{avg_score:.1f}/30")
+        st.metric("Gns. Score", f"{stats['avg_score']:.1f}/30")
     with col4:
-        st.metric("Success Rate", f"{ga_count/len(archives)*100:.0f}%" if archives else "0%")
+        st.metric("Success Rate", f"{ga_count/total*100:.0f}%" if total else "0%")
 
     st.divider()
 
-    # Archive list
-    for archive in archives:
-        status = get_sejr_status(archive)
+    # Filters (applied server-side before paging)
+    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+    with col1:
+        ranks = st.multiselect("Rang", list(RANK_COLORS), key="arkiv_ranks")
+    with col2:
+        min_score, max_score = st.slider("Score", 0, 30, (0, 30), key="arkiv_score")
+    with col3:
+        search = st.text_input("Søg navn", key="arkiv_search")
+    with col4:
+        page_size = st.selectbox("Pr. side", PAGE_SIZES, index=1, key="arkiv_page_size")
+
+    # New filter -> back to the first page
+    filter_key = (tuple(ranks), min_score, max_score, search, page_size)
+    if st.session_state.get("arkiv_filter") != filter_key:
+        st.session_state.arkiv_filter = filter_key
+        st.session_state.arkiv_page = 0
+    if "arkiv_open" not in st.session_state:
+        st.session_state.arkiv_open = set()
+
+    page = st.session_state.arkiv_page
+    archives, matches = query_archive(ranks, min_score, max_score, search, page, page_size)
+    pages = max(1, -(-matches // page_size))
+
+    # Archive list — only this page is rendered; details load when an entry is opened
+    for status in archives:
+        archive = ARCHIVE_DIR / status["name"]
         rank, color = get_rank(status["score"])
+        is_open = status["name"] in st.session_state.arkiv_open
+
+        col1, col2 = st.columns([6, 1])
+        with col1:
+            st.markdown(f"{rank} **{archive.name[:40]}...** ({status['score']}/30)")
+        with col2:
+            if st.button("Luk" if is_open else "Åbn", key=f"open_{status['name']}", use_container_width=True):
+                st.session_state.arkiv_open ^= {status["name"]}
+                st.rerun()
+        if is_open:
+            with st.container(border=True):
+                show_details(archive, status)
 
-        with st.expander(f"{rank} **{archive.name[:40]}...** ({status['score']}/30)"):
-            col1, col2 = st.columns([2, 1])
-
-            with col1:
-                # Diploma
-                diploma_file = archive / "SEJR_DIPLOM.md"
-                if diploma_file.exists():
-                    diploma = diploma_file.read_text()
-                    st.markdown(diploma[:2000])
-                else:
-                    st.info("Intet diplom fundet")
-
-            with col2:
-                st.markdown("### Scores")
-                st.metric("Pass 1", f"{status['p1']}/10")
-                st.metric("Pass 2", f"{status['p2']}/10")
-                st.metric("Pass 3", f"{status['p3']}/10")
-                st.metric("Total", f"{status['score']}/30")
-
-                # Conclusion
-                conclusion_file = archive / "CONCLUSION.md"
-                if conclusion_file.exists():
-                    st.markdown("### Konklusion")
-                    st.text(conclusion_file.read_text()[:500])
+    if not archives:
+        st.info("Ingen arkiver matcher filteret")
+
+    # Pagination
+    st.divider()
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if st.button("← Forrige", disabled=page == 0, use_container_width=True):
+            st.session_state.arkiv_page = page - 1
+            st.rerun()
+    with col2:
+        st.caption(f"Side {page + 1} af {pages} · {matches} arkiver")
+    with col3:
+        if st.button("Næste →", disabled=page + 1 >= pages, use_container_width=True):
+            st.session_state.arkiv_page = page + 1
+            st.rerun()
@@ -4,8 +4,9 @@ STATISTIK PAGE - Overview of all stats and patterns
 """
 import streamlit as st
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
+import sys
 
 st.set_page_config(page_title="Statistik", page_icon="[DATA]", layout="wide")
 
@@ -14,14 +15,17 @@ ACTIVE_DIR = SYSTEM_PATH / "10_ACTIVE"
 ARCHIVE_DIR = SYSTEM_PATH / "90_ARCHIVE"
 CURRENT_DIR = SYSTEM_PATH / "_CURRENT"
 
+sys.path.insert(0, str(SYSTEM_PATH))
+from web_data import load_active_sejrs, load_archived_sejrs, load_event_counts, read_text  # Cached loaders
+
 st.title("[DATA] Statistik & Patterns")
 st.caption("Overblik over alt - lær fra historien")
 
 # Quick stats
 col1, col2, col3, col4 = st.columns(4)
 
-active_count = len(list(ACTIVE_DIR.iterdir())) if ACTIVE_DIR.exists() else 0
-archive_count = len(list(ARCHIVE_DIR.iterdir())) if ARCHIVE_DIR.exists() else 0
+active_count = len(load_active_sejrs())
+archive_count = len(load_archived_sejrs())
 
 with col1:
     st.metric("[FOLDER] Aktive", active_count)
@@ -40,22 +44,44 @@ st.divider()
 
 # Patterns
 st.subheader(" Learned Patterns")
-patterns_file = CURRENT_DIR / "PATTERNS.yaml"
-if patterns_file.exists():
-    content = patterns_file.read_text()
+content = read_text(CURRENT_DIR / "PATTERNS.yaml")
+if content is not None:
     st.code(content, language="yaml")
 else:
     st.info("Ingen patterns endnu - kør auto_learn.py")
 
 # Predictions
 st.subheader("[TARGET] Next Steps")
-next_file = CURRENT_DIR / "NEXT.md"
-if next_file.exists():
-    content = next_file.read_text()
+content = read_text(CURRENT_DIR / "NEXT.md")
+if content is not None:
     st.markdown(content)
 else:
     st.info("Ingen predictions endnu - kør auto_predict.py")
 
+# Activity across all sejr (indexed queries, no JSONL scans)
+st.subheader("[LOG] Aktivitet (30 dage)")
+since = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+per_day = load_event_counts("day", since=since)
+if per_day:
+    import pandas as pd
+    st.bar_chart(pd.DataFrame({"Hændelser": per_day}).sort_index())
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.caption("Top actions")
+        for action, count in list(load_event_counts("action", since=since).items())[:8]:
+            st.write(f"{action}: {count}")
+    with col2:
+        st.caption("Mest aktive sejr")
+        for sejr, count in list(load_event_counts("sejr", since=since).items())[:8]:
+            st.write(f"{sejr[:30]}: {count}")
+    with col3:
+        st.caption("Modeller")
+        for model, count in load_event_counts("model", since=since).items():
+            st.write(f"{model}: {count}")
+else:
+    st.info("Ingen logget aktivitet de sidste 30 dage")
+
 # DNA Layer Activity
 st.subheader("[DNA] 7 DNA Layers")
 layers = [
@@ -83,16 +109,7 @@ st.divider()
 st.subheader(" Archive Performance")
 
 if ARCHIVE_DIR.exists():
-    archives = list(ARCHIVE_DIR.iterdir())
-    scores = []
-    for a in archives:
-        if a.is_dir():
-            status_file = a / "STATUS.yaml"
-            if status_file.exists():
-                content = status_file.read_text()
-                for line in content.split("\n"):
-                    if "total_score:" in line:
-                        scores.append(int(line.split(":")[1].strip()))
+    scores = [r["score"] for r in load_archived_sejrs() if r["status"]]
 
     if scores:
         import pandas as pd
@@ -4,12 +4,16 @@ INDSTILLINGER PAGE - System configuration
 """
 import streamlit as st
 from pathlib import Path
-import subprocess
+import sys
 
 st.set_page_config(page_title="Indstillinger", page_icon="[CONFIG]", layout="wide")
 
 SYSTEM_PATH = Path(__file__).parent.parent
 
+sys.path.insert(0, str(SYSTEM_PATH))
+from web_data import load_git_status, read_text, stream_job  # Cached loaders
+from script_jobs import get_job_queue  # In-process script runs
+
 st.title("[CONFIG] Indstillinger")
 st.caption("System konfiguration og vedligeholdelse")
 
@@ -40,19 +44,13 @@ APP_DIR: {SYSTEM_PATH / "app"}
 
 # Git status
 st.subheader(" Git Status")
-try:
-    result = subprocess.run(
-        ["git", "status", "--short"],
-        capture_output=True,
-        text=True,
-        cwd=str(SYSTEM_PATH)
-    )
-    if result.stdout.strip():
-        st.warning(f"Uncommitted changes:\n{result.stdout}")
-    else:
-        st.success("[OK] Git clean - all committed")
-except Exception:
+git_status = load_git_status()
+if git_status is None:
     st.error("Git not available")
+elif git_status.strip():
+    st.warning(f"Uncommitted changes:\n{git_status}")
+else:
+    st.success("[OK] Git clean - all committed")
 
 # Maintenance
 st.subheader("[TOOL] Vedligeholdelse")
@@ -60,26 +58,16 @@ col1, col2 = st.columns(2)
 
 with col1:
     if st.button("[SYNC] Rebuild STATE.md"):
-        result = subprocess.run(
-            ["python3", str(SYSTEM_PATH / "scripts/auto_track.py"), "--rebuild-state"],
-            capture_output=True,
-            text=True,
-            cwd=str(SYSTEM_PATH)
-        )
-        st.code(result.stdout + result.stderr)
+        job = stream_job(get_job_queue(SYSTEM_PATH).submit("auto_track.py", ["--rebuild-state"], use_cache=False))
+        st.code(job.output())
 
 with col2:
     if st.button("[DOCS] Rebuild PATTERNS.yaml"):
-        result = subprocess.run(
-            ["python3", str(SYSTEM_PATH / "scripts/auto_learn.py")],
-            capture_output=True,
-            text=True,
-            cwd=str(SYSTEM_PATH)
-        )
-        st.code(result.stdout + result.stderr)
+        job = stream_job(get_job_queue(SYSTEM_PATH).submit("auto_learn.py", use_cache=False))
+        st.code(job.output())
 
 # DNA.yaml
 st.subheader("[DNA] DNA.yaml")
-dna_file = SYSTEM_PATH / "DNA.yaml"
-if dna_file.exists():
-    st.code(dna_file.read_text(), language="yaml")
+dna_content = read_text(SYSTEM_PATH / "DNA.yaml")
+if dna_content is not None:
+    st.code(dna_content, language="yaml")
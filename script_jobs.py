@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+SCRIPT JOBS — Baggrunds-kø og in-process dispatcher for scripts/*.py
+====================================================================
+
+WHAT: Job-kø med begrænset worker-pool. Hvert kald får et job-ID, output
+      læses linje for linje mens scriptet kører, samme script kører aldrig
+      to gange samtidigt, og færdige resultater genbruges så længe
+      10_ACTIVE/90_ARCHIVE er uændret siden kørslen. Scripts med main(argv)
+      kaldes direkte i processen; resten kører som subprocess
+WHY:  web_app.run_script blokerede Streamlit-tråden i subprocess.run i op til
+      60 sek og viste først output til sidst. To brugere (eller to tryk fra
+      telefonen) startede auto_verify/auto_learn oven i hinanden. Hver
+      handling startede desuden en ny python3 der importerede PyYAML og
+      alle moduler forfra
+WHO:  Importeret af web_data (stream_job) → web_app, web_app_en,
+      pages/1_Aktiv_Sejr, samt masterpiece/masterpiece_en (DNA-knapper)
+HOW:  from script_jobs import get_job_queue
+      queue = get_job_queue(SYSTEM_PATH)
+      job = queue.submit("auto_verify.py", ["--sejr", name])
+      job.wait(0.5); print(job.status, job.tail(10))       # poll fra UI-tråd
+      job.result                                            # main()'s returværdi
+      queue.active_jobs()                                   # alt der kører/venter
+
+Kø-regler: samme (script, args) som allerede kører/venter returnerer det
+eksisterende job. Samme script med andre args venter i scriptets egen kø,
+så det ikke optager en worker mens det venter.
+
+In-process: print() fra jobbets tråd sendes til jobbet (sys.stdout/stderr
+routes pr. tråd), og SystemExit bliver til returncode. JOB_TIMEOUT gælder
+kun subprocess-kørsler — en tråd kan ikke dræbes. JobQueue(inprocess=False)
+kører alt som subprocess som før.
+
+Version: 3.0.0
+"""
+import importlib.util
+import inspect
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from sejr_index import dir_fingerprint
+
+MAX_WORKERS = 2        # Scripts running at once across all sessions
+JOB_TIMEOUT = 60       # Seconds before a running script is killed
+CACHE_TTL = 300        # Seconds a finished result may be reused
+MAX_HISTORY = 50       # Finished jobs kept for lookup by ID
+MAX_OUTPUT_LINES = 5000
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+@dataclass
+class Job:
+    """One script run. Fields are updated by the worker; read them via the methods."""
+    id: str
+    script: str
+    args: Tuple[str, ...]
+    status: str = QUEUED
+    returncode: Optional[int] = None
+    lines: List[str] = field(default_factory=list)
+    submitted: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    fingerprint: str = ""            # Input state right after the run (cache key)
+    result: Any = None               # main()'s return value for in-process runs
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def key(self) -> Tuple[str, Tuple[str, ...]]:
+        return self.script, self.args
+
+    @property
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def ok(self) -> bool:
+        return self.status == DONE
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block up to timeout seconds; True once the job has finished."""
+        return self._done.wait(timeout)
+
+    def output(self) -> str:
+        with self._lock:
+            return "\n".join(self.lines)
+
+    def tail(self, n: int) -> str:
+        with self._lock:
+            return "\n".join(self.lines[-n:])
+
+    def line_count(self) -> int:
+        with self._lock:
+            return len(self.lines)
+
+    def _append(self, line: str) -> None:
+        with self._lock:
+            self.lines.append(line)
+            if len(self.lines) > MAX_OUTPUT_LINES:
+                del self.lines[:len(self.lines) - MAX_OUTPUT_LINES]
+
+
+# ============================================================================
+# IN-PROCESS EXECUTION
+# ============================================================================
+
+_local = threading.local()
+_modules: Dict[str, Tuple[int, Optional[ModuleType]]] = {}   # path -> (mtime_ns, module)
+_modules_lock = threading.Lock()
+
+
+class _ThreadRoutedStream:
+    """sys.stdout/sys.stderr wrapper: writes from a job thread go to that job only."""
+
+    def __init__(self, original):
+        self._original = original
+
+    def write(self, text: str) -> int:
+        sink = getattr(_local, "sink", None)
+        if sink is None:
+            return self._original.write(text)
+        sink.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if getattr(_local, "sink", None) is None:
+            self._original.flush()
+
+    def isatty(self) -> bool:
+        return getattr(_local, "sink", None) is None and self._original.isatty()
+
+    def __getattr__(self, name):
+        return getattr(self._original, name)
+
+
+class _LineSink:
+    """Collects written text into complete lines on a Job."""
+
+    def __init__(self, job: Job):
+        self.job = job
+        self._buffer = ""
+
+    def write(self, text: str) -> None:
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self.job._append(line)
+
+    def close(self) -> None:
+        if self._buffer:
+            self.job._append(self._buffer)
+            self._buffer = ""
+
+
+def _install_routing() -> None:
+    with _modules_lock:
+        if not isinstance(sys.stdout, _ThreadRoutedStream):
+            sys.stdout = _ThreadRoutedStream(sys.stdout)
+        if not isinstance(sys.stderr, _ThreadRoutedStream):
+            sys.stderr = _ThreadRoutedStream(sys.stderr)
+
+
+def _accepts_argv(main: Any) -> bool:
+    """True if main can be called as main(argv)."""
+    if not callable(main):
+        return False
+    try:
+        inspect.signature(main).bind([])
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def load_script(path: Path) -> Optional[ModuleType]:
+    """Import a script as a module if it exposes main(argv); None otherwise.
+
+    Only scripts with both ``def main(`` and a ``__main__`` guard are
+    imported, so scripts that do their work at import time keep running
+    as subprocesses; so do scripts whose main() takes no argv.
+    Modules are cached until the file's mtime changes.
+    """
+    path = Path(path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    key = str(path)
+    with _modules_lock:
+        cached = _modules.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+    try:
+        source = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    module = None
+    if "\ndef main(" in source and "__name__ == \"__main__\"" in source:
+        spec = importlib.util.spec_from_file_location(f"_sejr_script_{path.stem}", path)
+        try:
+            module = importlib.util.module_from_spec(spec)
+            # Registered so its functions pickle (auto_verify --jobs sends _verify_one to workers)
+            sys.modules[spec.name] = module
+            spec.loader.exec_module(module)
+        except Exception:
+            sys.modules.pop(spec.name, None)
+            module = None            # Broken import: let the subprocess report it
+        if module is not None and not _accepts_argv(getattr(module, "main", None)):
+            module = None            # main() without argv: run it as a subprocess
+    with _modules_lock:
+        _modules[key] = (mtime, module)
+    return module
+
+
+def _run_inprocess(job: Job, module: ModuleType) -> int:
+    """Call module.main(args) in this thread, capturing its output on the job."""
+    _install_routing()
+    sink = _LineSink(job)
+    _local.sink = sink
+    try:
+        job.result = module.main(list(job.args))
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        sink.write(f"{e.code}\n")
+        return 1
+    except Exception:
+        sink.write(traceback.format_exc())
+        return 1
+    finally:
+        _local.sink = None
+        sink.close()
+
+
+# ============================================================================
+# JOB QUEUE
+# ============================================================================
+
+class JobQueue:
+    """Bounded pool of script runs with per-script exclusion and result reuse."""
+
+    def __init__(self, system_path: Path, max_workers: int = MAX_WORKERS,
+                 timeout: float = JOB_TIMEOUT, python: str = sys.executable or "python3",
+                 inprocess: bool = True):
+        self.system_path = Path(system_path)
+        self.scripts_dir = self.system_path / "scripts"
+        self.timeout = timeout
+        self.inprocess = inprocess
+        self.python = python
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="script-job")
+        self._lock = threading.RLock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._pending: Dict[Tuple[str, Tuple[str, ...]], Job] = {}   # key -> queued/running job
+        self._busy: Dict[str, Job] = {}                              # script -> running job
+        self._waiting: Dict[str, Deque[Job]] = {}                    # script -> jobs behind it
+        self._results: Dict[Tuple[str, Tuple[str, ...]], Job] = {}   # key -> last finished job
+
+    # -- state ----------------------------------------------------------------
+
+    def fingerprint(self, script: str) -> str:
+        """Cheap stat-only key for everything a script reads: itself and the sejr folders."""
+        try:
+            st = (self.scripts_dir / script).stat()
+            script_key = f"{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            script_key = "-"
+        return "|".join((script_key,
+                         dir_fingerprint(self.system_path / "10_ACTIVE"),
+                         dir_fingerprint(self.system_path / "90_ARCHIVE")))
+
+    def cached(self, script: str, args: Sequence[str] = ()) -> Optional[Job]:
+        """Last successful run of (script, args) if nothing changed on disk since."""
+        with self._lock:
+            job = self._results.get((script, tuple(args)))
+        if job is None or not job.ok or time.time() - (job.finished or 0) > CACHE_TTL:
+            return None
+        return job if job.fingerprint == self.fingerprint(script) else None
+
+    # -- submitting -----------------------------------------------------------
+
+    def submit(self, script: str, args: Sequence[str] = (), use_cache: bool = True) -> Job:
+        """Queue a script run and return its Job (or the one already covering it)."""
+        key = (script, tuple(str(a) for a in args))
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+        if use_cache:
+            job = self.cached(*key)
+            if job is not None:
+                return job
+
+        job = Job(id=uuid.uuid4().hex[:12], script=key[0], args=key[1])
+        if not (self.scripts_dir / script).is_file():
+            job._append(f"Script not found: {script}")
+            self._finish(job, FAILED)
+            with self._lock:
+                self._remember(job)
+            return job
+
+        with self._lock:
+            pending = self._pending.get(key)     # Lost a race with another session
+            if pending is not None:
+                return pending
+            self._pending[key] = job
+            self._remember(job)
+            if script in self._busy:
+                self._waiting.setdefault(script, deque()).append(job)
+            else:
+                self._start(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active_jobs(self) -> List[Job]:
+        """Queued and running jobs, oldest first."""
+        with self._lock:
+            return [job for job in self._jobs.values() if not job.is_done]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    # -- running --------------------------------------------------------------
+
+    def _remember(self, job: Job) -> None:
+        self._jobs[job.id] = job
+        while len(self._jobs) > MAX_HISTORY:
+            oldest = next(iter(self._jobs.values()))
+            if not oldest.is_done:
+                break
+            self._jobs.popitem(last=False)
+
+    def _start(self, job: Job) -> None:
+        self._busy[job.script] = job
+        self._pool.submit(self._run, job)
+
+    def _run(self, job: Job) -> None:
+        job.status = RUNNING
+        job.started = time.time()
+        module = load_script(self.scripts_dir / job.script) if self.inprocess else None
+        try:
+            if module is not None:
+                job.returncode = _run_inprocess(job, module)
+            else:
+                job.returncode = self._run_subprocess(job)
+        except Exception as e:
+            job._append(str(e))
+        status = DONE if job.returncode == 0 else FAILED
+        job.fingerprint = self.fingerprint(job.script)
+        self._finish(job, status)
+
+        with self._lock:
+            self._pending.pop(job.key, None)
+            self._results[job.key] = job
+            waiting = self._waiting.get(job.script)
+            if waiting:
+                self._start(waiting.popleft())
+            else:
+                self._waiting.pop(job.script, None)
+                self._busy.pop(job.script, None)
+
+    def _run_subprocess(self, job: Job) -> int:
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        proc = subprocess.Popen(
+            [self.python, str(self.scripts_dir / job.script), *job.args],
+            cwd=str(self.system_path), env=env, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, text=True, errors="replace", bufsize=1,
+        )
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            proc.kill()
+
+        killer = threading.Timer(self.timeout, kill)
+        killer.daemon = True
+        killer.start()
+        try:
+            for line in proc.stdout:
+                job._append(line.rstrip("\n"))
+            returncode = proc.wait()
+        finally:
+            killer.cancel()
+        if timed_out.is_set():
+            job._append(f"Timeout efter {self.timeout:.0f}s")
+        return returncode
+
+    @staticmethod
+    def _finish(job: Job, status: str) -> None:
+        job.status = status
+        job.finished = time.time()
+        job._done.set()
+
+
+_QUEUES: Dict[str, JobQueue] = {}
+_QUEUES_LOCK = threading.Lock()
+
+
+def get_job_queue(system_path: Path) -> JobQueue:
+    """Return the process-wide JobQueue for a system path (shared by all sessions)."""
+    key = str(Path(system_path).resolve())
+    with _QUEUES_LOCK:
+        if key not in _QUEUES:
+            _QUEUES[key] = JobQueue(Path(key))
+        return _QUEUES[key]
@@ -21,12 +21,12 @@ RANKINGS:
 
 import argparse
 import sys
-import yaml
-from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from yaml_utils import parse_yaml_simple
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from yaml_utils import parse_yaml_simple, write_yaml
+from archive_snapshot import get_archive_records  # Packed 90_ARCHIVE snapshot
 
 
 # Point values
@@ -75,11 +75,9 @@ RANKS = [
 ]
 
 
-def write_yaml_simple(filepath: Path, data: dict):
-    """Write YAML using PyYAML (preserves nested structures)."""
-    header = f"# ADMIRAL SCORE - Auto-updated\n# Updated: {datetime.now().isoformat()}\n\n"
-    yaml_content = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False, width=120)
-    filepath.write_text(header + yaml_content, encoding="utf-8")
+def write_yaml_simple(filepath: Path, data: dict) -> bool:
+    """Write ADMIRAL_SCORE.yaml (write-if-changed, atomic — see yaml_utils.write_yaml)."""
+    return write_yaml(filepath, data, header="ADMIRAL SCORE - Auto-updated")
 
 
 def get_rank(score: int) -> str:
@@ -267,6 +265,37 @@ def _extract_score_from_diplom(sejr_path: Path) -> dict | None:
     return None
 
 
+def _entry_from_archive_record(record) -> dict | None:
+    """Leaderboard entry for an archived sejr, same source order as collect_from_dir."""
+    extras = record.extras
+    data = extras.get("admiral_score")
+    if data is not None:
+        totals = calculate_totals(data)
+        return {
+            "sejr": record.name,
+            "model": data.get("meta", {}).get("model_name", "Kv1nt"),
+            "score": totals["total_score"],
+            "rank": totals["rank"],
+        }
+    score = extras.get("diplom_score")
+    if score is not None:
+        return {
+            "sejr": record.name,
+            "model": "Kv1nt",
+            "score": score,
+            "rank": extras.get("diplom_rank") or get_rank(score),
+        }
+    score = extras.get("status_score")
+    if isinstance(score, (int, float)):
+        return {
+            "sejr": record.name,
+            "model": extras.get("created_by"),
+            "score": int(score),
+            "rank": get_rank(int(score)),
+        }
+    return None
+
+
 def show_leaderboard(system_path: Path):
     """Show global leaderboard from all available score sources."""
     scores = []
@@ -306,9 +335,13 @@ def show_leaderboard(system_path: Path):
                 entry["status"] = status_label
                 scores.append(entry)
 
-    # Collect from both directories
+    # Active sejr are read live; archived ones come from the packed snapshot
     collect_from_dir(system_path / "10_ACTIVE", "ACTIVE")
-    collect_from_dir(system_path / "90_ARCHIVE", "ARCHIVED")
+    for record in get_archive_records(system_path):
+        entry = _entry_from_archive_record(record)
+        if entry:
+            entry["status"] = "ARCHIVED"
+            scores.append(entry)
 
     # Sort by score
     scores.sort(key=lambda x: x["score"], reverse=True)
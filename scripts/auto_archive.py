@@ -19,75 +19,20 @@ import shutil
 import re
 import subprocess
 import sys
-import yaml
 from pathlib import Path
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent))
-from yaml_utils import parse_yaml_simple
-
-
-def write_yaml_simple(filepath: Path, data: dict):
-    """Write YAML using PyYAML (preserves nested structures)."""
-    header = f"# Archive metadata - {datetime.now().isoformat()}\n\n"
-    yaml_content = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False, width=120)
-    filepath.write_text(header + yaml_content, encoding="utf-8")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from yaml_utils import parse_yaml_simple, write_yaml
+from archive_snapshot import ArchiveSnapshot, get_archive_records
+from archive_snapshot import extract_status_fields as _extract_status_fields  # Flat + nested STATUS
 
 
 # ============================================================================
 # 3-PASS ARCHIVE ENFORCEMENT
 # ============================================================================
 
-def _extract_status_fields(status: dict) -> dict:
-    """Extract status fields from either flat or nested STATUS.yaml format.
-
-    Supports both:
-    - Flat format: status.get("pass_1_complete") (legacy)
-    - Nested format: status['pass_tracking']['pass_1']['complete'] (current)
-    """
-    pt = status.get("pass_tracking", {})
-    st = status.get("score_tracking", {})
-
-    if pt:
-        # Nested format (current standard)
-        p1 = pt.get("pass_1", {})
-        p2 = pt.get("pass_2", {})
-        p3 = pt.get("pass_3", {})
-        totals = st.get("totals", pt.get("totals", {}))
-        return {
-            "can_archive": pt.get("can_archive", False),
-            "current_pass": pt.get("current_pass", 0),
-            "pass_1_complete": p1.get("complete", False),
-            "pass_2_complete": p2.get("complete", False),
-            "pass_3_complete": p3.get("complete", False),
-            "pass_1_score": p1.get("score", 0),
-            "pass_2_score": p2.get("score", 0),
-            "pass_3_score": p3.get("score", 0),
-            "total_score": totals.get("total_score", totals.get("score", 0)),
-            "final_verification_complete": p3.get("final_verification", False),
-            "pass_1_checkboxes": p1.get("checkboxes_done", 0),
-            "pass_2_checkboxes": p2.get("checkboxes_done", 0),
-            "pass_3_checkboxes": p3.get("checkboxes_done", 0),
-        }
-    else:
-        # Flat format (legacy)
-        return {
-            "can_archive": status.get("can_archive", False),
-            "current_pass": status.get("current_pass", 0),
-            "pass_1_complete": status.get("pass_1_complete", False),
-            "pass_2_complete": status.get("pass_2_complete", False),
-            "pass_3_complete": status.get("pass_3_complete", False),
-            "pass_1_score": status.get("pass_1_score", 0),
-            "pass_2_score": status.get("pass_2_score", 0),
-            "pass_3_score": status.get("pass_3_score", 0),
-            "total_score": status.get("total_score", 0),
-            "final_verification_complete": status.get("final_verification_complete", False),
-            "pass_1_checkboxes": status.get("pass_1_checkboxes", 0),
-            "pass_2_checkboxes": status.get("pass_2_checkboxes", 0),
-            "pass_3_checkboxes": status.get("pass_3_checkboxes", 0),
-        }
-
-
 def check_3pass_complete(sejr_path: Path) -> dict:
     """Check if all 3 passes are complete and scores improve."""
     status_file = sejr_path / "STATUS.yaml"
@@ -679,9 +624,13 @@ def archive_sejr(sejr_name: str, system_path: Path, force: bool = False):
     }
 
     metadata_file = archive_path / "ARCHIVE_METADATA.yaml"
-    write_yaml_simple(metadata_file, metadata)
+    write_yaml(metadata_file, metadata, header="Archive metadata")
     print(f"[OK] Created: {metadata_file}")
 
+    # Append to the packed archive snapshot (read by index, leaderboard, stats, auto_learn)
+    ArchiveSnapshot(system_path).append(archive_path)
+    print(f"[OK] Snapshot record appended")
+
     # Remove from 10_ACTIVE
     print(f"\n  Removing from 10_ACTIVE: {sejr_path}")
     shutil.rmtree(sejr_path)
@@ -696,30 +645,44 @@ def archive_sejr(sejr_name: str, system_path: Path, force: bool = False):
     print(f"\n Updating archive index...")
     update_archive_index(system_path)
 
-    # FEEDBACK LOOP: Trigger auto_learn after archive to update patterns
-    learn_script = system_path / "scripts" / "auto_learn.py"
-    if learn_script.exists():
+    # FEEDBACK LOOP: Learn from the new archive — in-process, no second interpreter
+    if (system_path / "scripts" / "auto_learn.py").exists():
         print(f"\n Learning from completed sejr...")
         try:
-            result = subprocess.run(
-                ["python3", str(learn_script)],
-                cwd=str(system_path),
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode == 0:
-                print(f"[OK] Patterns updated (auto_learn.py)")
-            else:
-                print(f"[WARN] auto_learn.py exit code {result.returncode}")
-        except subprocess.TimeoutExpired:
-            print(f"[WARN] auto_learn.py timed out (30s)")
-        except Exception as e:
-            print(f"[WARN] auto_learn.py error: {e}")
+            import auto_learn
+        except ImportError:
+            _learn_subprocess(system_path)
+        else:
+            try:
+                auto_learn.run_learning(system_path)
+                print(f"[OK] Patterns updated (auto_learn)")
+            except Exception as e:
+                print(f"[WARN] auto_learn error: {e}")
 
     return True
 
 
+def _learn_subprocess(system_path: Path):
+    """Fallback: run auto_learn.py in its own interpreter."""
+    learn_script = system_path / "scripts" / "auto_learn.py"
+    try:
+        result = subprocess.run(
+            ["python3", str(learn_script)],
+            cwd=str(system_path),
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode == 0:
+            print(f"[OK] Patterns updated (auto_learn.py)")
+        else:
+            print(f"[WARN] auto_learn.py exit code {result.returncode}")
+    except subprocess.TimeoutExpired:
+        print(f"[WARN] auto_learn.py timed out (30s)")
+    except Exception as e:
+        print(f"[WARN] auto_learn.py error: {e}")
+
+
 def update_archive_index(system_path: Path):
     """Update INDEX.md in 90_ARCHIVE/ with all completed sejr."""
     archive_dir = system_path / "90_ARCHIVE"
@@ -727,34 +690,23 @@ def update_archive_index(system_path: Path):
     if not archive_dir.exists():
         return
 
-    # Collect all archived sejr with their data
+    # Collect all archived sejr with their data (from the packed snapshot)
     archived_sejr = []
 
-    for folder in sorted(archive_dir.iterdir(), reverse=True):
-        if not folder.is_dir() or folder.name.startswith('.'):
-            continue
-
-        status_file = folder / "STATUS.yaml"
-        metadata_file = folder / "ARCHIVE_METADATA.yaml"
-
-        status = parse_yaml_simple(status_file) if status_file.exists() else {}
-        metadata = parse_yaml_simple(metadata_file) if metadata_file.exists() else {}
-
-        s = _extract_status_fields(status)
-        total_score = s['total_score']
-        rank_name, rank_emoji = get_rank_from_score(total_score)
+    for record in sorted(get_archive_records(system_path), key=lambda r: r.name, reverse=True):
+        rank_name, rank_emoji = get_rank_from_score(record.total_score)
 
         archived_sejr.append({
-            'name': folder.name,
-            'path': folder,
-            'total_score': total_score,
-            'pass_1_score': s['pass_1_score'],
-            'pass_2_score': s['pass_2_score'],
-            'pass_3_score': s['pass_3_score'],
+            'name': record.name,
+            'path': archive_dir / record.name,
+            'total_score': record.total_score,
+            'pass_1_score': record.pass_1_score,
+            'pass_2_score': record.pass_2_score,
+            'pass_3_score': record.pass_3_score,
             'rank_name': rank_name,
             'rank_emoji': rank_emoji,
-            'archived_at': metadata.get('archived_at', 'Unknown'),
-            'has_diplom': (folder / "SEJR_DIPLOM.md").exists(),
+            'archived_at': record.extras.get('archived_at') or 'Unknown',
+            'has_diplom': record.has_diplom,
         })
 
     # Generate INDEX.md
@@ -882,9 +834,15 @@ def list_completed_sejr(system_path: Path):
             print()
 
     print("=" * 60 + "\n")
+    return {"ready": ready, "not_ready": not_ready}
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    """Command-line entry point; also called in-process by script_jobs.
+
+    Returns the action's result: archive_sejr's bool for --sejr, the
+    ready/not-ready lists for --list, the index path for --update-index.
+    """
     parser = argparse.ArgumentParser(
         description="Archive completed sejr liste (requires 3-pass completion)"
     )
@@ -897,12 +855,12 @@ if __name__ == "__main__":
                        help="Update INDEX.md in 90_ARCHIVE/")
     parser.add_argument("--generate-diploms", action="store_true",
                        help="Generate SEJR_DIPLOM.md for all archived sejr that don't have one")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     system_path = Path(__file__).parent.parent
 
     if args.update_index:
-        update_archive_index(system_path)
+        return update_archive_index(system_path)
     elif args.generate_diploms:
         # Generate diploms for existing archives
         archive_dir = system_path / "90_ARCHIVE"
@@ -920,10 +878,11 @@ if __name__ == "__main__":
                     generated += 1
         print(f"\n[OK] Generated {generated} diploms")
         update_archive_index(system_path)
+        return generated
     elif args.list:
-        list_completed_sejr(system_path)
+        return list_completed_sejr(system_path)
     elif args.sejr:
-        archive_sejr(args.sejr, system_path, force=args.force)
+        return archive_sejr(args.sejr, system_path, force=args.force)
     else:
         print("Usage: auto_archive.py --sejr <name> [--force]")
         print("   or: auto_archive.py --list")
@@ -933,3 +892,8 @@ if __name__ == "__main__":
         print("   - Pass 3 [OK] (score > Pass 2)")
         print("   - Final verification [OK] (5+ tests)")
         print("   - Total score >= 24/30")
+        return None
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,9 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+from yaml_utils import write_yaml  # Write-if-changed, atomic
+
 
 # ════════════════════════════════════════════════════════════════════════════
 # CONFIG
@@ -224,9 +227,8 @@ class HealthCheck:
             },
         }
 
-        header = f"# STATUS.yaml - REPAIRED by auto_health_check.py\n# Repaired: {datetime.now().isoformat()}\n\n"
-        yaml_content = yaml.dump(reconstructed, default_flow_style=False, allow_unicode=True, sort_keys=False, width=120)
-        filepath.write_text(header + yaml_content, encoding="utf-8")
+        write_yaml(filepath, reconstructed,
+                   header=f"STATUS.yaml - REPAIRED by auto_health_check.py ({datetime.now().isoformat()})")
         self.fixed(f"{filepath.parent.name}/STATUS.yaml")
 
     def _reconstruct_sejr_liste(self, archive_dir: Path):
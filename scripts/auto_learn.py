@@ -3,19 +3,30 @@
 Auto-learn patterns from completed sejr
 Part of SEJR LISTE SYSTEM - DNA Layer 4 (SELF-IMPROVING)
 
+Incremental: per-archive extractions and merged aggregates live in
+_CURRENT/LEARN_STATE.json, so a run only processes archives that are new
+since the last one (--full re-learns everything).
+
 INGEN EXTERNAL DEPENDENCIES - Kun Python standard library
+(NumPy fra requirements.txt bruges til lighedsberegning hvis installeret)
 """
 
+import argparse
 import json
+import os
 import re
 import sys
-import yaml
 from pathlib import Path
 from datetime import datetime
 from collections import Counter
+from typing import List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
-from yaml_utils import parse_yaml_simple
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from yaml_utils import write_json, write_yaml  # Write-if-changed, atomic
+from archive_snapshot import build_record, get_archive_records  # Packed 90_ARCHIVE snapshot
+from text_similarity import cluster_texts, most_similar  # Paraphrase clustering
+from event_store import get_event_store  # Cross-sejr activity store
 
 
 # ============================================================================
@@ -48,94 +59,25 @@ GENERIC_ACTIONS = {
 }
 
 
-def write_yaml_simple(filepath: Path, data: dict, indent: int = 0):
-    """Write YAML using PyYAML (preserves nested structures)."""
-    yaml_content = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False, width=120)
-    filepath.write_text(yaml_content, encoding="utf-8")
+def _learn_data(record) -> Optional[dict]:
+    """auto_learn's view of an archive snapshot record (None without CONCLUSION.md)"""
+    if not record.has_conclusion:
+        return None
+    extras = record.extras
+    return {
+        'name': record.name,
+        'metrics': extras.get('metrics', {}),
+        'learnings': extras.get('learnings', []),
+        'reusable': extras.get('reusable', []),
+        'improvements': extras.get('improvements', []),
+        'action_counts': extras.get('action_counts', {}),
+    }
+
 
 def extract_learnings_from_sejr(sejr_path: Path):
     """Extract semantic learnings from archived sejr (reads CONCLUSION.md)"""
     # Archived sejr have CONCLUSION.md, not SEJR_LISTE.md
-    conclusion_file = sejr_path / "CONCLUSION.md"
-    status_file = sejr_path / "STATUS.yaml"
-
-    if not conclusion_file.exists():
-        return None
-
-    content = conclusion_file.read_text(encoding="utf-8")
-
-    # Extract metrics from STATUS.yaml
-    metrics = {}
-    if status_file.exists():
-        status = parse_yaml_simple(status_file)
-        metrics = {
-            'pass_1_score': status.get('pass_1_score', 0),
-            'pass_2_score': status.get('pass_2_score', 0),
-            'pass_3_score': status.get('pass_3_score', 0),
-            'total_score': status.get('total_score', 0),
-        }
-
-    # Extract learnings from CONCLUSION.md
-    # Look for "## Hvad Lærte Vi" section
-    learnings = []
-    in_learnings = False
-    for line in content.split('\n'):
-        if '## Hvad Lærte Vi' in line:
-            in_learnings = True
-            continue
-        if in_learnings:
-            if line.startswith('##'):
-                break
-            if line.strip() and not line.strip().startswith('-'):
-                learnings.append(line.strip())
-
-    # Extract reusable items from "## Hvad Kan Genbruges"
-    reusable = []
-    in_reusable = False
-    for line in content.split('\n'):
-        if '## Hvad Kan Genbruges' in line:
-            in_reusable = True
-            continue
-        if in_reusable:
-            if line.startswith('##'):
-                break
-            if line.strip().startswith('-'):
-                reusable.append(line.strip().lstrip('- '))
-
-    # Extract improvement proofs from "### Pass X → Pass Y Forbedring"
-    improvements = []
-    in_improvement = False
-    for line in content.split('\n'):
-        if '→' in line and 'Forbedring' in line:
-            in_improvement = True
-            continue
-        if in_improvement:
-            if line.startswith('#'):
-                in_improvement = False
-                continue
-            if line.strip():
-                improvements.append(line.strip())
-
-    # Parse AUTO_LOG.jsonl for action patterns
-    log_file = sejr_path / "AUTO_LOG.jsonl"
-    actions = []
-    if log_file.exists():
-        try:
-            with open(log_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        actions.append(json.loads(line))
-        except Exception:
-            pass
-
-    return {
-        'name': sejr_path.name,
-        'metrics': metrics,
-        'learnings': learnings,
-        'reusable': reusable,
-        'improvements': improvements,
-        'actions': actions
-    }
+    return _learn_data(build_record(sejr_path))
 
 def is_blacklisted(text: str) -> bool:
     """Check if text is blacklisted placeholder or stop-word"""
@@ -149,114 +91,226 @@ def is_blacklisted(text: str) -> bool:
     return False
 
 
-def extract_semantic_patterns(learnings: list[str]) -> list[dict]:
-    """Extract MEANINGFUL semantic patterns from learnings, not word counts."""
-    patterns = []
-    seen_texts = set()  # Track to avoid duplicates
+# Semantic categories in priority order: (category, keywords, extra check)
+SEMANTIC_CATEGORIES = [
+    ('BUG_FIX', ('fejl', 'bug', 'løsning', 'fikse', 'rettet'),
+     lambda text: 'fordi' in text or 'løsning' in text),
+    ('WORKFLOW', ('altid', 'aldrig', 'skal', 'must', 'never', 'always'),
+     lambda text: len(text) > 20),
+    ('TOOL', ('.py', 'script', 'auto_', 'generate_', 'executor'), None),
+    ('TECHNICAL', ('regex', 'api', 'path', 'mock', 'test'), None),
+]
+
+# Per category: (label, top N, prevention, optimization, base confidence)
+SEMANTIC_OUTPUT = {
+    'BUG_FIX': ('BUG LÆRT', 3, 'Check for this issue in similar contexts',
+                'Add to pre-flight checklist', 0.95),
+    'WORKFLOW': ('WORKFLOW', 3, 'Follow this rule in similar situations',
+                 'Automate enforcement if possible', 0.9),
+    'TOOL': ('TOOL', 2, 'Use existing tool before creating new',
+             'Document tool usage and edge cases', 0.85),
+    'TECHNICAL': ('TECHNICAL', 2, 'Remember this technical constraint',
+                  'Add to technical documentation', 0.9),
+}
 
-    # Categories of actionable patterns - MUTUALLY EXCLUSIVE
-    categorized = {}  # learning -> best category
 
-    for learning in learnings:
-        if not learning or is_blacklisted(learning):
-            continue
+def categorize_learning(learning: str) -> Optional[str]:
+    """Best category for one learning (first matching keyword group wins)."""
+    learning_lower = learning.lower()
+    for category, keywords, check in SEMANTIC_CATEGORIES:
+        if any(kw in learning_lower for kw in keywords):
+            # A keyword group claims the learning even if its check fails
+            return category if check is None or check(learning_lower) else None
+    return None
 
-        learning_lower = learning.lower()
-        learning_key = learning[:50].lower()  # Use first 50 chars as dedup key
 
-        if learning_key in seen_texts:
-            continue
-        seen_texts.add(learning_key)
+def support_confidence(base: float, support: int) -> float:
+    """Confidence grows with support: each extra sejr halves the remaining doubt."""
+    return round(1 - (1 - base) / max(1, support), 2)
 
-        # Determine BEST category (priority order: BUG > WORKFLOW > TOOL > TECHNICAL)
-        category = None
 
-        # Pattern: Bug fixes - highest priority (specific learnings from errors)
-        if any(kw in learning_lower for kw in ['fejl', 'bug', 'løsning', 'fikse', 'rettet']):
-            if 'fordi' in learning_lower or 'løsning' in learning_lower:
-                category = 'BUG_FIX'
+def _new_cluster(leader: str) -> dict:
+    return {'leader': leader, 'support': 0, 'votes': {}, 'first': {}}
 
-        # Pattern: Workflow rules - "altid", "aldrig", "skal"
-        elif any(kw in learning_lower for kw in ['altid', 'aldrig', 'skal', 'must', 'never', 'always']):
-            if len(learning) > 20:
-                category = 'WORKFLOW'
 
-        # Pattern: Script/tool learnings
-        elif any(kw in learning_lower for kw in ['.py', 'script', 'auto_', 'generate_', 'executor']):
-            category = 'TOOL'
+def _add_member(cluster: dict, text: str) -> None:
+    cluster['support'] += 1
+    category = categorize_learning(text)
+    if category:
+        cluster['votes'][category] = cluster['votes'].get(category, 0) + 1
+        cluster['first'].setdefault(category, text)
 
-        # Pattern: Technical (API/regex/path issues)
-        elif any(kw in learning_lower for kw in ['regex', 'api', 'path', 'mock', 'test']):
-            category = 'TECHNICAL'
 
-        if category:
-            categorized[learning] = category
+def cluster_learnings(clusters: List[dict], learnings: List[str]) -> None:
+    """Add learnings to the leader clusters in place.
+
+    Without clusters the whole batch is clustered at once (cluster_texts).
+    Otherwise each new learning is compared to the stored leaders only:
+    a paraphrase joins its leader's cluster, anything else starts a new one.
+    """
+    candidates = [l for l in learnings if l and not is_blacklisted(l)]
+    if not clusters:
+        for members in cluster_texts(candidates):
+            cluster = _new_cluster(candidates[members[0]])
+            for i in members:
+                _add_member(cluster, candidates[i])
+            clusters.append(cluster)
+        return
+    leaders = [c['leader'] for c in clusters]
+    for text in candidates:
+        match = most_similar(text, leaders)
+        if match is None:
+            clusters.append(_new_cluster(text))
+            leaders.append(text)
+            match = len(clusters) - 1
+        _add_member(clusters[match], text)
+
+
+def semantic_patterns_from_clusters(clusters: List[dict]) -> List[dict]:
+    """One pattern per cluster, ranked by support within its category."""
+    priority = [c for c, _, _ in SEMANTIC_CATEGORIES]
+
+    # Cluster -> (category, representative, support)
+    by_category = {c: [] for c in priority}
+    for cluster in clusters:
+        votes = cluster['votes']
+        if not votes:
+            continue
+        category = min(votes, key=lambda c: (-votes[c], priority.index(c)))
+        by_category[category].append((cluster['first'][category], cluster['support']))
 
-    # Create patterns from categorized learnings (no duplicates)
     today = datetime.now().strftime("%Y-%m-%d")
+    patterns = []
+    for category in priority:
+        label, top_n, prevention, optimization, base = SEMANTIC_OUTPUT[category]
+        # Highest support first; stable sort keeps first-seen order for ties
+        ranked = sorted(by_category[category], key=lambda item: -item[1])
+        for text, support in ranked[:top_n]:
+            patterns.append({
+                'pattern': f'{label}: {text[:100]}',
+                'prevention': prevention,
+                'optimization': optimization,
+                'category': category,
+                'confidence': support_confidence(base, support),
+                'support': support,
+                'first_seen': today
+            })
 
-    # Group by category
-    by_category = {'BUG_FIX': [], 'WORKFLOW': [], 'TOOL': [], 'TECHNICAL': []}
-    for learning, cat in categorized.items():
-        by_category[cat].append(learning)
+    return patterns
 
-    # BUG patterns (top 3)
-    for bug in by_category['BUG_FIX'][:3]:
-        patterns.append({
-            'pattern': f'BUG LÆRT: {bug[:100]}',
-            'prevention': 'Check for this issue in similar contexts',
-            'optimization': 'Add to pre-flight checklist',
-            'category': 'BUG_FIX',
-            'confidence': 0.95,
-            'first_seen': today
-        })
 
-    # WORKFLOW patterns (top 3)
-    for wf in by_category['WORKFLOW'][:3]:
-        patterns.append({
-            'pattern': f'WORKFLOW: {wf[:100]}',
-            'prevention': 'Follow this rule in similar situations',
-            'optimization': 'Automate enforcement if possible',
-            'category': 'WORKFLOW',
-            'confidence': 0.9,
-            'first_seen': today
-        })
+def extract_semantic_patterns(learnings: List[str]) -> List[dict]:
+    """Extract MEANINGFUL semantic patterns from learnings, not word counts.
 
-    # TOOL patterns (top 2)
-    for tool in by_category['TOOL'][:2]:
-        patterns.append({
-            'pattern': f'TOOL: {tool[:100]}',
-            'prevention': 'Use existing tool before creating new',
-            'optimization': 'Document tool usage and edge cases',
-            'category': 'TOOL',
-            'confidence': 0.85,
-            'first_seen': today
-        })
+    Near-duplicate learnings (paraphrases across sejr) are clustered by
+    TF-IDF cosine similarity; each cluster becomes one pattern whose support
+    (number of learnings in it) ranks it and drives its confidence.
+    """
+    clusters = []
+    cluster_learnings(clusters, learnings)
+    return semantic_patterns_from_clusters(clusters)
 
-    # TECHNICAL patterns (top 2)
-    for tech in by_category['TECHNICAL'][:2]:
-        patterns.append({
-            'pattern': f'TECHNICAL: {tech[:100]}',
-            'prevention': 'Remember this technical constraint',
-            'optimization': 'Add to technical documentation',
-            'category': 'TECHNICAL',
-            'confidence': 0.9,
-            'first_seen': today
-        })
 
-    return patterns
+# ============================================================================
+# AGGREGATES — additive, so new archives can be merged into existing totals
+# ============================================================================
+
+def new_aggregates() -> dict:
+    """Empty pattern aggregates (everything identify_patterns needs, nothing more)"""
+    return {
+        'sejr_count': 0,
+        'grand_admirals': 0,
+        'learnings': [],              # Quality learnings, in archive order
+        'clusters': [],               # Paraphrase clusters of learnings[:clustered]
+        'clustered': 0,
+        'reusable_by_type': {},       # "Script" -> ["auto_verify.py", ...]
+        'improvement_keywords': {},   # "tests" -> count
+        'action_counts': {},          # Normalized action -> count
+    }
+
+
+def merge_sejr_data(aggregates: dict, sejr: dict) -> None:
+    """Merge one sejr's extraction (see _learn_data) into the aggregates"""
+    aggregates['sejr_count'] += 1
+    if sejr['metrics'].get('total_score', 0) >= 27:
+        aggregates['grand_admirals'] += 1
+
+    # Filter out blacklisted and short learnings
+    aggregates['learnings'].extend(
+        l for l in sejr.get('learnings', [])
+        if l and len(l) > 20 and not is_blacklisted(l)
+    )
+
+    # Group quality reusable items by type (Script:, Template:, Pattern:, etc.)
+    for item in sejr.get('reusable', []):
+        if item and len(item) > 10 and not is_blacklisted(item) and ':' in item:
+            item_type = item.split(':')[0].strip()
+            content = item.split(':', 1)[1].strip()
+            aggregates['reusable_by_type'].setdefault(item_type, []).append(content)
+
+    # Common improvement themes
+    keywords = aggregates['improvement_keywords']
+    for imp in sejr.get('improvements', []):
+        if not imp or len(imp) <= 15 or is_blacklisted(imp):
+            continue
+        imp_lower = imp.lower()
+        if 'test' in imp_lower:
+            keywords['tests'] = keywords.get('tests', 0) + 1
+        if 'dokumentation' in imp_lower or 'docs' in imp_lower:
+            keywords['documentation'] = keywords.get('documentation', 0) + 1
+        if 'refactor' in imp_lower or 'cleanup' in imp_lower:
+            keywords['refactoring'] = keywords.get('refactoring', 0) + 1
+        if 'error' in imp_lower or 'fejl' in imp_lower:
+            keywords['error_handling'] = keywords.get('error_handling', 0) + 1
+
+    # Action names are normalized (lowercase, strip) when the snapshot is built
+    actions = aggregates['action_counts']
+    for action, count in sejr.get('action_counts', {}).items():
+        actions[action] = actions.get(action, 0) + count
+
+
+def update_clusters(aggregates: dict) -> None:
+    """Cluster the learnings merged since the last call (only those)."""
+    done = aggregates['clustered']
+    cluster_learnings(aggregates['clusters'], aggregates['learnings'][done:])
+    aggregates['clustered'] = len(aggregates['learnings'])
 
 
 def identify_patterns(all_sejr_data: list):
     """Identify MEANINGFUL patterns across completed sejr (ADMIRAL STANDARD)"""
+    aggregates = new_aggregates()
+    for sejr in all_sejr_data:
+        merge_sejr_data(aggregates, sejr)
+    return patterns_from_aggregates(aggregates)
+
+
+def archived_action_counts(system_path: Path, names: list, folders: list) -> Optional[dict]:
+    """Normalized action counts over archived sejr from the event store.
+
+    Only the given archive folders (new since the last run) are synced;
+    the counts are one GROUP BY on the indexed store instead of summing
+    per-archive log counts. None if the store cannot be opened.
+    """
+    store = get_event_store(system_path)
+    if not store.available:
+        return None
+    store.sync_folders(folders)
+    counts = Counter()
+    for action, count in store.count_by("action", source="auto_log", sejrs=names).items():
+        counts[action.lower().strip()] += count
+    return dict(counts)
+
+
+def patterns_from_aggregates(aggregates: dict, action_counts: Optional[dict] = None) -> list:
+    """Turn merged aggregates into patterns (action_counts overrides the aggregated ones)"""
     patterns = []
     today = datetime.now().strftime("%Y-%m-%d")
 
     # ========================================================================
     # META PATTERN 1: Overall success rate (keep this, it's useful)
     # ========================================================================
-    grand_admirals = sum(1 for s in all_sejr_data if s['metrics'].get('total_score', 0) >= 27)
-    total = len(all_sejr_data)
+    grand_admirals = aggregates['grand_admirals']
+    total = aggregates['sejr_count']
 
     if total > 0:
         success_rate = grand_admirals / total
@@ -273,40 +327,13 @@ def identify_patterns(all_sejr_data: list):
     # ========================================================================
     # SEMANTIC PATTERNS: Extract from actual learnings (REAL VALUE)
     # ========================================================================
-    all_learnings = []
-    for sejr in all_sejr_data:
-        all_learnings.extend(sejr.get('learnings', []))
-
-    # Filter out blacklisted and short learnings
-    quality_learnings = [l for l in all_learnings
-                        if l and len(l) > 20 and not is_blacklisted(l)]
-
-    if quality_learnings:
-        semantic_patterns = extract_semantic_patterns(quality_learnings)
-        patterns.extend(semantic_patterns)
+    update_clusters(aggregates)
+    patterns.extend(semantic_patterns_from_clusters(aggregates['clusters']))
 
     # ========================================================================
     # REUSABLE ITEMS: Konkrete genbrugelige ting (scripts, templates, patterns)
     # ========================================================================
-    all_reusable = []
-    for sejr in all_sejr_data:
-        all_reusable.extend(sejr.get('reusable', []))
-
-    # Filter quality reusable items
-    quality_reusable = [r for r in all_reusable
-                       if r and len(r) > 10 and not is_blacklisted(r)]
-
-    # Group by type (Script:, Template:, Pattern:, etc.)
-    reusable_by_type = {}
-    for item in quality_reusable:
-        if ':' in item:
-            item_type = item.split(':')[0].strip()
-            content = item.split(':', 1)[1].strip()
-            if item_type not in reusable_by_type:
-                reusable_by_type[item_type] = []
-            reusable_by_type[item_type].append(content)
-
-    for item_type, items in reusable_by_type.items():
+    for item_type, items in aggregates['reusable_by_type'].items():
         if len(items) >= 2:
             patterns.append({
                 'pattern': f'REUSABLE {item_type.upper()}: {len(items)} identificeret',
@@ -321,69 +348,38 @@ def identify_patterns(all_sejr_data: list):
     # ========================================================================
     # IMPROVEMENT PATTERNS: Hvad forbedres typisk mellem passes?
     # ========================================================================
-    all_improvements = []
-    for sejr in all_sejr_data:
-        all_improvements.extend(sejr.get('improvements', []))
-
-    quality_improvements = [i for i in all_improvements
-                           if i and len(i) > 15 and not is_blacklisted(i)]
-
-    if quality_improvements:
-        # Find common improvement themes
-        improvement_keywords = []
-        for imp in quality_improvements:
-            imp_lower = imp.lower()
-            if 'test' in imp_lower:
-                improvement_keywords.append('tests')
-            if 'dokumentation' in imp_lower or 'docs' in imp_lower:
-                improvement_keywords.append('documentation')
-            if 'refactor' in imp_lower or 'cleanup' in imp_lower:
-                improvement_keywords.append('refactoring')
-            if 'error' in imp_lower or 'fejl' in imp_lower:
-                improvement_keywords.append('error_handling')
-
-        for keyword, count in Counter(improvement_keywords).most_common(3):
-            if count >= 2:
-                patterns.append({
-                    'pattern': f'IMPROVEMENT FOCUS: {keyword} forbedres i {count} sejr',
-                    'prevention': f'Inkludér {keyword} fra Pass 1',
-                    'optimization': f'Brug {keyword} checklist i template',
-                    'category': 'IMPROVEMENT',
-                    'confidence': 0.8,
-                    'first_seen': today
-                })
+    for keyword, count in Counter(aggregates['improvement_keywords']).most_common(3):
+        if count >= 2:
+            patterns.append({
+                'pattern': f'IMPROVEMENT FOCUS: {keyword} forbedres i {count} sejr',
+                'prevention': f'Inkludér {keyword} fra Pass 1',
+                'optimization': f'Brug {keyword} checklist i template',
+                'category': 'IMPROVEMENT',
+                'confidence': 0.8,
+                'first_seen': today
+            })
 
     # ========================================================================
     # ACTION PATTERNS: Normaliser og filtrer (kun VALUABLE actions)
     # ========================================================================
-    all_actions = []
-    for sejr in all_sejr_data:
-        all_actions.extend(sejr.get('actions', []))
-
-    if all_actions:
-        # Normalize action names (lowercase, strip)
-        action_types = Counter(
-            a.get('action', 'unknown').lower().strip()
-            for a in all_actions
-        )
-
-        # Filter out generic/blacklisted actions
-        valuable_actions = {
-            action: count for action, count in action_types.items()
-            if action not in GENERIC_ACTIONS
-            and count >= 5
-            and not is_blacklisted(action)
-        }
+    # Filter out generic/blacklisted actions
+    valuable_actions = {
+        action: count for action, count in (action_counts if action_counts is not None
+                                            else aggregates['action_counts']).items()
+        if action not in GENERIC_ACTIONS
+        and count >= 5
+        and not is_blacklisted(action)
+    }
 
-        for action, count in sorted(valuable_actions.items(), key=lambda x: -x[1])[:3]:
-            patterns.append({
-                'pattern': f'FREQUENT ACTION: {action} ({count}x across sejr)',
-                'prevention': f'Consider automating {action}',
-                'optimization': f'Create script/hotkey for {action}',
-                'category': 'AUTOMATION',
-                'confidence': min(0.9, count * 0.05),
-                'first_seen': today
-            })
+    for action, count in sorted(valuable_actions.items(), key=lambda x: -x[1])[:3]:
+        patterns.append({
+            'pattern': f'FREQUENT ACTION: {action} ({count}x across sejr)',
+            'prevention': f'Consider automating {action}',
+            'optimization': f'Create script/hotkey for {action}',
+            'category': 'AUTOMATION',
+            'confidence': min(0.9, count * 0.05),
+            'first_seen': today
+        })
 
     return patterns
 
@@ -415,94 +411,188 @@ def update_patterns_yaml(system_path: Path, new_patterns: list):
         except Exception:
             pass  # Use fresh data if JSON is corrupt
 
-    # Add new patterns (avoid duplicates)
-    existing_patterns = [p.get('pattern', '') for p in data['learned_patterns'] if isinstance(p, dict)]
+    # Add new patterns (avoid duplicates and paraphrases of semantic patterns)
+    existing_patterns = [p.get('pattern', '') if isinstance(p, dict) else '' for p in data['learned_patterns']]
     added_count = 0
+    refreshed_count = 0
 
     for pattern in new_patterns:
-        if pattern['pattern'] not in existing_patterns:
-            data['learned_patterns'].append({
-                'pattern': pattern['pattern'],
-                'prevention': pattern['prevention'],
-                'optimization': pattern['optimization'],
-                'applied_count': 0,
-                'time_saved_total': '0 min',
-                'confidence': pattern['confidence'],
-                'first_seen': pattern['first_seen'],
-                'last_applied': None
-            })
-            added_count += 1
+        if pattern['pattern'] in existing_patterns:
+            continue
+
+        if 'support' in pattern:
+            label = pattern['pattern'].split(': ', 1)[0] + ': '
+            same_label = [i for i, text in enumerate(existing_patterns) if text.startswith(label)]
+            match = most_similar(pattern['pattern'][len(label):],
+                                 [existing_patterns[i][len(label):] for i in same_label])
+            if match is not None:
+                # Same learning in other words: strengthen the existing entry
+                entry = data['learned_patterns'][same_label[match]]
+                entry['support'] = max(entry.get('support', 1), pattern['support'])
+                entry['confidence'] = max(entry.get('confidence', 0), pattern['confidence'])
+                refreshed_count += 1
+                continue
+
+        entry = {
+            'pattern': pattern['pattern'],
+            'prevention': pattern['prevention'],
+            'optimization': pattern['optimization'],
+            'applied_count': 0,
+            'time_saved_total': '0 min',
+            'confidence': pattern['confidence'],
+            'first_seen': pattern['first_seen'],
+            'last_applied': None
+        }
+        if 'support' in pattern:
+            entry['support'] = pattern['support']
+        data['learned_patterns'].append(entry)
+        existing_patterns.append(entry['pattern'])
+        added_count += 1
 
     # Update metadata
     data['system']['last_learned'] = datetime.now().strftime("%Y-%m-%d %H:%M")
     data['system']['total_patterns'] = len(data['learned_patterns'])
 
-    # Write as JSON (better for complex nested structures)
-    with open(patterns_json, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Write as JSON (better for complex nested structures). Both files are
+    # watched, so a run that learned nothing new must not touch them.
+    write_json(patterns_json, data, ignore_keys=("system.last_learned",))
 
     # Also write simple YAML summary for human readability
-    yaml_summary = f"""# PATTERNS - Auto-learned from {data['system']['total_patterns']} patterns
-# Last updated: {data['system']['last_learned']}
-# Full data in: PATTERNS.json
-
-system_version: "1.0.0"
-last_learned: "{data['system']['last_learned']}"
-total_patterns: {data['system']['total_patterns']}
-
-# Top patterns (see PATTERNS.json for full list):
-"""
-    for p in data['learned_patterns'][:5]:
-        yaml_summary += f"\n# - {p['pattern'][:60]}..."
-
-    patterns_file.write_text(yaml_summary, encoding="utf-8")
+    summary = {
+        'system_version': '1.0.0',
+        'last_learned': data['system']['last_learned'],
+        'total_patterns': data['system']['total_patterns'],
+        # Top patterns (see PATTERNS.json for full list)
+        'top_patterns': [f"{p['pattern'][:60]}..." for p in data['learned_patterns'][:5]],
+    }
+    write_yaml(patterns_file, summary, ignore_keys=("last_learned",),
+               header=f"PATTERNS - Auto-learned from {data['system']['total_patterns']} patterns"
+                      " (full data in: PATTERNS.json)")
 
     print(f"[OK] Updated: {patterns_json}")
     print(f"   Total patterns: {data['system']['total_patterns']}")
     print(f"   Added {added_count} new patterns")
+    if refreshed_count:
+        print(f"   Merged {refreshed_count} paraphrases into existing patterns")
 
-def learn_from_completed(system_path: Path):
-    """Learn from all completed sejr in archive"""
-    archive_dir = system_path / "90_ARCHIVE"
+# ============================================================================
+# INCREMENTAL STATE — _CURRENT/LEARN_STATE.json
+# ============================================================================
 
-    if not archive_dir.exists():
-        print("[INFO]  No archive directory yet - no completed sejr to learn from")
-        return
+LEARN_STATE_FILE = "LEARN_STATE.json"
+LEARN_STATE_VERSION = 2
 
-    completed_sejr = [f for f in archive_dir.iterdir() if f.is_dir()]
 
-    if not completed_sejr:
-        print("[INFO]  No completed sejr found in archive")
-        return
+def load_learn_state(system_path: Path) -> dict:
+    """Per-archive extractions + merged aggregates from the last run ({} if none)"""
+    state_file = system_path / "_CURRENT" / LEARN_STATE_FILE
+    try:
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(state, dict) or state.get('version') != LEARN_STATE_VERSION:
+        return {}
+    return state
+
 
-    print(f" Learning from {len(completed_sejr)} completed sejr...\n")
+def save_learn_state(system_path: Path, state: dict):
+    """Write LEARN_STATE.json atomically (temp file + rename)"""
+    state_file = system_path / "_CURRENT" / LEARN_STATE_FILE
+    state_file.parent.mkdir(exist_ok=True)
+    tmp = state_file.with_suffix('.json.tmp')
+    tmp.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, state_file)
 
-    # Extract data from all completed sejr
-    all_sejr_data = []
-    for sejr_path in completed_sejr:
-        data = extract_learnings_from_sejr(sejr_path)
+
+def learn_from_completed(system_path: Path, full: bool = False):
+    """Learn from completed sejr in archive — incrementally.
+
+    Only archives that are new (or changed) since the last run are
+    extracted and merged into the stored aggregates, their learnings are
+    compared to the stored cluster leaders, and only their logs are synced
+    into the event store. Archives that changed or disappeared trigger a
+    re-merge from the stored per-archive results (still no file reads).
+    full=True discards the stored state.
+
+    Returns {"new": archives learned this run, "total": archives known,
+    "patterns": patterns identified (None when nothing changed)}.
+    """
+    # Snapshot validation is stat-only — no CONCLUSION.md / AUTO_LOG reads
+    completed_sejr = get_archive_records(system_path)
+
+    if not completed_sejr:
+        if not (system_path / "90_ARCHIVE").exists():
+            print("[INFO]  No archive directory yet - no completed sejr to learn from")
+        else:
+            print("[INFO]  No completed sejr found in archive")
+        return {"new": 0, "total": 0, "patterns": None}
+
+    state = {} if full else load_learn_state(system_path)
+    archives = state.get('archives', {})
+
+    current = {r.name: r for r in completed_sejr}
+    new_records = [r for r in completed_sejr
+                   if archives.get(r.name, {}).get('signature') != r.signature]
+    stale = [name for name in archives
+             if name not in current or archives[name]['signature'] != current[name].signature]
+
+    if not new_records and not stale:
+        print(f"[OK] Ingen nye arkiver siden sidste kørsel ({len(archives)} allerede lært)")
+        return {"new": 0, "total": len(completed_sejr), "patterns": None}
+
+    print(f" Learning from {len(new_records)} new of {len(completed_sejr)} completed sejr...\n")
+
+    # Extract data from new/changed sejr only
+    new_data = []
+    for record in new_records:
+        data = _learn_data(record)
+        archives[record.name] = {
+            'signature': record.signature,
+            'archived_ts': record.archived_ts,
+            'data': data,
+        }
         if data:
-            all_sejr_data.append(data)
+            new_data.append(data)
 
-    if not all_sejr_data:
-        print("[WARN]  No learnings could be extracted")
-        return
+    archive_dir = system_path / "90_ARCHIVE"
+    if stale or 'aggregates' not in state:
+        # Aggregates are additive only — re-merge from stored per-archive results
+        for name in [n for n in archives if n not in current]:
+            del archives[name]
+        aggregates = new_aggregates()
+        for name in sorted(archives):
+            if archives[name]['data']:
+                merge_sejr_data(aggregates, archives[name]['data'])
+        changed_folders = [archive_dir / name for name in current]
+    else:
+        aggregates = state['aggregates']
+        for data in new_data:
+            merge_sejr_data(aggregates, data)
+        changed_folders = [archive_dir / r.name for r in new_records]
+    update_clusters(aggregates)
+
+    save_learn_state(system_path, {
+        'version': LEARN_STATE_VERSION,
+        'archives': archives,
+        'aggregates': aggregates,
+    })
 
     # Show what was extracted
-    total_learnings = sum(len(s.get('learnings', [])) for s in all_sejr_data)
-    total_reusable = sum(len(s.get('reusable', [])) for s in all_sejr_data)
-    total_improvements = sum(len(s.get('improvements', [])) for s in all_sejr_data)
-    print(f" Extracted from {len(all_sejr_data)} sejr:")
+    total_learnings = sum(len(s.get('learnings', [])) for s in new_data)
+    total_reusable = sum(len(s.get('reusable', [])) for s in new_data)
+    total_improvements = sum(len(s.get('improvements', [])) for s in new_data)
+    print(f" Extracted from {len(new_data)} new sejr ({aggregates['sejr_count']} total):")
     print(f"   • {total_learnings} learnings")
     print(f"   • {total_reusable} reusable items")
     print(f"   • {total_improvements} improvement descriptions")
     print()
 
-    # Identify patterns
-    patterns = identify_patterns(all_sejr_data)
+    # Identify patterns from the merged aggregates
+    patterns = patterns_from_aggregates(aggregates, archived_action_counts(system_path, list(current),
+                                                                           changed_folders))
 
     if patterns:
-        print(f" Identified {len(patterns)} new patterns:")
+        print(f" Identified {len(patterns)} patterns:")
         for p in patterns:
             print(f"   • {p['pattern']}")
         print()
@@ -512,6 +602,8 @@ def learn_from_completed(system_path: Path):
     else:
         print("[INFO]  No new patterns identified")
 
+    return {"new": len(new_records), "total": len(completed_sejr), "patterns": patterns}
+
 # ============================================================================
 # PS1: TEMPLATE SELVLÆRING — Templates arver visdom fra ALLE sejre
 # ============================================================================
@@ -591,9 +683,13 @@ def update_status_template_with_metrics(system_path: Path, all_sejr_data: list):
     print(f"[OK]    Historiske metrics: avg {metrics_data['historical_averages']['total']}/30 fra {len(scores)} sejre")
 
 
-if __name__ == "__main__":
-    system_path = Path(__file__).parent.parent
-    learn_from_completed(system_path)
+def run_learning(system_path: Path, full: bool = False) -> dict:
+    """Learn from the archive and refresh templates (what the CLI does).
+
+    Called in-process by auto_archive after each archive. Returns the
+    learn_from_completed result.
+    """
+    result = learn_from_completed(system_path, full=full)
 
     # PS1: Opdater templates med patterns
     patterns_file = system_path / "_CURRENT" / "PATTERNS.json"
@@ -605,3 +701,17 @@ if __name__ == "__main__":
                 update_templates_with_learnings(system_path, all_patterns)
         except Exception as e:
             print(f"[WARN]  Template update failed: {e}")
+    return result
+
+
+def main(argv=None) -> dict:
+    """Command-line entry point; also called in-process by script_jobs."""
+    parser = argparse.ArgumentParser(description="Learn patterns from archived sejr (incremental)")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore LEARN_STATE.json and re-learn from all archives")
+    args = parser.parse_args(argv)
+    return run_learning(Path(__file__).parent.parent, full=args.full)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,14 @@ import json
 import sys
 import yaml
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 from yaml_utils import parse_yaml_simple
+from event_store import get_event_store  # Cross-sejr activity store
+
+IDLE_DAYS = 3  # Active sejr without logged activity this long need a nudge
 
 
 def load_patterns(system_path: Path):
@@ -41,7 +45,8 @@ def scan_current_state(system_path: Path):
         return {
             'active_sejr_count': 0,
             'status_distribution': {},
-            'needs_attention': []
+            'needs_attention': [],
+            'idle': []
         }
 
     sejr_folders = [f for f in active_dir.iterdir() if f.is_dir()]
@@ -69,9 +74,18 @@ def scan_current_state(system_path: Path):
     return {
         'active_sejr_count': len(sejr_folders),
         'status_distribution': status_counts,
-        'needs_attention': needs_attention
+        'needs_attention': needs_attention,
+        'idle': find_idle_sejr(system_path, [f.name for f in sejr_folders])
     }
 
+def find_idle_sejr(system_path: Path, names: list) -> list:
+    """Active sejr with no logged activity for IDLE_DAYS (one indexed query)"""
+    store = get_event_store(system_path)
+    store.sync(("10_ACTIVE",))
+    last_seen = store.last_activity(sejrs=names)
+    cutoff = (datetime.now() - timedelta(days=IDLE_DAYS)).isoformat()
+    return sorted(name for name in names if last_seen.get(name, '') < cutoff)
+
 def generate_predictions(patterns_data: dict, current_state: dict):
     """Generate AI-driven predictions for next steps"""
     predictions = {
@@ -125,7 +139,16 @@ def generate_predictions(patterns_data: dict, current_state: dict):
                 'suggestion': 'Apply learned optimizations to avoid repeated mistakes'
             })
 
-    # Prediction 3: Maintenance suggestions
+    # Prediction 3: Based on logged activity
+    if current_state.get('idle'):
+        predictions['insights'].append({
+            'type': 'activity',
+            'insight': f'{len(current_state["idle"])} active sejr without activity for {IDLE_DAYS}+ days: '
+                       + ', '.join(current_state['idle'][:3]),
+            'suggestion': 'Finish, archive or drop stalled sejr'
+        })
+
+    # Prediction 4: Maintenance suggestions
     if current_state['active_sejr_count'] > 3:
         predictions['insights'].append({
             'type': 'maintenance',
@@ -215,6 +238,7 @@ def run_prediction(system_path: Path):
     print(f"[DATA] Current state:")
     print(f"   Active sejr: {current_state['active_sejr_count']}")
     print(f"   Needs attention: {len(current_state['needs_attention'])}")
+    print(f"   Idle ({IDLE_DAYS}+ days): {len(current_state['idle'])}")
     print(f"   Learned patterns: {len(patterns_data.get('learned_patterns', []))}\n")
 
     # Generate predictions
@@ -224,7 +248,11 @@ def run_prediction(system_path: Path):
     update_next_md(system_path, predictions)
 
     print(f"\n[OK] Predictions generated and saved to _CURRENT/NEXT.md")
+    return predictions
+
+def main(argv=None) -> dict:
+    """Command-line entry point; also called in-process by script_jobs (returns the predictions)."""
+    return run_prediction(Path(__file__).parent.parent)
 
 if __name__ == "__main__":
-    system_path = Path(__file__).parent.parent
-    run_prediction(system_path)
+    main()
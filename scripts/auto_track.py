@@ -6,7 +6,6 @@ Part of SEJR LISTE SYSTEM - DNA Layer 2 (SELF-DOCUMENTING)
 INGEN EXTERNAL DEPENDENCIES - Kun Python standard library
 """
 
-import json
 import sys
 import yaml
 from pathlib import Path
@@ -14,7 +13,9 @@ from datetime import datetime
 from collections import defaultdict
 
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 from yaml_utils import parse_yaml_simple
+from log_tail import last_json  # Reads the last line without loading the whole log
 
 
 def scan_active_sejr(system_path: Path):
@@ -38,12 +39,7 @@ def scan_active_sejr(system_path: Path):
 
         # Read AUTO_LOG.jsonl to get latest actions
         log_file = sejr_folder / "AUTO_LOG.jsonl"
-        latest_action = None
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                if lines:
-                    latest_action = json.loads(lines[-1])
+        latest_action = last_json(log_file) if log_file.exists() else None
 
         sejr_data.append({
             'name': sejr_folder.name,
@@ -179,21 +175,30 @@ def rebuild_state(system_path: Path):
     update_delta_md(system_path)
 
     print(f"\n[OK] State rebuilt - found {len(sejr_data)} active sejr")
+    return sejr_data
 
-if __name__ == "__main__":
+def main(argv=None) -> list:
+    """Command-line entry point; also called in-process by script_jobs.
+
+    Returns the scanned sejr data (one dict per active sejr).
+    """
     import argparse
 
     parser = argparse.ArgumentParser(description="Auto-track sejr liste state")
     parser.add_argument("--rebuild-state", action="store_true",
                        help="Rebuild STATE.md from scratch")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     system_path = Path(__file__).parent.parent
 
     if args.rebuild_state:
-        rebuild_state(system_path)
-    else:
-        # Default: update state
-        sejr_data = scan_active_sejr(system_path)
-        update_state_md(system_path, sejr_data)
-        print("[OK] State tracking updated")
+        return rebuild_state(system_path)
+
+    # Default: update state
+    sejr_data = scan_active_sejr(system_path)
+    update_state_md(system_path, sejr_data)
+    print("[OK] State tracking updated")
+    return sejr_data
+
+if __name__ == "__main__":
+    main()
@@ -14,24 +14,26 @@ REGEL: Kan IKKE arkiveres før alle 3 passes er gennemført og verificeret.
 """
 
 import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
 import subprocess
-import re
 import sys
-import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
 sys.path.insert(0, str(Path(__file__).parent))
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from yaml_utils import parse_yaml_simple
-from checkbox_utils import count_checkboxes  # Centralized — no more duplicates
+from yaml_utils import parse_yaml_simple, write_yaml
+from sejr_parser import SejrDocument, parse_sejr  # Single-pass parser
+from sejr_delta import get_delta_engine  # Incremental checkbox deltas
 
 
-def write_yaml_simple(filepath: Path, data: dict):
-    """Write YAML using PyYAML (preserves nested structures)."""
-    header = f"# STATUS.yaml - Auto-generated by auto_verify.py\n# Last updated: {datetime.now(timezone.utc).astimezone().isoformat()}\n\n"
-    yaml_content = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False, width=120)
-    filepath.write_text(header + yaml_content, encoding="utf-8")
+# Timestamps refreshed on every run — not a reason to rewrite STATUS.yaml
+STATUS_VOLATILE_KEYS = ("meta.last_updated", "last_verification")
 
 
 # ============================================================================
@@ -41,204 +43,53 @@ def write_yaml_simple(filepath: Path, data: dict):
 def detect_current_pass(content: str) -> int:
     """Detect which pass is currently active based on checkbox completion.
 
-    Supports BOTH formats:
+    Supports BOTH formats (see sejr_parser for the region rules):
     - Emoji: #  PASS 1: (from generate_sejr.py)
     - Plain: ## PASS 1: FUNGERENDE (manually created)
     """
-    # Check Pass 1 completion (try emoji format first, then plain)
-    pass1_section = extract_section_flexible(content, pass_num=1)
-    pass1_done, pass1_total = count_checkboxes(pass1_section)
-
-    # Check Pass 1 Review
-    pass1_review = extract_section_flexible(content, pass_num=1, review=True)
-    pass1_review_done, pass1_review_total = count_checkboxes(pass1_review)
-
-    # Check Pass 2 completion
-    pass2_section = extract_section_flexible(content, pass_num=2)
-    pass2_done, pass2_total = count_checkboxes(pass2_section)
-
-    # Check Pass 2 Review
-    pass2_review = extract_section_flexible(content, pass_num=2, review=True)
-    pass2_review_done, pass2_review_total = count_checkboxes(pass2_review)
-
-    # Check Pass 3 completion
-    pass3_section = extract_section_flexible(content, pass_num=3)
-    pass3_done, pass3_total = count_checkboxes(pass3_section)
-
-    # Determine current pass
-    if pass1_total > 0 and pass1_done < pass1_total:
-        return 1
-    elif pass1_review_total > 0 and pass1_review_done < pass1_review_total:
-        return 1  # Still in review phase of pass 1
-    elif pass2_total > 0 and pass2_done < pass2_total:
-        return 2
-    elif pass2_review_total > 0 and pass2_review_done < pass2_review_total:
-        return 2  # Still in review phase of pass 2
-    elif pass3_total > 0 and pass3_done < pass3_total:
-        return 3
-    elif pass3_done == pass3_total and pass3_total > 0:
-        return 3  # Pass 3 complete
-
-    return 1  # Default to pass 1
-
-
-def extract_section(content: str, start_marker: str, end_marker: str) -> str:
-    """Extract a section of content between markers."""
-    start_idx = content.find(start_marker)
-    end_idx = content.find(end_marker)
-
-    if start_idx == -1:
-        return ""
-    if end_idx == -1:
-        end_idx = len(content)
-
-    return content[start_idx:end_idx]
+    return parse_sejr(content).current_pass()
+
+
+def _pass_result(doc: SejrDocument, pass_num: int) -> dict:
+    """Checkbox/score summary for one pass (review blocks are NOT counted)."""
+    done, total = doc.pass_counts(pass_num)
+    return {
+        "checkboxes_done": done,
+        "checkboxes_total": total,
+        "completion_pct": (done / total * 100) if total > 0 else 0,
+        "score": doc.score(pass_num),
+        "complete": done == total and total > 0,
+    }
 
 
-def extract_section_flexible(content: str, pass_num: int, review: bool = False) -> str:
-    """Extract pass section supporting BOTH emoji and plain formats.
+def verify_pass_progress(sejr_path: Path, doc: SejrDocument = None) -> dict:
+    """Verify progress across all 3 passes.
 
-    Emoji format (generate_sejr.py): # 🥉 PASS 1:
-    Plain format (manual): ## PASS 1: FUNGERENDE
-    Review format: ## PASS 1 REVIEW / # 🔍 PASS 1 →
+    Args:
+        sejr_path: Sejr folder containing SEJR_LISTE.md
+        doc: Already parsed document, e.g. DeltaResult.doc (skips the file)
     """
-    PASS_EMOJI = {1: "🥉", 2: "🥈", 3: "🥇"}
-    NEXT_PASS = {1: 2, 2: 3, 3: None}
-
-    if review:
-        # Try emoji review markers first
-        start_markers = [
-            f"# 🔍 PASS {pass_num} →",
-            f"## PASS {pass_num} REVIEW",
-        ]
-        next_num = NEXT_PASS.get(pass_num)
-        if next_num:
-            end_markers = [
-                f"# {PASS_EMOJI.get(next_num, '')} PASS {next_num}:",
-                f"## PASS {next_num}:",
-            ]
-        else:
-            end_markers = [
-                "# 📦 SEMANTISK KONKLUSION",
-                "## SEMANTISK KONKLUSION",
-                "## VERIFIKATION",
-            ]
-    else:
-        # Try emoji section markers first, then plain
-        emoji = PASS_EMOJI.get(pass_num, "")
-        start_markers = [
-            f"# {emoji} PASS {pass_num}:",
-            f"## PASS {pass_num}:",
-        ]
-        # End at review section or next pass
-        end_markers = [
-            f"# 🔍 PASS {pass_num} →",
-            f"## PASS {pass_num} REVIEW",
-        ]
-
-    # Try each start marker
-    for start_m in start_markers:
-        start_idx = content.find(start_m)
-        if start_idx != -1:
-            # Find nearest end marker
-            best_end = len(content)
-            for end_m in end_markers:
-                end_idx = content.find(end_m, start_idx + len(start_m))
-                if end_idx != -1 and end_idx < best_end:
-                    best_end = end_idx
-            return content[start_idx:best_end]
-
-    return ""
-
-
-def extract_score(content: str, pass_num: int, checkboxes_done: int = 0, checkboxes_total: int = 0) -> int:
-    """Extract score for a specific pass. Auto-calculates from completion if not explicit."""
-    # First try to find explicit score in content
-    patterns = [
-        rf'PASS {pass_num} SCORE:\s*(\d+)/10',
-        rf'Pass {pass_num}.*?(\d+)/10',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-
-    # AUTO-CALCULATE score based on checkbox completion (0-10 scale)
-    if checkboxes_total > 0:
-        completion_pct = checkboxes_done / checkboxes_total
-        # Score = completion percentage * 10, rounded
-        return round(completion_pct * 10)
-
-    return 0
-
-
-def verify_pass_progress(sejr_path: Path) -> dict:
-    """Verify progress across all 3 passes."""
-    sejr_file = sejr_path / "SEJR_LISTE.md"
-
-    if not sejr_file.exists():
-        return {"error": "SEJR_LISTE.md not found"}
-
-    content = sejr_file.read_text(encoding="utf-8")
+    if doc is None:
+        # Delta engine: unchanged files are not re-read, edits are applied incrementally
+        doc = get_delta_engine().update(sejr_path).doc
+        if doc is None:
+            return {"error": "SEJR_LISTE.md not found"}
 
-    # Detect current pass
-    current_pass = detect_current_pass(content)
-
-    # Count checkboxes for each pass
     results = {
-        "current_pass": current_pass,
-        "pass_1": {},
-        "pass_2": {},
-        "pass_3": {},
+        "current_pass": doc.current_pass(),
+        "pass_1": _pass_result(doc, 1),
+        "pass_2": _pass_result(doc, 2),
+        "pass_3": _pass_result(doc, 3),
         "can_archive": False,
     }
-
-    # Pass 1 analysis (flexible: supports BOTH emoji and plain format)
-    pass1_content = extract_section_flexible(content, pass_num=1)
-    p1_done, p1_total = count_checkboxes(pass1_content)
-    p1_score = extract_score(content, 1, p1_done, p1_total)
-    results["pass_1"] = {
-        "checkboxes_done": p1_done,
-        "checkboxes_total": p1_total,
-        "completion_pct": (p1_done / p1_total * 100) if p1_total > 0 else 0,
-        "score": p1_score,
-        "complete": p1_done == p1_total and p1_total > 0,
-    }
-
-    # Pass 2 analysis (flexible format)
-    pass2_content = extract_section_flexible(content, pass_num=2)
-    p2_done, p2_total = count_checkboxes(pass2_content)
-    p2_score = extract_score(content, 2, p2_done, p2_total)
-    results["pass_2"] = {
-        "checkboxes_done": p2_done,
-        "checkboxes_total": p2_total,
-        "completion_pct": (p2_done / p2_total * 100) if p2_total > 0 else 0,
-        "score": p2_score,
-        "complete": p2_done == p2_total and p2_total > 0,
-        "improved_from_pass1": p2_score >= p1_score if p2_score > 0 and p1_score > 0 else None,
-    }
-
-    # Pass 3 analysis (flexible format)
-    pass3_content = extract_section_flexible(content, pass_num=3)
-    p3_done, p3_total = count_checkboxes(pass3_content)
-    p3_score = extract_score(content, 3, p3_done, p3_total)
-    results["pass_3"] = {
-        "checkboxes_done": p3_done,
-        "checkboxes_total": p3_total,
-        "completion_pct": (p3_done / p3_total * 100) if p3_total > 0 else 0,
-        "score": p3_score,
-        "complete": p3_done == p3_total and p3_total > 0,
-        "improved_from_pass2": p3_score >= p2_score if p3_score > 0 and p2_score > 0 else None,
-    }
-
-    # Final verification check (flexible: emoji or plain markers)
-    final_section = extract_section(content, "# [OK] FINAL VERIFICATION", "# [VICTORY] SEMANTISK KONKLUSION")
-    if not final_section:
-        final_section = extract_section(content, "## VERIFIKATION", "## SEMANTISK KONKLUSION")
-    if not final_section:
-        final_section = extract_section(content, "## VERIFIKATION", "---\n\n*Oprettet")
-    final_done, final_total = count_checkboxes(final_section)
+    p1_score = results["pass_1"]["score"]
+    p2_score = results["pass_2"]["score"]
+    p3_score = results["pass_3"]["score"]
+    results["pass_2"]["improved_from_pass1"] = p2_score >= p1_score if p2_score > 0 and p1_score > 0 else None
+    results["pass_3"]["improved_from_pass2"] = p3_score >= p2_score if p3_score > 0 and p2_score > 0 else None
+
+    # Final verification (## VERIFIKATION / # [OK] FINAL VERIFICATION block)
+    final_done, final_total = doc.final_counts()
     results["final_verification"] = {
         "done": final_done,
         "total": final_total,
@@ -455,57 +306,184 @@ def run_verification(sejr_path: Path):
     status['completion_percentage'] = completion_pct
     status['status'] = status_label
 
-    write_yaml_simple(status_file, status)
-    print(f"[OK] Status updated: {status_file}")
+    if write_yaml(status_file, status, header="STATUS.yaml - Auto-generated by auto_verify.py",
+                  ignore_keys=STATUS_VOLATILE_KEYS):
+        print(f"[OK] Status updated: {status_file}")
+    else:
+        print(f"[OK] Status unchanged: {status_file}")
 
     return results['can_archive']
 
 
-def verify_all(system_path: Path):
-    """Verify all active sejr lister."""
+# ============================================================================
+# VERIFY CACHE + PARALLEL --all
+# ============================================================================
+
+VERIFY_CACHE_FILE = "VERIFY_CACHE.json"  # In _CURRENT/ — content hashes per sejr
+
+
+def _file_hash(path: Path) -> str:
+    """SHA-256 of a file's bytes, or '' if it does not exist."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+# Part of every cache entry: editing the verifier or the parser it scores with
+# invalidates all cached results instead of serving ones computed by old code
+VERIFIER_VERSION = hashlib.sha256("".join(
+    _file_hash(path) for path in (Path(__file__), Path(__file__).parent.parent / "sejr_parser.py")
+).encode()).hexdigest()[:16]
+
+
+def _load_verify_cache(system_path: Path) -> dict:
+    cache_file = system_path / "_CURRENT" / VERIFY_CACHE_FILE
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_verify_cache(system_path: Path, cache: dict):
+    cache_file = system_path / "_CURRENT" / VERIFY_CACHE_FILE
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _verify_one(sejr_path: str, capture: bool = False) -> dict:
+    """Verify one sejr and return its result plus post-run content hashes.
+
+    Top-level so ProcessPoolExecutor can pickle it. With capture=True the
+    printed report is returned instead of printed (keeps --jobs output ordered).
+    """
+    path = Path(sejr_path)
+    buffer = io.StringIO()
+    if capture:
+        with contextlib.redirect_stdout(buffer):
+            can_archive = run_verification(path)
+    else:
+        can_archive = run_verification(path)
+    return {
+        "name": path.name,
+        "can_archive": bool(can_archive),
+        "output": buffer.getvalue(),
+        "sejr_hash": _file_hash(path / "SEJR_LISTE.md"),
+        "status_hash": _file_hash(path / "STATUS.yaml"),
+    }
+
+
+def verify_all(system_path: Path, jobs: int = 1, use_cache: bool = True):
+    """Verify all active sejr lister.
+
+    Args:
+        system_path: Root of the sejrliste system
+        jobs: Number of worker processes (1 = serial, as before)
+        use_cache: Skip sejrs whose SEJR_LISTE.md and STATUS.yaml are
+            byte-identical to the last verification by the same VERIFIER_VERSION
+            (no STATUS.yaml rewrite)
+
+    Returns:
+        {"results": {name: {"can_archive", "cached"}}, "ready_to_archive": [names]}
+    """
     active_dir = system_path / "10_ACTIVE"
+    summary = {"results": {}, "ready_to_archive": []}
 
     if not active_dir.exists():
         print("[FAIL] No 10_ACTIVE directory found")
-        return
+        return summary
 
-    sejr_folders = [f for f in active_dir.iterdir() if f.is_dir()]
+    sejr_folders = sorted(f for f in active_dir.iterdir() if f.is_dir())
 
     if not sejr_folders:
         print("[INFO] No active sejr lister found in 10_ACTIVE/")
-        return
+        return summary
 
     print(f"Found {len(sejr_folders)} active sejr lister\n")
     print("=" * 60)
 
-    ready_to_archive = []
+    cache = _load_verify_cache(system_path) if use_cache else {}
+    results = {}
+    pending = []
     for sejr_path in sejr_folders:
-        if run_verification(sejr_path):
-            ready_to_archive.append(sejr_path.name)
-        print("=" * 60)
-
+        entry = cache.get(sejr_path.name)
+        if (entry and entry.get("sejr_hash") and entry.get("verifier") == VERIFIER_VERSION
+                and entry["sejr_hash"] == _file_hash(sejr_path / "SEJR_LISTE.md")
+                and entry.get("status_hash") == _file_hash(sejr_path / "STATUS.yaml")):
+            results[sejr_path.name] = entry
+        else:
+            pending.append(sejr_path)
+
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            for result in pool.map(_verify_one, [str(p) for p in pending], [True] * len(pending)):
+                print(result["output"], end="")
+                print("=" * 60)
+                results[result["name"]] = result
+    else:
+        for sejr_path in pending:
+            result = _verify_one(str(sejr_path))
+            print("=" * 60)
+            results[result["name"]] = result
+
+    skipped = len(sejr_folders) - len(pending)
+    if skipped:
+        print(f"[CACHE] {skipped} uaendrede sejr sprunget over (STATUS.yaml ikke omskrevet)")
+
+    new_cache = {}
+    for name, result in results.items():
+        if result.get("sejr_hash"):
+            new_cache[name] = {k: result[k] for k in ("sejr_hash", "status_hash", "can_archive")}
+            new_cache[name]["verifier"] = VERIFIER_VERSION
+    if new_cache != cache:
+        _save_verify_cache(system_path, new_cache)
+
+    ready_to_archive = [f.name for f in sejr_folders if results.get(f.name, {}).get("can_archive")]
     if ready_to_archive:
         print(f"\n[OK] READY TO ARCHIVE ({len(ready_to_archive)}):")
         for name in ready_to_archive:
             print(f"   • {name}")
         print(f"\nArchive with: python scripts/auto_archive.py --sejr <name>")
 
+    pending_names = {p.name for p in pending}
+    summary["results"] = {
+        f.name: {"can_archive": bool(results.get(f.name, {}).get("can_archive")),
+                 "cached": f.name not in pending_names}
+        for f in sejr_folders
+    }
+    summary["ready_to_archive"] = ready_to_archive
+    return summary
 
-if __name__ == "__main__":
+
+def main(argv=None) -> dict:
+    """Command-line entry point; also called in-process by script_jobs (same result as verify_all)."""
     parser = argparse.ArgumentParser(description="Auto-verify sejr liste with 3-PASS system")
     parser.add_argument("--sejr", help="Specific sejr folder name to verify")
     parser.add_argument("--all", action="store_true", help="Verify all active sejr lister")
-    args = parser.parse_args()
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Parallel worker processes for --all (0 = one per CPU)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-verify every sejr even if nothing changed")
+    args = parser.parse_args(argv)
 
     system_path = Path(__file__).parent.parent
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
-    if args.all:
-        verify_all(system_path)
-    elif args.sejr:
-        sejr_path = system_path / "10_ACTIVE" / args.sejr
-        if sejr_path.exists():
-            run_verification(sejr_path)
-        else:
-            print(f"[FAIL] Sejr folder not found: {sejr_path}")
-    else:
-        verify_all(system_path)
+    if args.all or not args.sejr:
+        return verify_all(system_path, jobs=jobs, use_cache=not args.no_cache)
+
+    sejr_path = system_path / "10_ACTIVE" / args.sejr
+    if not sejr_path.exists():
+        print(f"[FAIL] Sejr folder not found: {sejr_path}")
+        return {"results": {}, "ready_to_archive": []}
+    can_archive = bool(run_verification(sejr_path))
+    return {"results": {args.sejr: {"can_archive": can_archive, "cached": False}},
+            "ready_to_archive": [args.sejr] if can_archive else []}
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,8 @@ Fra: HOW TO USE A CLAUDE OPUS/06_AUTOMATION_PIPELINE.md
 Tilpasset til lokalt system (ingen Docker, ingen API keys nødvendige).
 """
 
+import ast
+import py_compile
 import subprocess
 import sys
 import os
@@ -27,25 +29,58 @@ RESET = "\033[0m"
 BOLD = "\033[1m"
 
 
+def check_syntax(filepath):
+    """Syntax check i processen (samme som python3 -m py_compile)."""
+    try:
+        py_compile.compile(filepath, doraise=True)
+    except py_compile.PyCompileError as e:
+        return False, str(e)
+    return True, ""
+
+
+def code_metrics(filepath):
+    """Linjer, funktioner og klasser — parset i processen."""
+    with open(filepath, 'r') as f:
+        source = f.read()
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as e:
+        return False, str(e)
+    funcs = [n for n in ast.walk(tree) if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    classes = [n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)]
+    return True, (f"{source.count(chr(10))} {filepath}\n---\n"
+                  f"Functions: {len(funcs)}\nClasses: {len(classes)}\n")
+
+
 def run_step(name, cmd, cwd=None):
-    """Kør et pipeline step og returnér resultat."""
+    """Kør et pipeline step og returnér resultat.
+
+    cmd er enten en shell-kommando (køres som subprocess) eller en
+    funktion uden argumenter der køres i processen og returnerer
+    (ok, output) — uden at starte en ny python3.
+    """
     print(f"\n{BLUE}{'='*60}{RESET}")
     print(f"{BOLD}Step: {name}{RESET}")
     print(f"{BLUE}{'='*60}{RESET}")
 
     try:
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True,  # nosec B602
-            timeout=60, cwd=cwd
-        )
+        if callable(cmd):
+            ok, stdout = cmd()
+            returncode, stderr = (0 if ok else 1), ""
+        else:
+            result = subprocess.run(
+                cmd, shell=True, capture_output=True, text=True,  # nosec B602
+                timeout=60, cwd=cwd
+            )
+            returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
 
-        if result.returncode == 0:
+        if returncode == 0:
             print(f"{GREEN}[OK] {name}: PASSED{RESET}")
-            if result.stdout.strip():
-                print(result.stdout[:500])
-            return {"status": "pass", "output": result.stdout, "errors": 0}
+            if stdout.strip():
+                print(stdout[:500])
+            return {"status": "pass", "output": stdout, "errors": 0}
         else:
-            output = result.stdout + result.stderr
+            output = stdout + stderr
             error_count = output.count('\n')
             print(f"{YELLOW}[WARN]  {name}: {error_count} issues{RESET}")
             if output.strip():
@@ -183,7 +218,7 @@ def main():
     # Step 1: Syntax check (ALTID)
     results["Syntax Check"] = run_step(
         "Syntax Check",
-        f"python3 -m py_compile '{filepath}'"
+        lambda: check_syntax(filepath)
     )
 
     # Step 2: Linting (ALTID)
@@ -202,11 +237,7 @@ def main():
         # Step 4: Line count + complexity
         results["Code Metrics"] = run_step(
             "Code Metrics",
-            f"wc -l '{filepath}' && echo '---' && "
-            f"python3 -c \"import ast; tree = ast.parse(open('{filepath}').read()); "
-            f"funcs = [n for n in ast.walk(tree) if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]; "
-            f"classes = [n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)]; "
-            f"print(f'Functions: {{len(funcs)}}'); print(f'Classes: {{len(classes)}}')\""
+            lambda: code_metrics(filepath)
         )
 
     # Step 5: Ollama code review (valgfrit)
@@ -18,121 +18,66 @@ import sys
 import yaml
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 from yaml_utils import parse_yaml_simple
+from sejr_parser import SejrDocument, parse_sejr_file  # Single-pass parser
 
 
-def extract_task_name(sejr_file: Path) -> str:
-    """Extract the actual task name from SEJR_LISTE.md."""
-    if not sejr_file.exists():
-        return "Ukendt opgave"
+def _load_doc(sejr_file: Path, doc: Optional[SejrDocument]) -> Optional[SejrDocument]:
+    """Reuse an already parsed document, else parse the file once."""
+    return doc if doc is not None else parse_sejr_file(sejr_file)
 
-    content = sejr_file.read_text(encoding="utf-8")
 
-    # Find title line
-    for line in content.split("\n"):
-        if line.startswith("# SEJR:"):
-            return line.replace("# SEJR:", "").strip()
+def extract_task_name(sejr_file: Path, doc: Optional[SejrDocument] = None) -> str:
+    """Extract the actual task name from SEJR_LISTE.md."""
+    doc = _load_doc(sejr_file, doc)
+    if doc is None:
+        return "Ukendt opgave"
 
-    return sejr_file.parent.name
+    # Title line (# SEJR: ...)
+    return doc.title or sejr_file.parent.name
 
 
-def extract_next_unchecked(sejr_file: Path) -> dict:
+def extract_next_unchecked(sejr_file: Path, doc: Optional[SejrDocument] = None) -> dict:
     """Find the SPECIFIC next unchecked checkbox with context."""
-    if not sejr_file.exists():
+    doc = _load_doc(sejr_file, doc)
+    if doc is None:
         return {"task": "Aabn SEJR_LISTE.md", "section": "Unknown", "line": 0}
 
-    content = sejr_file.read_text(encoding="utf-8")
-    lines = content.split("\n")
-
-    current_section = "Unknown"
-    current_pass = "Unknown"
-
-    for i, line in enumerate(lines, 1):
-        # Track sections
-        if line.startswith("# "):
-            if "PASS 1" in line:
-                current_pass = "Pass 1"
-            elif "PASS 2" in line:
-                current_pass = "Pass 2"
-            elif "PASS 3" in line:
-                current_pass = "Pass 3"
-
-        if line.startswith("## "):
-            current_section = line.replace("## ", "").strip()
-        elif line.startswith("### "):
-            current_section = line.replace("### ", "").strip()
-
-        # Find unchecked checkbox
-        if re.match(r'^- \[ \]', line.strip()):
-            task = line.strip()[6:].strip()
-            # Clean up task text
-            task = re.sub(r'\s+', ' ', task)
-            if len(task) > 100:
-                task = task[:100] + "..."
-
-            return {
-                "task": task,
-                "section": current_section,
-                "pass": current_pass,
-                "line": i
-            }
-
-    return {"task": "Alle checkboxes afkrydsede", "section": "Done", "line": 0}
-
-
-def count_checkboxes_by_pass(sejr_file: Path) -> dict:
-    """Count checkboxes for each pass (excluding REVIEW sections).
-
-    IMPORTANT: This must match auto_verify.py's counting method.
-    REVIEW sections are NOT counted as part of the pass.
-    This prevents discrepancy between build_claude_context.py and auto_verify.py.
-    Fixed: 2026-01-29 (Rule -44 enforcement)
-    """
-    if not sejr_file.exists():
-        return {}
+    checkbox = doc.next_unchecked()
+    if checkbox is None:
+        return {"task": "Alle checkboxes afkrydsede", "section": "Done", "line": 0}
 
-    content = sejr_file.read_text(encoding="utf-8")
+    # Clean up task text
+    task = re.sub(r'\s+', ' ', checkbox.text)
+    if len(task) > 100:
+        task = task[:100] + "..."
 
-    result = {
-        "pass_1": {"done": 0, "total": 0},
-        "pass_2": {"done": 0, "total": 0},
-        "pass_3": {"done": 0, "total": 0},
+    return {
+        "task": task,
+        "section": checkbox.section or "Unknown",
+        "pass": f"Pass {checkbox.pass_num}" if checkbox.pass_num else "Unknown",
+        "line": checkbox.line
     }
 
-    current_pass = None
-
-    for line in content.split("\n"):
-        if line.startswith("#"):
-            upper = line.upper()
-            # Calculate heading level (# = 1, ## = 2, ### = 3)
-            heading_level = 0
-            while heading_level < len(line) and line[heading_level] == '#':
-                heading_level += 1
-            is_main = heading_level <= 2  # Only ## or # level stops counting
-
-            # Stop counting at REVIEW, VERIFIKATION, or KONKLUSION (main sections only)
-            if "REVIEW" in upper and is_main:
-                current_pass = None
-            elif ("VERIFIKATION" in upper or "VERIFICATION" in upper) and is_main:
-                current_pass = None
-            elif "SEMANTISK KONKLUSION" in upper:
-                current_pass = None
-            elif "PASS 1" in upper:
-                current_pass = "pass_1"
-            elif "PASS 2" in upper:
-                current_pass = "pass_2"
-            elif "PASS 3" in upper:
-                current_pass = "pass_3"
-
-        if current_pass:
-            # Use findall to handle multiple checkboxes on single line
-            done_count = len(re.findall(r'- \[[xX]\]', line))
-            undone_count = len(re.findall(r'- \[ \]', line))
-            result[current_pass]["done"] += done_count
-            result[current_pass]["total"] += done_count + undone_count
 
+def count_checkboxes_by_pass(sejr_file: Path, doc: Optional[SejrDocument] = None) -> dict:
+    """Count checkboxes for each pass (excluding REVIEW sections).
+
+    Counts come from sejr_parser — the same model auto_verify.py uses,
+    so the two scripts can no longer disagree (Rule -44 enforcement).
+    """
+    doc = _load_doc(sejr_file, doc)
+    if doc is None:
+        return {}
+
+    result = {}
+    for n in (1, 2, 3):
+        done, total = doc.pass_counts(n)
+        result[f"pass_{n}"] = {"done": done, "total": total}
     return result
 
 
@@ -198,9 +143,10 @@ def build_claude_md(sejr_path: Path) -> str:
 
     # Get actual data
     status = parse_yaml_simple(status_file)
-    task_name = extract_task_name(sejr_file)
-    next_task = extract_next_unchecked(sejr_file)
-    checkbox_counts = count_checkboxes_by_pass(sejr_file)
+    doc = parse_sejr_file(sejr_file)  # Parsed ONCE, shared by all extractors
+    task_name = extract_task_name(sejr_file, doc)
+    next_task = extract_next_unchecked(sejr_file, doc)
+    checkbox_counts = count_checkboxes_by_pass(sejr_file, doc)
     current_pass = determine_current_pass(checkbox_counts, status)
 
     # Calculate actual progress
@@ -339,12 +285,14 @@ def update_sejr(sejr_path: Path):
 
     # Also print current state
     status = parse_yaml_simple(sejr_path / "STATUS.yaml")
-    next_task = extract_next_unchecked(sejr_path / "SEJR_LISTE.md")
+    sejr_file = sejr_path / "SEJR_LISTE.md"
+    doc = parse_sejr_file(sejr_file)
+    next_task = extract_next_unchecked(sejr_file, doc)
 
     print(f"\n{'=' * 50}")
     print(f"FOCUS LOCK AKTIVERET")
     print(f"{'=' * 50}")
-    print(f"   Opgave: {extract_task_name(sejr_path / 'SEJR_LISTE.md')}")
+    print(f"   Opgave: {extract_task_name(sejr_file, doc)}")
     print(f"   Pass:   {status.get('current_pass', 1)}/3")
     print(f"   Naeste: {next_task['task'][:50]}...")
     print(f"   Score:  {status.get('total_score', 0)}/30")
@@ -156,6 +156,8 @@ def generate_sejr(name: str, system_path: Path, goal: str = None, tech: str = No
     Uses ATOMIC CREATION: All files are written to a temp directory first,
     then renamed to final location. If anything fails mid-way, no orphaned
     folder is left in 10_ACTIVE.
+
+    Returns the new sejr folder, or False if the template is missing.
     """
     import re
     import tempfile
@@ -491,10 +493,11 @@ Vi ved det virker fordi:
     print(f"\n   INGEN REDUNDANS — Alt data kun et sted!")
     print(f"{'=' * 60}\n")
 
-    return True
+    return sejr_path
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    """Command-line entry point; also called in-process by script_jobs (see generate_sejr)."""
     parser = argparse.ArgumentParser(
         description="Generate new SEJR (Streamlined - 5 files with PROJECT_BRIEF)"
     )
@@ -515,7 +518,11 @@ if __name__ == "__main__":
         "--scope",
         help="What's in scope vs out of scope (for PROJECT_BRIEF.md)"
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     system_path = Path(__file__).parent.parent
-    generate_sejr(args.name, system_path, goal=args.goal, tech=args.tech, scope=args.scope)
+    return generate_sejr(args.name, system_path, goal=args.goal, tech=args.tech, scope=args.scope)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,9 @@ import yaml
 from pathlib import Path
 from datetime import datetime, timezone
 
+sys.path.insert(0, str(Path(__file__).parent))
+from yaml_utils import write_yaml  # Write-if-changed, atomic
+
 SYSTEM_ROOT = Path(__file__).parent.parent
 ARCHIVE = SYSTEM_ROOT / "90_ARCHIVE"
 ACTIVE = SYSTEM_ROOT / "10_ACTIVE"
@@ -68,10 +71,7 @@ def migrate_status(status_path: Path) -> bool:
     data['model_tracking'] = {'models_used': [], 'sessions': []}
 
     # Write back
-    header = f"# STATUS.yaml - Unified format (migrated {now_iso})\n\n"
-    yaml_content = yaml.dump(data, default_flow_style=False, allow_unicode=True,
-                             sort_keys=False, width=120)
-    status_path.write_text(header + yaml_content, encoding="utf-8")
+    write_yaml(status_path, data, header=f"STATUS.yaml - Unified format (migrated {now_iso})")
     return True
 
 
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate clustering of short texts (learnings, patterns).
+
+REPLACES: first-50-chars dedup in auto_learn.extract_semantic_patterns
+USES: hashed TF-IDF vectors (word unigrams + character trigrams) and
+      cosine similarity. NumPy (requirements.txt) does the similarity in
+      one batched matrix product; without it a sparse pure-Python path
+      gives the same clusters.
+
+Clustering is greedy "leader" clustering in input order: the first
+unassigned text starts a cluster and takes every unassigned text whose
+similarity to it is >= threshold. No chaining, so clusters stay tight
+and the output is deterministic.
+
+Part of SEJR LISTE SYSTEM — DNA Layer 4 (SELF-IMPROVING)
+"""
+
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # Optional — pure-Python fallback below
+    np = None
+
+DIMENSIONS = 1 << 11          # Hash buckets per vector
+SIMILARITY_THRESHOLD = 0.45   # Cosine similarity for "same learning"
+BLOCK_ROWS = 512              # Rows per similarity block (bounds memory)
+
+_LIST_PREFIX = re.compile(r'^\s*(?:[-*]|\d+[.)])\s*')
+_WORD = re.compile(r'\w+')
+
+
+def normalize(text: str) -> str:
+    """Lowercase text without list numbering and markdown emphasis."""
+    text = _LIST_PREFIX.sub('', text)
+    return text.replace('*', '').replace('_', ' ').replace('`', '').lower().strip()
+
+
+def _features(text: str) -> Counter:
+    """Hashed term counts: words (len >= 2) plus their character trigrams."""
+    counts = Counter()
+    for word in _WORD.findall(normalize(text)):
+        if len(word) < 2:
+            continue
+        counts['w:' + word] += 1
+        padded = f'#{word}#'
+        for i in range(len(padded) - 2):
+            counts['c:' + padded[i:i + 3]] += 1
+    hashed = Counter()
+    for term, count in counts.items():
+        hashed[zlib.crc32(term.encode('utf-8')) % DIMENSIONS] += count
+    return hashed
+
+
+def _idf(features: list) -> dict:
+    """Smoothed inverse document frequency per bucket for this batch."""
+    n = len(features)
+    df = Counter()
+    for f in features:
+        df.update(f.keys())
+    return {bucket: math.log((1 + n) / (1 + count)) + 1 for bucket, count in df.items()}
+
+
+def tfidf_vectors(texts: list) -> list:
+    """L2-normalized sparse TF-IDF vectors ({bucket: weight}) for a batch."""
+    features = [_features(t) for t in texts]
+    idf = _idf(features)
+    vectors = []
+    for f in features:
+        vec = {b: (1 + math.log(c)) * idf[b] for b, c in f.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        vectors.append({b: v / norm for b, v in vec.items()})
+    return vectors
+
+
+def _neighbors_numpy(vectors: list, threshold: float) -> list:
+    n = len(vectors)
+    matrix = np.zeros((n, DIMENSIONS), dtype=np.float32)
+    for row, vec in enumerate(vectors):
+        if vec:
+            matrix[row, list(vec.keys())] = list(vec.values())
+    neighbors = [[] for _ in range(n)]
+    for start in range(0, n, BLOCK_ROWS):
+        block = matrix[start:start + BLOCK_ROWS] @ matrix.T
+        rows, cols = np.nonzero(block >= threshold)
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            if start + r != c:
+                neighbors[start + r].append(c)
+    return neighbors
+
+
+def _neighbors_python(vectors: list, threshold: float) -> list:
+    """Neighbors of leaders only: items already clustered are never scored again."""
+    n = len(vectors)
+    postings = {}
+    for idx, vec in enumerate(vectors):
+        for bucket, weight in vec.items():
+            postings.setdefault(bucket, []).append((idx, weight))
+    neighbors = [[] for _ in range(n)]
+    assigned = [False] * n
+    for i, vec in enumerate(vectors):
+        if assigned[i]:
+            continue
+        scores = Counter()
+        for bucket, weight in vec.items():
+            for j, other in postings[bucket]:
+                if j > i and not assigned[j]:
+                    scores[j] += weight * other
+        for j, score in scores.items():
+            if score >= threshold:
+                neighbors[i].append(j)
+                assigned[j] = True
+    return neighbors
+
+
+def cluster_texts(texts: list, threshold: float = SIMILARITY_THRESHOLD,
+                  use_numpy: Optional[bool] = None) -> list:
+    """Group near-duplicate texts.
+
+    Returns a list of clusters (lists of indices into texts), each in input
+    order, ordered by their first member. Every index appears exactly once.
+    """
+    if not texts:
+        return []
+    if use_numpy is None:
+        use_numpy = np is not None
+    vectors = tfidf_vectors(texts)
+    if use_numpy and np is not None:
+        neighbors = _neighbors_numpy(vectors, threshold)
+    else:
+        neighbors = _neighbors_python(vectors, threshold)
+
+    assigned = [False] * len(texts)
+    clusters = []
+    for leader in range(len(texts)):
+        if assigned[leader]:
+            continue
+        assigned[leader] = True
+        members = [leader]
+        for j in sorted(neighbors[leader]):
+            if not assigned[j]:
+                assigned[j] = True
+                members.append(j)
+        clusters.append(members)
+    return clusters
+
+
+def most_similar(text: str, others: list, threshold: float = SIMILARITY_THRESHOLD) -> Optional[int]:
+    """Index of the most similar text in others if it reaches threshold, else None."""
+    if not others:
+        return None
+    vectors = tfidf_vectors([text] + list(others))
+    first = vectors[0]
+    best, best_score = None, threshold
+    for idx, vec in enumerate(vectors[1:]):
+        score = sum(w * vec.get(b, 0.0) for b, w in first.items())
+        if score >= best_score:
+            best, best_score = idx, score
+    return best
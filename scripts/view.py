@@ -11,14 +11,12 @@ Brug: python view.py
 
 import os
 import sys
-import json
-import re
 from pathlib import Path
 from datetime import datetime
 
-# Import centralized YAML parser
-sys.path.insert(0, str(Path(__file__).parent))
-from yaml_utils import parse_yaml_simple
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from auto_log import latest_entries
+from sejr_daemon import load_state  # Daemon snapshot if running, else a local (cached) scan
 
 # Paths — project root is one level up from scripts/
 SCRIPT_DIR = Path(__file__).parent
@@ -30,38 +28,9 @@ def clear_screen():
     """Clear terminal screen."""
     os.system('clear' if os.name != 'nt' else 'cls')
 
-# parse_yaml_simple imported from yaml_utils (centralized PyYAML parser)
-
-def parse_checkboxes(filepath: Path) -> tuple:
-    """Parse checkboxes from SEJR_LISTE.md. Returns (done, total)."""
-    if not filepath.exists():
-        return 0, 0
-
-    content = filepath.read_text(encoding="utf-8")
-
-    # Find all checkboxes: - [x] or - [ ]
-    checked = len(re.findall(r'- \[[xX]\]', content))
-    unchecked = len(re.findall(r'- \[ \]', content))
-
-    return checked, checked + unchecked
-
 def parse_log(filepath: Path) -> list:
     """Parse AUTO_LOG.jsonl. Returns last 5 entries."""
-    if not filepath.exists():
-        return []
-
-    entries = []
-    content = filepath.read_text(encoding="utf-8")
-
-    for line in content.strip().split("\n"):
-        if line.strip():
-            try:
-                entry = json.loads(line)
-                entries.append(entry)
-            except Exception:
-                pass
-
-    return entries[-5:]  # Last 5
+    return latest_entries(filepath.parent, 5)  # Hot segment first, older segments only if needed
 
 def format_timestamp(ts: str) -> str:
     """Format timestamp to HH:MM."""
@@ -97,25 +66,18 @@ def progress_bar(done: int, total: int, width: int = 20) -> str:
     return f"{bar} {int(pct * 100)}%"
 
 def find_active_sejr() -> list:
-    """Find all active sejr folders."""
-    if not ACTIVE_DIR.exists():
-        return []
-
-    sejr_list = []
-    for d in ACTIVE_DIR.iterdir():
-        if d.is_dir() and (d / "SEJR_LISTE.md").exists():
-            sejr_list.append(d)
-
-    return sorted(sejr_list, key=lambda x: x.name, reverse=True)
+    """Records for all active sejr folders that have a SEJR_LISTE.md."""
+    records = [r for r in load_state(PROJECT_DIR)["active"] if "SEJR_LISTE.md" in r["files"]]
+    return sorted(records, key=lambda r: r["name"], reverse=True)
 
-def display_sejr(sejr_path: Path):
+def display_sejr(record: dict):
     """Display status for a single sejr with 3-PASS tracking."""
-    name = sejr_path.name
+    name = record["name"]
 
-    # Parse files
-    status = parse_yaml_simple(sejr_path / "STATUS.yaml")
-    done, total = parse_checkboxes(sejr_path / "SEJR_LISTE.md")
-    logs = parse_log(sejr_path / "AUTO_LOG.jsonl")
+    # Parsed STATUS.yaml and checkbox counts come with the record
+    status = record["status"]
+    done, total = record["checkboxes_done"], record["checkboxes_total"]
+    logs = parse_log(Path(record["path"]) / "AUTO_LOG.jsonl")
 
     # 3-PASS Status
     current_pass = status.get("current_pass", 1)
@@ -226,8 +188,8 @@ def main():
     print(f"\n [FOLDER] Fundet {len(active_sejr)} aktiv(e) sejr:\n")
 
     # Display each sejr
-    for sejr_path in active_sejr:
-        display_sejr(sejr_path)
+    for record in active_sejr:
+        display_sejr(record)
 
     # Quick commands
     print("-" * 60)
@@ -3,7 +3,8 @@
 Shared YAML utilities for all Sejrliste scripts.
 
 REPLACES: parse_yaml_simple/write_yaml_simple (buggy flat parser)
-USES: PyYAML (properly installed in venv)
+USES: PyYAML (properly installed in venv) via sejr_yaml — LibYAML
+      CSafeLoader when available + mtime-keyed cache of parsed files
 
 This module provides safe, correct YAML handling that preserves
 nested structures, lists, and all YAML features.
@@ -11,45 +12,74 @@ nested structures, lists, and all YAML features.
 Part of SEJR LISTE SYSTEM — DNA Layer 4 (SELF-IMPROVING)
 """
 
+import json
+import os
+import sys
+import tempfile
 import yaml
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import Iterable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sejr_yaml import load_yaml_file, safe_load  # Shared loader (LibYAML + cache)
 
 
 def parse_yaml(filepath: Path) -> dict:
     """Parse YAML file using PyYAML (handles nested structures correctly).
 
+    Cached in sejr_yaml: the file is only re-parsed when it changes.
+
     Args:
         filepath: Path to the YAML file
 
     Returns:
         dict: Parsed YAML content, or empty dict if file doesn't exist or is invalid
     """
-    if not filepath.exists():
-        return {}
-
-    try:
-        content = filepath.read_text(encoding="utf-8")
-        result = yaml.safe_load(content)
-        return result if isinstance(result, dict) else {}
-    except (yaml.YAMLError, UnicodeDecodeError):
-        return {}
-
-
-def write_yaml(filepath: Path, data: dict, header: str = None):
+    return load_yaml_file(Path(filepath))
+
+
+def _without_keys(data, keys: Iterable[str]):
+    """Return a shallow copy of data without the given dotted keys ("meta.last_updated")."""
+    if not isinstance(data, dict):
+        return data
+    result = dict(data)
+    nested = {}
+    for key in keys:
+        head, _, rest = key.partition(".")
+        if rest:
+            nested.setdefault(head, []).append(rest)
+        else:
+            result.pop(head, None)
+    for head, rest in nested.items():
+        if isinstance(result.get(head), dict):
+            result[head] = _without_keys(result[head], rest)
+    return result
+
+
+def write_yaml(filepath: Path, data: dict, header: str = None,
+               ignore_keys: Iterable[str] = (), timestamp: bool = True) -> bool:
     """Write YAML file using PyYAML (preserves nested structures).
 
+    Write-if-changed: the existing file is loaded and compared semantically
+    with the new data (comments and the "Last updated" line do not count).
+    Unchanged content is NOT rewritten, so mtimes — and every cache or file
+    watcher keyed on them — stay untouched. Real changes are written
+    atomically (temp file in the same directory + os.replace), so readers
+    never see a half-written file.
+
     Args:
         filepath: Path to write to
         data: Dictionary to serialize
         header: Optional comment header (without # prefix)
-    """
-    lines = []
-    if header:
-        lines.append(f"# {header}")
-    lines.append(f"# Last updated: {datetime.now(timezone.utc).astimezone().isoformat()}")
-    lines.append("")
+        ignore_keys: Dotted keys left out of the comparison, for fields that
+            change on every run (e.g. "meta.last_updated")
+        timestamp: Add the "# Last updated:" comment line
 
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    filepath = Path(filepath)
     yaml_content = yaml.dump(
         data,
         default_flow_style=False,
@@ -58,10 +88,73 @@ def write_yaml(filepath: Path, data: dict, header: str = None):
         width=120
     )
 
-    filepath.write_text(
-        "\n".join(lines) + yaml_content,
-        encoding="utf-8"
-    )
+    if filepath.exists():
+        try:
+            current = safe_load(filepath.read_text(encoding="utf-8"))
+            # Compare against what the file WILL contain (dates, key order, etc.)
+            if _without_keys(current, ignore_keys) == _without_keys(safe_load(yaml_content), ignore_keys):
+                return False
+        except (OSError, yaml.YAMLError, UnicodeDecodeError):
+            pass  # Unreadable or corrupt — overwrite it
+
+    lines = []
+    if header:
+        lines.append(f"# {header}")
+    if timestamp:
+        lines.append(f"# Last updated: {datetime.now(timezone.utc).astimezone().isoformat()}")
+    if lines:
+        lines.append("")
+
+    _atomic_write(filepath, "\n".join(lines) + yaml_content)
+    return True
+
+
+def write_json(filepath: Path, data, ignore_keys: Iterable[str] = (), indent: int = 2) -> bool:
+    """Write a JSON file with the same write-if-changed + atomic rules as write_yaml.
+
+    Args:
+        filepath: Path to write to
+        data: JSON-serializable data
+        ignore_keys: Dotted keys left out of the comparison (e.g. "system.last_learned")
+        indent: JSON indentation
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    filepath = Path(filepath)
+    content = json.dumps(data, indent=indent, ensure_ascii=False)
+
+    if filepath.exists():
+        try:
+            current = json.loads(filepath.read_text(encoding="utf-8"))
+            if _without_keys(current, ignore_keys) == _without_keys(json.loads(content), ignore_keys):
+                return False
+        except (OSError, ValueError):
+            pass  # Unreadable or corrupt — overwrite it
+
+    _atomic_write(filepath, content)
+    return True
+
+
+def _atomic_write(filepath: Path, text: str) -> None:
+    """Write text via a temp file in the same directory + os.replace (keeps the file mode)."""
+    try:
+        mode = filepath.stat().st_mode & 0o777
+    except OSError:
+        mode = 0o644
+
+    fd, tmp_name = tempfile.mkstemp(dir=str(filepath.parent), prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 # Backwards-compatible aliases
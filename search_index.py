@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+SEARCH INDEX — Persistent fuldtekst-indeks for IntelligentSearch
+================================================================
+
+WHAT: Inverteret indeks (token → fil/linje) i _CURRENT/search_index.db over
+      alle filer i 10_ACTIVE, 90_ARCHIVE og (valgfrit) INTRO-træet.
+      SQLite FTS5 giver postings, bm25-rangering og prefix-match ("verif*")
+WHY:  IntelligentSearch.search gennemløb alle mapper og læste ALLE filer ved
+      hvert tastetryk, før den sorterede og skar ned til 50 resultater.
+      Nu læses kun filer hvis (mtime, size) er ændret, og en søgning er ét
+      indeks-opslag
+WHO:  Importeret af masterpiece_en og masterpiece (IntelligentSearch)
+HOW:  from search_index import get_search_index
+      index = get_search_index(SYSTEM_PATH, intro_path=INTRO_PATH)
+      for hit in index.search("auto_verify", limit=50): print(hit.name, hit.line_num)
+      for batch in index.search_batches(query, cancelled=event.is_set): ...  # UI-tråde
+
+Rowid = (file_id << 20) | line_num, så alle linjer for én fil ligger i ét
+rowid-interval og kan slettes uden fuld tabel-scan. Linje 0 er filnavnet.
+Uden FTS5 i sqlite3 er ``available`` False, og kalderen søger som før.
+
+Version: 3.0.0
+"""
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+INDEX_FILENAME = "search_index.db"
+SCHEMA_VERSION = 1
+
+LINE_BITS = 20
+MAX_LINES = (1 << LINE_BITS) - 1
+CONTENT_SUFFIXES = (".md", ".yaml", ".txt", ".py", ".jsonl")
+SEJR_DIRS = ("10_ACTIVE", "90_ARCHIVE")
+INTRO_OWNER = "INTRO SYSTEM"
+REFRESH_INTERVAL = 2.0  # Seconds between stat-walks triggered by search()
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+@dataclass
+class SearchHit:
+    """One matching line (line_num 0 = file or folder name)."""
+    owner: str        # Sejr folder name, or INTRO_OWNER
+    kind: str         # folder | file | log | intro
+    path: str
+    name: str
+    line_num: int
+    text: str
+    rank: float       # bm25 (lower is better)
+
+
+def _signature(st) -> str:
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def build_match_query(query: str) -> str:
+    """FTS5 MATCH expression: every query token as a quoted prefix term."""
+    tokens = _TOKEN_RE.findall(query.lower())
+    return " ".join(f'"{t}"*' for t in tokens)
+
+
+class SearchIndex:
+    """Incrementally maintained FTS5 index over sejr and INTRO files."""
+
+    def __init__(self, system_path: Path, db_path: Optional[Path] = None,
+                 intro_path: Optional[Path] = None):
+        self.system_path = Path(system_path)
+        self.db_path = Path(db_path) if db_path else self.system_path / "_CURRENT" / INDEX_FILENAME
+        self.intro_path = Path(intro_path) if intro_path else None
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._failed = False
+        self._files: Dict[str, Tuple[int, str]] = {}           # path -> (id, signature)
+        self._meta: Dict[int, Tuple[str, str, str, str]] = {}  # id -> (owner, kind, path, name)
+        self._next_id = 1
+        self._last_refresh = 0.0
+        self.index_count = 0  # Files (re)indexed by this process (for diagnostics)
+
+    # -- database -----------------------------------------------------------
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._failed:
+            return self._conn
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute("DROP TABLE IF EXISTS lines")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                " id INTEGER PRIMARY KEY,"
+                " path TEXT UNIQUE NOT NULL,"
+                " owner TEXT NOT NULL,"
+                " kind TEXT NOT NULL,"
+                " name TEXT NOT NULL,"
+                " signature TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS lines USING fts5("
+                "text, tokenize = 'unicode61 remove_diacritics 0')"
+            )
+            conn.commit()
+            for file_id, path, owner, kind, name, signature in conn.execute(
+                    "SELECT id, path, owner, kind, name, signature FROM files"):
+                self._files[path] = (file_id, signature)
+                self._meta[file_id] = (owner, kind, path, name)
+                self._next_id = max(self._next_id, file_id + 1)
+            self._conn = conn
+        except sqlite3.Error:
+            self._failed = True
+            self._conn = None
+        return self._conn
+
+    @property
+    def available(self) -> bool:
+        """False if the database (or FTS5) cannot be used."""
+        with self._lock:
+            return self._db() is not None
+
+    # -- indexing -----------------------------------------------------------
+
+    def _walk(self) -> Iterator[Tuple[Path, str, str, str]]:
+        """Yield (path, owner, kind, signature) for everything searchable."""
+        for dirname in SEJR_DIRS:
+            root = self.system_path / dirname
+            if not root.is_dir():
+                continue
+            for folder in root.iterdir():
+                if folder.name.startswith(".") or not folder.is_dir():
+                    continue
+                yield folder, folder.name, "folder", ""
+                for file_path in folder.iterdir():
+                    try:
+                        st = file_path.stat()
+                    except OSError:
+                        continue
+                    if file_path.is_file():
+                        kind = "log" if file_path.suffix == ".jsonl" else "file"
+                        yield file_path, folder.name, kind, _signature(st)
+
+        if self.intro_path is not None and self.intro_path.is_dir():
+            try:
+                for md_file in self.intro_path.rglob("*.md"):
+                    try:
+                        st = md_file.stat()
+                    except OSError:
+                        continue
+                    if md_file.is_file():
+                        yield md_file, INTRO_OWNER, "intro", _signature(st)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _lines(path: Path, kind: str) -> List[Tuple[int, str]]:
+        """(line_num, text) rows for a file: its name plus non-empty content lines."""
+        rows = [(0, path.name)]
+        if kind == "folder" or path.suffix not in CONTENT_SUFFIXES:
+            return rows
+        try:
+            content = path.read_text(errors="ignore")
+        except OSError:
+            return rows
+        for i, line in enumerate(content.split("\n"), 1):
+            if i > MAX_LINES:
+                break
+            if line.strip():
+                rows.append((i, line))
+        return rows
+
+    def _delete(self, conn: sqlite3.Connection, path: str) -> None:
+        file_id, _ = self._files.pop(path)
+        self._meta.pop(file_id, None)
+        conn.execute("DELETE FROM lines WHERE rowid BETWEEN ? AND ?",
+                     (file_id << LINE_BITS, (file_id << LINE_BITS) | MAX_LINES))
+        conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def refresh(self, cancelled: Optional[Callable[[], bool]] = None) -> int:
+        """Bring the index up to date with the file tree. Returns files (re)indexed.
+
+        If cancelled() turns True the work done so far is kept and the rest
+        is picked up by the next refresh (nothing is purged on a partial walk).
+        """
+        with self._lock:
+            conn = self._db()
+            if conn is None:
+                return 0
+            changed = 0
+            seen = set()
+            complete = True
+            try:
+                for path, owner, kind, signature in self._walk():
+                    if cancelled is not None and cancelled():
+                        complete = False
+                        break
+                    key = str(path)
+                    seen.add(key)
+                    known = self._files.get(key)
+                    if known is not None and known[1] == signature:
+                        continue
+                    if known is not None:
+                        self._delete(conn, key)
+                    file_id = self._next_id
+                    self._next_id += 1
+                    conn.execute(
+                        "INSERT INTO files (id, path, owner, kind, name, signature) VALUES (?, ?, ?, ?, ?, ?)",
+                        (file_id, key, owner, kind, path.name, signature),
+                    )
+                    conn.executemany(
+                        "INSERT INTO lines (rowid, text) VALUES (?, ?)",
+                        [((file_id << LINE_BITS) | n, text) for n, text in self._lines(path, kind)],
+                    )
+                    self._files[key] = (file_id, signature)
+                    self._meta[file_id] = (owner, kind, key, path.name)
+                    changed += 1
+                if complete:
+                    # Without an intro_path, INTRO rows belong to another process's index
+                    stale = [k for k, (file_id, _) in self._files.items() if k not in seen
+                             and (self.intro_path is not None or self._meta[file_id][1] != "intro")]
+                    for key in stale:
+                        self._delete(conn, key)
+                        changed += 1
+                conn.commit()
+            except sqlite3.Error:
+                # Drop the in-memory view too; it is reloaded from the database
+                conn.rollback()
+                self.close()
+                self._files.clear()
+                self._meta.clear()
+                return 0
+            self.index_count += changed
+            if complete:
+                self._last_refresh = time.monotonic()
+            return changed
+
+    # -- queries ------------------------------------------------------------
+
+    def search_batches(self, query: str, limit: int = 50, batch_size: int = 10,
+                       include_intro: bool = True, refresh: bool = True,
+                       cancelled: Optional[Callable[[], bool]] = None) -> Iterator[List[SearchHit]]:
+        """Ranked hits in batches of batch_size, for streaming to a UI.
+
+        Every query token matches as a word prefix. Lines containing the
+        query verbatim come first, then bm25 order. The file tree is
+        re-checked at most every REFRESH_INTERVAL seconds. Stops as soon as
+        cancelled() returns True (checked per file while refreshing and
+        between batches).
+        """
+        cancelled = cancelled or (lambda: False)
+        match = build_match_query(query)
+        if not match:
+            return
+        with self._lock:
+            conn = self._db()
+            if conn is None:
+                return
+            if refresh and time.monotonic() - self._last_refresh >= REFRESH_INTERVAL:
+                self.refresh(cancelled)
+            if cancelled():
+                return
+            try:
+                if include_intro:
+                    rows = conn.execute(
+                        "SELECT rowid, text, rank FROM lines WHERE lines MATCH ? ORDER BY rank LIMIT ?",
+                        (match, limit * 4),
+                    ).fetchall()
+                else:
+                    # Filter in SQL, or INTRO rows could fill the whole LIMIT
+                    rows = conn.execute(
+                        "SELECT lines.rowid, lines.text, lines.rank FROM lines"
+                        " JOIN files ON files.id = (lines.rowid >> ?)"
+                        " WHERE lines MATCH ? AND files.kind != 'intro'"
+                        " ORDER BY lines.rank LIMIT ?",
+                        (LINE_BITS, match, limit * 4),
+                    ).fetchall()
+            except sqlite3.Error:
+                return
+            hits = []
+            for rowid, text, rank in rows:
+                meta = self._meta.get(rowid >> LINE_BITS)
+                if meta is None or (meta[1] == "intro" and not include_intro):
+                    continue
+                owner, kind, path, name = meta
+                hits.append(SearchHit(owner, kind, path, name, rowid & MAX_LINES, text, rank))
+
+        needle = query.lower()
+        hits.sort(key=lambda h: needle not in h.text.lower())
+        hits = hits[:limit]
+        for start in range(0, len(hits), batch_size):
+            if cancelled():
+                return
+            yield hits[start:start + batch_size]
+
+    def search(self, query: str, limit: int = 50, refresh: bool = True,
+               include_intro: bool = True) -> List[SearchHit]:
+        """All ranked hits for a query at once (see search_batches)."""
+        return [hit for batch in self.search_batches(query, limit, batch_size=limit or 1,
+                                                     include_intro=include_intro, refresh=refresh)
+                for hit in batch]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_INDEXES: Dict[str, SearchIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_search_index(system_path: Path, intro_path: Optional[Path] = None) -> SearchIndex:
+    """Return the process-wide SearchIndex for a system path."""
+    key = str(Path(system_path).resolve())
+    with _INDEXES_LOCK:
+        if key not in _INDEXES:
+            _INDEXES[key] = SearchIndex(Path(key), intro_path=intro_path)
+        return _INDEXES[key]
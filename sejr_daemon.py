@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+SEJR DAEMON — Lokal state-server for alle front-ends
+====================================================
+
+WHAT: Én langlivet proces der ejer de parsede sejr-records (via sejr_index),
+      overvåger 10_ACTIVE, 90_ARCHIVE og _CURRENT med inotify (watchdog) og
+      serverer snapshots + push-ændringer over en Unix socket
+      (_CURRENT/sejrd.sock). SejrClient er den tynde klient
+WHY:  Desktop-app, Streamlit, TUI, scripts/view.py og cron-scripts byggede
+      hver især state op fra disk og pollede hvert 2.-5. sekund. N klienter
+      betød N stat-walks; nu er det én watcher, og klienterne får besked
+      når noget faktisk ændrer sig (idéen fra _unused/services/unified_sync.py)
+WHO:  Startes med `python3 sejr_daemon.py` (fx fra autostart/systemd --user).
+      Læses af scripts/view.py og web_data via load_state/SejrClient;
+      masterpiece/masterpiece_en og TUI'en (app/watcher.watch_daemon)
+      abonnerer og falder tilbage til egen overvågning uden daemon
+HOW:  from sejr_daemon import SejrClient, load_state
+      state = load_state(SYSTEM_PATH)       # Daemon-snapshot, ellers lokal scan
+      for record in state["active"]: print(record["name"], record["progress"])
+      client = SejrClient(SYSTEM_PATH)
+      client.subscribe(lambda change: print(change["active"], change["logs"]))
+
+Protokol: én JSON pr. linje. Requests {"op": "ping" | "snapshot" |
+"subscribe"}. snapshot med "since": version svarer {"unchanged": true}
+hvis intet er ændret. Efter subscribe sender serveren
+{"event": "changed", "version", "active", "archived", "logs", "current"}
+(navne på ændrede sejrs / filer) indtil forbindelsen lukkes.
+
+Uden watchdog poller daemonen selv hvert POLL_INTERVAL sekund — stadig
+kun én poller uanset antal klienter.
+
+Version: 3.0.0
+"""
+import argparse
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sejr_index import get_index
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Polling fallback
+    FileSystemEventHandler = object
+    Observer = None
+
+SOCKET_FILENAME = "sejrd.sock"  # In _CURRENT/
+SEJR_DIRS = {"active": "10_ACTIVE", "archived": "90_ARCHIVE"}
+CURRENT_FILES = ("STATE.md", "NEXT.md", "DELTA.md", "PATTERNS.yaml", "PATTERNS.json")
+LOG_FILENAME = "AUTO_LOG.jsonl"
+DEBOUNCE = 0.25        # Seconds to coalesce a burst of inotify events into one refresh
+POLL_INTERVAL = 2.0    # Seconds between refreshes without watchdog
+CLIENT_TIMEOUT = 1.0   # Seconds a client waits for the daemon before falling back
+
+
+def socket_path(system_path: Path) -> Path:
+    return Path(system_path) / "_CURRENT" / SOCKET_FILENAME
+
+
+def _file_key(path: Path) -> str:
+    try:
+        st = path.stat()
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+# ============================================================================
+# STATE
+# ============================================================================
+
+class SejrState:
+    """Parsed records for all sejrs plus change detection between refreshes."""
+
+    def __init__(self, system_path: Path):
+        self.system_path = Path(system_path)
+        self.version = 0
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict[str, dict]] = {key: {} for key in SEJR_DIRS}
+        self._logs: Dict[str, str] = {}       # Active sejr name -> AUTO_LOG key
+        self._current: Dict[str, str] = {}    # _CURRENT filename -> file key
+
+    def refresh(self) -> Optional[dict]:
+        """Re-scan (stat-only for unchanged folders). Returns the change, or None."""
+        index = get_index(self.system_path)
+        with self._lock:
+            change = {key: [] for key in SEJR_DIRS}
+            for key, dirname in SEJR_DIRS.items():
+                records = {r["name"]: r for r in index.scan_dir(self.system_path / dirname)}
+                old = self._records[key]
+                change[key] = sorted(name for name in records.keys() | old.keys()
+                                     if records.get(name) != old.get(name))
+                self._records[key] = records
+
+            logs = {name: _file_key(Path(r["path"]) / LOG_FILENAME)
+                    for name, r in self._records["active"].items()}
+            change["logs"] = sorted(name for name, k in logs.items() if self._logs.get(name) != k)
+            self._logs = logs
+
+            current_dir = self.system_path / "_CURRENT"
+            current = {name: _file_key(current_dir / name) for name in CURRENT_FILES}
+            change["current"] = sorted(name for name, k in current.items() if self._current.get(name) != k)
+            self._current = current
+
+            if not any(change.values()):
+                return None
+            self.version += 1
+            change["version"] = self.version
+            return change
+
+    def snapshot(self) -> dict:
+        """Records per directory, newest first (same order as sejr_index.scan_dir)."""
+        with self._lock:
+            snap = {"version": self.version}
+            for key in SEJR_DIRS:
+                snap[key] = sorted(self._records[key].values(), key=lambda r: r["mtime"], reverse=True)
+            snap["current"] = dict(self._current)
+            return snap
+
+
+def local_snapshot(system_path: Path) -> dict:
+    """The snapshot a daemon would serve, built in this process."""
+    state = SejrState(system_path)
+    state.refresh()
+    return state.snapshot()
+
+
+# ============================================================================
+# DAEMON
+# ============================================================================
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        daemon: "SejrDaemon" = self.server.owner
+        for raw in self.rfile:
+            try:
+                request = json.loads(raw)
+                op = request.get("op")
+            except (ValueError, AttributeError):
+                self._send({"ok": False, "error": "invalid request"})
+                continue
+            if op == "ping":
+                self._send({"ok": True, "version": daemon.state.version, "pid": os.getpid()})
+            elif op == "snapshot":
+                since = request.get("since")
+                if since is not None and since == daemon.state.version:
+                    self._send({"ok": True, "version": since, "unchanged": True})
+                else:
+                    self._send(dict(daemon.state.snapshot(), ok=True))
+            elif op == "subscribe":
+                self._stream(daemon)
+                return
+            else:
+                self._send({"ok": False, "error": f"unknown op: {op}"})
+
+    def _send(self, message: dict) -> None:
+        self.wfile.write(json.dumps(message, default=str).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+    def _stream(self, daemon: "SejrDaemon") -> None:
+        inbox = daemon.add_subscriber()
+        try:
+            self._send({"ok": True, "version": daemon.state.version})
+            while not daemon.stopped.is_set():
+                try:
+                    change = inbox.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                self._send(dict(change, event="changed"))
+        except OSError:
+            pass  # Client went away
+        finally:
+            daemon.remove_subscriber(inbox)
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _WatchHandler(FileSystemEventHandler):
+    """Turns inotify events under the watched roots into a debounced refresh."""
+
+    def __init__(self, daemon: "SejrDaemon"):
+        self.daemon = daemon
+
+    def on_any_event(self, event):
+        path = Path(event.src_path)
+        if path.parent.name == "_CURRENT" and path.name not in CURRENT_FILES:
+            return  # Our own index/db writes, the socket, other caches
+        self.daemon.schedule_refresh()
+
+
+class SejrDaemon:
+    """Unix-socket server around one SejrState, refreshed by inotify or polling."""
+
+    def __init__(self, system_path: Path, sock: Optional[Path] = None, use_watchdog: bool = True,
+                 poll_interval: float = POLL_INTERVAL):
+        self.system_path = Path(system_path)
+        self.socket_path = Path(sock) if sock else socket_path(self.system_path)
+        self.state = SejrState(self.system_path)
+        self.use_watchdog = use_watchdog and Observer is not None
+        self.poll_interval = poll_interval
+        self.stopped = threading.Event()
+        self._subscribers: List[queue.Queue] = []
+        self._sub_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._observer = None
+        self._threads: List[threading.Thread] = []
+
+    # -- subscribers ----------------------------------------------------------
+
+    def add_subscriber(self) -> queue.Queue:
+        inbox: queue.Queue = queue.Queue()
+        with self._sub_lock:
+            self._subscribers.append(inbox)
+        return inbox
+
+    def remove_subscriber(self, inbox: queue.Queue) -> None:
+        with self._sub_lock:
+            if inbox in self._subscribers:
+                self._subscribers.remove(inbox)
+
+    def refresh(self) -> Optional[dict]:
+        """Refresh the state and push the change (if any) to every subscriber."""
+        change = self.state.refresh()
+        if change is not None:
+            with self._sub_lock:
+                for inbox in self._subscribers:
+                    inbox.put(change)
+        return change
+
+    def schedule_refresh(self) -> None:
+        """Refresh DEBOUNCE seconds after the last call (bursts become one refresh)."""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(DEBOUNCE, self.refresh)
+            self._timer.daemon = True
+            self._timer.start()
+
+    # -- lifecycle ------------------------------------------------------------
+
+    def _claim_socket(self) -> None:
+        """Remove a stale socket; refuse to start if another daemon answers on it."""
+        if not self.socket_path.exists():
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink()
+        else:
+            raise RuntimeError(f"sejr daemon already running on {self.socket_path}")
+        finally:
+            probe.close()
+
+    def _poll(self) -> None:
+        while not self.stopped.wait(self.poll_interval):
+            self.refresh()
+
+    def start(self) -> None:
+        """Scan once, bind the socket and start watching (returns immediately)."""
+        self.state.refresh()
+        self._claim_socket()
+        self._server = _Server(str(self.socket_path), _Handler)
+        self._server.owner = self
+        serve = threading.Thread(target=self._server.serve_forever, name="sejrd-serve", daemon=True)
+        serve.start()
+        self._threads.append(serve)
+
+        if self.use_watchdog:
+            self._observer = Observer()
+            handler = _WatchHandler(self)
+            for dirname in SEJR_DIRS.values():
+                root = self.system_path / dirname
+                root.mkdir(exist_ok=True)
+                self._observer.schedule(handler, str(root), recursive=True)
+            self._observer.schedule(handler, str(self.system_path / "_CURRENT"), recursive=False)
+            self._observer.start()
+        else:
+            poller = threading.Thread(target=self._poll, name="sejrd-poll", daemon=True)
+            poller.start()
+            self._threads.append(poller)
+
+    def stop(self) -> None:
+        self.stopped.set()
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        for thread in self._threads:
+            thread.join(timeout=2)
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class SejrClient:
+    """Thin client for a running daemon. Every call returns None if it is not running."""
+
+    def __init__(self, system_path: Path, sock: Optional[Path] = None, timeout: float = CLIENT_TIMEOUT):
+        self.socket_path = Path(sock) if sock else socket_path(system_path)
+        self.timeout = timeout
+
+    def _connect(self) -> Optional[socket.socket]:
+        if not self.socket_path.exists():
+            return None
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.settimeout(self.timeout)
+        try:
+            conn.connect(str(self.socket_path))
+        except OSError:
+            conn.close()
+            return None
+        return conn
+
+    def request(self, op: str, **params) -> Optional[dict]:
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            with conn, conn.makefile("rb") as reader:
+                conn.sendall(json.dumps(dict(params, op=op)).encode("utf-8") + b"\n")
+                line = reader.readline()
+            reply = json.loads(line) if line else None
+        except (OSError, ValueError):
+            return None
+        return reply if isinstance(reply, dict) and reply.get("ok") else None
+
+    def ping(self) -> Optional[int]:
+        """The daemon's state version, or None if no daemon answers."""
+        reply = self.request("ping")
+        return reply["version"] if reply else None
+
+    def snapshot(self, since: Optional[int] = None) -> Optional[dict]:
+        return self.request("snapshot", since=since)
+
+    def subscribe(self, callback: Callable[[dict], None],
+                  on_disconnect: Optional[Callable[[], None]] = None) -> Optional[threading.Thread]:
+        """Call callback(change) from a background thread for every pushed change.
+
+        Returns the reader thread, or None if no daemon is running.
+        on_disconnect is called once if the daemon goes away.
+        """
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            conn.sendall(b'{"op": "subscribe"}\n')
+            reader = conn.makefile("rb")
+            ack = reader.readline()
+        except OSError:
+            conn.close()
+            return None
+        if not ack:
+            conn.close()
+            return None
+        conn.settimeout(None)
+
+        def _read():
+            try:
+                for line in reader:
+                    try:
+                        change = json.loads(line)
+                    except ValueError:
+                        continue
+                    callback(change)
+            except OSError:
+                pass
+            finally:
+                reader.close()
+                conn.close()
+                if on_disconnect is not None:
+                    on_disconnect()
+
+        thread = threading.Thread(target=_read, name="sejrd-client", daemon=True)
+        thread.start()
+        return thread
+
+
+def load_state(system_path: Path) -> dict:
+    """Daemon snapshot if one is running, otherwise the same snapshot built locally."""
+    snap = SejrClient(system_path).snapshot()
+    if snap is not None:
+        return snap
+    return local_snapshot(system_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve sejr state over a Unix socket")
+    parser.add_argument("--status", action="store_true", help="Check whether a daemon is running")
+    parser.add_argument("--poll", action="store_true", help="Poll instead of using inotify (watchdog)")
+    args = parser.parse_args()
+
+    system_path = Path(__file__).parent
+    if args.status:
+        version = SejrClient(system_path).ping()
+        print("[OK] sejr daemon running (state version %s)" % version if version is not None
+              else "[INFO] sejr daemon not running")
+        sys.exit(0 if version is not None else 1)
+
+    daemon = SejrDaemon(system_path, use_watchdog=not args.poll)
+    try:
+        daemon.start()
+    except RuntimeError as e:
+        print(f"[FAIL] {e}")
+        sys.exit(1)
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stopped.set())  # Clean stop under systemd/kill
+    print(f"[OK] sejr daemon listening on {daemon.socket_path} "
+          f"({'inotify' if daemon.use_watchdog else f'polling every {daemon.poll_interval:.0f}s'})")
+    try:
+        daemon.stopped.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
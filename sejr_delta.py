@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+SEJR DELTA — Inkrementel checkbox-delta motor for SEJR_LISTE.md
+================================================================
+
+WHAT: Husker sidste SejrDocument (sejr_parser) pr. sejr og differ ny
+      indhold linje for linje. Udsender strukturerede events
+      ("checkbox 14 in Pass 2 checked") og opdaterer tællinger kun for
+      de ændrede linjer
+WHY:  Når én checkbox afkrydses, re-parsede og re-talte alle forbrugere
+      hele filen. Store lister (tusindvis af linjer) opdateres nu med det samme
+WHO:  Bruges af app/watcher.FileWatcher, masterpiece_en.LiveActivityMonitor
+      og scripts/auto_verify
+HOW:  from sejr_delta import get_delta_engine
+      result = get_delta_engine().update(sejr_path)
+      for event in result.events: print(event.describe())
+
+Hurtig sti: ændrede linjer uden markører, score-linjer eller tomme linjer
+(fx afkrydsning) re-tokeniseres alene. Ellers fuld re-parse via parse_sejr
+(se sejr_parser.is_structural).
+
+Version: 3.0.0
+"""
+import bisect
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sejr_parser import CHECKBOX_RE, Checkbox, SejrDocument, is_structural, parse_sejr
+
+
+@dataclass
+class CheckboxEvent:
+    """One checkbox change between two versions of a SEJR_LISTE.md."""
+    sejr: str
+    kind: str                  # checked | unchecked | added | removed | edited
+    index: int                 # 1-based position among all checkboxes in the file
+    line: int
+    region: str
+    pass_num: Optional[int]
+    text: str
+
+    def describe(self) -> str:
+        where = f"Pass {self.pass_num}" if self.pass_num else self.region
+        if self.region == "review" and self.pass_num:
+            where = f"Pass {self.pass_num} review"
+        return f"checkbox {self.index} in {where} {self.kind}"
+
+
+@dataclass
+class DeltaResult:
+    """Outcome of DeltaEngine.update()."""
+    sejr: str
+    doc: Optional[SejrDocument]
+    events: List[CheckboxEvent] = field(default_factory=list)
+    changed_lines: int = 0
+    full_reparse: bool = False
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.events) or self.changed_lines > 0
+
+
+@dataclass
+class _SejrState:
+    signature: Tuple[int, int]
+    lines: List[str]
+    doc: SejrDocument
+
+
+def _context_before(doc: SejrDocument, line: int) -> Tuple[str, Optional[int], str, str]:
+    """(region, pass_num, section, heading) in effect just before a 1-based line."""
+    idx = bisect.bisect_right(doc.sections, line - 1, key=lambda s: s.line) - 1
+    if idx < 0:
+        return "preamble", None, "", ""
+    current = doc.sections[idx]
+    section = ""
+    for s in reversed(doc.sections[:idx + 1]):
+        if s.level in (2, 3):
+            section = s.title
+            break
+    return current.region, current.pass_num, section, current.title
+
+
+def _diff_events(sejr: str, old: List[Checkbox], old_start: int,
+                 new: List[Checkbox], new_start: int) -> List[CheckboxEvent]:
+    """Pair old/new checkboxes of a changed block and describe the differences.
+
+    old_start/new_start are the 0-based positions of the block's first
+    checkbox in the old/new document (for the reported index).
+    """
+    events: List[CheckboxEvent] = []
+
+    def event(kind: str, cb: Checkbox, pos: int) -> CheckboxEvent:
+        return CheckboxEvent(sejr, kind, pos + 1, cb.line, cb.region, cb.pass_num, cb.text)
+
+    if len(old) == len(new):
+        for i, (a, b) in enumerate(zip(old, new)):
+            if a.checked != b.checked:
+                events.append(event("checked" if b.checked else "unchecked", b, new_start + i))
+            elif a.text != b.text:
+                events.append(event("edited", b, new_start + i))
+        return events
+
+    # Different number of checkboxes: pair by text, rest are added/removed
+    unmatched: Dict[str, List[int]] = {}
+    for i, a in enumerate(old):
+        unmatched.setdefault(a.text, []).append(i)
+    for i, b in enumerate(new):
+        candidates = unmatched.get(b.text)
+        if candidates:
+            a = old[candidates.pop(0)]
+            if a.checked != b.checked:
+                events.append(event("checked" if b.checked else "unchecked", b, new_start + i))
+        else:
+            events.append(event("added", b, new_start + i))
+    for positions in unmatched.values():
+        for i in positions:
+            events.append(event("removed", old[i], old_start + i))
+    return events
+
+
+class DeltaEngine:
+    """Keeps the last parsed SejrDocument per sejr and applies line diffs.
+
+    The returned ``doc`` is owned by the engine and updated in place on
+    the next call — copy anything you need to keep.
+    """
+
+    def __init__(self):
+        self._states: Dict[str, _SejrState] = {}
+        self._lock = threading.Lock()
+
+    def forget(self, sejr_path: Path) -> None:
+        with self._lock:
+            self._states.pop(str(sejr_path), None)
+
+    def update(self, sejr_path: Path, content: Optional[str] = None) -> DeltaResult:
+        """Bring the cached model for a sejr up to date and return the delta.
+
+        Args:
+            sejr_path: Sejr folder (or its SEJR_LISTE.md)
+            content: New file content; read from disk if omitted. Without
+                content the file is only read when its mtime/size changed.
+        """
+        sejr_path = Path(sejr_path)
+        if sejr_path.name == "SEJR_LISTE.md":
+            sejr_path = sejr_path.parent
+        sejr_file = sejr_path / "SEJR_LISTE.md"
+        key = str(sejr_path)
+
+        with self._lock:
+            state = self._states.get(key)
+            try:
+                st = sejr_file.stat()
+                signature = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                self._states.pop(key, None)
+                return DeltaResult(sejr_path.name, None)
+
+            if content is None:
+                if state is not None and state.signature == signature:
+                    return DeltaResult(sejr_path.name, state.doc)
+                try:
+                    content = sejr_file.read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    return DeltaResult(sejr_path.name, state.doc if state else None)
+
+            new_lines = content.split("\n")
+            if state is None:
+                doc = parse_sejr(content)
+                self._states[key] = _SejrState(signature, new_lines, doc)
+                return DeltaResult(sejr_path.name, doc, changed_lines=len(new_lines), full_reparse=True)
+
+            result = self._apply(sejr_path.name, state, new_lines, content)
+            state.signature = signature
+            return result
+
+    def _apply(self, sejr: str, state: _SejrState, new_lines: List[str], content: str) -> DeltaResult:
+        old_lines = state.lines
+        old_n, new_n = len(old_lines), len(new_lines)
+
+        # Common prefix / suffix → the changed block
+        limit = min(old_n, new_n)
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and old_lines[old_n - 1 - suffix] == new_lines[new_n - 1 - suffix]):
+            suffix += 1
+
+        old_block = old_lines[prefix:old_n - suffix]
+        new_block = new_lines[prefix:new_n - suffix]
+        if not old_block and not new_block:
+            state.lines = new_lines
+            return DeltaResult(sejr, state.doc)
+
+        doc = state.doc
+        first_line = prefix + 1                      # 1-based
+        old_last = prefix + len(old_block)           # inclusive, old numbering
+        new_last = prefix + len(new_block)           # inclusive, new numbering
+        key = lambda cb: cb.line
+        i0 = bisect.bisect_left(doc.checkboxes, first_line, key=key)
+        i1 = bisect.bisect_right(doc.checkboxes, old_last, key=key)
+        old_cbs = doc.checkboxes[i0:i1]
+        changed = max(len(old_block), len(new_block))
+
+        # Lines that can move region/span boundaries or scores force a full re-parse
+        if any(is_structural(l) for l in old_block) or any(is_structural(l) for l in new_block):
+            new_doc = parse_sejr(content)
+            j0 = bisect.bisect_left(new_doc.checkboxes, first_line, key=key)
+            j1 = bisect.bisect_right(new_doc.checkboxes, new_last, key=key)
+            events = _diff_events(sejr, old_cbs, i0, new_doc.checkboxes[j0:j1], j0)
+            state.doc = new_doc
+            state.lines = new_lines
+            return DeltaResult(sejr, new_doc, events, changed, full_reparse=True)
+
+        # Fast path: re-tokenize only the changed block
+        region, pass_num, section, heading = _context_before(doc, first_line)
+        new_cbs: List[Checkbox] = []
+        for offset, line in enumerate(new_block):
+            if "- [" not in line:
+                continue
+            for match in CHECKBOX_RE.finditer(line):
+                new_cbs.append(Checkbox(
+                    line=first_line + offset,
+                    checked=match.group(1) != " ",
+                    text=line[match.end():].strip(),
+                    section=section,
+                    heading=heading,
+                    region=region,
+                    pass_num=pass_num,
+                    column=match.start(),
+                ))
+
+        events = _diff_events(sejr, old_cbs, i0, new_cbs, i0)
+
+        for cb in old_cbs:
+            doc.count_checkbox(cb, -1)
+        doc.checkboxes[i0:i1] = new_cbs
+        shift = len(new_block) - len(old_block)
+        if shift:
+            for cb in doc.checkboxes[i0 + len(new_cbs):]:
+                cb.line += shift
+            for s in doc.sections:
+                if s.line > old_last:
+                    s.line += shift
+            doc.shift_spans(old_last, shift)
+        for cb in new_cbs:
+            doc.count_checkbox(cb)
+        doc.line_count = new_n
+        state.lines = new_lines
+        return DeltaResult(sejr, doc, events, changed)
+
+
+_ENGINE: Optional[DeltaEngine] = None
+
+
+def get_delta_engine() -> DeltaEngine:
+    """Return the process-wide DeltaEngine."""
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = DeltaEngine()
+    return _ENGINE
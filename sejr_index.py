@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+SEJR INDEX — Persistent metadata-indeks delt af alle front-ends
+===============================================================
+
+WHAT: SQLite-indeks i _CURRENT/sejr_index.db med checkbox-tal, progress,
+      score, fase, STATUS.yaml-data og filliste for hver sejr-mappe
+WHY:  web_app, masterpiece_en og app/sejr_app gennemløb 10_ACTIVE og
+      90_ARCHIVE og parsede ALLE SEJR_LISTE.md + STATUS.yaml ved hver
+      refresh. Nu re-parses kun mapper hvis signatur (mtime + size) er ændret
+WHO:  Importeret af web_app, masterpiece_en, app/sejr_app (bruger sejr_parser, sejr_yaml)
+HOW:  from sejr_index import get_index
+      records = get_index(SYSTEM_PATH).scan_dir(ACTIVE_DIR)
+
+Version: 3.0.0
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sejr_parser import parse_sejr
+from sejr_yaml import load_yaml_file
+
+INDEX_FILENAME = "sejr_index.db"
+SCHEMA_VERSION = 2
+
+# Files whose (mtime, size) decide whether a folder must be re-parsed.
+# The folder's own mtime covers files being added, removed or renamed.
+TRACKED_FILES = ("SEJR_LISTE.md", "STATUS.yaml")
+
+
+def _stat_key(path: Path) -> str:
+    """Return 'mtime_ns:size' for a path, or '-' if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def folder_signature(folder: Path) -> str:
+    """Cheap change signature for a sejr folder (stat calls only, no reads)."""
+    parts = [_stat_key(folder)] + [_stat_key(folder / name) for name in TRACKED_FILES]
+    return "|".join(parts)
+
+
+def dir_fingerprint(directory: Path) -> str:
+    """Change fingerprint for a whole sejr directory (10_ACTIVE / 90_ARCHIVE).
+
+    Combines the directory's own stat with folder_signature() of every
+    sejr folder in it — stat calls only, so it is cheap enough to compute
+    on every web rerun and use as a cache key.
+    """
+    directory = Path(directory)
+    digest = hashlib.blake2b(_stat_key(directory).encode(), digest_size=12)
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except OSError:
+        return digest.hexdigest()
+    for entry in entries:
+        if entry.name.startswith(".") or not entry.is_dir():
+            continue
+        digest.update(f"|{entry.name}={folder_signature(Path(entry.path))}".encode())
+    return digest.hexdigest()
+
+
+def summarize_status(data: dict) -> Tuple[int, str]:
+    """Derive (total_score, phase) from STATUS.yaml data.
+
+    Supports BOTH the nested v3.0.0 format (pass_tracking.*) and the
+    old flat format (total_score, pass_N_score, pass_N_complete), with
+    score_tracking.totals.total_score as last resort for the score.
+    """
+    pt = data.get("pass_tracking")
+    if isinstance(pt, dict) and pt:
+        p1 = pt.get("pass_1") or {}
+        p2 = pt.get("pass_2") or {}
+        p3 = pt.get("pass_3") or {}
+        score = pt.get("total_score", 0) or 0
+        if score == 0:
+            score = p1.get("score", 0) + p2.get("score", 0) + p3.get("score", 0)
+        complete = (p1.get("complete"), p2.get("complete"), p3.get("complete"))
+    else:
+        score = data.get("total_score", 0) or 0
+        if score == 0:
+            score = (data.get("pass_1_score", 0) + data.get("pass_2_score", 0)
+                     + data.get("pass_3_score", 0))
+        complete = (data.get("pass_1_complete"), data.get("pass_2_complete"),
+                    data.get("pass_3_complete"))
+    if score == 0:
+        # Some archived files only carry the score in score_tracking.totals
+        st = data.get("score_tracking")
+        if isinstance(st, dict) and isinstance(st.get("totals"), dict):
+            score = st["totals"].get("total_score", 0) or 0
+
+    if complete[2]:
+        phase = "COMPLETE"
+    elif complete[1]:
+        phase = "PASS 3"
+    elif complete[0]:
+        phase = "PASS 2"
+    else:
+        phase = "PASS 1"
+    return score, phase
+
+
+def parse_folder(folder: Path) -> dict:
+    """Parse one sejr folder into an index record (the expensive part)."""
+    sejr_file = folder / "SEJR_LISTE.md"
+    status_file = folder / "STATUS.yaml"
+
+    record = {
+        "name": folder.name,
+        "path": str(folder),
+        "is_archived": "90_ARCHIVE" in str(folder),
+        "checkboxes_done": 0,
+        "checkboxes_total": 0,
+        "progress": 0,
+        "content_pass": "1",
+        "score": 0,
+        "phase": "UNKNOWN",
+        "status": {},
+        "files": [],
+    }
+
+    if sejr_file.exists():
+        try:
+            content = sejr_file.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            content = ""
+        done, total = parse_sejr(content).totals()
+        record["checkboxes_done"] = done
+        record["checkboxes_total"] = total
+        record["progress"] = int((done / total * 100) if total > 0 else 0)
+        # Same heuristic the desktop app has always used for its pass badge
+        if "Pass 3" in content and "PASS 3" in content.upper():
+            record["content_pass"] = "3"
+        elif "Pass 2" in content and "PASS 2" in content.upper():
+            record["content_pass"] = "2"
+
+    if status_file.exists():
+        data = load_yaml_file(status_file)
+        if data:
+            # Round-trip through JSON so dates etc. match what the DB returns
+            record["status"] = json.loads(json.dumps(data, default=str))
+            try:
+                record["score"], record["phase"] = summarize_status(record["status"])
+            except (TypeError, AttributeError):
+                pass
+
+    try:
+        record["files"] = sorted(f.name for f in folder.iterdir() if f.is_file())
+    except OSError:
+        pass
+
+    return record
+
+
+class SejrIndex:
+    """Signature-keyed cache of parsed sejr folders.
+
+    Two layers: an in-process dict (free lookups on every refresh) backed
+    by SQLite so a fresh process — or another front-end — can reuse the
+    work. If the database cannot be opened the index runs memory-only.
+    """
+
+    def __init__(self, system_path: Path, db_path: Optional[Path] = None):
+        self.system_path = Path(system_path)
+        self.db_path = Path(db_path) if db_path else self.system_path / "_CURRENT" / INDEX_FILENAME
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_failed = False
+        self._memory: Dict[str, Tuple[str, dict]] = {}
+        self.parse_count = 0  # Folders parsed by this process (for diagnostics)
+
+    # -- database -----------------------------------------------------------
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._db_failed:
+            return self._conn
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS sejrs")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sejrs ("
+                " path TEXT PRIMARY KEY,"
+                " parent TEXT NOT NULL,"
+                " signature TEXT NOT NULL,"
+                " data TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sejrs_parent ON sejrs(parent)")
+            conn.commit()
+            self._conn = conn
+        except sqlite3.Error:
+            self._db_failed = True
+            self._conn = None
+        return self._conn
+
+    def _db_load(self, path: str) -> Optional[Tuple[str, dict]]:
+        conn = self._db()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT signature, data FROM sejrs WHERE path = ?", (path,)).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _db_store(self, rows: List[Tuple[str, str, str, dict]]) -> None:
+        conn = self._db()
+        if conn is None or not rows:
+            return
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sejrs (path, parent, signature, data) VALUES (?, ?, ?, ?)",
+                [(p, parent, sig, json.dumps(rec, default=str)) for p, parent, sig, rec in rows],
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def _db_purge(self, parent: str, keep: List[str]) -> None:
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            existing = {r[0] for r in conn.execute("SELECT path FROM sejrs WHERE parent = ?", (parent,))}
+            stale = existing.difference(keep)
+            if stale:
+                conn.executemany("DELETE FROM sejrs WHERE path = ?", [(p,) for p in stale])
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+    # -- lookups ------------------------------------------------------------
+
+    def _lookup(self, folder: Path, pending: List[Tuple[str, str, str, dict]]) -> dict:
+        key = str(folder)
+        signature = folder_signature(folder)
+
+        cached = self._memory.get(key)
+        if cached is None or cached[0] != signature:
+            cached = self._db_load(key)
+            if cached is None or cached[0] != signature:
+                record = parse_folder(folder)
+                self.parse_count += 1
+                cached = (signature, record)
+                pending.append((key, str(folder.parent), signature, record))
+            self._memory[key] = cached
+
+        record = dict(cached[1])
+        try:
+            record["mtime"] = folder.stat().st_mtime
+        except OSError:
+            record["mtime"] = 0.0
+        return record
+
+    def get(self, folder: Path) -> dict:
+        """Return the record for a single sejr folder (re-parsed only if changed)."""
+        with self._lock:
+            pending: List[Tuple[str, str, str, dict]] = []
+            record = self._lookup(Path(folder), pending)
+            self._db_store(pending)
+            return record
+
+    def scan_dir(self, directory: Path) -> List[dict]:
+        """Return records for every sejr folder in a directory, newest first.
+
+        Records for folders that disappeared from the directory are purged.
+        """
+        directory = Path(directory)
+        if not directory.exists():
+            return []
+        with self._lock:
+            pending: List[Tuple[str, str, str, dict]] = []
+            records = []
+            for folder in directory.iterdir():
+                if folder.is_dir() and not folder.name.startswith("."):
+                    records.append(self._lookup(folder, pending))
+            self._db_store(pending)
+
+            seen = {r["path"] for r in records}
+            prefix = str(directory)
+            for key in [k for k in self._memory if str(Path(k).parent) == prefix and k not in seen]:
+                del self._memory[key]
+            self._db_purge(prefix, list(seen))
+
+        records.sort(key=lambda r: r["mtime"], reverse=True)
+        return records
+
+    def scan(self) -> List[dict]:
+        """Return all active records followed by all archived records."""
+        return (self.scan_dir(self.system_path / "10_ACTIVE")
+                + self.scan_dir(self.system_path / "90_ARCHIVE"))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_INDEXES: Dict[str, SejrIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_index(system_path: Path) -> SejrIndex:
+    """Return the process-wide SejrIndex for a system path."""
+    key = str(Path(system_path).resolve())
+    with _INDEXES_LOCK:
+        if key not in _INDEXES:
+            _INDEXES[key] = SejrIndex(Path(key))
+        return _INDEXES[key]
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+SEJR PARSER — Single-pass parser for SEJR_LISTE.md
+===================================================
+
+WHAT: Gennemløber SEJR_LISTE.md ÉN gang og returnerer en typed dokumentmodel:
+      sektioner, pass-grænser, review-blokke, final verification,
+      checkboxes med linjenumre og eksplicitte scores
+WHY:  auto_verify, build_claude_context og enforcement_engine tokeniserede
+      samme fil med hver deres regler (O(passes × markers × fil)) og talte
+      forskelligt. Ét parse = én sandhed
+WHO:  Importeret af auto_verify, build_claude_context, enforcement_engine,
+      sejr_index
+HOW:  from sejr_parser import parse_sejr, parse_sejr_file
+      doc = parse_sejr(content)
+      done, total = doc.pass_counts(1)
+
+TO LAG:
+  Regioner (pr. overskrift) giver hver checkbox sin section/pass-etiket
+  (build_claude_context, enforcement_engine, sejr_delta-events).
+  Verify-spans (pass_counts, review_counts, final_counts, score) følger
+  auto_verify's oprindelige markør-regler, så verify_pass_progress og
+  can_archive er uændrede: en pass starter ved første "# 🥉 PASS 1:" /
+  "## PASS 1:" (substring) og slutter ved pass'ets REVIEW-markør, ellers
+  ved filens slutning. Spans kan overlappe. Se _verify_spans.
+
+REGIONER (kun hovedoverskrifter # / ## skifter region):
+  "# 🥉 PASS 1:" / "## PASS 1: ..."       → pass 1   (også "## PASS 1 SCORE", osv.)
+  "# 🔍 PASS 1 →" / "## PASS 1 REVIEW"    → review 1
+  "## VERIFIKATION" / "# [OK] FINAL VERIFICATION" → final
+  "## SEMANTISK KONKLUSION"               → conclusion
+  alt andet ("## 3-PASS RESULTAT", ...)   → other
+  før første hovedoverskrift              → preamble
+  Under-overskrifter (###+) der nævner "PASS N" inde i final
+  (fx "### PASS 3 COMPLETION CHECKLIST") tælles til pass N indtil
+  næste overskrift på samme eller højere niveau.
+
+Version: 3.0.0
+"""
+import bisect
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CHECKBOX_RE = re.compile(r'- \[([ xX])\]')
+PASS_RE = re.compile(r'PASS ([123])\b')
+
+PASS_NUMBERS = (1, 2, 3)
+PASS_EMOJI = {1: "🥉", 2: "🥈", 3: "🥇"}
+
+Position = Tuple[int, int]     # (1-based line, 0-based column)
+
+
+@dataclass
+class Checkbox:
+    """A single '- [ ]' / '- [x]' marker."""
+    line: int                  # 1-based line number
+    checked: bool
+    text: str                  # Text after the marker on the same line
+    section: str               # Nearest ## / ### heading
+    heading: str               # Nearest heading of any level
+    region: str                # preamble | pass | review | final | conclusion | other
+    pass_num: Optional[int]    # Set for pass and review regions
+    column: int = 0            # 0-based column of the marker
+
+    @property
+    def position(self) -> Position:
+        return self.line, self.column
+
+
+@dataclass
+class Section:
+    """A markdown heading and the region it belongs to."""
+    level: int
+    title: str
+    line: int
+    region: str
+    pass_num: Optional[int]
+
+
+@dataclass
+class SejrDocument:
+    """Structured model of a SEJR_LISTE.md file."""
+    title: Optional[str] = None
+    line_count: int = 0
+    sections: List[Section] = field(default_factory=list)
+    checkboxes: List[Checkbox] = field(default_factory=list)
+    explicit_scores: Dict[int, int] = field(default_factory=dict)
+    # (region, pass_num) -> [done, total]
+    counts: Dict[Tuple[str, Optional[int]], List[int]] = field(default_factory=dict)
+    # ("pass" | "review" | "final", pass_num) -> (start, end or None for end of file)
+    spans: Dict[Tuple[str, Optional[int]], Tuple[Position, Optional[Position]]] = field(default_factory=dict)
+    span_counts: Dict[Tuple[str, Optional[int]], List[int]] = field(default_factory=dict)
+
+    # -- counts ---------------------------------------------------------------
+
+    def region_counts(self, region: str, pass_num: Optional[int] = None) -> Tuple[int, int]:
+        done, total = self.counts.get((region, pass_num), (0, 0))
+        return done, total
+
+    def _span_counts(self, key: Tuple[str, Optional[int]]) -> Tuple[int, int]:
+        done, total = self.span_counts.get(key, (0, 0))
+        return done, total
+
+    def pass_counts(self, pass_num: int) -> Tuple[int, int]:
+        """(done, total) for a pass, excluding its review block (auto_verify rules)."""
+        return self._span_counts(("pass", pass_num))
+
+    def review_counts(self, pass_num: int) -> Tuple[int, int]:
+        return self._span_counts(("review", pass_num))
+
+    def final_counts(self) -> Tuple[int, int]:
+        return self._span_counts(("final", None))
+
+    def count_checkbox(self, cb: Checkbox, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) one checkbox from the region and span counts."""
+        for counts, key in [(self.counts, (cb.region, cb.pass_num))] + [
+                (self.span_counts, key) for key, (start, end) in self.spans.items()
+                if start <= cb.position and (end is None or cb.position < end)]:
+            bucket = counts.setdefault(key, [0, 0])
+            bucket[0] += sign * cb.checked
+            bucket[1] += sign
+
+    def shift_spans(self, after_line: int, shift: int) -> None:
+        """Move span boundaries below after_line by shift lines (lines inserted/removed)."""
+        def moved(pos: Optional[Position]) -> Optional[Position]:
+            return (pos[0] + shift, pos[1]) if pos is not None and pos[0] > after_line else pos
+        self.spans = {key: (moved(start), moved(end)) for key, (start, end) in self.spans.items()}
+
+    def totals(self) -> Tuple[int, int]:
+        """(done, total) over the whole file — same as checkbox_utils.count_checkboxes."""
+        done = sum(c[0] for c in self.counts.values())
+        total = sum(c[1] for c in self.counts.values())
+        return done, total
+
+    # -- derived --------------------------------------------------------------
+
+    def score(self, pass_num: int) -> int:
+        """Explicit 'PASS N SCORE: X/10', else auto-calculated from completion."""
+        if pass_num in self.explicit_scores:
+            return self.explicit_scores[pass_num]
+        done, total = self.pass_counts(pass_num)
+        if total > 0:
+            return round(done / total * 10)
+        return 0
+
+    def current_pass(self) -> int:
+        """Which pass is active: first incomplete pass or review, else 3 (or 1 if empty)."""
+        for n in PASS_NUMBERS:
+            done, total = self.pass_counts(n)
+            if total > 0 and done < total:
+                return n
+            if n < 3:
+                done, total = self.review_counts(n)
+                if total > 0 and done < total:
+                    return n
+        if self.pass_counts(3)[1] > 0:
+            return 3
+        return 1
+
+    def next_unchecked(self) -> Optional[Checkbox]:
+        for cb in self.checkboxes:
+            if not cb.checked:
+                return cb
+        return None
+
+
+def _classify(title: str) -> Tuple[str, Optional[int]]:
+    """Map a main (# / ##) heading to its region."""
+    upper = title.upper()
+    if "SEMANTISK KONKLUSION" in upper:
+        return "conclusion", None
+    match = PASS_RE.search(upper)
+    if match:
+        n = int(match.group(1))
+        rest = upper[match.end():].lstrip()
+        if rest.startswith("REVIEW") or rest.startswith("→"):
+            return "review", n
+        return "pass", n
+    if "VERIFIKATION" in upper or "VERIFICATION" in upper:
+        return "final", None
+    return "other", None
+
+
+def is_structural(line: str) -> bool:
+    """Lines that can move a region, a verify span or a score.
+
+    Verify markers all contain "# ", scores "/10"; the final-verification
+    fallback ends at "---" + blank line + "*Oprettet".
+    """
+    return ("# " in line or "/10" in line or "SCORE" in line.upper()
+            or line.startswith("---") or line.startswith("*Oprettet") or not line.strip())
+
+
+def _marker_span(content: str, start_markers: List[str], end_markers: List[str]) -> Optional[Tuple[int, int]]:
+    """First found start marker (in list order) up to the nearest end marker after it."""
+    for start_m in start_markers:
+        start = content.find(start_m)
+        if start != -1:
+            end = len(content)
+            for end_m in end_markers:
+                idx = content.find(end_m, start + len(start_m))
+                if idx != -1 and idx < end:
+                    end = idx
+            return start, end
+    return None
+
+
+def _final_span(content: str) -> Optional[Tuple[int, int]]:
+    """Final verification block; the end marker is searched from the top of the file."""
+    for start_m, end_m in (("# [OK] FINAL VERIFICATION", "# [VICTORY] SEMANTISK KONKLUSION"),
+                           ("## VERIFIKATION", "## SEMANTISK KONKLUSION"),
+                           ("## VERIFIKATION", "---\n\n*Oprettet")):
+        start = content.find(start_m)
+        if start == -1:
+            continue
+        end = content.find(end_m)
+        if end == -1:
+            end = len(content)
+        if end > start:
+            return start, end
+    return None
+
+
+def _verify_spans(content: str) -> Dict[Tuple[str, Optional[int]], Tuple[int, int]]:
+    """Character spans auto_verify counts for each pass, review and final block."""
+    spans = {}
+    for n in PASS_NUMBERS:
+        span = _marker_span(content, [f"# {PASS_EMOJI[n]} PASS {n}:", f"## PASS {n}:"],
+                            [f"# 🔍 PASS {n} →", f"## PASS {n} REVIEW"])
+        if span:
+            spans[("pass", n)] = span
+        if n < 3:
+            ends = [f"# {PASS_EMOJI[n + 1]} PASS {n + 1}:", f"## PASS {n + 1}:"]
+        else:
+            ends = ["# 📦 SEMANTISK KONKLUSION", "## SEMANTISK KONKLUSION", "## VERIFIKATION"]
+        span = _marker_span(content, [f"# 🔍 PASS {n} →", f"## PASS {n} REVIEW"], ends)
+        if span:
+            spans[("review", n)] = span
+    span = _final_span(content)
+    if span:
+        spans[("final", None)] = span
+    return spans
+
+
+def _first_score(content: str, pass_num: int) -> Optional[int]:
+    """'PASS N SCORE: X/10' anywhere, else the first 'Pass N ... X/10'."""
+    for pattern in (rf'PASS {pass_num} SCORE:\s*(\d+)/10', rf'Pass {pass_num}.*?(\d+)/10'):
+        match = re.search(pattern, content, re.IGNORECASE)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def parse_sejr(content: str) -> SejrDocument:
+    """Parse SEJR_LISTE.md content in a single linear pass."""
+    doc = SejrDocument()
+
+    region: str = "preamble"
+    pass_num: Optional[int] = None
+    # (heading level, pass) for a "### PASS N ..." block inside final
+    override: Optional[Tuple[int, int]] = None
+    section = ""
+    heading = ""
+
+    lines = content.split("\n")
+    doc.line_count = len(lines)
+
+    for lineno, line in enumerate(lines, 1):
+        if line.startswith("#"):
+            level = len(line) - len(line.lstrip("#"))
+            title = line[level:].strip()
+            if doc.title is None and level == 1 and title.upper().startswith("SEJR"):
+                doc.title = title.split(":", 1)[1].strip() if ":" in title else title
+            if override and level <= override[0]:
+                override = None
+            if level <= 2:
+                region, pass_num = _classify(title)
+            elif region == "final":
+                sub_region, sub_pass = _classify(title)
+                if sub_region == "pass":
+                    override = (level, sub_pass)
+            if level in (2, 3):
+                section = title
+            heading = title
+            if override:
+                doc.sections.append(Section(level, title, lineno, "pass", override[1]))
+            else:
+                doc.sections.append(Section(level, title, lineno, region, pass_num))
+
+        if "- [" in line:
+            cb_region, cb_pass = ("pass", override[1]) if override else (region, pass_num)
+            for match in CHECKBOX_RE.finditer(line):
+                doc.checkboxes.append(Checkbox(
+                    line=lineno,
+                    checked=match.group(1) != " ",
+                    text=line[match.end():].strip(),
+                    section=section,
+                    heading=heading,
+                    region=cb_region,
+                    pass_num=cb_pass,
+                    column=match.start(),
+                ))
+
+    # "PASS N SCORE: X/10" wins over looser "Pass N ... X/10" mentions
+    for n in PASS_NUMBERS:
+        score = _first_score(content, n)
+        if score is not None:
+            doc.explicit_scores[n] = score
+
+    # Character offsets → (line, column), via the start offset of every line
+    line_starts = [0]
+    for line in lines[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+
+    def position(offset: int) -> Position:
+        idx = bisect.bisect_right(line_starts, offset) - 1
+        return idx + 1, offset - line_starts[idx]
+
+    for key, (start, end) in _verify_spans(content).items():
+        doc.spans[key] = (position(start), None if end == len(content) else position(end))
+    for cb in doc.checkboxes:
+        doc.count_checkbox(cb)
+
+    return doc
+
+
+def parse_sejr_file(sejr_file: Path) -> Optional[SejrDocument]:
+    """Parse a SEJR_LISTE.md file, or None if it does not exist."""
+    if not sejr_file.exists():
+        return None
+    return parse_sejr(sejr_file.read_text(encoding="utf-8"))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+SEJR YAML — Fælles YAML-loader med LibYAML og parse-cache
+==========================================================
+
+WHAT: Én loader for STATUS.yaml / PATTERNS.yaml / ADMIRAL_SCORE.yaml:
+      bruger yaml.CSafeLoader (LibYAML, C) når den findes, ellers
+      yaml.SafeLoader, og holder en LRU af parsede dokumenter keyed på
+      (inode, mtime_ns, size)
+WHY:  scripts/yaml_utils, app/utils/yaml_parser og web_app havde hver deres
+      parser (den inline web-parser gav andre resultater for nested STATUS).
+      Leaderboards og arkivsider læser 40+ STATUS-filer pr. render — det
+      meste af tiden gik med ren-Python YAML-parsing
+WHO:  Importeret af scripts/yaml_utils, app/utils/yaml_parser, sejr_index,
+      web_app_en, masterpiece/masterpiece_en og pages/
+HOW:  from sejr_yaml import load_yaml_file
+      status = load_yaml_file(sejr_path / "STATUS.yaml")   # {} hvis mangler
+
+Kaldere får en dyb kopi, så de frit kan ændre dict'en (auto_verify gør).
+
+Version: 3.0.0
+"""
+import copy
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as Loader
+    LIBYAML = True
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as Loader
+    LIBYAML = False
+
+CACHE_SIZE = 256
+
+
+def safe_load(text: str) -> Any:
+    """yaml.safe_load with the fastest available safe loader."""
+    return yaml.load(text, Loader=Loader)
+
+
+class YamlCache:
+    """LRU of parsed YAML files, invalidated by (inode, mtime_ns, size)."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, filepath: Path) -> Optional[Any]:
+        """Parsed content of a file, or None if it is missing or invalid."""
+        key = str(filepath)
+        try:
+            st = Path(filepath).stat()
+        except OSError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(cached[1])
+
+        try:
+            data = safe_load(Path(filepath).read_text(encoding="utf-8"))
+        except (OSError, yaml.YAMLError, UnicodeDecodeError):
+            data = None
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (signature, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_CACHE = YamlCache()
+
+
+def load_yaml_file(filepath: Path) -> Dict[str, Any]:
+    """Parse a YAML mapping file (cached). Returns {} if missing, invalid or not a mapping."""
+    data = _CACHE.load(filepath)
+    return data if isinstance(data, dict) else {}
+
+
+def get_yaml_cache() -> YamlCache:
+    """Return the process-wide YamlCache (for stats or clear())."""
+    return _CACHE
@@ -34,7 +34,6 @@ from pathlib import Path
 from datetime import datetime
 import re
 import subprocess
-import json
 import shutil
 import os
 from typing import List, Dict, Any, Optional
@@ -46,41 +45,6 @@ try:
 except ImportError:
     ENFORCEMENT_AVAILABLE = False
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# INLINE YAML PARSER - ZERO DEPENDENCIES
-# ═══════════════════════════════════════════════════════════════════════════════
-
-def parse_yaml_simple(content: str) -> dict:
-    """
-    Simple YAML parser for key: value files.
-    Handles STATUS.yaml format (unified v3.0.0) - NO external dependencies.
-    """
-    result = {}
-    for line in content.split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        if ':' in line:
-            key, value = line.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-            # Parse value types
-            if value.lower() == 'true':
-                result[key] = True
-            elif value.lower() == 'false':
-                result[key] = False
-            elif value.isdigit():
-                result[key] = int(value)
-            elif value.replace('.', '').isdigit():
-                result[key] = float(value)
-            elif value.startswith('"') and value.endswith('"'):
-                result[key] = value[1:-1]
-            elif value.startswith("'") and value.endswith("'"):
-                result[key] = value[1:-1]
-            else:
-                result[key] = value
-    return result
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1279,100 +1243,44 @@ document.addEventListener('DOMContentLoaded', function() {
 # DATA MODELS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from checkbox_utils import count_checkboxes  # Centralized — no more duplicates
-
-def get_sejr_status(sejr_path: Path) -> dict:
-    """Get complete status for a sejr"""
-    sejr_file = sejr_path / "SEJR_LISTE.md"
-    status_file = sejr_path / "STATUS.yaml"  # FIXED: Was VERIFY_STATUS.yaml
-
-    result = {
-        "name": sejr_path.name,
-        "path": str(sejr_path),
-        "checkboxes_done": 0,
-        "checkboxes_total": 0,
-        "progress": 0,
-        "score": "0/30",
-        "phase": "UNKNOWN",
-        "is_archived": "90_ARCHIVE" in str(sejr_path),
-        "files": [],
-        "last_modified": datetime.fromtimestamp(sejr_path.stat().st_mtime) if sejr_path.exists() else datetime.now()
+# Cached loaders keyed on folder fingerprints (sejr_index + archive snapshot underneath)
+from web_data import (load_active_sejrs, load_archived_sejrs, load_latest_log, load_sejr_record, read_text,
+                      show_active_jobs, stream_job)
+from script_jobs import get_job_queue  # Background runs shared by all sessions
+
+def _sejr_from_record(record: dict) -> dict:
+    """Map a sejr_index record to the dict shape the pages expect"""
+    return {
+        "name": record["name"],
+        "path": record["path"],
+        "checkboxes_done": record["checkboxes_done"],
+        "checkboxes_total": record["checkboxes_total"],
+        "progress": record["progress"],
+        "score": f"{record['score']}/30",
+        "phase": record["phase"],
+        "is_archived": record["is_archived"],
+        "files": record["files"],
+        "last_modified": datetime.fromtimestamp(record["mtime"]) if record["mtime"] else datetime.now(),
     }
 
-    # Count checkboxes
-    if sejr_file.exists():
-        content = sejr_file.read_text()
-        done, total = count_checkboxes(content)
-        result["checkboxes_done"] = done
-        result["checkboxes_total"] = total
-        result["progress"] = int((done / total * 100) if total > 0 else 0)
-
-    # Get verify status - FIXED: Read correct fields from STATUS.yaml
-    if status_file.exists():
-        try:
-            data = parse_yaml_simple(status_file.read_text())
-            # total_score is the correct field name
-            score = data.get('total_score', 0)
-            if score == 0:
-                # Fallback: Calculate from pass scores
-                p1 = data.get('pass_1_score', 0)
-                p2 = data.get('pass_2_score', 0)
-                p3 = data.get('pass_3_score', 0)
-                score = p1 + p2 + p3
-            result["score"] = f"{score}/30"
-            # Determine phase from pass status
-            if data.get('pass_3_complete'):
-                result["phase"] = "COMPLETE"
-            elif data.get('pass_2_complete'):
-                result["phase"] = "PASS 3"
-            elif data.get('pass_1_complete'):
-                result["phase"] = "PASS 2"
-            else:
-                result["phase"] = "PASS 1"
-        except Exception:
-            pass
-
-    # List files in folder
-    if sejr_path.exists():
-        result["files"] = [f.name for f in sejr_path.iterdir() if f.is_file()]
-
-    return result
+def get_sejr_status(sejr_path: Path) -> dict:
+    """Get complete status for a sejr (re-parsed only if its files changed)"""
+    return _sejr_from_record(load_sejr_record(sejr_path))
 
 def get_all_sejrs() -> List[dict]:
     """Get all active and archived sejrs"""
-    sejrs = []
-
-    # Active
-    if ACTIVE_DIR.exists():
-        for folder in sorted(ACTIVE_DIR.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-            if folder.is_dir() and not folder.name.startswith("."):
-                sejrs.append(get_sejr_status(folder))
-
-    # Archived (last 10)
-    if ARCHIVE_DIR.exists():
-        for folder in sorted(ARCHIVE_DIR.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True)[:10]:
-            if folder.is_dir() and not folder.name.startswith("."):
-                sejrs.append(get_sejr_status(folder))
+    # Active first (newest first), then the 10 most recent archived
+    return [_sejr_from_record(r) for r in load_active_sejrs() + load_archived_sejrs()[:10]]
 
-    return sejrs
+def run_script(script_name: str, args=None, use_cache: bool = True) -> tuple:
+    """Run a DNA layer script in the background job queue, streaming its output.
 
-def run_script(script_name: str) -> tuple:
-    """Run a DNA layer script"""
-    script_path = SCRIPTS_DIR / script_name
-    if not script_path.exists():
-        return False, f"Script not found: {script_name}"
-
-    try:
-        result = subprocess.run(
-            ["python3", str(script_path)],
-            cwd=str(SYSTEM_PATH),
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        return result.returncode == 0, result.stdout or result.stderr
-    except Exception as e:
-        return False, str(e)
+    Duplicate clicks (from any session) attach to the run already in
+    progress; an unchanged tree reuses the last successful result.
+    """
+    job = get_job_queue(SYSTEM_PATH).submit(script_name, args or (), use_cache=use_cache)
+    stream_job(job)
+    return job.ok, job.output()
 
 def copy_file(source: str, target_dir: str) -> bool:
     """Copy a file to target directory"""
@@ -1557,7 +1465,7 @@ with st.sidebar:
     # Quick actions
     st.markdown("** Quick Actions**")
     if st.button(" New Victory", use_container_width=True):
-        success, output = run_script("generate_sejr.py")
+        success, output = run_script("generate_sejr.py", use_cache=False)
         if success:
             st.success("New victory created!")
             st.rerun()
@@ -1567,6 +1475,10 @@ with st.sidebar:
     if st.button(" Refresh", use_container_width=True):
         st.rerun()
 
+    if get_job_queue(SYSTEM_PATH).active_jobs():
+        st.markdown("** Running scripts**")
+        show_active_jobs()
+
     st.markdown("---")
 
     # MENU ITEMS - Orange-red text
@@ -2223,7 +2135,7 @@ else:
 
         sejr_file = sejr_path / "SEJR_LISTE.md"
         if sejr_file.exists():
-            content = sejr_file.read_text()
+            content = read_text(sejr_file) or ""
 
             # Show tasks with checkboxes
             lines = content.split('\n')
@@ -2256,19 +2168,17 @@ else:
         # Show raw markdown option
         with st.expander(" View Raw SEJR_LISTE.md"):
             if sejr_file.exists():
-                st.code(sejr_file.read_text(), language="markdown")
+                st.code(read_text(sejr_file) or "", language="markdown")
 
     st.markdown("---")
 
     # Log stream
     st.markdown("###  Live Activity Log")
-    log_file = sejr_path / "AUTO_LOG.jsonl"
-    if log_file.exists():
+    logs = load_latest_log(sejr_path, 10)
+    if logs:
         st.markdown('<div class="log-stream">', unsafe_allow_html=True)
-        logs = log_file.read_text().strip().split('\n')[-10:]
-        for log_line in reversed(logs):
+        for entry in reversed(logs):
             try:
-                entry = json.loads(log_line)
                 ts = entry.get('timestamp', '')[:19]
                 action = entry.get('action', 'unknown')
                 st.markdown(f"""
@@ -2369,17 +2279,9 @@ with col_realtime1:
     if ACTIVE_DIR.exists():
         for folder in ACTIVE_DIR.iterdir():
             if folder.is_dir():
-                log_file = folder / "AUTO_LOG.jsonl"
-                if log_file.exists():
-                    try:
-                        lines = log_file.read_text().strip().split('\n')[-10:]
-                        for line in lines:
-                            if line:
-                                entry = json.loads(line)
-                                entry['sejr'] = folder.name[:15]
-                                live_actions.append(entry)
-                    except Exception:
-                        pass
+                for entry in load_latest_log(folder, 10):
+                    entry['sejr'] = folder.name[:15]
+                    live_actions.append(entry)
 
     # Sort by timestamp and show latest
     live_actions.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
@@ -2481,7 +2383,7 @@ with col_realtime3:
         if selected_file and st.button(" View Code", key="show_code_btn"):
             with st.expander(f" {selected_file.name}", expanded=True):
                 try:
-                    content = selected_file.read_text()[:3000]
+                    content = (read_text(selected_file) or "")[:3000]
                     lang = "python" if selected_file.suffix == ".py" else "yaml" if selected_file.suffix == ".yaml" else "markdown"
                     st.code(content, language=lang)
                 except Exception as e:
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+WEB DATA — Cachede data-loadere for web_app og pages/
+=====================================================
+
+WHAT: st.cache_data-loadere for sejr-lister, arkiv-resuméer, tekstfiler,
+      AUTO_LOG, aktivitets-tællinger og git status, plus live-visning af
+      script-jobs fra script_jobs-køen. Hver loader er keyed på
+      et billigt fingeraftryk (stat af mapper/filer, ingen læsning), så
+      cachen invalideres præcis når data ændres på disk
+WHY:  Streamlit kører hele scriptet igen ved hvert klik. web_app og pages/
+      gennemløb 10_ACTIVE/90_ARCHIVE og læste SEJR_LISTE.md, STATUS.yaml og
+      diplomer ved hver rerun — over Tailscale på telefonen føltes hvert tryk
+      som en genlæsning af hele arkivet
+WHO:  Importeret af web_app, web_app_en og pages/1-5
+      (bruger sejr_index, archive_snapshot, auto_log, event_store, script_jobs,
+      og sejr_daemon når den kører)
+HOW:  from web_data import load_active_sejrs, load_archive_summaries, read_text
+      for record in load_active_sejrs(): print(record["name"], record["progress"])
+      diplom = read_text(ARCHIVE_DIR / name / "SEJR_DIPLOM.md")   # None hvis mangler
+      job = stream_job(get_job_queue(SYSTEM_PATH).submit("auto_verify.py"))
+
+Loaderne returnerer kopier (st.cache_data pickler resultatet), så sider
+frit kan ændre dem.
+
+Version: 3.0.0
+"""
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+from archive_snapshot import get_archive_records
+from auto_log import LOG_FILENAME, MANIFEST_FILENAME, SEGMENT_DIRNAME, latest_entries
+from event_store import get_event_store
+from script_jobs import Job, get_job_queue
+from sejr_daemon import SEJR_DIRS, SejrClient
+from sejr_index import dir_fingerprint, folder_signature, get_index
+
+SYSTEM_PATH = Path(__file__).parent
+ACTIVE_DIR = SYSTEM_PATH / "10_ACTIVE"
+ARCHIVE_DIR = SYSTEM_PATH / "90_ARCHIVE"
+
+EVENTS_TTL = 10  # Seconds; event counts need a sync anyway, so cache by time
+GIT_TTL = 15     # Seconds; `git status` walks the whole work tree
+JOB_POLL = 0.3   # Seconds between live output refreshes while a script runs
+
+# (minimum total score, rank) — highest first
+ARCHIVE_RANKS = [(27, "GRAND ADMIRAL"), (24, "ADMIRAL"), (21, "KAPTAJN"), (18, "LØJTNANT"), (0, "KADET")]
+
+
+def file_key(path: Path) -> str:
+    """'mtime_ns:size' for a file, '-' if missing (the cache key for its content)."""
+    try:
+        st_ = Path(path).stat()
+    except OSError:
+        return "-"
+    return f"{st_.st_mtime_ns}:{st_.st_size}"
+
+
+# ============================================================================
+# SEJR LISTS
+# ============================================================================
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _sejr_records(directory: str, fingerprint: str) -> List[dict]:
+    return get_index(SYSTEM_PATH).scan_dir(Path(directory))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _daemon_records(key: str, version: int) -> Optional[List[dict]]:
+    snap = SejrClient(SYSTEM_PATH).snapshot()
+    return snap[key] if snap else None
+
+
+def load_sejr_records(directory: Path) -> List[dict]:
+    """sejr_index records for every folder in a directory, newest first.
+
+    With the sejr daemon running this is one ping (its state version is
+    the cache key) instead of a stat walk of the directory.
+    """
+    directory = Path(directory)
+    key = next((k for k, name in SEJR_DIRS.items() if directory == SYSTEM_PATH / name), None)
+    if key is not None:
+        version = SejrClient(SYSTEM_PATH).ping()
+        if version is not None:
+            records = _daemon_records(key, version)
+            if records is not None:
+                return records
+    return _sejr_records(str(directory), dir_fingerprint(directory))
+
+
+def load_active_sejrs() -> List[dict]:
+    return load_sejr_records(ACTIVE_DIR)
+
+
+def load_archived_sejrs() -> List[dict]:
+    return load_sejr_records(ARCHIVE_DIR)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _sejr_record(path: str, signature: str) -> dict:
+    return get_index(SYSTEM_PATH).get(Path(path))
+
+
+def load_sejr_record(folder: Path) -> dict:
+    """sejr_index record for one folder."""
+    return _sejr_record(str(folder), folder_signature(Path(folder)))
+
+
+# ============================================================================
+# ARCHIVE
+# ============================================================================
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _archive_summaries(fingerprint: str) -> List[dict]:
+    summaries = []
+    for record in get_archive_records(SYSTEM_PATH):
+        summaries.append({
+            "name": record.name,
+            "score": record.total_score,
+            "p1": record.pass_1_score,
+            "p2": record.pass_2_score,
+            "p3": record.pass_3_score,
+            "checkboxes_done": record.checkboxes_done,
+            "checkboxes_total": record.checkboxes_total,
+            "archived_ts": record.archived_ts,
+            "has_diplom": record.has_diplom,
+            "has_conclusion": record.has_conclusion,
+        })
+    summaries.sort(key=lambda s: s["name"], reverse=True)
+    return summaries
+
+
+def load_archive_summaries() -> List[dict]:
+    """One flat dict per archived sejr (from the archive snapshot), newest name first."""
+    return _archive_summaries(dir_fingerprint(ARCHIVE_DIR))
+
+
+def archive_rank(score: int) -> str:
+    """Rank name for a total score (same thresholds as SEJR_DIPLOM.md)."""
+    for threshold, name in ARCHIVE_RANKS:
+        if score >= threshold:
+            return name
+    return ARCHIVE_RANKS[-1][1]
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _archive_stats(fingerprint: str) -> dict:
+    summaries = _archive_summaries(fingerprint)
+    scores = [s["score"] for s in summaries]
+    ranks: Dict[str, int] = {name: 0 for _, name in ARCHIVE_RANKS}
+    for score in scores:
+        ranks[archive_rank(score)] += 1
+    return {
+        "count": len(scores),
+        "avg_score": sum(scores) / len(scores) if scores else 0.0,
+        "max_score": max(scores, default=0),
+        "ranks": ranks,
+    }
+
+
+def load_archive_stats() -> dict:
+    """Precomputed archive totals: count, avg_score, max_score and count per rank."""
+    return _archive_stats(dir_fingerprint(ARCHIVE_DIR))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _archive_page(fingerprint: str, ranks: tuple, min_score: int, max_score: int,
+                  search: str, page: int, page_size: int) -> tuple:
+    matches = [
+        s for s in _archive_summaries(fingerprint)
+        if min_score <= s["score"] <= max_score
+        and (not ranks or archive_rank(s["score"]) in ranks)
+        and search.lower() in s["name"].lower()
+    ]
+    start = page * page_size
+    return matches[start:start + page_size], len(matches)
+
+
+def query_archive(ranks: tuple = (), min_score: int = 0, max_score: int = 30, search: str = "",
+                  page: int = 0, page_size: int = 20) -> tuple:
+    """(summaries on this page, total matches) — filtering and slicing happen server-side."""
+    return _archive_page(dir_fingerprint(ARCHIVE_DIR), tuple(ranks), min_score, max_score,
+                         search, page, page_size)
+
+
+# ============================================================================
+# FILES
+# ============================================================================
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _read_text(path: str, key: str) -> Optional[str]:
+    try:
+        return Path(path).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+
+
+def read_text(path: Path) -> Optional[str]:
+    """File content, re-read only when the file's (mtime, size) changes."""
+    key = file_key(path)
+    if key == "-":
+        return None
+    return _read_text(str(path), key)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _latest_log(sejr_path: str, key: str, n: int) -> List[dict]:
+    return latest_entries(Path(sejr_path), n)
+
+
+def load_latest_log(sejr_path: Path, n: int = 10) -> List[dict]:
+    """Last n AUTO_LOG entries (oldest first)."""
+    sejr_path = Path(sejr_path)
+    key = file_key(sejr_path / LOG_FILENAME) + "|" + file_key(sejr_path / SEGMENT_DIRNAME / MANIFEST_FILENAME)
+    return _latest_log(str(sejr_path), key, n)
+
+
+# ============================================================================
+# ACTIVITY
+# ============================================================================
+
+@st.cache_data(show_spinner=False, ttl=EVENTS_TTL, max_entries=32)
+def load_event_counts(field: str, since: Optional[str] = None) -> Dict[str, int]:
+    """Event counts grouped by field (see EventStore.count_by), synced first."""
+    store = get_event_store(SYSTEM_PATH)
+    store.sync()
+    return store.count_by(field, since=since)
+
+
+# ============================================================================
+# SCRIPT JOBS
+# ============================================================================
+
+def stream_job(job: Job, lines: int = 15, timeout: Optional[float] = None) -> Job:
+    """Show a job's output live in a placeholder until it finishes (or timeout).
+
+    The job runs in the shared worker pool, so leaving the page or a rerun
+    does not stop it; the next run can pick it up again by ID.
+    """
+    placeholder = st.empty()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    shown = -1
+    while not job.wait(JOB_POLL):
+        count = job.line_count()
+        if count != shown:
+            shown = count
+            placeholder.code(f"[{job.status}] {job.script}\n{job.tail(lines)}")
+        if deadline is not None and time.monotonic() >= deadline:
+            return job
+    placeholder.empty()
+    return job
+
+
+def show_active_jobs() -> None:
+    """Compact list of queued/running scripts from every session (for the sidebar)."""
+    for job in get_job_queue(SYSTEM_PATH).active_jobs():
+        since = job.started or job.submitted
+        st.caption(f"⏳ {job.script} — {job.status} ({time.time() - since:.0f}s)")
+
+
+# ============================================================================
+# SYSTEM
+# ============================================================================
+
+@st.cache_data(show_spinner=False, ttl=GIT_TTL)
+def load_git_status() -> Optional[str]:
+    """`git status --short` for the system repo (None if git is unavailable)."""
+    try:
+        result = subprocess.run(["git", "status", "--short"], capture_output=True,
+                                text=True, cwd=str(SYSTEM_PATH), timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout